@@ -1,3 +1,17 @@
-from .indicators import IndicatorEngine
+import importlib
 
-__all__ = ['IndicatorEngine']
+_EXPORTS = {
+    'IndicatorEngine': '.indicators',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    # 첫 접근 시 로드 (pandas 지연 로딩)
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
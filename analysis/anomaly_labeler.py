@@ -0,0 +1,211 @@
+"""
+호가창 이상 패턴 사후 라벨링
+- 라벨이 없는 orderbook_anomalies 행을 ohlcv_data 1분봉과 한 번의 집합 UPDATE 로 조인해
+  1분/5분/15분 후 가격과 수익률을 details['outcome'] 에 기록 (price_after = 최장 기간 가격)
+- 라벨된 이상 패턴의 유형별 적중률/평균 수익률 집계 (전략에서 사용)
+"""
+
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import text
+
+from database import SessionLocal, SystemLog
+import config
+
+# 유형별 예상 가격 방향 (1 상승, -1 하락, 0 방향 없음 - 변동폭으로 판단)
+DIRECTIONS = {
+    'extreme_bid_imbalance': 1,
+    'extreme_ask_imbalance': -1,
+    'whale_wall': {'bid': 1, 'ask': -1},    # 매수벽 지지 / 매도벽 저항
+    'spread_spike': 0,
+    'volume_surge': 0,
+}
+
+
+def horizon_key(minutes: int) -> str:
+    return f"{minutes}m"
+
+
+def _direction(anomaly_type: str, side: Optional[str]) -> int:
+    direction = DIRECTIONS.get(anomaly_type, 0)
+    if isinstance(direction, dict):
+        return direction.get(side, 0)
+    return direction
+
+
+class AnomalyLabeler:
+    """이상 패턴 결과 라벨링 + 적중률 집계"""
+
+    def __init__(self, session_factory=SessionLocal, horizons: List[int] = None):
+        """
+        Args:
+            session_factory: DB 세션 팩토리
+            horizons: 라벨 기간 (분, 기본: config.ANOMALY_LABEL_HORIZONS)
+        """
+        self.session_factory = session_factory
+        self.horizons = sorted(horizons or config.ANOMALY_LABEL_HORIZONS)
+        self._label_sql = text(self._build_label_sql())
+
+    def _build_label_sql(self) -> str:
+        """
+        라벨 UPDATE 문 - 기간별 LATERAL 조인 (uix_ohlcv 인덱스 범위 조회)
+        기간 h 의 가격: 이상 패턴 시각 + h 를 포함하는 1분봉 종가
+        """
+        schema = config.DB_SCHEMA
+        laterals, columns, outcome = [], [], []
+        for minutes in self.horizons:
+            key = horizon_key(minutes)
+            alias = f"h{minutes}"
+            laterals.append(f"""
+        LEFT JOIN LATERAL (
+            SELECT o.close FROM {schema}.ohlcv_data o
+            WHERE o.symbol = p.symbol AND o.timeframe = '1m'
+              AND o.timestamp > p.timestamp + interval '{minutes - 1} minutes'
+              AND o.timestamp <= p.timestamp + interval '{minutes} minutes'
+            ORDER BY o.timestamp
+            LIMIT 1
+        ) {alias} ON true""")
+            columns.append(f"{alias}.close AS close_{minutes}")
+            outcome.append(f"'{key}', jsonb_build_object('price', l.close_{minutes}, "
+                           f"'return', l.close_{minutes} / p.price_before - 1)")
+
+        longest = self.horizons[-1]
+        sep = ',\n                    '
+        return f"""
+        WITH pending AS (
+            SELECT id, symbol, timestamp, price_before
+            FROM {schema}.orderbook_anomalies
+            WHERE details -> 'outcome' IS NULL
+              AND timestamp <= :cutoff
+              AND price_before > 0
+            ORDER BY timestamp
+            LIMIT :limit
+        ),
+        labels AS (
+            SELECT p.id, {', '.join(columns)}
+            FROM pending p{''.join(laterals)}
+        )
+        UPDATE {schema}.orderbook_anomalies p
+        SET price_after = COALESCE(l.close_{longest}, p.price_after),
+            details = COALESCE(p.details, '{{}}'::jsonb) || jsonb_build_object(
+                'outcome', jsonb_build_object(
+                    {sep.join(outcome)},
+                    'labeled_at', CAST(:now AS text)))
+        FROM labels l
+        WHERE p.id = l.id
+          AND (l.close_{longest} IS NOT NULL OR p.timestamp <= :expire)
+        """
+
+    def label_pending(self, limit: int = None) -> int:
+        """
+        라벨 대상 일괄 처리 - 최장 기간 캔들이 있거나 대기 시간을 넘긴 행만 확정
+        Returns:
+            라벨된 행 수
+        """
+        now = datetime.now()
+        params = {
+            'cutoff': now - timedelta(minutes=self.horizons[-1] + 1),
+            'expire': now - timedelta(seconds=config.ANOMALY_LABEL_MAX_WAIT),
+            'limit': limit or config.ANOMALY_LABEL_BATCH,
+            'now': now.isoformat(timespec='seconds'),
+        }
+        db = self.session_factory()
+        try:
+            result = db.execute(self._label_sql, params)
+            db.commit()
+            return result.rowcount
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def hit_rates(self, days: int = None, threshold: float = None) -> Dict[str, Dict]:
+        """
+        유형별 적중률 (방향성 유형: 예상 방향으로 threshold 이상 이동, 그 외: 변동폭 threshold 이상)
+        Returns:
+            {anomaly_type: {'count': 라벨 수, '1m': {'count', 'hit_rate', 'avg_return'}, ...}}
+            avg_return 은 방향성 유형이면 예상 방향 기준 수익률, 그 외는 평균 변동폭
+        """
+        days = days or config.ANOMALY_STATS_DAYS
+        threshold = threshold if threshold is not None else config.ANOMALY_HIT_THRESHOLD
+        keys = [horizon_key(minutes) for minutes in self.horizons]
+        returns = ', '.join(f"(details -> 'outcome' -> '{key}' ->> 'return')::float" for key in keys)
+
+        db = self.session_factory()
+        try:
+            rows = db.execute(text(f"""
+                SELECT anomaly_type, details ->> 'side', {returns}
+                FROM {config.DB_SCHEMA}.orderbook_anomalies
+                WHERE details -> 'outcome' IS NOT NULL AND timestamp >= :since
+            """), {'since': datetime.now() - timedelta(days=days)}).all()
+        finally:
+            db.close()
+
+        grouped: Dict[str, List] = {}
+        for row in rows:
+            grouped.setdefault(row[0], []).append(row)
+
+        stats = {}
+        for anomaly_type, type_rows in grouped.items():
+            directions = np.array([_direction(anomaly_type, row[1]) for row in type_rows], dtype=float)
+            values = np.array([[np.nan if v is None else v for v in row[2:]] for row in type_rows], dtype=float)
+            # 방향성 행은 예상 방향 수익률, 방향 없는 행은 변동폭
+            moves = np.where(directions[:, None] != 0, values * directions[:, None], np.abs(values))
+
+            entry = {'count': len(type_rows)}
+            for i, key in enumerate(keys):
+                column = moves[:, i]
+                column = column[~np.isnan(column)]
+                entry[key] = {
+                    'count': int(column.size),
+                    'hit_rate': float((column >= threshold).mean()) if column.size else None,
+                    'avg_return': float(column.mean()) if column.size else None,
+                }
+            stats[anomaly_type] = entry
+        return stats
+
+    def run_once(self) -> int:
+        """라벨 대상이 남지 않을 때까지 일괄 처리"""
+        total = 0
+        while True:
+            labeled = self.label_pending()
+            total += labeled
+            if labeled < config.ANOMALY_LABEL_BATCH:
+                return total
+
+    def run_loop(self, interval: int = None):
+        """주기적 라벨링 (python -m analysis.anomaly_labeler)"""
+        interval = interval or config.ANOMALY_LABEL_INTERVAL
+        print(f"이상 패턴 라벨링 시작, 주기: {interval}초")
+        while True:
+            try:
+                labeled = self.run_once()
+                if labeled:
+                    print(f"[AnomalyLabeler] {labeled}건 라벨링")
+                time.sleep(interval)
+            except KeyboardInterrupt:
+                print("\n라벨링 중단됨")
+                break
+            except Exception as e:
+                self._log_error(f"라벨링 에러: {str(e)}")
+                time.sleep(interval)
+
+    def _log_error(self, message: str):
+        print(f"[AnomalyLabeler ERROR] {message}")
+        db = self.session_factory()
+        try:
+            db.add(SystemLog(log_level='ERROR', module='AnomalyLabeler', message=message))
+            db.commit()
+        except Exception:
+            db.rollback()
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    labeler = AnomalyLabeler()
+    labeler.run_loop()
@@ -5,17 +5,26 @@ TA-Lib 및 pandas_ta 활용
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List
+from typing import Dict, List, Set
 from decimal import Decimal
 from datetime import datetime, timedelta
-from database import SessionLocal, OHLCVData, TechnicalIndicator
+from database import SessionLocal, TechnicalIndicator
+from database import queries
 import config
-
-# TA 라이브러리
-try:
-    import ta
-except ImportError:
-    print("Warning: 'ta' library not installed. Run: pip install ta")
+from utils import metrics
+
+# 지표 키 → 계산 그룹 (같은 그룹은 한 번에 계산)
+INDICATOR_GROUPS = {
+    'rsi_14': 'rsi',
+    'macd': 'macd', 'macd_signal': 'macd', 'macd_histogram': 'macd',
+    'bb_upper': 'bb', 'bb_middle': 'bb', 'bb_lower': 'bb', 'bb_position': 'bb',
+    'ema_9': 'ema_9', 'ema_21': 'ema_21', 'ema_50': 'ema_50', 'ema_200': 'ema_200',
+    'volume_sma_20': 'volume_sma',
+    'atr_14': 'atr',
+    'adx_14': 'adx',
+    'stoch_k': 'stoch', 'stoch_d': 'stoch',
+    'price_change_5m': 'price_change', 'price_change_15m': 'price_change', 'price_change_24h': 'price_change',
+}
 
 
 class IndicatorEngine:
@@ -35,28 +44,8 @@ class IndicatorEngine:
             DataFrame
         """
         try:
-            query = self.db.query(OHLCVData).filter(
-                OHLCVData.symbol == symbol,
-                OHLCVData.timeframe == timeframe
-            ).order_by(OHLCVData.timestamp.desc()).limit(limit)
-
-            data = query.all()
-
-            if not data:
-                return pd.DataFrame()
-
-            df = pd.DataFrame([{
-                'timestamp': d.timestamp,
-                'open': float(d.open),
-                'high': float(d.high),
-                'low': float(d.low),
-                'close': float(d.close),
-                'volume': float(d.volume)
-            } for d in data])
-
-            df = df.sort_values('timestamp').reset_index(drop=True)
-            return df
-
+            # 컬럼 단위 조회 (ORM 객체/Decimal 생성 없이 DB 에서 float 변환)
+            return queries.ohlcv_frame(self.db, symbol, timeframe, limit)
         except Exception as e:
             print(f"OHLCV 조회 실패: {str(e)}")
             return pd.DataFrame()
@@ -168,87 +157,97 @@ class IndicatorEngine:
 
         return {'k': k, 'd': d}
 
-    def calculate_all_indicators(self, symbol: str, timeframe: str) -> Dict:
+    def calculate_all_indicators(self, symbol: str, timeframe: str, required: Set[str] = None) -> Dict:
         """
         모든 지표 계산
         Args:
             symbol: 코인 심볼
             timeframe: 타임프레임
+            required: 필요한 지표 키 (None이면 전체) - 해당 지표 그룹만 계산
         Returns:
             계산된 지표 딕셔너리
         """
+        with metrics.INDICATOR_SECONDS.time(timeframe=timeframe):
+            return self._calculate_all_indicators(symbol, timeframe, required)
+
+    def _calculate_all_indicators(self, symbol: str, timeframe: str, required: Set[str] = None) -> Dict:
+        """모든 지표 계산 (내부 구현)"""
         df = self.get_ohlcv_data(symbol, timeframe, limit=200)
 
         if df.empty or len(df) < 50:
             print(f"데이터 부족: {symbol} {timeframe}")
             return None
 
+        if required is None:
+            groups = set(INDICATOR_GROUPS.values())
+        else:
+            groups = {INDICATOR_GROUPS[key] for key in required if key in INDICATOR_GROUPS}
+
+        def latest(series: pd.Series):
+            value = series.iloc[-1]
+            return float(value) if pd.notna(value) else None
+
         try:
+            indicators = {
+                'symbol': symbol,
+                'timeframe': timeframe,
+                'timestamp': df.iloc[-1]['timestamp'],
+            }
+
             # RSI
-            rsi = self.calculate_rsi(df, 14)
+            if 'rsi' in groups:
+                indicators['rsi_14'] = latest(self.calculate_rsi(df, 14))
 
             # MACD
-            macd_data = self.calculate_macd(df)
-
-            # 볼린저 밴드
-            bb_data = self.calculate_bollinger_bands(df)
+            if 'macd' in groups:
+                macd_data = self.calculate_macd(df)
+                indicators['macd'] = latest(macd_data['macd'])
+                indicators['macd_signal'] = latest(macd_data['signal'])
+                indicators['macd_histogram'] = latest(macd_data['histogram'])
+
+            # 볼린저 밴드 + 밴드 내 위치 (0~1, 0.5=중간)
+            if 'bb' in groups:
+                bb_data = self.calculate_bollinger_bands(df)
+                current_price = df.iloc[-1]['close']
+                bb_range = bb_data['upper'].iloc[-1] - bb_data['lower'].iloc[-1] if pd.notna(bb_data['upper'].iloc[-1]) else 1
+                bb_position = (current_price - bb_data['lower'].iloc[-1]) / bb_range if bb_range > 0 and pd.notna(bb_data['lower'].iloc[-1]) else 0.5
+                indicators['bb_upper'] = latest(bb_data['upper'])
+                indicators['bb_middle'] = latest(bb_data['middle'])
+                indicators['bb_lower'] = latest(bb_data['lower'])
+                indicators['bb_position'] = float(bb_position)
 
             # EMA
-            ema_9 = self.calculate_ema(df, 9)
-            ema_21 = self.calculate_ema(df, 21)
-            ema_50 = self.calculate_ema(df, 50)
-            ema_200 = self.calculate_ema(df, 200)
+            for period in (9, 21, 50, 200):
+                if f'ema_{period}' in groups:
+                    indicators[f'ema_{period}'] = latest(self.calculate_ema(df, period))
 
             # 거래량 이동평균
-            volume_sma = df['volume'].rolling(window=20).mean()
+            if 'volume_sma' in groups:
+                indicators['volume_sma_20'] = latest(df['volume'].rolling(window=20).mean())
 
             # ATR
-            atr = self.calculate_atr(df, 14)
+            if 'atr' in groups:
+                indicators['atr_14'] = latest(self.calculate_atr(df, 14))
 
             # ADX
-            adx = self.calculate_adx(df, 14)
+            if 'adx' in groups:
+                indicators['adx_14'] = latest(self.calculate_adx(df, 14))
 
             # 스토캐스틱
-            stoch_data = self.calculate_stochastic(df)
-
-            # 최신 값 추출
-            latest_idx = -1
+            if 'stoch' in groups:
+                stoch_data = self.calculate_stochastic(df)
+                indicators['stoch_k'] = latest(stoch_data['k'])
+                indicators['stoch_d'] = latest(stoch_data['d'])
 
             # 가격 변동률 계산 (급등 감지용)
-            price_change_5m = (df.iloc[-1]['close'] - df.iloc[-5]['close']) / df.iloc[-5]['close'] if len(df) >= 5 else 0
-            price_change_15m = (df.iloc[-1]['close'] - df.iloc[-15]['close']) / df.iloc[-15]['close'] if len(df) >= 15 else 0
-            price_change_24h = (df.iloc[-1]['close'] - df.iloc[0]['close']) / df.iloc[0]['close'] if len(df) >= 144 else price_change_15m  # 1분봉 기준 24시간
-
-            # 볼린저밴드 포지션 (0~1, 0.5=중간)
-            current_price = df.iloc[-1]['close']
-            bb_range = bb_data['upper'].iloc[-1] - bb_data['lower'].iloc[-1] if pd.notna(bb_data['upper'].iloc[-1]) else 1
-            bb_position = (current_price - bb_data['lower'].iloc[-1]) / bb_range if bb_range > 0 and pd.notna(bb_data['lower'].iloc[-1]) else 0.5
-
-            indicators = {
-                'symbol': symbol,
-                'timeframe': timeframe,
-                'timestamp': df.iloc[latest_idx]['timestamp'],
-                'rsi_14': float(rsi.iloc[latest_idx]) if pd.notna(rsi.iloc[latest_idx]) else None,
-                'macd': float(macd_data['macd'].iloc[latest_idx]) if pd.notna(macd_data['macd'].iloc[latest_idx]) else None,
-                'macd_signal': float(macd_data['signal'].iloc[latest_idx]) if pd.notna(macd_data['signal'].iloc[latest_idx]) else None,
-                'macd_histogram': float(macd_data['histogram'].iloc[latest_idx]) if pd.notna(macd_data['histogram'].iloc[latest_idx]) else None,
-                'bb_upper': float(bb_data['upper'].iloc[latest_idx]) if pd.notna(bb_data['upper'].iloc[latest_idx]) else None,
-                'bb_middle': float(bb_data['middle'].iloc[latest_idx]) if pd.notna(bb_data['middle'].iloc[latest_idx]) else None,
-                'bb_lower': float(bb_data['lower'].iloc[latest_idx]) if pd.notna(bb_data['lower'].iloc[latest_idx]) else None,
-                'bb_position': float(bb_position),
-                'ema_9': float(ema_9.iloc[latest_idx]) if pd.notna(ema_9.iloc[latest_idx]) else None,
-                'ema_21': float(ema_21.iloc[latest_idx]) if pd.notna(ema_21.iloc[latest_idx]) else None,
-                'ema_50': float(ema_50.iloc[latest_idx]) if pd.notna(ema_50.iloc[latest_idx]) else None,
-                'ema_200': float(ema_200.iloc[latest_idx]) if pd.notna(ema_200.iloc[latest_idx]) else None,
-                'volume_sma_20': float(volume_sma.iloc[latest_idx]) if pd.notna(volume_sma.iloc[latest_idx]) else None,
-                'atr_14': float(atr.iloc[latest_idx]) if pd.notna(atr.iloc[latest_idx]) else None,
-                'adx_14': float(adx.iloc[latest_idx]) if pd.notna(adx.iloc[latest_idx]) else None,
-                'stoch_k': float(stoch_data['k'].iloc[latest_idx]) if pd.notna(stoch_data['k'].iloc[latest_idx]) else None,
-                'stoch_d': float(stoch_data['d'].iloc[latest_idx]) if pd.notna(stoch_data['d'].iloc[latest_idx]) else None,
-                'price_change_5m': float(price_change_5m),
-                'price_change_15m': float(price_change_15m),
-                'price_change_24h': float(price_change_24h),
-            }
+            if 'price_change' in groups:
+                close = df['close']
+                price_change_5m = (close.iloc[-1] - close.iloc[-5]) / close.iloc[-5] if len(df) >= 5 else 0
+                price_change_15m = (close.iloc[-1] - close.iloc[-15]) / close.iloc[-15] if len(df) >= 15 else 0
+                price_change_24h = (close.iloc[-1] - close.iloc[0]) / close.iloc[0] if len(df) >= 144 else price_change_15m  # 1분봉 기준 24시간
+                indicators['price_change_5m'] = float(price_change_5m)
+                indicators['price_change_15m'] = float(price_change_15m)
+                indicators['price_change_24h'] = float(price_change_24h)
 
             return indicators
 
@@ -0,0 +1,212 @@
+"""
+호가창 분석 커널 (NumPy)
+- 호가 리스트({'price': str, 'quantity': str})를 한 번만 파싱해 연속 배열로 보관
+- 총 물량, 상위 N단계 불균형, 가중 중간가, 마이크로프라이스, 중간가 대비 bp 이내 잔량,
+  벽 감지, 누적 잔량 곡선을 벡터 연산으로 계산
+- 수집기(OrderbookCollector), 엔진 호가창 캐시, 호가창 전략이 같은 결과를 공유
+"""
+
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_DEPTH_BPS = (10, 50, 100)
+
+def _depth(quantities: np.ndarray) -> np.ndarray:
+    """누적 잔량 (앞에 0 추가 - depth[k] = 상위 k단계 합)"""
+    depth = np.zeros(quantities.size + 1)
+    np.cumsum(quantities, out=depth[1:])
+    return depth
+
+
+class ParsedBook:
+    """
+    파싱된 호가창 - 매수는 가격 내림차순, 매도는 오름차순 (거래소 응답 순서)
+    누적 잔량(bid_depth/ask_depth)을 함께 보관해 합계/상위 N단계/bp 이내 잔량을 인덱싱으로 계산
+    """
+
+    __slots__ = ('bid_prices', 'bid_quantities', 'ask_prices', 'ask_quantities', 'bid_depth', 'ask_depth')
+
+    def __init__(self, bid_prices: np.ndarray, bid_quantities: np.ndarray,
+                 ask_prices: np.ndarray, ask_quantities: np.ndarray):
+        self.bid_prices = bid_prices
+        self.bid_quantities = bid_quantities
+        self.ask_prices = ask_prices
+        self.ask_quantities = ask_quantities
+        self.bid_depth = _depth(bid_quantities)
+        self.ask_depth = _depth(ask_quantities)
+
+    @property
+    def best_bid(self) -> float:
+        return float(self.bid_prices[0]) if self.bid_prices.size else 0.0
+
+    @property
+    def best_ask(self) -> float:
+        return float(self.ask_prices[0]) if self.ask_prices.size else 0.0
+
+    @property
+    def mid_price(self) -> float:
+        if self.bid_prices.size and self.ask_prices.size:
+            return (self.best_bid + self.best_ask) / 2
+        return self.best_bid or self.best_ask
+
+    def side(self, side: str):
+        """(가격, 수량, 누적 잔량) 배열 - side: 'bid' 또는 'ask'"""
+        if side == 'bid':
+            return self.bid_prices, self.bid_quantities, self.bid_depth
+        return self.ask_prices, self.ask_quantities, self.ask_depth
+
+    def volume(self, side: str, top_n: int = None) -> float:
+        """상위 N단계 잔량 합 (기본: 전체)"""
+        depth = self.bid_depth if side == 'bid' else self.ask_depth
+        return float(depth[-1] if top_n is None else depth[min(top_n, depth.size - 1)])
+
+
+def parse_orderbook(orderbook: Dict) -> ParsedBook:
+    """
+    호가창 dict(bids/asks) → ParsedBook (이미 파싱된 결과가 있으면 재사용)
+    문자열 가격/수량을 한 번의 배열 변환으로 파싱 (레벨별 float() 호출 없음)
+    """
+    parsed = orderbook.get('book')
+    if isinstance(parsed, ParsedBook):
+        return parsed
+
+    bids = orderbook.get('bids') or []
+    asks = orderbook.get('asks') or []
+    # [매수 가격 | 매수 수량 | 매도 가격 | 매도 수량] 한 배열 - 구간 슬라이스는 연속 메모리 뷰
+    values = np.array([level['price'] for level in bids] + [level['quantity'] for level in bids] +
+                      [level['price'] for level in asks] + [level['quantity'] for level in asks],
+                      dtype=np.float64)
+    n_bids, n_asks = len(bids), len(asks)
+    split = 2 * n_bids
+    return ParsedBook(values[:n_bids], values[n_bids:split],
+                      values[split:split + n_asks], values[split + n_asks:])
+
+
+def top_imbalance(book: ParsedBook, top_n: int = 10) -> float:
+    """상위 N단계 매수/매도 물량 비율 (매도 물량 없으면 0)"""
+    ask_volume = book.volume('ask', top_n)
+    return book.volume('bid', top_n) / ask_volume if ask_volume > 0 else 0.0
+
+
+def weighted_mid(book: ParsedBook, top_n: int = 5) -> float:
+    """상위 N단계 물량 가중 평균가 (양쪽 호가 합산)"""
+    total = book.volume('bid', top_n) + book.volume('ask', top_n)
+    if total <= 0:
+        return book.mid_price
+    notional = book.bid_prices[:top_n] @ book.bid_quantities[:top_n] + \
+        book.ask_prices[:top_n] @ book.ask_quantities[:top_n]
+    return float(notional / total)
+
+
+def microprice(book: ParsedBook) -> float:
+    """최우선 호가 잔량 가중 가격 (매수 잔량이 많을수록 매도 호가 쪽)"""
+    if not (book.bid_prices.size and book.ask_prices.size):
+        return book.mid_price
+    bid_quantity, ask_quantity = book.bid_quantities[0], book.ask_quantities[0]
+    total = bid_quantity + ask_quantity
+    if total <= 0:
+        return book.mid_price
+    return float((book.best_bid * ask_quantity + book.best_ask * bid_quantity) / total)
+
+
+def depth_at_bps(book: ParsedBook, bps: Sequence[float] = DEFAULT_DEPTH_BPS) -> Dict[float, Dict[str, float]]:
+    """
+    중간가 대비 bp 이내 누적 잔량
+    Returns:
+        {bp: {'bid': 수량, 'ask': 수량}}
+    """
+    mid = book.mid_price
+    if mid <= 0:
+        return {b: {'bid': 0.0, 'ask': 0.0} for b in bps}
+
+    offsets = np.asarray(bps, dtype=np.float64) * (mid / 10000)
+    # 매수 가격은 내림차순 - 역순 뷰(오름차순)에서 하한 이상 개수
+    bid_counts = book.bid_prices.size - np.searchsorted(book.bid_prices[::-1], mid - offsets, side='left')
+    ask_counts = np.searchsorted(book.ask_prices, mid + offsets, side='right')
+    return {b: {'bid': bid, 'ask': ask} for b, bid, ask in
+            zip(bps, book.bid_depth[bid_counts].tolist(), book.ask_depth[ask_counts].tolist())}
+
+
+def cumulative_depth(book: ParsedBook, side: str) -> np.ndarray:
+    """누적 잔량 곡선 (최우선 호가부터)"""
+    return book.side(side)[2][1:]
+
+
+def detect_walls(book: ParsedBook, side: str, ratio: float = 3.0, levels: int = None,
+                 average_over: int = None) -> List[Dict]:
+    """
+    호가창 벽(대량 주문) 감지 - 평균 물량의 ratio 배 초과
+    Args:
+        side: 'bid' 또는 'ask'
+        levels: 검사할 단계 수 (기본: 전체)
+        average_over: 평균 기준 단계 수 (기본: 전체 단계 평균, 지정 시 상위 N단계 합 / N)
+    Returns:
+        [{'price', 'quantity', 'ratio', 'side'}]
+    """
+    prices, quantities, depth = book.side(side)
+    if not quantities.size:
+        return []
+
+    if average_over is None:
+        average = depth[-1] / quantities.size
+    else:
+        average = depth[min(average_over, quantities.size)] / average_over
+    if average <= 0:
+        return []
+
+    prices, quantities = prices[:levels], quantities[:levels]
+    index = np.flatnonzero(quantities > average * ratio)
+    if not index.size:
+        return []
+    return [{'price': price, 'quantity': quantity, 'ratio': quantity / average, 'side': side}
+            for price, quantity in zip(prices[index].tolist(), quantities[index].tolist())]
+
+
+def analyze(orderbook: Dict, book: Optional[ParsedBook] = None, top_n: int = 10,
+            wall_ratio: float = 3.0, depth_bps: Sequence[float] = DEFAULT_DEPTH_BPS) -> Dict:
+    """
+    호가창 종합 분석 (OrderbookCollector.analyze_orderbook 결과 키 포함)
+    Args:
+        orderbook: {'bids', 'asks'} 호가창
+        book: 이미 파싱된 호가창 (없으면 파싱)
+    Returns:
+        분석 결과 + 'book' (ParsedBook, 후속 계산에서 재사용)
+    """
+    book = book if book is not None else parse_orderbook(orderbook)
+
+    bid_total = book.volume('bid')
+    ask_total = book.volume('ask')
+    best_bid, best_ask = book.best_bid, book.best_ask
+
+    return {
+        'bid_total_volume': bid_total,
+        'ask_total_volume': ask_total,
+        'imbalance_ratio': bid_total / ask_total if ask_total > 0 else 0,
+        'top_imbalance': top_imbalance(book, top_n),
+        'spread': best_ask - best_bid,
+        'best_bid': best_bid,
+        'best_ask': best_ask,
+        'mid_price': book.mid_price,
+        'weighted_mid': weighted_mid(book),
+        'microprice': microprice(book),
+        'depth_bps': depth_at_bps(book, depth_bps),
+        'bid_walls': detect_walls(book, 'bid', wall_ratio),
+        'ask_walls': detect_walls(book, 'ask', wall_ratio),
+        'book': book,
+    }
+
+
+def cache_entry(bids: List[Dict], asks: List[Dict], timestamp: datetime, book: Optional[ParsedBook] = None) -> Dict:
+    """
+    엔진 호가창 캐시 항목 - 원본 호가 + 분석 결과 + 파싱된 배열('book', 전략/주문에서 재사용)
+    (캐시 규칙: 매도 물량 없으면 불균형 1.0, 한쪽 호가가 없으면 스프레드 0)
+    """
+    entry = analyze({'bids': bids, 'asks': asks}, book=book)
+    if entry['ask_total_volume'] <= 0:
+        entry['imbalance_ratio'] = 1.0
+    if not (bids and asks):
+        entry['spread'] = 0
+    entry.update({'bids': bids, 'asks': asks, 'timestamp': timestamp})
+    return entry
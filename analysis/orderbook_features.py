@@ -0,0 +1,262 @@
+"""
+호가창 특성 시계열 (종목별 고정 크기 링 버퍼)
+- 스냅샷마다 불균형, 스프레드(bp), 중간가 ±0.5%/±1% 잔량, 벽 개수, 주문 흐름 불균형(OFI),
+  총 물량을 기록
+- 롤링 평균/표준편차(누적합 갱신)와 EWMA 기준선을 스냅샷당 고정 비용으로 유지
+- 이상 패턴(스프레드/물량 급등)을 직전 스냅샷 1개가 아닌 최근 구간 분포 대비로 판단
+"""
+
+import threading
+import time
+from typing import Dict, Optional
+
+import numpy as np
+
+from analysis import orderbook_analytics
+import config
+
+FEATURES = (
+    'imbalance',        # 매수/매도 총 물량 비율
+    'spread_bps',       # 스프레드 (중간가 대비 bp)
+    'bid_depth_50',     # 중간가 -0.5% 이내 매수 잔량
+    'ask_depth_50',     # 중간가 +0.5% 이내 매도 잔량
+    'bid_depth_100',    # 중간가 -1% 이내 매수 잔량
+    'ask_depth_100',    # 중간가 +1% 이내 매도 잔량
+    'wall_count',       # 매수 + 매도 벽 개수
+    'ofi',              # 직전 스냅샷 대비 최우선 호가 주문 흐름 불균형
+    'total_volume',     # 매수 + 매도 총 물량
+)
+FEATURE_INDEX = {name: i for i, name in enumerate(FEATURES)}
+
+_DEPTH_BPS = (50, 100)
+
+
+def order_flow_imbalance(previous: tuple, current: tuple) -> float:
+    """
+    최우선 호가 주문 흐름 불균형 (Cont-Kukanov-Stoikov)
+    Args:
+        previous/current: (최우선 매수가, 매수 잔량, 최우선 매도가, 매도 잔량)
+    Returns:
+        양수 = 매수 압력 (매수 잔량 증가/매도 잔량 감소), 음수 = 매도 압력
+    """
+    prev_bid, prev_bid_qty, prev_ask, prev_ask_qty = previous
+    bid, bid_qty, ask, ask_qty = current
+    flow = 0.0
+    if bid >= prev_bid:
+        flow += bid_qty
+    if bid <= prev_bid:
+        flow -= prev_bid_qty
+    if ask <= prev_ask:
+        flow -= ask_qty
+    if ask >= prev_ask:
+        flow += prev_ask_qty
+    return flow
+
+
+class _Series:
+    """종목 1개의 링 버퍼 + 롤링/EWMA 통계"""
+
+    __slots__ = ('values', 'timestamps', 'pos', 'count', 'sum', 'sumsq', 'ewma', 'ewm_var', 'last_top')
+
+    def __init__(self, window: int):
+        width = len(FEATURES)
+        self.values = np.zeros((window, width))
+        self.timestamps = np.zeros(window)
+        self.pos = 0
+        self.count = 0
+        self.sum = np.zeros(width)
+        self.sumsq = np.zeros(width)
+        self.ewma: Optional[np.ndarray] = None
+        self.ewm_var = np.zeros(width)
+        self.last_top: Optional[tuple] = None
+
+    def mean_std(self):
+        mean = self.sum / self.count
+        std = np.sqrt(np.maximum(self.sumsq / self.count - mean * mean, 0.0))
+        # 누적합 계산 오차 수준의 분산은 0으로 간주 (일정한 값에서 z-score 폭주 방지)
+        std[std <= 1e-9 * np.maximum(np.abs(mean), 1.0)] = 0.0
+        return mean, std
+
+    def push(self, row: np.ndarray, timestamp: float, alpha: float):
+        window = self.values.shape[0]
+        if self.count == window:
+            old = self.values[self.pos]
+            self.sum -= old
+            self.sumsq -= old * old
+        else:
+            self.count += 1
+        self.values[self.pos] = row
+        self.timestamps[self.pos] = timestamp
+        self.sum += row
+        self.sumsq += row * row
+        self.pos = (self.pos + 1) % window
+        if self.pos == 0:
+            # 한 바퀴마다 누적합 재계산 (부동소수점 오차 누적 방지, 분할 상환 고정 비용)
+            self.sum = self.values.sum(axis=0)
+            self.sumsq = (self.values * self.values).sum(axis=0)
+
+        if self.ewma is None:
+            self.ewma = row.copy()
+        else:
+            delta = row - self.ewma
+            self.ewma += alpha * delta
+            self.ewm_var = (1 - alpha) * (self.ewm_var + alpha * delta * delta)
+
+    def ordered(self) -> np.ndarray:
+        """시간순 (오래된 것부터) 특성 행렬"""
+        if self.count < self.values.shape[0]:
+            return self.values[:self.count].copy()
+        return np.roll(self.values, -self.pos, axis=0)
+
+
+class OrderbookFeatureHistory:
+    """종목별 호가창 특성 시계열 (스레드 안전)"""
+
+    def __init__(self, window: int = None, halflife: float = None, min_periods: int = None):
+        """
+        Args:
+            window: 종목별 보관 스냅샷 수 (기본: config.ORDERBOOK_FEATURE_WINDOW)
+            halflife: EWMA 반감기 (스냅샷 수, 기본: config.ORDERBOOK_FEATURE_HALFLIFE)
+            min_periods: z-score 판단 최소 스냅샷 수 (기본: config.ORDERBOOK_FEATURE_MIN_PERIODS)
+        """
+        self.window = window or config.ORDERBOOK_FEATURE_WINDOW
+        halflife = halflife or config.ORDERBOOK_FEATURE_HALFLIFE
+        self.alpha = 1 - 0.5 ** (1 / halflife)
+        self.min_periods = min(min_periods or config.ORDERBOOK_FEATURE_MIN_PERIODS, self.window)
+        self._series: Dict[str, _Series] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def extract(analysis: Dict) -> np.ndarray:
+        """orderbook_analytics.analyze/cache_entry 결과 → 특성 벡터 (OFI 제외)"""
+        book = analysis.get('book')
+        if book is None:
+            book = orderbook_analytics.parse_orderbook(analysis)
+        depth = analysis.get('depth_bps') or {}
+        if not all(bps in depth for bps in _DEPTH_BPS):
+            depth = orderbook_analytics.depth_at_bps(book, _DEPTH_BPS)
+
+        mid = book.mid_price
+        spread = book.best_ask - book.best_bid if (book.bid_prices.size and book.ask_prices.size) else 0.0
+        walls = len(analysis.get('bid_walls') or []) + len(analysis.get('ask_walls') or [])
+
+        return np.array([
+            analysis['imbalance_ratio'],
+            spread / mid * 10000 if mid > 0 else 0.0,
+            depth[50]['bid'],
+            depth[50]['ask'],
+            depth[100]['bid'],
+            depth[100]['ask'],
+            walls,
+            0.0,
+            analysis['bid_total_volume'] + analysis['ask_total_volume'],
+        ], dtype=np.float64)
+
+    @staticmethod
+    def _top(analysis: Dict) -> Optional[tuple]:
+        book = analysis.get('book')
+        if book is None or not (book.bid_prices.size and book.ask_prices.size):
+            return None
+        return (book.best_bid, float(book.bid_quantities[0]), book.best_ask, float(book.ask_quantities[0]))
+
+    def update(self, symbol: str, analysis: Dict, timestamp: float = None) -> Dict:
+        """
+        스냅샷 추가 - z-score/기준선은 추가 전 구간 기준 (급등이 자기 자신을 희석하지 않도록)
+        Args:
+            analysis: orderbook_analytics.analyze/cache_entry 결과
+            timestamp: 스냅샷 시각 (epoch 초, 기본: 현재)
+        Returns:
+            {'features': {이름: 값}, 'zscore': {이름: z}, 'ewma': {이름: 기준선},
+             'ready': 최소 스냅샷 수 충족 여부, 'count': 구간 스냅샷 수}
+        """
+        row = self.extract(analysis)
+        top = self._top(analysis)
+        timestamp = timestamp if timestamp is not None else time.time()
+
+        with self._lock:
+            series = self._series.get(symbol)
+            if series is None:
+                series = self._series[symbol] = _Series(self.window)
+
+            if top is not None and series.last_top is not None:
+                row[FEATURE_INDEX['ofi']] = order_flow_imbalance(series.last_top, top)
+            if top is not None:
+                series.last_top = top
+
+            ready = series.count >= self.min_periods
+            if series.count:
+                mean, std = series.mean_std()
+                zscore = np.divide(row - mean, std, out=np.zeros_like(row), where=std > 0)
+                ewma = series.ewma.copy()
+            else:
+                zscore = np.zeros_like(row)
+                ewma = row.copy()
+            count = series.count
+
+            series.push(row, timestamp, self.alpha)
+
+        return {
+            'features': dict(zip(FEATURES, row.tolist())),
+            'zscore': dict(zip(FEATURES, zscore.tolist())),
+            'ewma': dict(zip(FEATURES, ewma.tolist())),
+            'ready': ready,
+            'count': count,
+        }
+
+    def baseline(self, symbol: str) -> Optional[Dict]:
+        """
+        현재 구간 통계
+        Returns:
+            {'mean', 'std', 'ewma', 'ewm_std': {이름: 값}, 'count'} (기록 없으면 None)
+        """
+        with self._lock:
+            series = self._series.get(symbol)
+            if series is None or not series.count:
+                return None
+            mean, std = series.mean_std()
+            return {
+                'mean': dict(zip(FEATURES, mean.tolist())),
+                'std': dict(zip(FEATURES, std.tolist())),
+                'ewma': dict(zip(FEATURES, series.ewma.tolist())),
+                'ewm_std': dict(zip(FEATURES, np.sqrt(series.ewm_var).tolist())),
+                'count': series.count,
+            }
+
+    def zscore(self, symbol: str, feature: str, value: float) -> Optional[float]:
+        """value 의 현재 구간 대비 z-score (기록 없거나 표준편차 0이면 None)"""
+        with self._lock:
+            series = self._series.get(symbol)
+            if series is None or not series.count:
+                return None
+            mean, std = series.mean_std()
+        i = FEATURE_INDEX[feature]
+        return float((value - mean[i]) / std[i]) if std[i] > 0 else None
+
+    def series(self, symbol: str, feature: str = None):
+        """
+        시간순 시계열
+        Returns:
+            (timestamps, values) - feature 지정 시 1차원, 아니면 (n, len(FEATURES))
+        """
+        with self._lock:
+            series = self._series.get(symbol)
+            if series is None:
+                return np.zeros(0), np.zeros((0, len(FEATURES))) if feature is None else np.zeros(0)
+            values = series.ordered()
+            if series.count < self.window:
+                timestamps = series.timestamps[:series.count].copy()
+            else:
+                timestamps = np.roll(series.timestamps, -series.pos)
+        if feature is not None:
+            values = values[:, FEATURE_INDEX[feature]]
+        return timestamps, values
+
+    def reset(self, symbol: str):
+        """종목 기록 삭제 (호가 단계 수 변경 등 분포가 바뀐 경우)"""
+        with self._lock:
+            self._series.pop(symbol, None)
+
+    def ready(self, symbol: str) -> bool:
+        with self._lock:
+            series = self._series.get(symbol)
+            return series is not None and series.count >= self.min_periods
@@ -11,14 +11,18 @@ import json
 from urllib.parse import urlencode
 from typing import Dict, List, Optional, Any
 import config
+from utils import metrics
+from utils.rate_limiter import PUBLIC_LIMITER, PRIVATE_LIMITER
 
 
 class BithumbAPI:
     """빗썸 REST API 클라이언트"""
 
-    BASE_URL = "https://api.bithumb.com"
+    BASE_URL = config.BITHUMB_API_URL
 
-    def __init__(self, api_key: str = None, secret_key: str = None):
+    def __init__(self, api_key: str = None, secret_key: str = None, base_url: str = None):
+        if base_url:
+            self.BASE_URL = base_url.rstrip('/')
         self.api_key = api_key or config.BITHUMB_API_KEY
         self.secret_key = secret_key or config.BITHUMB_SECRET_KEY
         self.session = requests.Session()
@@ -54,7 +58,24 @@ class BithumbAPI:
         }
 
     def _request(self, method: str, endpoint: str, params: Dict = None, signed: bool = False) -> Dict:
-        """HTTP 요청 처리"""
+        """HTTP 요청 처리 (지연시간 메트릭 기록)"""
+        # 심볼이 포함된 경로는 라벨 카디널리티를 줄이기 위해 앞부분만 사용
+        metric_endpoint = '/'.join(endpoint.split('/')[:3])
+
+        # 프로세스 공유 속도 제한
+        (PRIVATE_LIMITER if signed else PUBLIC_LIMITER).acquire()
+
+        start = time.perf_counter()
+        result = self._send(method, endpoint, params, signed)
+        metrics.API_REQUEST_SECONDS.observe(time.perf_counter() - start, endpoint=metric_endpoint)
+
+        if result.get('status') != '0000':
+            metrics.API_ERRORS.inc(endpoint=metric_endpoint)
+
+        return result
+
+    def _send(self, method: str, endpoint: str, params: Dict = None, signed: bool = False) -> Dict:
+        """HTTP 요청 전송"""
         url = f"{self.BASE_URL}{endpoint}"
 
         if signed:
@@ -103,14 +124,16 @@ class BithumbAPI:
         endpoint = f"/public/ticker/{symbol}_KRW"
         return self._request('GET', endpoint)
 
-    def get_orderbook(self, symbol: str) -> Dict:
+    def get_orderbook(self, symbol: str, count: int = None) -> Dict:
         """
         호가 정보 조회 (매수/매도 호가)
         Args:
             symbol: 코인 심볼 (예: "BTC")
+            count: 호가 단계 수 (1-30, 기본 30)
         """
         endpoint = f"/public/orderbook/{symbol}_KRW"
-        return self._request('GET', endpoint)
+        params = {'count': count} if count else None
+        return self._request('GET', endpoint, params)
 
     def get_transaction_history(self, symbol: str, count: int = 20) -> Dict:
         """
@@ -256,9 +279,11 @@ class BithumbWebSocket:
     실시간 데이터 수신용
     """
 
-    WS_URL = "wss://pubwss.bithumb.com/pub/ws"
+    WS_URL = config.BITHUMB_WS_URL
 
-    def __init__(self):
+    def __init__(self, ws_url: str = None):
+        if ws_url:
+            self.WS_URL = ws_url
         self.ws = None
         self.subscriptions = []
 
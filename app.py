@@ -9,6 +9,7 @@ import sys
 from dashboard import app as dashboard_app
 from core.trading_engine_v2 import TradingEngineV2
 from database.init_db import main as init_database
+import config
 
 def run_trading_engine():
     """백그라운드에서 자동매매 엔진 실행"""
@@ -21,28 +22,20 @@ def run_trading_engine():
         except Exception as e:
             print(f"⚠️  DB 초기화 스킵: {str(e)}")
 
-        # 초기 데이터 수집 (OHLCV 데이터가 없으면)
-        from database import SessionLocal, OHLCVData
-        db = SessionLocal()
-        ohlcv_count = db.query(OHLCVData).count()
-        db.close()
+        if config.ENGINE_SHARDS != 1:
+            # 멀티 프로세스 모드 - 수집/시그널은 워커(샤드별 부트스트랩 포함), 대시보드 프로세스는 주문만
+            from core.sharding import ShardCoordinator
+            engine = ShardCoordinator(bootstrap=True)
+        else:
+            # 트레이딩 엔진 생성 (10초 주기로 빠른 거래)
+            engine = TradingEngineV2()
 
-        if ohlcv_count < 50:
-            print(f"📊 OHLCV 데이터 부족 ({ohlcv_count}개) - 초기 수집 시작...")
-            from collect_initial_data import collect_historical_candles, collect_realtime_data
-            import config
+            # 과거 캔들 부트스트랩 (부족한 종목만 병렬 수집, 준비된 종목부터 거래 시작)
+            from collectors.bootstrap import HistoryBootstrap
+            engine.require_bootstrap()
+            bootstrap = HistoryBootstrap(engine.symbols, on_ready=engine.mark_symbol_ready)
+            bootstrap.start()
 
-            # 각 코인별로 최근 100개 캔들 수집
-            for symbol in config.TARGET_PAIRS:
-                for tf in ['1m', '5m', '15m']:
-                    collect_historical_candles(symbol, tf, 100)
-                    import time
-                    time.sleep(0.5)
-
-            print("✅ 초기 데이터 수집 완료")
-
-        # 트레이딩 엔진 실행 (10초 주기로 빠른 거래)
-        engine = TradingEngineV2()
         engine.run(interval=10)
     except Exception as e:
         print(f"❌ 자동매매 엔진 에러: {str(e)}")
@@ -0,0 +1,4 @@
+"""
+핫패스 성능 벤치마크
+거래소/운영 DB 없이 합성 데이터로 실행
+"""
@@ -0,0 +1,181 @@
+"""
+import 시간 프로파일러
+모듈별로 새 인터프리터에서 `python -X importtime`을 실행해 시작 비용을 측정
+
+사용법:
+    python -m benchmarks.import_profile                              # 결과 출력 + import_profile.json 저장
+    python -m benchmarks.import_profile --compare baseline.json      # 기준선 대비 회귀 검사
+    python -m benchmarks.import_profile --modules database check_status --top 20
+
+import만 수행하므로 DB/거래소에 연결하지 않는다 (엔트리 스크립트는 모듈 대신 측정 대상에서 제외).
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from benchmarks.run_benchmarks import _git_commit
+
+# 시작 비용을 추적할 모듈
+DEFAULT_MODULES = [
+    'config',
+    'database',
+    'api',
+    'utils.telegram_notifier',
+    'core.risk_manager',
+    'core.order_executor',
+    'strategies',
+    'strategies.strategy_selector',
+    'analysis.indicators',
+    'core.trading_engine_v2',
+]
+
+# 지연 로딩 대상 - 아래 모듈에서 import되면 회귀로 판정
+FORBIDDEN_IMPORTS = {
+    'config': ['sqlalchemy'],
+    'database': ['psycopg', 'psycopg2'],
+    'api': ['sqlalchemy', 'pandas'],
+    'core.risk_manager': ['requests', 'pandas'],
+    'strategies': ['pandas'],
+    'core.trading_engine_v2': ['sklearn', 'ta', 'psycopg', 'psycopg2'],
+}
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def profile_module(module: str) -> Dict:
+    """
+    새 인터프리터에서 모듈 import 시간 측정
+    Returns:
+        {'total_ms', 'imports': {모듈: (self_ms, cumulative_ms)}}
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{module} import 실패:\n{proc.stderr[-2000:]}")
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        _, self_us, cumulative_us, raw_name = line.replace('import time:', '|', 1).split('|')
+        name = raw_name.strip()
+        depth = (len(raw_name) - len(raw_name.lstrip())) // 2
+        entries.append((name, int(self_us) / 1000, int(cumulative_us) / 1000, depth))
+
+    # importtime은 후위 순서 - 대상 모듈 직전의 더 깊은 항목이 하위 import
+    target = next(i for i, entry in enumerate(entries) if entry[0] == module)
+    imports = {module: entries[target][1:3]}
+    for name, self_ms, cumulative_ms, depth in reversed(entries[:target]):
+        if depth <= entries[target][3]:
+            break
+        imports[name] = (self_ms, cumulative_ms)
+
+    return {'total_ms': entries[target][2], 'imports': imports}
+
+
+def run(modules: List[str], repeat: int, top: int) -> Dict:
+    """모듈별 중앙값 import 시간 + 무거운 하위 모듈"""
+    results = {}
+    for module in modules:
+        runs = [profile_module(module) for _ in range(repeat)]
+        last = runs[-1]['imports']
+        heaviest = sorted(
+            ((name, times[1]) for name, times in last.items() if '.' not in name and name != module),
+            key=lambda item: item[1], reverse=True
+        )[:top]
+
+        results[module] = {
+            'total_ms': statistics.median(r['total_ms'] for r in runs),
+            'module_count': len(last),
+            'heaviest': heaviest,
+            'forbidden': [name for name in FORBIDDEN_IMPORTS.get(module, []) if name in last],
+        }
+    return results
+
+
+def print_results(results: Dict, baseline: Optional[Dict] = None):
+    print(f"\n{'모듈':<32}{'import(ms)':>12}{'모듈 수':>10}{'기준선 대비':>14}")
+    print("-" * 68)
+    for module, result in results.items():
+        ratio = ''
+        if baseline and module in baseline and baseline[module]['total_ms'] > 0:
+            ratio = f"{result['total_ms'] / baseline[module]['total_ms']:.2f}x"
+        print(f"{module:<32}{result['total_ms']:>12.1f}{result['module_count']:>10}{ratio:>14}")
+        heavy = ', '.join(f"{name} {ms:.0f}ms" for name, ms in result['heaviest'])
+        if heavy:
+            print(f"    └ {heavy}")
+        if result['forbidden']:
+            print(f"    ⚠️  지연 로딩 대상 import됨: {', '.join(result['forbidden'])}")
+
+
+def find_regressions(results: Dict, baseline: Optional[Dict], threshold: float,
+                     min_delta_ms: float = 20) -> List[str]:
+    """기준선 대비 느려진 모듈 + 지연 로딩 위반"""
+    regressions = [
+        f"{module}: {', '.join(result['forbidden'])} import됨"
+        for module, result in results.items() if result['forbidden']
+    ]
+    for module, result in (results.items() if baseline else []):
+        base = baseline.get(module)
+        if not base:
+            continue
+        if (result['total_ms'] > base['total_ms'] * threshold
+                and result['total_ms'] - base['total_ms'] > min_delta_ms):
+            regressions.append(
+                f"{module}: {base['total_ms']:.1f}ms → {result['total_ms']:.1f}ms"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='import 시간 프로파일')
+    parser.add_argument('--modules', nargs='+', default=DEFAULT_MODULES, help='측정할 모듈')
+    parser.add_argument('--repeat', type=int, default=3, help='모듈별 반복 횟수 (중앙값 사용)')
+    parser.add_argument('--top', type=int, default=5, help='표시할 무거운 하위 패키지 수')
+    parser.add_argument('--output', default='import_profile.json', help='결과 JSON 경로')
+    parser.add_argument('--compare', help='비교할 기준선 JSON 경로')
+    parser.add_argument('--threshold', type=float, default=1.25, help='회귀 판정 배수 (기본 1.25배)')
+    args = parser.parse_args()
+
+    results = run(args.modules, args.repeat, args.top)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+
+    print_results(results, baseline)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'commit': _git_commit(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+        },
+        'results': results
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"결과 저장: {args.output}")
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    if regressions:
+        print(f"\nimport 회귀 {len(regressions)}건:")
+        for line in regressions:
+            print(f"  - {line}")
+        sys.exit(1)
+    print("\nimport 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
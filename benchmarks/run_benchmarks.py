@@ -0,0 +1,520 @@
+"""
+핫패스 벤치마크 실행기
+
+사용법:
+    python -m benchmarks.run_benchmarks                          # 결과 출력 + bench_results.json 저장
+    python -m benchmarks.run_benchmarks --output baseline.json   # 기준선 저장
+    python -m benchmarks.run_benchmarks --compare baseline.json  # 기준선 대비 회귀 검사
+    python -m benchmarks.run_benchmarks --db-url postgresql://... # 로컬 Postgres로 쓰기 측정
+
+거래소 API는 호출하지 않으며, DB 쓰기 벤치마크는 기본적으로 SQLite 메모리 DB를 사용한다.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from benchmarks import synthetic
+import config
+
+SEED = 42
+INDICATOR_BARS = [200, 2000, 20000]
+UNIVERSE_SIZES = [110, 1000]
+POSITION_COUNTS = [5, 50, 500]
+OHLCV_BATCH_ROWS = 500
+
+
+# ===========================
+# 측정 도구
+# ===========================
+
+def measure(func: Callable, number: int = 100, repeat: int = 5, items: int = 1) -> Dict:
+    """
+    함수 실행 시간 측정
+    Args:
+        func: 측정할 함수 (인자 없음)
+        number: 반복당 호출 횟수
+        repeat: 반복 횟수
+        items: 호출당 처리 항목 수 (처리량 계산용)
+    Returns:
+        호출당 통계 (ms)
+    """
+    func()  # 워밍업
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+
+    mean = statistics.mean(samples)
+    return {
+        'number': number,
+        'repeat': repeat,
+        'mean_ms': mean * 1000,
+        'median_ms': statistics.median(samples) * 1000,
+        'min_ms': min(samples) * 1000,
+        'stdev_ms': (statistics.stdev(samples) * 1000) if len(samples) > 1 else 0.0,
+        'items_per_sec': items / mean if mean > 0 else 0.0
+    }
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       stderr=subprocess.DEVNULL).decode('utf-8').strip()
+    except Exception:
+        return 'unknown'
+
+
+# ===========================
+# 로컬 DB
+# ===========================
+
+def make_local_session(db_url: str):
+    """
+    벤치마크 전용 DB 세션
+    SQLite는 스키마가 없으므로 스키마를 제거하고 JSONB를 JSON으로 컴파일
+    """
+    from sqlalchemy import create_engine, text
+    from sqlalchemy.dialects.postgresql import JSONB
+    from sqlalchemy.ext.compiler import compiles
+    from sqlalchemy.orm import sessionmaker
+    from database.models import Base
+
+    if db_url.startswith('sqlite'):
+        @compiles(JSONB, 'sqlite')
+        def _compile_jsonb_sqlite(element, compiler, **kw):
+            return 'JSON'
+
+        engine = create_engine(db_url, execution_options={
+            'schema_translate_map': {config.DB_SCHEMA: None}
+        })
+    else:
+        engine = create_engine(db_url, connect_args={
+            'options': f'-c search_path={config.DB_SCHEMA}'
+        })
+        with engine.connect() as conn:
+            conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {config.DB_SCHEMA}"))
+            conn.commit()
+
+    Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+
+# ===========================
+# 벤치마크
+# ===========================
+
+def bench_orderbook(results: Dict):
+    """호가창 분석 (30단계) - 원본 호가 분석 / 파싱 / 파싱된 호가 재사용 분석"""
+    from analysis import orderbook_analytics
+    from collectors.orderbook_collector import OrderbookCollector
+
+    rng = np.random.default_rng(SEED)
+    collector = OrderbookCollector()
+    books = [synthetic.make_orderbook(rng, mid_price=float(rng.uniform(1, 100000)), levels=30)
+             for _ in range(64)]
+    state = {'i': 0}
+
+    def analyze():
+        book = books[state['i'] % len(books)]
+        state['i'] += 1
+        collector.analyze_orderbook(book)
+
+    def walls():
+        book = books[state['i'] % len(books)]
+        state['i'] += 1
+        collector._detect_walls(book['bids'], 'bid')
+
+    parsed = [orderbook_analytics.parse_orderbook(book) for book in books]
+
+    def parse():
+        book = books[state['i'] % len(books)]
+        state['i'] += 1
+        orderbook_analytics.parse_orderbook(book)
+
+    def analyze_parsed():
+        i = state['i'] % len(books)
+        state['i'] += 1
+        orderbook_analytics.analyze(books[i], book=parsed[i])
+
+    results['orderbook.analyze_orderbook[30]'] = measure(analyze, number=2000)
+    results['orderbook.detect_walls[30]'] = measure(walls, number=2000)
+    results['orderbook.parse[30]'] = measure(parse, number=2000)
+    results['orderbook.analyze_parsed[30]'] = measure(analyze_parsed, number=2000)
+
+
+def _tick_aligned_book(rng: np.random.Generator, mid_price: float, levels: int = 30) -> Dict:
+    """빗썸 호가 단위에 맞춘 합성 호가창 (수량 분포는 synthetic.make_orderbook 과 동일)"""
+    from core.execution_pricing import round_to_tick, step_ticks
+
+    book = synthetic.make_orderbook(rng, mid_price=mid_price, levels=levels)
+    ask, bid = round_to_tick(mid_price, 'BUY'), round_to_tick(mid_price, 'SELL')
+    if ask == bid:
+        ask = step_ticks(ask, 'BUY', 1)
+    for level in book['asks']:
+        level['price'] = repr(ask)
+        ask = step_ticks(ask, 'BUY', 1)
+    for level in book['bids']:
+        level['price'] = repr(bid)
+        bid = step_ticks(bid, 'SELL', 1)
+    return book
+
+
+def bench_execution(results: Dict):
+    """
+    지정가 산정 - 기존 방식(현재가 ±0.5%, 원 단위 반올림) 대비 체결 비용
+    비용: 중간가 대비 예상 평균 체결가 (bp), 무효 주문: 호가 단위 불일치/0원 가격
+    동일 수량 비용: 두 방식 모두 체결되는 호가창에서 작은 쪽 체결 수량 기준 비용 (깊이 차이 제외)
+    """
+    from core.execution_pricing import ExecutionPricer, walk_levels, tick_size
+    from decimal import Decimal as D
+
+    rng = np.random.default_rng(SEED)
+    pricer = ExecutionPricer(max_slippage=1.0)
+    mids = np.exp(rng.uniform(np.log(0.05), np.log(200000), 200))
+    books = [_tick_aligned_book(rng, float(mid)) for mid in mids]
+
+    for krw in (50_000, 2_000_000):
+        stats = {'old': [], 'new': []}
+        matched = {'old': [], 'new': []}
+        invalid = {'old': 0, 'new': 0}
+        deployed = {'old': 0.0, 'new': 0.0}
+
+        for book in books:
+            best_bid, best_ask = float(book['bids'][0]['price']), float(book['asks'][0]['price'])
+            mid = (best_bid + best_ask) / 2
+            asks = [(float(level['price']), float(level['quantity'])) for level in book['asks']]
+
+            old_price = round(best_ask * 1.005, 0)
+            quote = pricer.quote('SYN', 'BUY', best_ask, krw=krw, orderbook=book)
+
+            fills = {}
+            for name, price, units in (('old', old_price, krw / old_price if old_price > 0 else 0),
+                                       ('new', quote['price'], quote['units'])):
+                if price <= 0 or D(repr(price)) % tick_size(price) != 0:
+                    invalid[name] += 1
+                    continue
+                # 지정가 이하 호가만 체결
+                levels = [lv for lv in asks if lv[0] <= price]
+                filled, notional, _, _, _ = walk_levels(levels, units=units)
+                if filled > 0:
+                    stats[name].append((notional / filled - mid) / mid * 10000)
+                    deployed[name] += notional / krw
+                    fills[name] = (levels, filled)
+
+            if len(fills) == 2:
+                size = min(filled for _, filled in fills.values())
+                for name, (levels, _) in fills.items():
+                    filled, notional, _, _, _ = walk_levels(levels, units=size)
+                    matched[name].append((notional / filled - mid) / mid * 10000)
+
+        timing = measure(lambda: pricer.quote('SYN', 'BUY', 1000.0, krw=krw, orderbook=books[0]), number=2000)
+        for name in ('old', 'new'):
+            timing[f'{name}_cost_bps'] = float(np.mean(stats[name])) if stats[name] else None
+            timing[f'{name}_matched_cost_bps'] = float(np.mean(matched[name])) if matched[name] else None
+            timing[f'{name}_invalid_orders'] = invalid[name]
+            timing[f'{name}_budget_filled'] = deployed[name] / len(books)
+        results[f'execution.quote[{krw}]'] = timing
+
+        timing['matched_books'] = len(matched['new'])
+        print(f"  {krw:>9,}원: 비용 {timing['old_cost_bps'] or 0:.1f}bp → {timing['new_cost_bps'] or 0:.1f}bp "
+              f"(동일 수량 {timing['old_matched_cost_bps'] or 0:.1f}bp → {timing['new_matched_cost_bps'] or 0:.1f}bp, "
+              f"{len(matched['new'])}개 호가창), "
+              f"무효 주문 {invalid['old']} → {invalid['new']}/{len(books)}, "
+              f"예산 체결률 {timing['old_budget_filled']:.1%} → {timing['new_budget_filled']:.1%}")
+
+
+def bench_indicators(results: Dict):
+    """지표 계산 (200/2,000/20,000봉)"""
+    from analysis.indicators import IndicatorEngine
+
+    rng = np.random.default_rng(SEED)
+    engine = IndicatorEngine()
+
+    for bars in INDICATOR_BARS:
+        df = synthetic.make_ohlcv(rng, bars)
+        number = max(2, 20000 // bars)
+
+        results[f'indicators.rsi[{bars}]'] = measure(lambda: engine.calculate_rsi(df, 14), number=number)
+        results[f'indicators.macd[{bars}]'] = measure(lambda: engine.calculate_macd(df), number=number)
+        results[f'indicators.bollinger[{bars}]'] = measure(lambda: engine.calculate_bollinger_bands(df), number=number)
+        results[f'indicators.atr[{bars}]'] = measure(lambda: engine.calculate_atr(df, 14), number=number)
+        results[f'indicators.adx[{bars}]'] = measure(lambda: engine.calculate_adx(df, 14), number=number)
+        results[f'indicators.stochastic[{bars}]'] = measure(lambda: engine.calculate_stochastic(df), number=number)
+
+        # 전체 패스 (DB 조회 대신 합성 DataFrame 주입)
+        engine.get_ohlcv_data = lambda symbol, timeframe, limit=200, _df=df: _df
+        results[f'indicators.calculate_all[{bars}]'] = measure(
+            lambda: engine.calculate_all_indicators('SYN', '15m'), number=number
+        )
+
+
+def bench_strategies(results: Dict):
+    """전략 시그널 생성 처리량 (유니버스 전체)"""
+    from strategies.hyper_scalping_strategy import HyperScalpingStrategy
+    from strategies.moon_shot_strategy import MoonShotStrategy
+    from strategies.pre_pump_hunter import PrePumpHunter
+    from strategies.orderbook_scalping_strategy import OrderbookScalpingStrategy
+    from analysis import orderbook_analytics
+
+    rng = np.random.default_rng(SEED)
+
+    for size in UNIVERSE_SIZES:
+        symbols = synthetic.make_universe(size)
+        snapshot = synthetic.make_market_snapshot(rng, symbols)
+
+        for symbol in symbols:
+            # 엔진 호가창 캐시 항목과 같은 형태 (파싱된 배열 포함)
+            book = synthetic.make_orderbook(rng, mid_price=snapshot[symbol]['market_data']['current_price'], levels=30)
+            snapshot[symbol]['market_data']['orderbook'] = orderbook_analytics.cache_entry(
+                book['bids'], book['asks'], datetime.now()
+            )
+
+        for strategy_cls in (HyperScalpingStrategy, MoonShotStrategy, PrePumpHunter, OrderbookScalpingStrategy):
+            strategy = strategy_cls()
+
+            def run_universe(strategy=strategy):
+                for symbol in symbols:
+                    entry = snapshot[symbol]
+                    strategy.generate_signal(symbol, entry['market_data'], dict(entry['indicators']))
+
+            results[f'strategies.{strategy_cls.__name__}[{size}]'] = measure(
+                run_universe, number=5, items=size
+            )
+
+            if not strategy.supports_batch:
+                continue
+
+            # 일괄 스크리닝 (엔진 _build_signal_columns 와 같은 컬럼 구성)
+            columns = {
+                'price': np.array([snapshot[s]['market_data']['current_price'] for s in symbols], dtype=float),
+                'volume': np.array([snapshot[s]['market_data']['current_volume'] for s in symbols], dtype=float),
+            }
+            defaults = {'volume_ratio': 1.0, 'rsi': 50, 'price_change_5m': 0, 'price_change_15m': 0,
+                        'macd': 0, 'macd_signal': 0, 'bb_position': 0.5, 'orderbook_imbalance': 1.0}
+            for name, default in defaults.items():
+                columns[name] = np.array([snapshot[s]['indicators'].get(name, default) for s in symbols], dtype=float)
+
+            def run_batch(strategy=strategy_cls(), columns=columns):
+                result = strategy.generate_signals_batch(symbols, columns)
+                strategy.signals_from_batch(symbols, columns, result)
+
+            results[f'strategies.{strategy_cls.__name__}.batch[{size}]'] = measure(
+                run_batch, number=5, items=size
+            )
+
+
+def bench_position_exits(results: Dict, session_factory):
+    """오픈 포지션 청산 판단 (N개)"""
+    from core.risk_manager import RiskManager
+    from database import Position
+
+    rng = np.random.default_rng(SEED)
+    risk_manager = RiskManager()
+    risk_manager.db.close()
+    risk_manager.db = session_factory()
+
+    for count in POSITION_COUNTS:
+        positions = []
+        prices = []
+        for i in range(count):
+            entry = float(rng.uniform(10, 1000))
+            positions.append(Position(
+                symbol=f'SYN{i:04d}',
+                position_type='LONG',
+                entry_price=Decimal(str(entry)),
+                quantity=Decimal('10'),
+                stop_loss=Decimal(str(entry * 0.985)),
+                take_profit=Decimal(str(entry * 1.2)),
+                status='OPEN',
+                opened_at=datetime.now()
+            ))
+            prices.append(entry * float(rng.uniform(0.97, 1.03)))
+
+        def evaluate():
+            for position, price in zip(positions, prices):
+                risk_manager.update_position_metrics(position, price)
+                risk_manager.should_close_position(position, price)
+
+        results[f'positions.exit_evaluation[{count}]'] = measure(
+            evaluate, number=max(1, 500 // count), repeat=3, items=count
+        )
+
+
+def bench_ohlcv_writes(results: Dict, session_factory):
+    """OHLCV 대량 쓰기 (행 단위 ORM vs 벌크 insert)"""
+    from sqlalchemy import insert
+    from database import OHLCVData
+
+    session = session_factory()
+    state = {'batch': 0}
+    base_time = datetime(2025, 1, 1)
+
+    def make_rows(symbol: str) -> List[Dict]:
+        offset = state['batch'] * OHLCV_BATCH_ROWS
+        state['batch'] += 1
+        return [
+            {
+                'symbol': symbol,
+                'timeframe': '1m',
+                'timestamp': base_time + timedelta(minutes=offset + i),
+                'open': Decimal('100.5'),
+                'high': Decimal('101.0'),
+                'low': Decimal('100.0'),
+                'close': Decimal('100.7'),
+                'volume': Decimal('1234.5678')
+            }
+            for i in range(OHLCV_BATCH_ROWS)
+        ]
+
+    def orm_row_by_row():
+        # collect_initial_data.collect_historical_candles 와 동일한 패턴
+        for row in make_rows('ORM'):
+            exists = session.query(OHLCVData).filter(
+                OHLCVData.symbol == row['symbol'],
+                OHLCVData.timeframe == row['timeframe'],
+                OHLCVData.timestamp == row['timestamp']
+            ).first()
+            if not exists:
+                session.add(OHLCVData(**row))
+        session.commit()
+
+    def core_bulk():
+        session.execute(insert(OHLCVData), make_rows('BULK'))
+        session.commit()
+
+    results[f'db.ohlcv_orm_row_by_row[{OHLCV_BATCH_ROWS}]'] = measure(
+        orm_row_by_row, number=1, repeat=3, items=OHLCV_BATCH_ROWS
+    )
+    results[f'db.ohlcv_core_bulk_insert[{OHLCV_BATCH_ROWS}]'] = measure(
+        core_bulk, number=3, repeat=3, items=OHLCV_BATCH_ROWS
+    )
+    session.close()
+
+
+BENCHMARKS = ['orderbook', 'execution', 'indicators', 'strategies', 'positions', 'db']
+
+
+def run(selected: List[str], db_url: str) -> Dict:
+    """선택된 벤치마크 실행"""
+    results = {}
+    session_factory = None
+
+    if 'positions' in selected or 'db' in selected:
+        # 세션 팩토리 (같은 엔진 공유)
+        session = make_local_session(db_url)
+        bind = session.get_bind()
+        session.close()
+
+        from sqlalchemy.orm import sessionmaker
+        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=bind)
+
+    steps = {
+        'orderbook': lambda: bench_orderbook(results),
+        'execution': lambda: bench_execution(results),
+        'indicators': lambda: bench_indicators(results),
+        'strategies': lambda: bench_strategies(results),
+        'positions': lambda: bench_position_exits(results, session_factory),
+        'db': lambda: bench_ohlcv_writes(results, session_factory),
+    }
+
+    for name in BENCHMARKS:
+        if name in selected:
+            print(f"[{name}] 실행 중...")
+            steps[name]()
+
+    return results
+
+
+def print_results(results: Dict, baseline: Optional[Dict] = None):
+    """결과 표 출력"""
+    print("\n" + "=" * 90)
+    header = f"{'benchmark':<50} {'mean(ms)':>12} {'items/s':>14}"
+    if baseline:
+        header += f" {'vs base':>10}"
+    print(header)
+    print("-" * 90)
+
+    for name, stats in results.items():
+        line = f"{name:<50} {stats['mean_ms']:>12.4f} {stats['items_per_sec']:>14,.0f}"
+        if baseline and name in baseline:
+            ratio = stats['mean_ms'] / baseline[name]['mean_ms'] if baseline[name]['mean_ms'] > 0 else 0
+            line += f" {ratio:>9.2f}x"
+        print(line)
+    print("=" * 90)
+
+
+def find_regressions(results: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """기준선 대비 threshold 배 이상 느려진 벤치마크"""
+    regressions = []
+    for name, stats in results.items():
+        base = baseline.get(name)
+        if not base or base['mean_ms'] <= 0:
+            continue
+        ratio = stats['mean_ms'] / base['mean_ms']
+        if ratio > threshold:
+            regressions.append(f"{name}: {base['mean_ms']:.4f}ms → {stats['mean_ms']:.4f}ms ({ratio:.2f}x)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='핫패스 벤치마크')
+    parser.add_argument('--only', nargs='+', choices=BENCHMARKS, default=BENCHMARKS,
+                        help='실행할 벤치마크 그룹')
+    parser.add_argument('--db-url', default='sqlite://',
+                        help='DB 쓰기 벤치마크 대상 (기본: SQLite 메모리)')
+    parser.add_argument('--output', default='bench_results.json', help='결과 JSON 경로')
+    parser.add_argument('--compare', help='비교할 기준선 JSON 경로')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='회귀 판정 배수 (기본 1.25배)')
+    args = parser.parse_args()
+
+    results = run(args.only, args.db_url)
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'commit': _git_commit(),
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'numpy': np.__version__,
+            'seed': SEED,
+        },
+        'results': results
+    }
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)['results']
+
+    print_results(results, baseline)
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    print(f"결과 저장: {args.output}")
+
+    if baseline:
+        regressions = find_regressions(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n성능 회귀 {len(regressions)}건 (>{args.threshold:.2f}x):")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print("\n성능 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+벤치마크용 합성 데이터
+시드 고정으로 재현 가능한 호가창/OHLCV/종목 유니버스 생성
+"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+def make_universe(count: int) -> List[str]:
+    """합성 종목 심볼 리스트"""
+    return [f"SYN{i:04d}" for i in range(count)]
+
+
+def make_orderbook(rng: np.random.Generator, mid_price: float = 1000.0, levels: int = 30,
+                   wall_probability: float = 0.1) -> Dict:
+    """
+    빗썸 응답 형식의 호가창 생성 (가격/수량은 문자열)
+    Args:
+        rng: 난수 생성기
+        mid_price: 중간가
+        levels: 호가 단계 수
+        wall_probability: 단계별 벽(대량 주문) 발생 확률
+    """
+    tick = max(mid_price * 0.0005, 0.0001)
+
+    def side(direction: int) -> List[Dict]:
+        quantities = rng.lognormal(mean=3.0, sigma=0.8, size=levels)
+        walls = rng.random(levels) < wall_probability
+        quantities[walls] *= rng.uniform(4, 10, size=walls.sum())
+        return [
+            {
+                'price': f"{mid_price + direction * tick * (i + 1):.4f}",
+                'quantity': f"{quantities[i]:.8f}"
+            }
+            for i in range(levels)
+        ]
+
+    return {
+        'symbol': 'SYN',
+        'timestamp': datetime.now(),
+        'bids': side(-1),
+        'asks': side(1),
+    }
+
+
+def make_ohlcv(rng: np.random.Generator, bars: int, start_price: float = 1000.0,
+               volatility: float = 0.002) -> pd.DataFrame:
+    """랜덤워크 OHLCV DataFrame (IndicatorEngine.get_ohlcv_data 형식)"""
+    returns = rng.normal(0, volatility, size=bars)
+    close = start_price * np.exp(np.cumsum(returns))
+    open_ = np.concatenate(([start_price], close[:-1]))
+    spread = np.abs(rng.normal(0, volatility, size=bars)) * close
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    volume = rng.lognormal(mean=8.0, sigma=0.5, size=bars)
+
+    end = datetime(2025, 1, 1)
+    timestamps = [end - timedelta(minutes=bars - i) for i in range(bars)]
+
+    return pd.DataFrame({
+        'timestamp': timestamps,
+        'open': open_,
+        'high': high,
+        'low': low,
+        'close': close,
+        'volume': volume
+    })
+
+
+def make_market_snapshot(rng: np.random.Generator, symbols: List[str]) -> Dict[str, Dict]:
+    """
+    종목별 (market_data, indicators) 스냅샷
+    TradingEngineV2.generate_signal 이 전략에 넘기는 형식과 동일
+    """
+    snapshot = {}
+    for symbol in symbols:
+        price = float(rng.uniform(5, 900))
+        snapshot[symbol] = {
+            'market_data': {
+                'current_price': price,
+                'current_volume': float(rng.lognormal(10, 1)),
+                'orderbook': None
+            },
+            'indicators': {
+                'volume_ratio': float(rng.uniform(0.5, 3.0)),
+                'rsi': float(rng.uniform(20, 85)),
+                'rsi_14': float(rng.uniform(20, 85)),
+                'macd': float(rng.normal(0, 1)),
+                'macd_signal': float(rng.normal(0, 1)),
+                'bb_position': float(rng.uniform(0, 1)),
+                'price_change_5m': float(rng.normal(0, 0.01)),
+                'price_change_15m': float(rng.normal(0, 0.015)),
+                'orderbook_imbalance': float(rng.uniform(0.5, 2.0)),
+            }
+        }
+    return snapshot
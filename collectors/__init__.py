@@ -1,4 +1,6 @@
 from .orderbook_collector import OrderbookCollector
 from .price_collector import PriceCollector
+from .bootstrap import HistoryBootstrap
+from .trade_tape import TradeTape
 
-__all__ = ['OrderbookCollector', 'PriceCollector']
+__all__ = ['OrderbookCollector', 'PriceCollector', 'HistoryBootstrap', 'TradeTape']
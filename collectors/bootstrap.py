@@ -0,0 +1,252 @@
+"""
+콜드 스타트 과거 데이터 부트스트랩
+종목별 과거 캔들을 공유 속도 제한 하에 병렬 수집하고 벌크 저장
+종목의 모든 타임프레임이 준비되는 즉시 준비 완료 콜백 호출
+실패한 수집은 백오프 재시도, 재시도 소진 종목도 준비 완료 처리 (거래 대상에서 영구 제외 방지)
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import func
+
+from api import BithumbAPI
+from database import SessionLocal, OHLCVData, SystemLog
+from collectors.price_collector import CANDLE_INTERVAL_MAP
+from utils import metrics
+import config
+
+
+class HistoryBootstrap:
+    """과거 캔들 병렬 부트스트랩"""
+
+    def __init__(self, symbols: List[str], timeframes: List[str] = None,
+                 candles: int = None, min_rows: int = None, max_workers: int = None,
+                 on_ready: Optional[Callable[[str], None]] = None, retries: int = 2):
+        """
+        Args:
+            symbols: 대상 종목
+            timeframes: 수집 타임프레임 (기본: config.BOOTSTRAP_TIMEFRAMES)
+            candles: 타임프레임별 저장할 최근 캔들 수
+            min_rows: 이 개수 이상 저장된 종목/타임프레임은 수집 생략
+            max_workers: 동시 요청 스레드 수
+            on_ready: 종목 준비 완료 시 호출 (symbol)
+            retries: 요청 실패 시 재시도 횟수
+        """
+        self.symbols = list(dict.fromkeys(symbols))
+        self.timeframes = timeframes or config.BOOTSTRAP_TIMEFRAMES
+        self.candles = candles or config.BOOTSTRAP_CANDLES
+        self.min_rows = min_rows if min_rows is not None else config.BOOTSTRAP_MIN_ROWS
+        self.max_workers = max_workers or config.BOOTSTRAP_WORKERS
+        self.on_ready = on_ready
+        self.retries = retries
+
+        self.api = BithumbAPI()
+        self.ready: Set[str] = set()
+        self.failed: Set[str] = set()  # 재시도 소진 종목 (과거 데이터 없이 준비 완료 처리)
+        self.done = threading.Event()
+
+        self._pending: Dict[str, int] = {}
+        self._round_failed: Set[str] = set()
+        self._lock = threading.Lock()
+
+    # ===========================
+    # 실행
+    # ===========================
+
+    def run(self) -> Set[str]:
+        """
+        부트스트랩 실행 (완료까지 블로킹)
+        - 저장 캔들 조회 실패 시 전체 (종목, 타임프레임) 수집으로 진행 (중복 캔들은 저장 시 무시)
+        - 실패한 (종목, 타임프레임)은 지수 백오프로 BOOTSTRAP_RETRY_ROUNDS 회 재수집
+        - 재시도 소진 종목은 failed 에 남기고 준비 완료 처리 (실시간 수집 데이터로 지표 계산)
+        Returns:
+            준비 완료 종목
+        """
+        started = datetime.now()
+        try:
+            missing = self._find_missing()
+        except Exception as e:
+            self._log_error(f"저장 캔들 조회 실패 - 전체 종목 수집으로 진행: {str(e)}")
+            missing = {symbol: list(self.timeframes) for symbol in self.symbols}
+
+        # 이미 충분한 데이터가 있는 종목은 즉시 준비 완료
+        for symbol in self.symbols:
+            if not missing.get(symbol):
+                self._mark_ready(symbol)
+
+        jobs = [(symbol, tf) for symbol, tfs in missing.items() for tf in tfs]
+        if jobs:
+            print(f"📊 과거 캔들 부트스트랩: {len({symbol for symbol, _ in jobs})}개 종목, {len(jobs)}건 "
+                  f"({self.max_workers}개 동시)")
+
+        saved = 0
+        delay = config.BOOTSTRAP_RETRY_DELAY
+        for attempt in range(config.BOOTSTRAP_RETRY_ROUNDS + 1):
+            if attempt:
+                print(f"🔁 부트스트랩 재시도 {attempt}/{config.BOOTSTRAP_RETRY_ROUNDS}: "
+                      f"{len({symbol for symbol, _ in jobs})}개 종목, {len(jobs)}건 ({delay:.0f}초 후)")
+                time.sleep(delay)
+                delay = min(delay * 2, config.BOOTSTRAP_RETRY_MAX)
+            jobs, round_saved = self._run_jobs(jobs, attempt)
+            saved += round_saved
+            if not jobs:
+                break
+
+        # 재시도 소진 - 거래에서 영구 제외하지 않고 실시간 수집분으로 진행
+        self.failed = {symbol for symbol, _ in jobs}
+        for symbol in sorted(self.failed):
+            self._log_error(f"부트스트랩 재시도 소진: {symbol} "
+                            f"{[tf for s, tf in jobs if s == symbol]} - 실시간 수집 데이터로 거래 시작")
+            self._mark_ready(symbol)
+
+        elapsed = (datetime.now() - started).total_seconds()
+        print(f"✅ 부트스트랩 완료: {len(self.ready) - len(self.failed)}/{len(self.symbols)}개 종목 준비, "
+              f"실패 {len(self.failed)}개, {saved:,}개 캔들 저장 ({elapsed:.1f}초)")
+
+        self.done.set()
+        return self.ready
+
+    def _run_jobs(self, jobs: List[Tuple[str, str]], attempt: int) -> Tuple[List[Tuple[str, str]], int]:
+        """
+        (종목, 타임프레임) 수집 1회 - 종목의 모든 작업이 성공하면 즉시 준비 완료
+        Returns:
+            (실패 작업, 저장 캔들 수)
+        """
+        failed_jobs = []
+        saved = 0
+        with self._lock:
+            self._pending = {}
+            for symbol, _ in jobs:
+                self._pending[symbol] = self._pending.get(symbol, 0) + 1
+            self._round_failed = set()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='bootstrap') as executor:
+            futures = {executor.submit(self._fetch, symbol, tf): (symbol, tf) for symbol, tf in jobs}
+
+            for future in as_completed(futures):
+                symbol, tf = futures[future]
+                try:
+                    rows = future.result()
+                    saved += self._save(rows)
+                except Exception as e:
+                    failed_jobs.append((symbol, tf))
+                    with self._lock:
+                        self._round_failed.add(symbol)
+                    if attempt == 0:
+                        self._log_error(f"부트스트랩 실패 (재시도 예정): {symbol} {tf} - {str(e)}")
+                self._complete(symbol)
+
+        return failed_jobs, saved
+
+    def start(self) -> threading.Thread:
+        """백그라운드 스레드로 실행"""
+        thread = threading.Thread(target=self.run, daemon=True, name='history-bootstrap')
+        thread.start()
+        return thread
+
+    # ===========================
+    # 내부
+    # ===========================
+
+    def _find_missing(self) -> Dict[str, List[str]]:
+        """저장된 캔들이 부족한 (종목, 타임프레임) 조회 - 단일 GROUP BY"""
+        db = SessionLocal()
+        try:
+            counts = db.query(
+                OHLCVData.symbol, OHLCVData.timeframe, func.count(OHLCVData.id)
+            ).filter(
+                OHLCVData.symbol.in_(self.symbols),
+                OHLCVData.timeframe.in_(self.timeframes)
+            ).group_by(OHLCVData.symbol, OHLCVData.timeframe).all()
+        finally:
+            db.close()
+
+        existing = {(symbol, tf): count for symbol, tf, count in counts}
+        return {
+            symbol: [tf for tf in self.timeframes if existing.get((symbol, tf), 0) < self.min_rows]
+            for symbol in self.symbols
+        }
+
+    def _fetch(self, symbol: str, timeframe: str) -> List[Dict]:
+        """최근 캔들 조회 (요청 속도는 BithumbAPI 공유 리미터가 제한)"""
+        api_interval = CANDLE_INTERVAL_MAP.get(timeframe, timeframe)
+
+        for attempt in range(self.retries + 1):
+            response = self.api.get_candlestick(symbol, api_interval)
+            if response.get('status') == '0000':
+                break
+        else:
+            raise RuntimeError(response.get('message', response.get('status')))
+
+        # 빗썸은 오래된 순으로 반환 - 최근 N개 사용
+        return [
+            {
+                'symbol': symbol,
+                'timeframe': timeframe,
+                'timestamp': datetime.fromtimestamp(int(candle[0]) / 1000),
+                'open': Decimal(str(candle[1])),
+                'close': Decimal(str(candle[2])),
+                'high': Decimal(str(candle[3])),
+                'low': Decimal(str(candle[4])),
+                'volume': Decimal(str(candle[5]))
+            }
+            for candle in response.get('data', [])[-self.candles:]
+        ]
+
+    def _save(self, rows: List[Dict]) -> int:
+        """벌크 저장 (중복 캔들은 무시)"""
+        if not rows:
+            return 0
+
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        stmt = pg_insert(OHLCVData).on_conflict_do_nothing(
+            index_elements=['symbol', 'timeframe', 'timestamp']
+        )
+
+        db = SessionLocal()
+        try:
+            with metrics.DB_COMMIT_SECONDS.time(component='bootstrap'):
+                db.execute(stmt, rows)
+                db.commit()
+            return len(rows)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _complete(self, symbol: str):
+        """타임프레임 1건 완료 처리"""
+        with self._lock:
+            self._pending[symbol] -= 1
+            remaining = self._pending[symbol]
+
+        if remaining == 0 and symbol not in self._round_failed:
+            self._mark_ready(symbol)
+
+    def _mark_ready(self, symbol: str):
+        with self._lock:
+            self.ready.add(symbol)
+        if self.on_ready:
+            try:
+                self.on_ready(symbol)
+            except Exception as e:
+                self._log_error(f"준비 완료 콜백 에러: {symbol} - {str(e)}")
+
+    def _log_error(self, message: str):
+        """에러 로그"""
+        print(f"[ERROR] {message}")
+        db = SessionLocal()
+        try:
+            db.add(SystemLog(log_level='ERROR', module='HistoryBootstrap', message=message))
+            db.commit()
+        except Exception:
+            db.rollback()
+        finally:
+            db.close()
@@ -3,13 +3,16 @@
 핵심 차별화 모듈 - 대부분의 개인 투자자가 활용하지 않는 데이터
 """
 
-import time
 from datetime import datetime
 from typing import Dict, List, Tuple
 from decimal import Decimal
 from api import BithumbAPI
+from analysis import orderbook_analytics
+from analysis.orderbook_features import OrderbookFeatureHistory
+from core.scheduler import PollScheduler
 from database import SessionLocal, OrderbookSnapshot, OrderbookAnomaly, SystemLog
 import config
+from utils import metrics
 
 
 class OrderbookCollector:
@@ -19,6 +22,7 @@ class OrderbookCollector:
         self.api = BithumbAPI()
         self.db = SessionLocal()
         self.last_orderbooks = {}  # 이전 호가창 저장
+        self.feature_history = OrderbookFeatureHistory()  # 종목별 호가창 특성 시계열
 
     def collect_orderbook(self, symbol: str) -> Dict:
         """
@@ -49,41 +53,13 @@ class OrderbookCollector:
 
     def analyze_orderbook(self, orderbook: Dict) -> Dict:
         """
-        호가창 분석 - 불균형, 벽, 스프레드 등
+        호가창 분석 - 불균형, 벽, 스프레드 등 (호가는 한 번만 파싱, analysis.orderbook_analytics)
         Args:
             orderbook: 호가창 데이터
         Returns:
-            분석 결과
+            분석 결과 (파싱된 호가창 'book' 포함)
         """
-        bids = orderbook['bids']
-        asks = orderbook['asks']
-
-        # 매수/매도 총 물량 계산
-        bid_total_volume = sum(float(bid['quantity']) for bid in bids)
-        ask_total_volume = sum(float(ask['quantity']) for ask in asks)
-
-        # 불균형 비율 (매수 / 매도)
-        imbalance_ratio = bid_total_volume / ask_total_volume if ask_total_volume > 0 else 0
-
-        # 스프레드 (최고 매수가 - 최저 매도가)
-        best_bid = float(bids[0]['price']) if bids else 0
-        best_ask = float(asks[0]['price']) if asks else 0
-        spread = best_ask - best_bid
-
-        # 가격별 물량 분포 분석
-        bid_walls = self._detect_walls(bids, 'bid')
-        ask_walls = self._detect_walls(asks, 'ask')
-
-        return {
-            'bid_total_volume': bid_total_volume,
-            'ask_total_volume': ask_total_volume,
-            'imbalance_ratio': imbalance_ratio,
-            'spread': spread,
-            'best_bid': best_bid,
-            'best_ask': best_ask,
-            'bid_walls': bid_walls,
-            'ask_walls': ask_walls,
-        }
+        return orderbook_analytics.analyze(orderbook)
 
     def _detect_walls(self, orders: List[Dict], side: str) -> List[Dict]:
         """
@@ -94,34 +70,19 @@ class OrderbookCollector:
         Returns:
             감지된 벽 리스트
         """
-        if not orders:
-            return []
-
-        walls = []
-        avg_quantity = sum(float(o['quantity']) for o in orders) / len(orders)
-
-        for order in orders:
-            quantity = float(order['quantity'])
-            price = float(order['price'])
-
-            # 평균의 3배 이상이면 벽으로 간주
-            if quantity > avg_quantity * 3:
-                walls.append({
-                    'price': price,
-                    'quantity': quantity,
-                    'ratio': quantity / avg_quantity,
-                    'side': side
-                })
+        book = orderbook_analytics.parse_orderbook({'bids': orders} if side == 'bid' else {'asks': orders})
+        return orderbook_analytics.detect_walls(book, side)
 
-        return walls
-
-    def detect_anomalies(self, symbol: str, current: Dict, previous: Dict = None) -> List[Dict]:
+    def detect_anomalies(self, symbol: str, current: Dict, previous: Dict = None,
+                         features: Dict = None) -> List[Dict]:
         """
         호가창 이상 패턴 감지
         Args:
             symbol: 코인 심볼
             current: 현재 분석 결과
             previous: 이전 분석 결과
+            features: feature_history.update 결과 - 최소 스냅샷 수 충족 시 스프레드/물량 급등을
+                      최근 구간 z-score + EWMA 기준선으로 판단 (미충족 시 직전 스냅샷과 비교)
         Returns:
             감지된 이상 패턴 리스트
         """
@@ -164,6 +125,10 @@ class OrderbookCollector:
                     }
                 })
 
+        if features and features['ready']:
+            anomalies.extend(self._detect_surges(features))
+            return anomalies
+
         # 3. 스프레드 급등 (이전 대비)
         if previous and current['spread'] > 0:
             if previous['spread'] > 0:
@@ -199,6 +164,49 @@ class OrderbookCollector:
 
         return anomalies
 
+    def _detect_surges(self, features: Dict) -> List[Dict]:
+        """
+        스프레드/물량 급등 - 최근 구간 대비 z-score 이상이면서 EWMA 기준선 대비
+        기존 임계값(스프레드 +50%, 물량 +100%) 이상
+        """
+        anomalies = []
+        values, zscore, ewma = features['features'], features['zscore'], features['ewma']
+        threshold = config.ORDERBOOK_ANOMALY_ZSCORE
+
+        spread, spread_base = values['spread_bps'], ewma['spread_bps']
+        if spread_base > 0 and zscore['spread_bps'] >= threshold:
+            spread_change = (spread - spread_base) / spread_base
+            if spread_change > 0.5:
+                anomalies.append({
+                    'type': 'spread_spike',
+                    'severity': min(spread_change * 100, 100),
+                    'details': {
+                        'current_spread_bps': spread,
+                        'baseline_spread_bps': spread_base,
+                        'change_percent': spread_change * 100,
+                        'zscore': zscore['spread_bps'],
+                        'window': features['count']
+                    }
+                })
+
+        volume, volume_base = values['total_volume'], ewma['total_volume']
+        if volume_base > 0 and zscore['total_volume'] >= threshold:
+            volume_change = (volume - volume_base) / volume_base
+            if volume_change > 1.0:
+                anomalies.append({
+                    'type': 'volume_surge',
+                    'severity': min(volume_change * 50, 100),
+                    'details': {
+                        'current_volume': volume,
+                        'baseline_volume': volume_base,
+                        'change_percent': volume_change * 100,
+                        'zscore': zscore['total_volume'],
+                        'window': features['count']
+                    }
+                })
+
+        return anomalies
+
     def save_to_db(self, symbol: str, orderbook: Dict, analysis: Dict):
         """데이터베이스에 저장"""
         try:
@@ -214,7 +222,8 @@ class OrderbookCollector:
                 spread=Decimal(str(analysis['spread']))
             )
             self.db.add(snapshot)
-            self.db.commit()
+            with metrics.DB_COMMIT_SECONDS.time(component='orderbook_collector'):
+                self.db.commit()
 
         except Exception as e:
             self.db.rollback()
@@ -231,7 +240,7 @@ class OrderbookCollector:
                     severity=Decimal(str(anomaly['severity'])),
                     details=anomaly['details'],
                     price_before=Decimal(str(current_price)),
-                    price_after=Decimal(str(current_price))  # 추후 업데이트
+                    price_after=Decimal(str(current_price))  # AnomalyLabeler 가 15분 후 종가로 갱신
                 )
                 self.db.add(anomaly_record)
 
@@ -241,56 +250,73 @@ class OrderbookCollector:
             self.db.rollback()
             self._log_error(f"이상 패턴 저장 실패: {str(e)}")
 
-    def run_collection_loop(self, symbols: List[str], interval: int = None):
+    def process_symbol(self, symbol: str) -> List[Dict]:
         """
-        지속적인 데이터 수집 루프
-        Args:
-            symbols: 수집할 코인 심볼 리스트
-            interval: 수집 주기 (초), None이면 config 사용
+        종목 호가창 1회 수집 → 분석 → 이상 패턴 감지 → 저장
+        Returns:
+            감지된 이상 패턴 (수집 실패 시 빈 리스트)
         """
-        interval = interval or config.ORDERBOOK_INTERVAL
+        # 호가창 수집
+        orderbook = self.collect_orderbook(symbol)
+        if not orderbook:
+            return []
 
-        print(f"호가창 데이터 수집 시작: {symbols}, 주기: {interval}초")
+        # 분석
+        analysis = self.analyze_orderbook(orderbook)
 
-        while True:
-            try:
-                for symbol in symbols:
-                    # 호가창 수집
-                    orderbook = self.collect_orderbook(symbol)
-                    if not orderbook:
-                        continue
+        # 이상 패턴 감지 (특성 시계열 갱신 후 최근 구간 기준 판단)
+        previous = self.last_orderbooks.get(symbol)
+        features = self.feature_history.update(symbol, analysis, orderbook['timestamp'].timestamp())
+        anomalies = self.detect_anomalies(symbol, analysis, previous, features)
 
-                    # 분석
-                    analysis = self.analyze_orderbook(orderbook)
+        # 저장
+        self.save_to_db(symbol, orderbook, analysis)
 
-                    # 이상 패턴 감지
-                    previous = self.last_orderbooks.get(symbol)
-                    anomalies = self.detect_anomalies(symbol, analysis, previous)
+        if anomalies:
+            current_price = analysis['best_bid']
+            self.save_anomalies(symbol, anomalies, current_price)
+            print(f"[{symbol}] {len(anomalies)}개 이상 패턴 감지!")
 
-                    # 저장
-                    self.save_to_db(symbol, orderbook, analysis)
+        # 현재 상태 저장
+        self.last_orderbooks[symbol] = analysis
 
-                    if anomalies:
-                        current_price = analysis['best_bid']
-                        self.save_anomalies(symbol, anomalies, current_price)
-                        print(f"[{symbol}] {len(anomalies)}개 이상 패턴 감지!")
+        # 디버그 출력
+        print(f"[{symbol}] 불균형: {analysis['imbalance_ratio']:.2f}, "
+              f"스프레드: {analysis['spread']:.0f}, "
+              f"벽: 매수{len(analysis['bid_walls'])} 매도{len(analysis['ask_walls'])}")
+        return anomalies
 
-                    # 현재 상태 저장
-                    self.last_orderbooks[symbol] = analysis
+    def run_collection_loop(self, symbols: List[str], interval: int = None):
+        """
+        지속적인 데이터 수집 루프 (종목별 적응형 주기)
+        Args:
+            symbols: 수집할 코인 심볼 리스트
+            interval: 기준 수집 주기 (초), None이면 config 사용
+                      변동성 높은 종목/이상 패턴 감지 종목은 가속, 한산한 종목은 감속
+        """
+        interval = interval or config.ORDERBOOK_INTERVAL
 
-                    # 디버그 출력
-                    print(f"[{symbol}] 불균형: {analysis['imbalance_ratio']:.2f}, "
-                          f"스프레드: {analysis['spread']:.0f}, "
-                          f"벽: 매수{len(analysis['bid_walls'])} 매도{len(analysis['ask_walls'])}")
+        print(f"호가창 데이터 수집 시작: {symbols}, 기준 주기: {interval}초")
 
-                time.sleep(interval)
+        # DB 세션 1개를 공유하므로 작업 스레드 1개에서 순차 실행
+        scheduler = PollScheduler(workers=1, on_error=self._log_error, name='orderbook')
 
-            except KeyboardInterrupt:
-                print("\n수집 중단됨")
-                break
-            except Exception as e:
-                self._log_error(f"수집 루프 에러: {str(e)}")
-                time.sleep(interval)
+        def poll(symbol: str):
+            anomalies = self.process_symbol(symbol)
+            analysis = self.last_orderbooks.get(symbol)
+            if analysis:
+                scheduler.observe_prices({symbol: analysis['mid_price']})
+            if anomalies:
+                scheduler.boost(symbol)
+
+        scheduler.add_kind('orderbook', poll, interval, cost=1, adaptive=True)
+        scheduler.sync(symbols)
+        try:
+            scheduler.run()
+        except KeyboardInterrupt:
+            print("\n수집 중단됨")
+        finally:
+            scheduler.shutdown()
 
     def _log_error(self, message: str):
         """에러 로그 기록"""
@@ -2,13 +2,24 @@
 OHLCV 가격 데이터 수집 모듈
 """
 
-import time
 from datetime import datetime, timedelta
 from typing import List, Dict
 from decimal import Decimal
 from api import BithumbAPI
 from database import SessionLocal, OHLCVData, SystemLog
+from core.scheduler import PollScheduler
 import config
+from utils import metrics
+
+# 빗썸 API interval 매핑 (빗썸은 15m/4h/1d 대신 10m/6h/24h 지원)
+CANDLE_INTERVAL_MAP = {
+    '1m': '1m',
+    '5m': '5m',
+    '15m': '10m',
+    '1h': '1h',
+    '4h': '6h',
+    '1d': '24h'
+}
 
 
 class PriceCollector:
@@ -50,17 +61,7 @@ class PriceCollector:
     def collect_candlestick(self, symbol: str, interval: str = '1m') -> List[Dict]:
         """캔들스틱 데이터 수집"""
         try:
-            # 빗썸 API interval 매핑
-            interval_map = {
-                '1m': '1m',
-                '5m': '5m',
-                '15m': '10m',  # 빗썸은 10m 지원
-                '1h': '1h',
-                '4h': '6h',    # 빗썸은 6h 지원
-                '1d': '24h'
-            }
-
-            api_interval = interval_map.get(interval, '1m')
+            api_interval = CANDLE_INTERVAL_MAP.get(interval, '1m')
             response = self.api.get_candlestick(symbol, api_interval)
 
             if response.get('status') == '0000':
@@ -120,7 +121,8 @@ class PriceCollector:
                 )
                 self.db.add(ohlcv)
 
-            self.db.commit()
+            with metrics.DB_COMMIT_SECONDS.time(component='price_collector'):
+                self.db.commit()
 
         except IntegrityError as e:
             # UniqueViolation 에러 무시 (동시성 문제)
@@ -129,35 +131,43 @@ class PriceCollector:
             self.db.rollback()
             self._log_error(f"OHLCV 저장 실패: {str(e)}")
 
+    def process_symbol(self, symbol: str) -> Dict:
+        """종목 현재가 + 타임프레임별 최신 캔들 1회 수집/저장 (Ticker 반환, 실패 시 None)"""
+        # Ticker 정보 수집
+        ticker = self.collect_ticker(symbol)
+        if ticker:
+            print(f"[{symbol}] 현재가: {ticker['closing_price']:,.0f}원, "
+                  f"24h 변동: {ticker['fluctate_rate_24H']:.2f}%")
+
+        # 캔들 데이터 수집
+        for tf in self.timeframes:
+            candles = self.collect_candlestick(symbol, tf)
+            for candle in candles[-1:]:  # 최신 1개만 저장
+                self.save_ohlcv(candle)
+        return ticker
+
     def run_collection_loop(self, symbols: List[str], interval: int = None):
-        """지속적인 가격 데이터 수집"""
+        """지속적인 가격 데이터 수집 (종목별 적응형 주기 - 변동성 높은 종목 가속, 한산한 종목 감속)"""
         interval = interval or config.PRICE_INTERVAL
 
-        print(f"가격 데이터 수집 시작: {symbols}, 주기: {interval}초")
-
-        while True:
-            try:
-                for symbol in symbols:
-                    # Ticker 정보 수집
-                    ticker = self.collect_ticker(symbol)
-                    if ticker:
-                        print(f"[{symbol}] 현재가: {ticker['closing_price']:,.0f}원, "
-                              f"24h 변동: {ticker['fluctate_rate_24H']:.2f}%")
-
-                    # 캔들 데이터 수집
-                    for tf in self.timeframes:
-                        candles = self.collect_candlestick(symbol, tf)
-                        for candle in candles[-1:]:  # 최신 1개만 저장
-                            self.save_ohlcv(candle)
-
-                time.sleep(interval)
-
-            except KeyboardInterrupt:
-                print("\n수집 중단됨")
-                break
-            except Exception as e:
-                self._log_error(f"수집 루프 에러: {str(e)}")
-                time.sleep(interval)
+        print(f"가격 데이터 수집 시작: {symbols}, 기준 주기: {interval}초")
+
+        # DB 세션 1개를 공유하므로 작업 스레드 1개에서 순차 실행
+        scheduler = PollScheduler(workers=1, on_error=self._log_error, name='price')
+
+        def poll(symbol: str):
+            ticker = self.process_symbol(symbol)
+            if ticker:
+                scheduler.observe_prices({symbol: ticker['closing_price']})
+
+        scheduler.add_kind('price', poll, interval, cost=1 + len(self.timeframes), adaptive=True)
+        scheduler.sync(symbols)
+        try:
+            scheduler.run()
+        except KeyboardInterrupt:
+            print("\n수집 중단됨")
+        finally:
+            scheduler.shutdown()
 
     def _log_error(self, message: str):
         """에러 로그 기록"""
@@ -0,0 +1,378 @@
+"""
+체결 테이프 (transaction_history / 실시간 체결 구독)
+- 체결을 시각 + 체결 번호(cont_no)로 중복 제거 (폴링 구간 겹침, 재연결 재전송)
+- 종목별 초 단위 바(매수/매도 거래량, 거래대금, 체결 수)를 고정 크기 링 버퍼에 집계
+- 단기 거래량 비율(volume_ratio), VWAP, 매수 비중을 바 배열에서 벡터 연산으로 계산
+- 체결 시각은 KST 로 해석 (컨테이너가 UTC 로 실행돼도 바가 미래 시각으로 밀리지 않음)
+- 완료된 바를 일자(KST)/종목별 바이너리 파일(BAR_DTYPE 레코드, 바당 44바이트)로 추가 기록
+"""
+
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from api import BithumbWebSocket
+from database.models import KST
+import config
+from utils import metrics
+
+BAR_DTYPE = np.dtype([
+    ('second', '<i8'),          # epoch 초
+    ('buy_volume', '<f8'),      # 매수 체결 수량
+    ('sell_volume', '<f8'),     # 매도 체결 수량
+    ('buy_notional', '<f8'),    # 매수 체결 금액 (KRW)
+    ('sell_notional', '<f8'),   # 매도 체결 금액 (KRW)
+    ('trades', '<i4'),          # 체결 수
+])
+
+_BUY_VOLUME, _SELL_VOLUME, _BUY_NOTIONAL, _SELL_NOTIONAL, _TRADES = range(5)
+
+
+def _day(second) -> str:
+    return datetime.fromtimestamp(int(second), KST).strftime('%Y-%m-%d')
+
+
+def _kst_timestamp(value: str) -> float:
+    """빗썸 체결 시각 문자열 → epoch 초 (시간대 없는 값은 KST, 호스트 시간대와 무관)"""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        parsed = KST.localize(parsed)
+    return parsed.timestamp()
+
+
+class _SymbolTape:
+    """종목 1개의 초 단위 바 링 버퍼 + 중복 제거 기준"""
+
+    __slots__ = ('seconds', 'values', 'watermark', 'edge_keys', 'since', 'persisted_until')
+
+    def __init__(self, window: int, since: float):
+        self.seconds = np.full(window, -1, dtype=np.int64)
+        self.values = np.zeros((window, 5))
+        self.watermark = 0.0        # 마지막 반영 체결 시각
+        self.edge_keys = set()      # watermark 시각에 반영된 체결 키
+        self.since = since          # 수집 시작 시각 (이후 구간은 체결 없음 = 거래량 0)
+        self.persisted_until = -1   # 파일 기록 완료 초
+
+    def add(self, ts: float, key, price: float, units: float, is_buy: bool) -> bool:
+        """체결 반영 (중복/지연 체결이면 False)"""
+        if ts < self.watermark or (ts == self.watermark and key in self.edge_keys):
+            return False
+        if ts > self.watermark:
+            self.watermark = ts
+            self.edge_keys = {key}
+        else:
+            self.edge_keys.add(key)
+
+        second = int(ts)
+        slot = second % self.seconds.size
+        row = self.values[slot]
+        if self.seconds[slot] != second:
+            self.seconds[slot] = second
+            row[:] = 0.0
+        if is_buy:
+            row[_BUY_VOLUME] += units
+            row[_BUY_NOTIONAL] += units * price
+        else:
+            row[_SELL_VOLUME] += units
+            row[_SELL_NOTIONAL] += units * price
+        row[_TRADES] += 1
+        return True
+
+
+class TradeTape:
+    """종목별 체결 테이프 (스레드 안전)"""
+
+    def __init__(self, window: int = None, path: str = None):
+        """
+        Args:
+            window: 메모리 보관 초 단위 바 수 (기본: config.TRADE_TAPE_WINDOW)
+            path: 바 파일 디렉토리 (기본: config.TRADE_TAPE_PATH, 빈 문자열이면 기록 안 함)
+        """
+        self.window = window or config.TRADE_TAPE_WINDOW
+        self.path = config.TRADE_TAPE_PATH if path is None else path
+        self._tapes: Dict[str, _SymbolTape] = {}
+        self._lock = threading.Lock()
+
+    def watch(self, symbols: Iterable[str]):
+        """수집 시작 종목 등록 - 이 시각부터 체결 없는 구간을 거래량 0으로 간주"""
+        now = time.time()
+        with self._lock:
+            for symbol in symbols:
+                if symbol not in self._tapes:
+                    self._tapes[symbol] = _SymbolTape(self.window, now)
+
+    # ===========================
+    # 수신
+    # ===========================
+
+    def ingest(self, symbol: str, trades: List[Dict]) -> int:
+        """
+        /public/transaction_history 응답 반영
+        Args:
+            trades: [{'cont_no', 'transaction_date', 'type': 'bid'|'ask', 'units_traded', 'price'}]
+        Returns:
+            새로 반영된 체결 수
+        """
+        rows = []
+        invalid = 0
+        for trade in trades:
+            try:
+                ts = _kst_timestamp(trade['transaction_date'])
+                cont_no = trade.get('cont_no')
+                rows.append((ts, int(cont_no) if cont_no is not None and str(cont_no).isdigit() else -1,
+                             cont_no or (trade['price'], trade['units_traded'], trade['type']),
+                             float(trade['price']), float(trade['units_traded']), trade['type'] == 'bid'))
+            except (KeyError, TypeError, ValueError):
+                invalid += 1
+        rows.sort(key=lambda row: (row[0], row[1]))
+        return self._apply(symbol, rows, invalid)
+
+    def ingest_ws(self, rows: List[Dict]) -> int:
+        """
+        실시간 체결 메시지(content.list) 반영
+        Args:
+            rows: [{'symbol': 'BTC_KRW', 'buySellGb': '1'|'2', 'contPrice', 'contQty', 'contDtm'}]
+        Returns:
+            새로 반영된 체결 수
+        """
+        by_symbol: Dict[str, List] = {}
+        occurrences: Dict[tuple, int] = {}
+        invalid = 0
+        for row in rows:
+            try:
+                ts = _kst_timestamp(row['contDtm'])
+                # 체결 번호가 없으므로 같은 시각/가격/수량/방향 체결은 메시지 내 순번으로 구분
+                # (재연결 재전송은 같은 순번으로 중복 제거, 동일 조건의 별개 체결은 모두 반영)
+                base = (row['symbol'], ts, row['contPrice'], row['contQty'], row['buySellGb'])
+                occurrence = occurrences.get(base, 0)
+                occurrences[base] = occurrence + 1
+                key = base[2:] + (occurrence,)
+                by_symbol.setdefault(row['symbol'].split('_')[0], []).append(
+                    (ts, -1, key, float(row['contPrice']), float(row['contQty']), str(row['buySellGb']) == '2')
+                )
+            except (KeyError, TypeError, ValueError, AttributeError):
+                invalid += 1
+        accepted = sum(self._apply(symbol, sorted(items, key=lambda item: item[0]), 0)
+                       for symbol, items in by_symbol.items())
+        if invalid:
+            metrics.TRADES_INGESTED_TOTAL.inc(invalid, result='invalid')
+        return accepted
+
+    def _apply(self, symbol: str, rows: List[tuple], invalid: int) -> int:
+        accepted = 0
+        with self._lock:
+            tape = self._tapes.get(symbol)
+            if tape is None:
+                tape = self._tapes[symbol] = _SymbolTape(self.window, time.time())
+            for ts, _, key, price, units, is_buy in rows:
+                if tape.add(ts, key, price, units, is_buy):
+                    accepted += 1
+
+        if accepted:
+            metrics.TRADES_INGESTED_TOTAL.inc(accepted, result='accepted')
+        if len(rows) > accepted:
+            metrics.TRADES_INGESTED_TOTAL.inc(len(rows) - accepted, result='duplicate')
+        if invalid:
+            metrics.TRADES_INGESTED_TOTAL.inc(invalid, result='invalid')
+        return accepted
+
+    # ===========================
+    # 조회
+    # ===========================
+
+    def bars(self, symbol: str, seconds: int = None, now: float = None) -> np.ndarray:
+        """
+        최근 초 단위 바 (시간순, 체결 없는 초는 생략)
+        Returns:
+            BAR_DTYPE 배열
+        """
+        seconds = min(seconds or self.window, self.window)
+        end = int(now if now is not None else time.time())
+        with self._lock:
+            tape = self._tapes.get(symbol)
+            if tape is None:
+                return np.zeros(0, dtype=BAR_DTYPE)
+            mask = (tape.seconds > end - seconds) & (tape.seconds <= end)
+            return self._to_records(tape.seconds[mask], tape.values[mask])
+
+    def summary(self, symbol: str, seconds: int = 60, now: float = None) -> Dict:
+        """
+        최근 구간 집계
+        Returns:
+            {'buy_volume', 'sell_volume', 'volume', 'notional', 'vwap', 'trades', 'buy_ratio'}
+        """
+        totals = np.zeros(5)
+        end = int(now if now is not None else time.time())
+        with self._lock:
+            tape = self._tapes.get(symbol)
+            if tape is not None:
+                mask = (tape.seconds > end - min(seconds, self.window)) & (tape.seconds <= end)
+                totals = tape.values[mask].sum(axis=0)
+
+        volume = totals[_BUY_VOLUME] + totals[_SELL_VOLUME]
+        notional = totals[_BUY_NOTIONAL] + totals[_SELL_NOTIONAL]
+        return {
+            'buy_volume': float(totals[_BUY_VOLUME]),
+            'sell_volume': float(totals[_SELL_VOLUME]),
+            'volume': float(volume),
+            'notional': float(notional),
+            'vwap': float(notional / volume) if volume > 0 else None,
+            'trades': int(totals[_TRADES]),
+            'buy_ratio': float(totals[_BUY_VOLUME] / volume) if volume > 0 else None,
+        }
+
+    def volume_ratio(self, symbol: str, short: int = None, now: float = None) -> Optional[float]:
+        """
+        단기 거래량 비율 = 최근 short 초 거래량 / 직전 구간(window - short 초)의 short 초당 평균 거래량
+        Returns:
+            비율 (수집 기간이 window 미만이면 None - 호출 측 기본값 사용)
+        """
+        short = short or config.TRADE_TAPE_SHORT_WINDOW
+        now = now if now is not None else time.time()
+        end = int(now)
+        with self._lock:
+            tape = self._tapes.get(symbol)
+            if tape is None or now - tape.since < self.window:
+                return None
+            volumes = tape.values[:, _BUY_VOLUME] + tape.values[:, _SELL_VOLUME]
+            recent = (tape.seconds > end - short) & (tape.seconds <= end)
+            earlier = (tape.seconds > end - self.window) & (tape.seconds <= end - short)
+            short_volume = volumes[recent].sum()
+            baseline = volumes[earlier].sum() / (self.window - short) * short
+
+        if baseline > 0:
+            return float(short_volume / baseline)
+        # 직전 구간 체결 없음 - 새로 체결이 생기면 최대치로 간주
+        return 0.0 if short_volume <= 0 else float(self.window / short)
+
+    # ===========================
+    # 저장
+    # ===========================
+
+    @staticmethod
+    def _to_records(seconds: np.ndarray, values: np.ndarray) -> np.ndarray:
+        order = np.argsort(seconds)
+        records = np.zeros(order.size, dtype=BAR_DTYPE)
+        records['second'] = seconds[order]
+        for name, column in (('buy_volume', _BUY_VOLUME), ('sell_volume', _SELL_VOLUME),
+                             ('buy_notional', _BUY_NOTIONAL), ('sell_notional', _SELL_NOTIONAL),
+                             ('trades', _TRADES)):
+            records[name] = values[order, column]
+        return records
+
+    def flush(self, now: float = None, final: bool = False) -> int:
+        """
+        확정된 바를 {path}/{YYYY-MM-DD}/{symbol}.bin 에 추가 기록
+        - 마지막 반영 체결 시각(watermark) 이전 초: 이후 체결은 중복/지연으로 거부되므로 확정
+        - 그 외에는 TRADE_TAPE_FLUSH_LAG 초 이전 바만 기록 (다음 폴링에서 같은 초 체결이 추가될 수 있음)
+        Args:
+            final: 종료 시 기록 - 현재 초 이전 바 전체
+        Returns:
+            기록한 바 수
+        """
+        if not self.path:
+            return 0
+        current = int(now if now is not None else time.time())
+        pending = []
+        with self._lock:
+            for symbol, tape in self._tapes.items():
+                cutoff = current if final else min(current, max(int(tape.watermark),
+                                                                current - config.TRADE_TAPE_FLUSH_LAG))
+                mask = (tape.seconds > tape.persisted_until) & (tape.seconds < cutoff)
+                if not mask.any():
+                    continue
+                records = self._to_records(tape.seconds[mask], tape.values[mask])
+                tape.persisted_until = int(records['second'][-1])
+                pending.append((symbol, records))
+
+        written = 0
+        for symbol, records in pending:
+            first_day, last_day = _day(records['second'][0]), _day(records['second'][-1])
+            if first_day == last_day:
+                chunks = [(first_day, records)]
+            else:
+                days = np.array([_day(second) for second in records['second']])
+                chunks = [(day, records[days == day]) for day in np.unique(days)]
+            for day, chunk in chunks:
+                directory = os.path.join(self.path, day)
+                os.makedirs(directory, exist_ok=True)
+                with open(os.path.join(directory, f"{symbol}.bin"), 'ab') as f:
+                    chunk.tofile(f)
+                written += chunk.size
+        return written
+
+    @staticmethod
+    def load_bars(path: str, symbol: str, day: str) -> np.ndarray:
+        """
+        저장된 초 단위 바 파일 읽기 (메모리 매핑)
+        Args:
+            day: 'YYYY-MM-DD'
+        Returns:
+            BAR_DTYPE 배열 (파일 없으면 빈 배열)
+        """
+        file_path = os.path.join(path, day, f"{symbol}.bin")
+        if not os.path.exists(file_path) or os.path.getsize(file_path) < BAR_DTYPE.itemsize:
+            return np.zeros(0, dtype=BAR_DTYPE)
+        count = os.path.getsize(file_path) // BAR_DTYPE.itemsize
+        return np.memmap(file_path, dtype=BAR_DTYPE, mode='r', shape=(count,))
+
+
+class TradeTapeStream(BithumbWebSocket):
+    """실시간 체결 구독 → TradeTape (config.TRADE_TAPE_SOURCE='ws')"""
+
+    def __init__(self, tape: TradeTape, symbols: List[str], ws_url: str = None):
+        super().__init__(ws_url)
+        self.tape = tape
+        self.symbols = list(symbols)
+        self._resubscribe = threading.Event()
+
+    def handle_message(self, data: Dict):
+        if data.get('type') == 'transaction':
+            self.tape.ingest_ws((data.get('content') or {}).get('list') or [])
+
+    def on_open(self, ws):
+        # 연결 중 종목이 바뀌었으면 이전 목록으로 구독하지 않고 재연결
+        if self._resubscribe.is_set():
+            ws.close()
+            return
+        super().on_open(ws)
+
+    def update_symbols(self, symbols: List[str]):
+        """
+        구독 종목 변경 (유니버스 갱신) - 현재 연결을 닫아 run_loop 가 새 목록으로 즉시 재구독
+        추가 종목은 이 시각부터 테이프 수집 시작
+        """
+        symbols = list(symbols)
+        if set(symbols) == set(self.symbols):
+            return
+        self.tape.watch(symbols)
+        self.symbols = symbols
+        self._resubscribe.set()
+        ws = self.ws
+        if ws is not None:
+            ws.close()
+
+    def run_loop(self, is_running, reconnect_delay: float = 5):
+        """
+        연결 유지 (끊기면 재연결, update_symbols 호출 시 대기 없이 재구독)
+        Args:
+            is_running: 계속 실행 여부 콜백
+        """
+        self.tape.watch(self.symbols)
+        while is_running():
+            self._resubscribe.clear()
+            try:
+                # 구독 메시지는 연결 후 on_open 에서 전송
+                self.ws = None
+                self.subscriptions = []
+                self.subscribe_transaction(self.symbols)
+                self.connect()
+                self.run()
+            except Exception as e:
+                print(f"[TradeTapeStream ERROR] {str(e)}")
+            if is_running() and not self._resubscribe.is_set():
+                self._resubscribe.wait(reconnect_delay)
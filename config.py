@@ -1,27 +1,31 @@
 import os
 from dotenv import load_dotenv
-from sqlalchemy import URL
 
 load_dotenv()
 
 # Database Configuration
-DATABASE_URL = URL.create(
-    'postgresql',
-    username=os.getenv('DB_USER', 'unble'),
-    password=os.getenv('DB_PASSWORD', 'npg_1kjV0mhECxqs'),
-    host=os.getenv('DB_HOST', 'ep-divine-bird-a1f4mly5.ap-southeast-1.pg.koyeb.app'),
-    database=os.getenv('DB_NAME', 'unble'),
-)
+DB_USER = os.getenv('DB_USER', 'unble')
+DB_PASSWORD = os.getenv('DB_PASSWORD', 'npg_1kjV0mhECxqs')
+DB_HOST = os.getenv('DB_HOST', 'ep-divine-bird-a1f4mly5.ap-southeast-1.pg.koyeb.app')
+DB_NAME = os.getenv('DB_NAME', 'unble')
 
 DB_SCHEMA = os.getenv('DB_SCHEMA', 'auto_coin_trading')
 
 # Bithumb API Configuration
+BITHUMB_API_URL = os.getenv('BITHUMB_API_URL', 'https://api.bithumb.com')  # 모의 거래소 사용 시 변경
+BITHUMB_WS_URL = os.getenv('BITHUMB_WS_URL', 'wss://pubwss.bithumb.com/pub/ws')
 BITHUMB_API_KEY = os.getenv('BITHUMB_API_KEY', '')
 BITHUMB_SECRET_KEY = os.getenv('BITHUMB_SECRET_KEY', '')
+PUBLIC_API_RATE_LIMIT = float(os.getenv('PUBLIC_API_RATE_LIMIT', 100))  # 초당 요청 수 (빗썸 한도 135)
+PRIVATE_API_RATE_LIMIT = float(os.getenv('PRIVATE_API_RATE_LIMIT', 10))  # 초당 요청 수 (빗썸 한도 15)
 
 # Telegram Configuration
 TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN', '')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID', '')
+TELEGRAM_OUTBOX_SIZE = 1000  # 알림 대기열 최대 길이 (초과 시 버림)
+TELEGRAM_COALESCE_WINDOW = float(os.getenv('TELEGRAM_COALESCE_WINDOW', 2))  # 같은 종류 알림을 모아 한 메시지로 보낼 대기 시간 (초)
+TELEGRAM_MAX_RETRIES = 5  # 전송 실패 재시도 횟수
+TELEGRAM_RETRY_BACKOFF = 1.0  # 재시도 대기 (초, 회차마다 2배)
 
 # Trading Configuration
 TRADE_MODE = os.getenv('TRADE_MODE', 'paper')  # 'paper' or 'live'
@@ -47,7 +51,7 @@ TARGET_PAIRS = [
     'BORA', 'MEV', 'SSX', 'META', 'FCT2', 'MIX', 'TEMCO', 'VET', 'CHR', 'STPT',
     # 메이저 알트 (변동성)
     'XRP', 'ADA', 'DOGE', 'DOT', 'MATIC', 'LINK', 'UNI', 'ATOM', 'ETC', 'BCH',
-    'LTC', 'EOS', 'TRX', 'XLM', 'ALGO', 'AVAX', 'NEAR', 'FTM', 'HBAR', 'VET',
+    'LTC', 'EOS', 'TRX', 'XLM', 'ALGO', 'AVAX', 'NEAR', 'FTM', 'HBAR',
     # 추가 잠재력 코인
     'RNDR', 'IMX', 'APT', 'OP', 'ARB', 'SUI', 'SEI', 'TIA', 'STRK', 'PYTH',
     'WLD', 'JUP', 'DYM', 'ALT', 'MANTA', 'AEVO', 'PORTAL', 'PIXEL', 'RONIN', 'OMNI',
@@ -56,7 +60,130 @@ TARGET_PAIRS = [
     'BANANA', 'DRIFT', 'GRASS', 'MOVE', 'USUAL', 'PENGU', 'HYPE', 'VIRTUAL', 'AIXBT', 'ZEREBRO',
 ]
 
+# 부하 테스트용 대상 코인 재정의 (쉼표 구분, 예: 모의 거래소 심볼)
+if os.getenv('TARGET_PAIRS'):
+    TARGET_PAIRS = [s.strip().upper() for s in os.getenv('TARGET_PAIRS').split(',') if s.strip()]
+
+# Trading Universe (ALL 시세 1회 조회로 KRW 전체 마켓 순위 → 티어별 수집 주기/분석 깊이)
+UNIVERSE_MODE = os.getenv('UNIVERSE_MODE', 'dynamic')  # 'dynamic' (유동성 순위) 또는 'static' (TARGET_PAIRS 전체 hot)
+UNIVERSE_REFRESH_INTERVAL = int(os.getenv('UNIVERSE_REFRESH_INTERVAL', 300))  # 순위 갱신 주기 (초)
+UNIVERSE_MIN_TRADE_VALUE = float(os.getenv('UNIVERSE_MIN_TRADE_VALUE', 100_000_000))  # 최소 24시간 거래대금 (원)
+UNIVERSE_MAX_SPREAD_BPS = 100  # 최대 스프레드 (bp, 초과 시 거래 대상 제외)
+UNIVERSE_SCORE_WEIGHTS = {'trade_value': 0.5, 'volatility': 0.3, 'spread': 0.2}  # 백분위 순위 가중치
+UNIVERSE_STICKINESS = 0.05  # 기존 hot/warm 종목 가산점 (경계 종목의 잦은 교체 방지)
+UNIVERSE_TIERS = {
+    # size: 종목 수, *_interval: 수집 주기 (초), orderbook_depth: 호가 단계 수 (cold 는 시세만)
+    'hot': {'size': int(os.getenv('UNIVERSE_HOT_SIZE', 30)), 'orderbook_interval': 1,
+            'orderbook_depth': 30, 'trades_interval': 1},
+    'warm': {'size': int(os.getenv('UNIVERSE_WARM_SIZE', 70)), 'orderbook_interval': 10,
+             'orderbook_depth': 10, 'trades_interval': 10},
+}
+
+# Active Strategies (strategies.registry 키, 쉼표 구분)
+ACTIVE_STRATEGIES = [s.strip() for s in os.getenv('ACTIVE_STRATEGIES', 'hyper_scalping').split(',') if s.strip()]
+
 # Data Collection Intervals (seconds)
 ORDERBOOK_INTERVAL = 1  # 호가창 수집 주기
 PRICE_INTERVAL = 5  # 가격 데이터 수집 주기
 INDICATOR_INTERVAL = 60  # 지표 계산 주기
+
+# Adaptive Polling Scheduler (종목/데이터 종류별 다음 수집 시각 우선순위 큐)
+SCHEDULER_REQUEST_BUDGET = float(os.getenv('SCHEDULER_REQUEST_BUDGET', 80))  # 예약 수집 전체 초당 요청 한도 (주문 등 여유분 제외)
+SCHEDULER_WORKERS = int(os.getenv('SCHEDULER_WORKERS', 8))  # 수집 작업 동시 실행 스레드 수
+SCHEDULER_MIN_INTERVAL = 0.5  # 최소 수집 주기 (초)
+SCHEDULER_MAX_SPEEDUP = 0.5  # 변동성 높은 종목 주기 배수 하한
+SCHEDULER_MAX_BACKOFF = 4.0  # 한산한 종목 주기 배수 상한
+SCHEDULER_POSITION_FACTOR = 0.25  # 보유 포지션 종목 주기 배수 (요청 한도 초과 시에도 늘리지 않음)
+SCHEDULER_SIGNAL_FACTOR = 0.5  # 최근 시그널 종목 주기 배수
+SCHEDULER_SIGNAL_BOOST_SECONDS = 300  # 시그널 발생 후 가속 유지 시간 (초)
+SCHEDULER_VOLATILITY_HALFLIFE = 12  # 종목 변동성 EWMA 반감기 (가격 관측 수)
+
+# Orderbook Feature History (종목별 호가창 특성 시계열 - 이상 패턴 판단 기준)
+ORDERBOOK_FEATURE_WINDOW = int(os.getenv('ORDERBOOK_FEATURE_WINDOW', 300))  # 보관 스냅샷 수 (1초 주기 5분)
+ORDERBOOK_FEATURE_HALFLIFE = 60  # EWMA 반감기 (스냅샷 수)
+ORDERBOOK_FEATURE_MIN_PERIODS = 30  # z-score 판단 최소 스냅샷 수 (미만이면 직전 스냅샷과 비교)
+ORDERBOOK_ANOMALY_ZSCORE = float(os.getenv('ORDERBOOK_ANOMALY_ZSCORE', 3.0))  # 스프레드/물량 급등 판단 z-score
+
+# Trade Tape (체결 내역 → 종목별 초 단위 매수/매도 거래량 바)
+TRADE_TAPE_SOURCE = os.getenv('TRADE_TAPE_SOURCE', 'rest')  # 'rest' (transaction_history 폴링) 또는 'ws' (실시간 체결 구독)
+TRADE_TAPE_WINDOW = 900  # 메모리 보관 초 단위 바 수 (15분)
+TRADE_TAPE_SHORT_WINDOW = 60  # volume_ratio 단기 구간 (초, 직전 구간 평균 대비)
+TRADE_TAPE_FETCH_COUNT = 100  # 종목당 조회 체결 수 (빗썸 최대 100)
+TRADE_TAPE_PATH = os.getenv('TRADE_TAPE_PATH', 'state/trade_tape')  # 일자/종목별 초 단위 바 파일 (재시작 시 복원)
+TRADE_TAPE_FLUSH_INTERVAL = 10  # 완료된 초 단위 바 파일 기록 주기 (초)
+TRADE_TAPE_FLUSH_LAG = 30  # 바 확정 대기 (초, warm 체결 폴링 주기보다 길게 - 같은 초 체결의 뒤늦은 수신 반영)
+
+# Anomaly Outcome Labeling (이상 패턴 발생 후 가격 변화 사후 기록 → 유형별 적중률)
+ANOMALY_LABEL_HORIZONS = [1, 5, 15]  # 라벨 기간 (분, 1분봉 종가 기준)
+ANOMALY_LABEL_INTERVAL = int(os.getenv('ANOMALY_LABEL_INTERVAL', 300))  # 라벨링 주기 (초)
+ANOMALY_LABEL_BATCH = 5000  # 1회 라벨링 최대 건수
+ANOMALY_LABEL_MAX_WAIT = 3600  # 캔들 누락 시 라벨 확정까지 대기 (초, 초과 시 있는 기간만 기록)
+ANOMALY_HIT_THRESHOLD = 0.003  # 적중 기준 가격 변화 (0.3%, 방향성 유형은 예상 방향)
+ANOMALY_STATS_DAYS = 14  # 적중률 집계 기간 (일)
+ANOMALY_STATS_REFRESH = 600  # 엔진 적중률 갱신 주기 (초)
+
+# Parquet Archive (연구/백테스트용 일자/종목별 Parquet - python -m database.archive)
+ARCHIVE_PATH = os.getenv('ARCHIVE_PATH', 'data/archive')
+ARCHIVE_BATCH_SIZE = 50000  # 내보내기 서버 측 커서 배치 행 수
+ARCHIVE_COMPRESSION = 'zstd'
+
+# Cold-start Bootstrap
+BOOTSTRAP_MIN_ROWS = 50  # 종목/타임프레임별 최소 캔들 수 (미만이면 과거 데이터 수집)
+BOOTSTRAP_TIMEFRAMES = ['1m', '5m', '15m']
+BOOTSTRAP_CANDLES = 100  # 타임프레임별 저장할 최근 캔들 수
+BOOTSTRAP_WORKERS = int(os.getenv('BOOTSTRAP_WORKERS', 8))
+BOOTSTRAP_RETRY_ROUNDS = 5  # 실패한 (종목, 타임프레임) 재수집 횟수 (소진 시 실시간 수집분으로 준비 완료)
+BOOTSTRAP_RETRY_DELAY = 10  # 첫 재수집 대기 (초, 회차마다 2배)
+BOOTSTRAP_RETRY_MAX = 300  # 재수집 대기 상한 (초)
+
+# Warm-restart Snapshot
+SNAPSHOT_PATH = os.getenv('SNAPSHOT_PATH', 'state/engine_snapshot')
+SNAPSHOT_INTERVAL = int(os.getenv('SNAPSHOT_INTERVAL', 30))  # 체크포인트 주기 (초, 0이면 비활성)
+SNAPSHOT_MAX_AGE = 600  # 스냅샷 전체 허용 경과 시간 (초)
+SNAPSHOT_PRICE_MAX_AGE = 60  # 시세/전략 가격 상태 허용 경과 시간 (초)
+SNAPSHOT_ORDERBOOK_MAX_AGE = 30  # 호가창 허용 경과 시간 (초)
+
+# Sharded Engine (종목을 워커 프로세스로 분할, 코디네이터가 리스크/주문 전담)
+ENGINE_SHARDS = int(os.getenv('ENGINE_SHARDS', 1))  # 1이면 단일 프로세스, 0이면 CPU 코어 수
+SHARD_SIGNAL_MAX_AGE = 30  # 코디네이터가 실행할 워커 시그널 허용 경과 시간 (초)
+SHARD_RESTART_DELAY = 5  # 종료된 워커 재시작 대기 (초)
+
+# Order Management (실전 주문 비동기 제출/체결 추적)
+ORDER_POLL_INTERVAL = float(os.getenv('ORDER_POLL_INTERVAL', 1))  # 미체결 주문 조회 주기 (초)
+ORDER_STALE_SECONDS = int(os.getenv('ORDER_STALE_SECONDS', 30))  # 미체결 주문 자동 취소 (초)
+ORDER_SUBMIT_WORKERS = 4  # 동시 주문 제출 스레드 수
+ORDER_JOURNAL_PATH = os.getenv('ORDER_JOURNAL_PATH', 'state/order_journal.jsonl')  # 주문 선기록 저널 (재시작 복구)
+ORDER_RECOVERY_MATCH_WINDOW = 120  # 접수 응답 없이 종료된 주문을 거래소 주문/체결과 대조할 시간 범위 (초)
+ORDER_CALLBACK_RETRY_MAX = 60  # 체결 반영(콜백) 실패 시 재시도 최대 간격 (초, 성공할 때까지 재시도)
+
+# Execution Pricing (호가창 기반 지정가 산정)
+EXECUTION_MAX_SLIPPAGE = float(os.getenv('EXECUTION_MAX_SLIPPAGE', 0.01))  # 예상 슬리피지 한도 (초과 시 주문 생략)
+EXECUTION_FALLBACK_SLIPPAGE = 0.005  # 호가창이 없을 때 기준가 대비 가격 여유 (기존 0.5%)
+EXECUTION_SAFETY_TICKS = 1  # 필요한 마지막 호가 대비 추가 틱 (조회~주문 사이 호가 변동 흡수)
+EXECUTION_ORDERBOOK_MAX_AGE = 5  # 엔진 호가창 캐시 허용 경과 시간 (초, 초과 시 직접 조회)
+EXECUTION_ORDERBOOK_DEPTH = 30
+
+# Execution Algorithms (호가가 얇은 코인의 분할 주문)
+EXECUTION_SLICE_ALGO = os.getenv('EXECUTION_SLICE_ALGO', 'iceberg')  # 'iceberg' (잔량 기준) 또는 'twap' (시간 분할)
+EXECUTION_PARTICIPATION_RATE = float(os.getenv('EXECUTION_PARTICIPATION_RATE', 0.3))  # 자식 주문 1회 최대 비중 (밴드 내 호가 잔량 대비)
+EXECUTION_DEPTH_BAND = 0.005  # 참여율 계산 호가 범위 (최우선 호가 대비 0.5%)
+EXECUTION_SLICE_INTERVAL = 3  # 자식 주문 간격 (초, 호가 회복 대기)
+EXECUTION_SLICE_DURATION = 120  # 분할 주문 최대 진행 시간 (초, TWAP 분할 기간)
+
+# Account Balance
+BALANCE_CACHE_TTL = float(os.getenv('BALANCE_CACHE_TTL', 3))  # 잔고 캐시 유지 시간 (초)
+BALANCE_PRICE_MAX_AGE = 30  # 잔고 평가 시 엔진 시세 캐시 허용 지연 (초)
+
+
+def __getattr__(name):
+    # DATABASE_URL은 첫 접근 시 생성 (config import 시 SQLAlchemy 로드 방지)
+    if name == 'DATABASE_URL':
+        from sqlalchemy import URL
+        return URL.create(
+            'postgresql',
+            username=DB_USER,
+            password=DB_PASSWORD,
+            host=DB_HOST,
+            database=DB_NAME,
+        )
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
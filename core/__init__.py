@@ -1,4 +1,18 @@
-from .risk_manager import RiskManager
-from .order_executor import OrderExecutor
+import importlib
 
-__all__ = ['RiskManager', 'OrderExecutor']
+_EXPORTS = {
+    'RiskManager': '.risk_manager',
+    'OrderExecutor': '.order_executor',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    # 첫 접근 시 로드 (core.risk_manager 만 쓰는 스크립트가 API 클라이언트까지 로드하지 않도록)
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
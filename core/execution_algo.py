@@ -0,0 +1,285 @@
+"""
+분할 주문 실행 (호가가 얇은 코인)
+- 참여율 제한: 최우선 호가 대비 밴드 내 잔량의 일정 비율까지만 한 번에 주문
+- iceberg: 잔량 기준 - 매 자식 주문마다 현재 호가창 잔량으로 크기 재산정
+- twap: 시간 분할 - 남은 기간 동안 균등 분할 (참여율 상한 동시 적용)
+- 자식 주문은 순차 제출 (직전 자식 주문이 최종 상태가 된 뒤 간격 대기)
+- 자식 체결은 부모 주문에 합산되어 하나의 포지션으로 반영
+"""
+
+import itertools
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from core.execution_pricing import ExecutionPricer
+from core.order_manager import ManagedOrder, NEW, PARTIAL, FILLED, CANCELED, REJECTED, FINAL_STATES
+import config
+
+MIN_ORDER_KRW = 5000    # 빗썸 최소 주문 금액
+
+_parent_ids = itertools.count(1)
+
+
+def participation_cap(orderbook: Optional[Dict], side: str, rate: float = None,
+                      band: float = None) -> Optional[float]:
+    """
+    1회 주문 가능 금액 (KRW) = 최우선 호가 대비 band 이내 잔량 금액 × rate
+    Returns:
+        상한 금액 (호가창 없으면 None)
+    """
+    rate = rate if rate is not None else config.EXECUTION_PARTICIPATION_RATE
+    band = band if band is not None else config.EXECUTION_DEPTH_BAND
+
+    levels = (orderbook or {}).get('asks' if side == 'BUY' else 'bids') or []
+    if not levels:
+        return None
+
+    best = float(levels[0]['price'])
+    limit = best * (1 + band) if side == 'BUY' else best * (1 - band)
+    depth = 0.0
+    for level in levels:
+        price = float(level['price'])
+        if (side == 'BUY' and price > limit) or (side == 'SELL' and price < limit):
+            break
+        depth += price * float(level['quantity'])
+    return depth * rate
+
+
+class ParentOrder:
+    """
+    분할 주문 (부모)
+    체결 관련 속성은 ManagedOrder 와 같은 이름으로 제공 - 포지션 반영 로직을 그대로 사용
+    """
+
+    def __init__(self, symbol: str, side: str, algo: str, purpose: str = 'entry', position_id: int = None,
+                 krw: float = None, units: float = None, reference_price: float = 0.0,
+                 context: Dict = None, duration: float = None, interval: float = None):
+        """
+        Args:
+            algo: 'iceberg' 또는 'twap'
+            krw: 목표 주문 금액 (매수)
+            units: 목표 주문 수량 (매도)
+            reference_price: 시그널/현재가 (호가창 없을 때 기준)
+            duration: 최대 진행 시간 (초, 기본: config.EXECUTION_SLICE_DURATION)
+            interval: 자식 주문 간격 (초, 기본: config.EXECUTION_SLICE_INTERVAL)
+        """
+        self.parent_id = f"po_{int(time.time() * 1000)}_{next(_parent_ids)}"
+        self.symbol = symbol
+        self.side = side
+        self.algo = algo
+        self.purpose = purpose
+        self.position_id = position_id
+        self.target_krw = krw
+        self.target_units = units
+        self.reference_price = reference_price
+        self.context = context or {}
+        self.interval = interval if interval is not None else config.EXECUTION_SLICE_INTERVAL
+
+        self.children: List[ManagedOrder] = []
+        self.active: Optional[ManagedOrder] = None
+        self.state = NEW
+        self.error: Optional[str] = None
+        self.settled = False    # 최종 상태가 포지션에 반영됨 (OrderSlicer.settle) - 이후 목록에서 제거
+
+        self.created_at = time.time()
+        self.deadline = self.created_at + (duration if duration is not None else config.EXECUTION_SLICE_DURATION)
+        self.next_at = self.created_at
+
+    @property
+    def filled_units(self) -> float:
+        return sum(child.filled_units for child in self.children)
+
+    @property
+    def notional(self) -> float:
+        return sum(child.filled_units * child.avg_price for child in self.children)
+
+    @property
+    def avg_price(self) -> float:
+        filled = self.filled_units
+        return self.notional / filled if filled > 0 else 0.0
+
+    @property
+    def fee(self) -> float:
+        return sum(child.fee for child in self.children)
+
+    @property
+    def units(self) -> float:
+        """목표 수량 (금액 지정이면 현재 평균가/기준가로 환산)"""
+        if self.target_units is not None:
+            return self.target_units
+        price = self.avg_price or self.reference_price
+        return self.target_krw / price if price > 0 else 0.0
+
+    @property
+    def is_open(self) -> bool:
+        return self.state not in FINAL_STATES
+
+    def remaining_krw(self, price: float) -> float:
+        """남은 주문 금액 (수량 지정이면 price 로 환산)"""
+        if self.target_krw is not None:
+            return max(self.target_krw - self.notional, 0.0)
+        return max(self.target_units - self.filled_units, 0.0) * price
+
+    def to_dict(self) -> Dict:
+        return {
+            'parent_id': self.parent_id,
+            'symbol': self.symbol,
+            'side': self.side,
+            'algo': self.algo,
+            'purpose': self.purpose,
+            'position_id': self.position_id,
+            'state': self.state,
+            'children': len(self.children),
+            'filled_units': self.filled_units,
+            'avg_price': self.avg_price,
+            'fee': self.fee,
+        }
+
+
+class OrderSlicer:
+    """부모 주문 스케줄링 - 자식 주문 크기 산정/제출, 체결 합산"""
+
+    def __init__(self, pricer: ExecutionPricer, submit: Callable[[ManagedOrder], None],
+                 on_finish: Callable[[ParentOrder], None] = None):
+        """
+        Args:
+            pricer: 호가창 조회/지정가 산정
+            submit: 자식 주문 제출 함수 (주문 기록 생성 + OrderManager 제출)
+            on_finish: 자식 주문 체결과 무관하게 종료된 경우(기한 초과 등) 호출 - on_finish(parent)
+        """
+        self.pricer = pricer
+        self.submit = submit
+        self.on_finish = on_finish
+
+        self._parents: Dict[str, ParentOrder] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.is_running = False
+
+    def needs_slicing(self, orderbook: Optional[Dict], side: str, krw: float) -> bool:
+        """주문 금액이 참여율 상한을 넘는지 (호가창 없으면 분할하지 않음)"""
+        cap = participation_cap(orderbook, side)
+        return cap is not None and krw > max(cap, MIN_ORDER_KRW)
+
+    def start_parent(self, parent: ParentOrder) -> ParentOrder:
+        """부모 주문 등록 - 첫 자식 주문은 스케줄러 스레드가 즉시 제출"""
+        with self._lock:
+            self._parents[parent.parent_id] = parent
+        self.start()
+        self._wakeup.set()
+        return parent
+
+    def start(self):
+        if self.is_running:
+            return
+        self.is_running = True
+        self._thread = threading.Thread(target=self._run, name='order-slicer', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.is_running = False
+        self._wakeup.set()
+
+    def open_parents(self) -> List[ParentOrder]:
+        with self._lock:
+            return [parent for parent in self._parents.values() if parent.is_open]
+
+    def _run(self):
+        while self.is_running:
+            self._wakeup.wait(0.5)
+            self._wakeup.clear()
+            now = time.time()
+            for parent in self.open_parents():
+                if parent.active is None and now >= parent.next_at:
+                    try:
+                        self._next_child(parent)
+                    except Exception as e:
+                        print(f"[OrderSlicer ERROR] 자식 주문 에러 ({parent.symbol}): {str(e)}")
+                        parent.next_at = now + parent.interval
+
+            # 종료 후에도 포지션 반영(settle) 전까지 유지 - 최종 자식 체결 반영이 실패해 재전달될 때 부모 합산 필요
+            with self._lock:
+                for parent_id in [pid for pid, parent in self._parents.items()
+                                  if not parent.is_open and parent.settled]:
+                    del self._parents[parent_id]
+
+    def settle(self, parent: ParentOrder):
+        """종료된 부모 주문의 포지션 반영 완료 - 다음 주기에 목록에서 제거"""
+        parent.settled = True
+        self._wakeup.set()
+
+    def _next_child(self, parent: ParentOrder):
+        """현재 호가창 기준 자식 주문 크기 산정 후 제출 (완료/기한 초과 시 종료)"""
+        book = self.pricer.get_orderbook(parent.symbol)
+        quote_side = (book or {}).get('asks' if parent.side == 'BUY' else 'bids') or []
+        price = float(quote_side[0]['price']) if quote_side else parent.reference_price
+
+        remaining = parent.remaining_krw(price)
+        if remaining < MIN_ORDER_KRW or time.time() >= parent.deadline:
+            self._finish(parent)
+            if self.on_finish:
+                self.on_finish(parent)
+            return
+
+        cap = participation_cap(book, parent.side)
+        child_krw = remaining if cap is None else min(remaining, cap)
+        if parent.algo == 'twap':
+            slices_left = max(int((parent.deadline - time.time()) / parent.interval), 1)
+            child_krw = min(child_krw, remaining / slices_left)
+        child_krw = max(child_krw, MIN_ORDER_KRW)
+        # 최소 주문 금액 미만 잔량이 남지 않도록 마지막 자식 주문에 합산
+        if remaining - child_krw < MIN_ORDER_KRW:
+            child_krw = remaining
+
+        if parent.side == 'BUY':
+            quote = self.pricer.quote(parent.symbol, parent.side, parent.reference_price, krw=child_krw, orderbook=book)
+        else:
+            quote = self.pricer.quote(parent.symbol, parent.side, parent.reference_price,
+                                      units=child_krw / price, orderbook=book)
+        if not quote['acceptable'] or quote['units'] <= 0:
+            # 호가 회복 대기
+            parent.next_at = time.time() + parent.interval
+            return
+
+        child = ManagedOrder(parent.symbol, parent.side, quote['units'], quote['price'], purpose=parent.purpose,
+                             position_id=parent.position_id,
+                             context={'mid_price': quote['mid_price'], 'expected_price': quote['expected_price'],
+                                      'parent_id': parent.parent_id, 'slice': len(parent.children) + 1})
+        parent.active = child
+        parent.children.append(child)
+        self.submit(child)
+
+    def on_child_update(self, child: ManagedOrder) -> Optional[ParentOrder]:
+        """
+        자식 주문 상태/체결 변경 반영 (체결 추적 스레드에서 호출)
+        Returns:
+            부모 주문 (알 수 없는 자식이면 None)
+        """
+        with self._lock:
+            parent = self._parents.get(child.context.get('parent_id'))
+        if parent is None:
+            return None
+
+        if child.filled_units > 0 and parent.state == NEW:
+            parent.state = PARTIAL
+
+        if child.state in FINAL_STATES and parent.active is child:
+            parent.active = None
+            if child.state == REJECTED:
+                # 잔고 부족 등 - 이후 자식 주문도 실패하므로 종료
+                parent.error = child.error
+                self._finish(parent)
+            elif parent.remaining_krw(child.avg_price or child.price) < MIN_ORDER_KRW \
+                    or time.time() >= parent.deadline:
+                self._finish(parent)
+            else:
+                parent.next_at = time.time() + parent.interval
+                self._wakeup.set()
+        return parent
+
+    def _finish(self, parent: ParentOrder):
+        """부모 주문 종료 - 전량 체결이면 FILLED, 아니면 CANCELED (체결분은 유지)"""
+        price = parent.avg_price or parent.reference_price
+        parent.state = FILLED if parent.remaining_krw(price) < MIN_ORDER_KRW else CANCELED
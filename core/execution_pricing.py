@@ -0,0 +1,186 @@
+"""
+호가창 기반 지정가 산정
+- 빗썸 KRW 마켓 가격대별 호가 단위(틱) 적용 (1원 미만 코인 포함)
+- 주문 수량/금액만큼 호가를 소진하는 최소 체결 가능 가격 산정
+- 주문 전 예상 평균 체결가와 중간가 대비 슬리피지 추정
+"""
+
+import math
+from datetime import datetime
+from decimal import Decimal, ROUND_CEILING, ROUND_FLOOR
+from typing import Dict, List, Optional, Tuple
+
+from api import BithumbAPI
+import config
+
+# (가격 상한, 호가 단위) - 빗썸 KRW 마켓
+TICK_BANDS = [
+    (1, Decimal('0.0001')),
+    (10, Decimal('0.001')),
+    (100, Decimal('0.01')),
+    (1000, Decimal('0.1')),
+    (5000, Decimal('1')),
+    (10000, Decimal('5')),
+    (50000, Decimal('10')),
+    (100000, Decimal('50')),
+    (500000, Decimal('100')),
+    (1000000, Decimal('500')),
+]
+MAX_TICK = Decimal('1000')
+
+
+def tick_size(price: float) -> Decimal:
+    """가격대별 호가 단위"""
+    for upper, tick in TICK_BANDS:
+        if price < upper:
+            return tick
+    return MAX_TICK
+
+
+def round_to_tick(price: float, side: str) -> float:
+    """
+    호가 단위로 반올림 (매수는 올림, 매도는 내림 - 체결 가능 방향)
+    Args:
+        side: 'BUY' 또는 'SELL'
+    """
+    value = Decimal(str(price))
+    tick = tick_size(price)
+    steps = (value / tick).to_integral_value(rounding=ROUND_CEILING if side == 'BUY' else ROUND_FLOOR)
+    return float(max(steps, 1) * tick)
+
+
+def step_ticks(price: float, side: str, ticks: int) -> float:
+    """가격을 체결 가능 방향으로 n틱 이동"""
+    for _ in range(ticks):
+        tick = tick_size(price) if side == 'BUY' else tick_size(float(Decimal(str(price)) - Decimal('1e-9')))
+        price = float(Decimal(str(price)) + tick) if side == 'BUY' else float(Decimal(str(price)) - tick)
+    return round_to_tick(price, side)
+
+
+def floor_units(units: float) -> float:
+    """주문 수량 소수점 8자리 내림"""
+    return math.floor(units * 1e8) / 1e8
+
+
+def walk_levels(levels: List[Tuple[float, float]], units: float = None,
+                krw: float = None) -> Tuple[float, float, float, int, bool]:
+    """
+    호가 소진 시뮬레이션 (수량 또는 금액 기준)
+    Returns:
+        (체결 수량, 체결 금액, 마지막 소진 호가, 소진 단계 수, 전량 충족 여부)
+    """
+    filled = notional = last_price = 0.0
+    used = 0
+    for price, quantity in levels:
+        if units is not None:
+            take = min(quantity, units - filled)
+        else:
+            take = min(quantity, (krw - notional) / price)
+        if take <= 0:
+            break
+        filled += take
+        notional += take * price
+        last_price = price
+        used += 1
+        if (units is not None and filled >= units - 1e-12) or (krw is not None and notional >= krw - 1e-9):
+            return filled, notional, last_price, used, True
+    return filled, notional, last_price, used, False
+
+
+class ExecutionPricer:
+    """주문 가격/수량 산정 + 슬리피지 추정"""
+
+    def __init__(self, api: BithumbAPI = None, orderbook_cache: Dict = None,
+                 max_slippage: float = None, safety_ticks: int = None):
+        """
+        Args:
+            orderbook_cache: 엔진 호가창 캐시 ({symbol: {'bids', 'asks', 'timestamp'}})
+            max_slippage: 허용 예상 슬리피지 (기본: config.EXECUTION_MAX_SLIPPAGE)
+            safety_ticks: 마지막 소진 호가 대비 추가 틱 (기본: config.EXECUTION_SAFETY_TICKS)
+        """
+        self.api = api
+        self.orderbook_cache = orderbook_cache
+        self.max_slippage = max_slippage if max_slippage is not None else config.EXECUTION_MAX_SLIPPAGE
+        self.safety_ticks = safety_ticks if safety_ticks is not None else config.EXECUTION_SAFETY_TICKS
+
+    def get_orderbook(self, symbol: str) -> Optional[Dict]:
+        """신선한 캐시 호가창 우선, 없으면 직접 조회"""
+        book = self.orderbook_cache.get(symbol) if self.orderbook_cache is not None else None
+        if book and (datetime.now() - book['timestamp']).total_seconds() <= config.EXECUTION_ORDERBOOK_MAX_AGE:
+            return book
+
+        if self.api is None:
+            return None
+        result = self.api.get_orderbook(symbol, config.EXECUTION_ORDERBOOK_DEPTH)
+        if result.get('status') != '0000':
+            return None
+        data = result['data']
+        return {'bids': data.get('bids', []), 'asks': data.get('asks', [])}
+
+    def quote(self, symbol: str, side: str, reference_price: float, units: float = None,
+              krw: float = None, orderbook: Dict = None) -> Dict:
+        """
+        주문 가격/수량 산정
+        Args:
+            side: 'BUY' 또는 'SELL'
+            reference_price: 시그널/현재가 (호가창 없을 때 기준)
+            units: 주문 수량 (매도, 수량 지정 매수)
+            krw: 주문 금액 (금액 지정 매수)
+            orderbook: 호가창 (없으면 get_orderbook)
+        Returns:
+            {'price', 'units', 'expected_price', 'mid_price', 'slippage', 'levels',
+             'covered', 'source', 'acceptable'}
+        """
+        book = orderbook if orderbook is not None else self.get_orderbook(symbol)
+        raw = (book or {}).get('asks' if side == 'BUY' else 'bids') or []
+        levels = [(float(level['price']), float(level['quantity'])) for level in raw]
+
+        if not levels:
+            return self._fallback(side, reference_price, units, krw)
+
+        bids, asks = (book.get('bids') or []), (book.get('asks') or [])
+        if bids and asks:
+            mid = (float(bids[0]['price']) + float(asks[0]['price'])) / 2
+        else:
+            mid = levels[0][0]
+
+        _, _, last_price, used, covered = walk_levels(levels, units=units, krw=krw)
+        if not covered:
+            # 보이는 호가로 부족 - 마지막 호가에 기존 여유폭 적용
+            sign = 1 if side == 'BUY' else -1
+            last_price = last_price * (1 + sign * config.EXECUTION_FALLBACK_SLIPPAGE)
+        price = step_ticks(round_to_tick(last_price, side), side, self.safety_ticks)
+
+        # 금액 지정 시 지정가 기준으로 수량 산정 (예약 금액이 주문 금액을 넘지 않도록)
+        order_units = floor_units(units if units is not None else krw / price)
+        filled, notional, _, _, _ = walk_levels(levels, units=order_units)
+        expected = notional / filled if filled > 0 else price
+        slippage = (expected - mid) / mid if side == 'BUY' else (mid - expected) / mid
+
+        return {
+            'price': price,
+            'units': order_units,
+            'expected_price': expected,
+            'mid_price': mid,
+            'slippage': slippage,
+            'levels': used,
+            'covered': covered,
+            'source': 'orderbook',
+            'acceptable': covered and slippage <= self.max_slippage,
+        }
+
+    def _fallback(self, side: str, reference_price: float, units: float = None, krw: float = None) -> Dict:
+        """호가창 없음 - 기준가 ± 여유폭 (호가 단위 보정)"""
+        sign = 1 if side == 'BUY' else -1
+        price = round_to_tick(reference_price * (1 + sign * config.EXECUTION_FALLBACK_SLIPPAGE), side)
+        return {
+            'price': price,
+            'units': floor_units(units if units is not None else krw / price),
+            'expected_price': reference_price,
+            'mid_price': reference_price,
+            'slippage': config.EXECUTION_FALLBACK_SLIPPAGE,
+            'levels': 0,
+            'covered': False,
+            'source': 'fallback',
+            'acceptable': True,
+        }
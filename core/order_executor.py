@@ -4,12 +4,19 @@
 """
 
 import time
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional
 from decimal import Decimal
 from datetime import datetime
+from sqlalchemy import update
+from sqlalchemy.orm import object_session
 from api import BithumbAPI
-from database import SessionLocal, Position, Order, TradingSignal, SystemLog
+from database import SessionLocal, Position, Order, Trade, TradingSignal, SystemLog
+from core.order_manager import OrderManager, ManagedOrder, FILLED, CANCELED, FINAL_STATES
+from core.execution_pricing import ExecutionPricer
+from core.execution_algo import OrderSlicer, ParentOrder
+from core.order_journal import OrderJournal
 import config
+from utils import metrics
 
 
 class OrderExecutor:
@@ -20,6 +27,31 @@ class OrderExecutor:
         self.db = SessionLocal()
         self.is_live_mode = (config.TRADE_MODE == 'live')
 
+        # 잔고 캐시 (한 사이클 내 반복 조회 방지)
+        self._balance_cache = None
+        self._balance_cache_time = 0.0
+
+        # 시세 캐시 ({symbol: {'price', 'timestamp'}}) - 엔진이 market_data_cache 연결
+        self.price_cache = None
+
+        # 지정가 산정 (엔진이 pricer.orderbook_cache 에 호가창 캐시 연결)
+        self.pricer = ExecutionPricer(self.api)
+
+        # 포지션 체결 이벤트 콜백 - callback(event, info), event: 'open' / 'close' / 'canceled'
+        self.position_listeners: List[Callable[[str, Dict], None]] = []
+
+        # 실전 주문은 비동기 제출 + 체결 추적 (첫 주문 시 생성 - 잔고 조회용 인스턴스는 스레드 없음)
+        self.order_manager: Optional[OrderManager] = None
+
+        # 주문 선기록 저널 (재시작 시 recover_orders 로 복구)
+        self.journal = OrderJournal()
+
+        # 체결 반영 실패 후 재시도 대기 중인 주문 (client_id) - OrderManager 가 성공할 때까지 재전달
+        self._failed_updates = set()
+
+        # 호가가 얇은 코인은 참여율 제한으로 분할 주문 (자식 체결은 하나의 포지션에 합산)
+        self.slicer = OrderSlicer(self.pricer, self._submit_child, on_finish=self._on_parent_finish)
+
     def execute_signal(self, signal: TradingSignal, position_size_krw: float) -> Optional[Position]:
         """
         시그널 실행
@@ -44,17 +76,16 @@ class OrderExecutor:
             self._log_info(f"거래 모드: {'실전' if self.is_live_mode else '페이퍼'} | {symbol} {signal_type} {position_size_krw:.0f}원")
 
             if self.is_live_mode:
-                order_result = self._execute_live_order(symbol, signal_type, position_size_krw, entry_price)
-                if not order_result:
-                    self._log_error(f"실전 주문 실패: {symbol}")
-                    return None
-                # 실제 체결된 수량 사용
-                actual_quantity = order_result.get('filled_quantity', 0)
-            else:
-                # 모의 거래는 예상 수량 계산
-                quantity = position_size_krw / entry_price
-                order_result = self._execute_paper_order(symbol, signal_type, quantity, entry_price)
-                actual_quantity = order_result.get('filled_quantity', quantity)
+                # 주문 접수만 하고 반환 - 체결 수량/평균가는 체결 추적 시 포지션에 반영
+                return self._submit_live_entry(signal, position_size_krw)
+
+            # 모의 거래는 예상 수량 계산
+            quantity = position_size_krw / entry_price
+            order_result = self._execute_paper_order(symbol, signal_type, quantity, entry_price)
+            actual_quantity = order_result.get('filled_quantity', quantity)
+
+            # 주문 후 잔고 변동 반영
+            self.invalidate_balance_cache()
 
             # 포지션 생성
             position = Position(
@@ -73,7 +104,8 @@ class OrderExecutor:
             )
 
             self.db.add(position)
-            self.db.commit()
+            with metrics.DB_COMMIT_SECONDS.time(component='order_executor'):
+                self.db.commit()
             self.db.refresh(position)
 
             # 주문 기록
@@ -101,47 +133,405 @@ class OrderExecutor:
             self._log_error(f"시그널 실행 실패: {str(e)}")
             return None
 
-    def _execute_live_order(self, symbol: str, side: str, quantity: float, price: float) -> Optional[Dict]:
-        """실제 거래소 주문 (지정가 주문으로 즉시 체결)"""
-        try:
-            # 빗썸은 시장가 주문 미지원, 지정가로 즉시 체결
-            order_type = 'bid' if side == 'BUY' else 'ask'
+    def _submit_live_entry(self, signal: TradingSignal, position_size_krw: float) -> Optional[Position]:
+        """
+        실전 진입 주문 비동기 제출 (호가창 기반 최소 체결 가능 지정가)
+        Returns:
+            체결 대기(PENDING) 포지션 (예상 슬리피지 초과 시 None)
+        """
+        symbol = signal.symbol
+        side = 'BUY' if signal.signal_type == 'BUY' else 'SELL'
+        price = float(signal.entry_price)
+
+        # 빗썸은 시장가 주문 미지원, 주문 금액만큼 호가를 소진하는 지정가로 즉시 체결
+        # 참여율 상한을 넘는 주문은 분할 (자식 주문마다 슬리피지 검증)
+        book = self.pricer.get_orderbook(symbol)
+        sliced = self.slicer.needs_slicing(book, side, position_size_krw)
 
-            # 즉시 체결을 위해 가격 조정
+        if not sliced:
             if side == 'BUY':
-                # 매수: 현재가보다 0.5% 높게 (즉시 체결)
-                order_price = round(price * 1.005, 0)  # 원 단위로 반올림
-                # 주문 수량 계산 (KRW → 코인), 소수점 8자리
-                units = round(quantity / order_price, 8)
+                quote = self.pricer.quote(symbol, side, price, krw=position_size_krw, orderbook=book)
             else:
-                # 매도: 현재가보다 0.5% 낮게 (즉시 체결)
-                order_price = round(price * 0.995, 0)
-                # 매도 수량, 소수점 8자리
-                units = round(quantity / price, 8) if price > 0 else 0
+                quote = self.pricer.quote(symbol, side, price, units=position_size_krw / price, orderbook=book)
+            if not quote['acceptable']:
+                self._log_error(f"주문 생략 ({symbol}): 예상 슬리피지 {quote['slippage']*100:.2f}% "
+                                f"(호가 {quote['levels']}단계, 충족 {'O' if quote['covered'] else 'X'})")
+                return None
 
-            # 디버깅 로그
-            self._log_info(f"주문 준비: {symbol} {side} | units={units:.8f}, price={order_price:.0f}, total={units*order_price:.0f}원")
+            units, order_price = quote['units'], quote['price']
+            self._log_info(f"주문 준비: {symbol} {side} | units={units:.8f}, price={order_price:,.4f}, "
+                           f"total={units*order_price:.0f}원, 예상 슬리피지 {quote['slippage']*10000:.1f}bp ({quote['source']})")
+
+        position = Position(
+            symbol=symbol,
+            strategy_id=signal.strategy_id,
+            signal_id=signal.id,
+            position_type='LONG' if side == 'BUY' else 'SHORT',
+            entry_price=signal.entry_price,
+            quantity=Decimal('0'),
+            current_price=signal.entry_price,
+            unrealized_pnl=Decimal('0'),
+            stop_loss=signal.stop_loss,
+            take_profit=signal.take_profit,
+            status='PENDING',
+            opened_at=datetime.now()
+        )
+        self.db.add(position)
+        with metrics.DB_COMMIT_SECONDS.time(component='order_executor'):
+            self.db.commit()
+        self.db.refresh(position)
+
+        if sliced:
+            self._start_parent(ParentOrder(
+                symbol, side, config.EXECUTION_SLICE_ALGO, purpose='entry', position_id=position.id,
+                krw=position_size_krw if side == 'BUY' else None,
+                units=position_size_krw / price if side == 'SELL' else None,
+                reference_price=price
+            ))
+        else:
+            self._submit(ManagedOrder(symbol, side, units, order_price, purpose='entry', position_id=position.id,
+                                      context=self._quote_context(side, quote)))
+        return position
+
+    @staticmethod
+    def _quote_context(side: str, quote: Dict) -> Dict:
+        """예상 슬리피지 기록 + 체결 후 실현 슬리피지 계산용 중간가"""
+        metrics.EXECUTION_SLIPPAGE_BPS.observe(max(quote['slippage'], 0) * 10000, side=side, stage='expected')
+        return {'mid_price': quote['mid_price'], 'expected_price': quote['expected_price']}
+
+    def _start_parent(self, parent: ParentOrder):
+        """분할 주문 시작 (자식 주문은 분할 스레드가 순차 제출)"""
+        self._ensure_order_manager()
+        self.slicer.start_parent(parent)
+        self._log_info(f"분할 주문 시작 ({parent.algo}): {parent.symbol} {parent.side} "
+                       + (f"{parent.target_krw:,.0f}원" if parent.target_krw is not None
+                          else f"{parent.target_units:.8f}개")
+                       + f" | 참여율 {config.EXECUTION_PARTICIPATION_RATE:.0%}")
+
+    def _submit_child(self, managed: ManagedOrder):
+        """자식 주문 제출 (분할 스레드에서 호출 - 전용 세션 사용)"""
+        db = SessionLocal()
+        try:
+            self._submit(managed, db)
+        finally:
+            db.close()
+
+    def _ensure_order_manager(self):
+        if self.order_manager is None:
+            self.order_manager = OrderManager(self.api, journal=self.journal)
+            self.order_manager.add_listener(self._on_order_update)
+            self.order_manager.start()
+
+    def _submit(self, managed: ManagedOrder, db=None):
+        """주문 기록(NEW) 생성 후 비동기 제출"""
+        db = db or self.db
+        order = Order(
+            position_id=managed.position_id,
+            order_id=managed.client_id,     # 거래소 접수 후 주문 ID로 교체
+            symbol=managed.symbol,
+            order_type='LIMIT',
+            side=managed.side,
+            price=Decimal(str(managed.price)),
+            quantity=Decimal(str(managed.units)),
+            filled_quantity=Decimal('0'),
+            status=managed.state
+        )
+        db.add(order)
+        db.commit()
+
+        managed.record_id = order.id
+        self._ensure_order_manager()
+        self.order_manager.submit(managed)
+
+    def adopt_order(self, managed: ManagedOrder):
+        """거래소에 접수된 주문 추적 재개 (재시작 복구)"""
+        self._ensure_order_manager()
+        self.order_manager.adopt(managed)
+
+    def recover_orders(self) -> Dict:
+        """
+        재시작 복구 - 저널 미완료 주문/거래소 주문/포지션 대조 (실전 모드 시작 시 1회)
+        Returns:
+            복구 요약 (OrderReconciler.run)
+        """
+        from core.order_reconciler import OrderReconciler
 
-            result = self.api.place_order(
-                symbol=symbol,
-                order_type=order_type,
-                quantity=units,
-                price=order_price
-            )
+        summary = OrderReconciler(self).run()
+        if any(summary.values()):
+            self._log_info("주문 복구: " + ", ".join(f"{key} {value}" for key, value in summary.items() if value))
+        return summary
 
-            if result.get('status') == '0000':
-                return {
-                    'order_id': result.get('order_id'),
-                    'filled_price': order_price,
-                    'filled_quantity': units  # 실제 주문한 코인 수량
-                }
+    def wait_for_orders(self, timeout: float = None) -> bool:
+        """
+        제출한 실전 주문이 모두 최종 상태가 될 때까지 대기 (단발성 스크립트 종료 전 사용)
+        Returns:
+            모두 완료 여부
+        """
+        if self.order_manager is None:
+            return True
+        timeout = timeout if timeout is not None else config.ORDER_STALE_SECONDS + 10
+        if self.slicer.open_parents():
+            timeout += config.EXECUTION_SLICE_DURATION
+
+        deadline = time.time() + timeout
+        while self.slicer.open_parents():
+            if time.time() >= deadline:
+                return False
+            time.sleep(0.2)
+        return self.order_manager.wait_idle(max(deadline - time.time(), 0))
+
+    def _on_order_update(self, managed: ManagedOrder, previous_state: str):
+        """
+        주문 상태/체결 변경 → orders, positions 반영 (추적 스레드에서 호출, 전용 세션 사용)
+        반영 실패 시 예외를 다시 발생시켜 OrderManager 가 다음 추적 주기부터 재전달
+        (최초 실패만 system_logs 기록, 재시작 시에는 OrderReconciler 가 PENDING/CLOSING 포지션 복구)
+        주문 기록이 이미 최종 상태면 반영 완료된 중복 전달이므로 무시
+        """
+        db = SessionLocal()
+        try:
+            events = []
+            try:
+                order = db.get(Order, managed.record_id) if managed.record_id else None
+                if order is not None and order.status in FINAL_STATES:
+                    self._failed_updates.discard(managed.client_id)
+                    return
+                if order:
+                    if managed.order_id:
+                        order.order_id = managed.order_id
+                    order.status = managed.state
+                    order.filled_quantity = Decimal(str(managed.filled_units))
+                    order.fee = Decimal(str(managed.fee))
+                    if managed.filled_units > 0:
+                        order.price = Decimal(str(managed.avg_price))   # 실제 평균 체결가
+                    if managed.state in (FILLED, CANCELED) and managed.filled_units > 0:
+                        order.executed_at = datetime.now()
+
+                # 자식 주문은 부모 주문 합산 체결로 포지션 반영
+                target = managed
+                if 'parent_id' in managed.context:
+                    target = self.slicer.on_child_update(managed)
+                    if target is None and 'recovered_records' in managed.context:
+                        # 재시작 전 분할 주문의 자식 - 형제 주문 기록 합산으로 반영 (이후 자식 주문 없음)
+                        target = self._recovered_parent(db, managed)
+                if target is not None:
+                    events = self._reconcile_position(db, target)
+
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                if managed.client_id not in self._failed_updates:
+                    self._failed_updates.add(managed.client_id)
+                    self._log_error(f"체결 반영 실패 - 재시도 예정 ({managed.symbol} {managed.side} "
+                                    f"{managed.purpose}, 포지션 {managed.position_id}, {managed.state}): {str(e)}", db)
+                raise
+
+            if isinstance(target, ParentOrder) and target.state in FINAL_STATES:
+                # 최종 자식 체결까지 반영된 부모 주문 - 분할 스레드가 정리
+                self.slicer.settle(target)
+
+            if managed.client_id in self._failed_updates:
+                self._failed_updates.discard(managed.client_id)
+                self._log_info(f"체결 반영 복구: {managed.symbol} {managed.side} {managed.purpose} "
+                               f"(포지션 {managed.position_id}, {managed.state})", db)
+
+            if managed.state in FINAL_STATES and managed.filled_units > 0:
+                self.invalidate_balance_cache()
+                mid = managed.context.get('mid_price')
+                if mid:
+                    sign = 1 if managed.side == 'BUY' else -1
+                    metrics.EXECUTION_SLIPPAGE_BPS.observe(
+                        max(sign * (managed.avg_price - mid) / mid, 0) * 10000, side=managed.side, stage='realized'
+                    )
+
+            if managed.state in FINAL_STATES:
+                self._log_info(f"주문 {managed.state}: {managed.symbol} {managed.side} "
+                               f"{managed.filled_units:.8f}/{managed.units:.8f} @ {managed.avg_price:,.0f}원"
+                               + (f" | {managed.error}" if managed.error else ""), db)
+
+            if target is not managed and target is not None and target.state in FINAL_STATES:
+                self._finish_parent(target, events, db)
             else:
-                self._log_error(f"주문 실패: {result.get('message')} | 상세: {result}")
-                return None
+                self._emit_position_events(events)
+        finally:
+            db.close()
+
+    @staticmethod
+    def _recovered_parent(db, managed: ManagedOrder) -> ManagedOrder:
+        """형제 자식 주문 기록(orders)의 체결 합산 → 부모 주문 대용"""
+        records = db.query(Order).filter(Order.id.in_(managed.context['recovered_records'])).all()
+        filled = sum(float(record.filled_quantity or 0) for record in records)
+        notional = sum(float(record.filled_quantity or 0) * float(record.price) for record in records)
+
+        aggregate = ManagedOrder(managed.symbol, managed.side, managed.units, managed.price,
+                                 purpose=managed.purpose, position_id=managed.position_id,
+                                 context={k: v for k, v in managed.context.items() if k != 'parent_id'})
+        aggregate.filled_units = filled
+        aggregate.avg_price = notional / filled if filled > 0 else 0.0
+        aggregate.state = managed.state
+        return aggregate
+
+    def _reconcile_position(self, db, managed) -> List:
+        """
+        주문(또는 분할 부모 주문) 체결 → 포지션 반영
+        Returns:
+            포지션 이벤트 리스트 [(event, info)]
+        """
+        position = db.get(Position, managed.position_id) if managed.position_id else None
+        if not position:
+            return []
+        if managed.purpose == 'entry':
+            return self._reconcile_entry(db, position, managed)
+        if managed.purpose == 'exit' and managed.state in FINAL_STATES:
+            return self._reconcile_exit(db, position, managed)
+        if managed.purpose == 'add' and managed.state in FINAL_STATES:
+            self._reconcile_add(position, managed)
+        return []
+
+    def _on_parent_finish(self, parent: ParentOrder):
+        """자식 주문 체결과 무관하게 종료된 분할 주문 (기한 초과/잔량 소진) → 포지션 확정"""
+        db = SessionLocal()
+        try:
+            try:
+                events = self._reconcile_position(db, parent)
+                db.commit()
+            except Exception as e:
+                db.rollback()
+                # 포지션은 PENDING/CLOSING 으로 남아 재시작 시 OrderReconciler 가 복구
+                self._log_error(f"분할 주문 반영 실패 ({parent.symbol} {parent.side}, 포지션 {parent.position_id}) "
+                                f"- 재시작 시 복구 대상: {str(e)}", db)
+                return
+            finally:
+                # 재전달 경로 없음 (자식 주문 없이 종료) - 성공/실패와 무관하게 정리
+                self.slicer.settle(parent)
+            self._finish_parent(parent, events, db)
+        finally:
+            db.close()
+
+    def _finish_parent(self, parent: ParentOrder, events: List, db):
+        self._log_info(f"분할 주문 {parent.state}: {parent.symbol} {parent.side} {len(parent.children)}회 | "
+                       f"{parent.filled_units:.8f} @ {parent.avg_price:,.4f}원"
+                       + (f" | {parent.error}" if parent.error else ""), db)
+        self._emit_position_events(events)
+
+    def _emit_position_events(self, events: List):
+        for event, info in events:
+            for callback in self.position_listeners:
+                try:
+                    callback(event, info)
+                except Exception as e:
+                    print(f"[OrderExecutor ERROR] 포지션 콜백 에러: {str(e)}")
+
+    def _reconcile_entry(self, db, position: Position, managed: ManagedOrder) -> List:
+        """진입 주문 체결 → 포지션 수량/평균 진입가 (최종 상태에서 OPEN 또는 CANCELED)"""
+        if position.status != 'PENDING':
+            return []   # 이미 반영된 진입 (중복 전달)
+        if managed.filled_units > 0:
+            position.quantity = Decimal(str(managed.filled_units))
+            position.entry_price = Decimal(str(managed.avg_price))
+            position.current_price = Decimal(str(managed.avg_price))
+
+        if managed.state not in FINAL_STATES:
+            return []
+
+        if managed.filled_units > 0:
+            position.status = 'OPEN'
+            signal = db.get(TradingSignal, position.signal_id) if position.signal_id else None
+            return [('open', {
+                'position_id': position.id,
+                'symbol': position.symbol,
+                'position_type': position.position_type,
+                'entry_price': managed.avg_price,
+                'quantity': managed.filled_units,
+                'investment': managed.avg_price * managed.filled_units,
+                'take_profit': float(position.take_profit) if position.take_profit else 0,
+                'stop_loss': float(position.stop_loss) if position.stop_loss else 0,
+                'strategy_id': position.strategy_id,
+                'confidence': float(signal.confidence) if signal and signal.confidence else 0
+            })]
+
+        position.status = 'CANCELED'
+        position.closed_at = datetime.now()
+        return [('canceled', {'position_id': position.id, 'symbol': position.symbol})]
+
+    def _reconcile_exit(self, db, position: Position, managed: ManagedOrder) -> List:
+        """청산 주문 최종 상태 → 체결분 거래 기록, 잔량은 OPEN으로 복귀"""
+        if position.status != 'CLOSING':
+            return []   # 이미 반영된 청산 (중복 전달) - 거래 기록 중복 방지
+        quantity = float(position.quantity)
+        if managed.filled_units <= 0:
+            position.status = 'OPEN'
+            return []
+
+        reason = managed.context.get('reason', '')
+        pnl, pnl_percent = self._record_trade(db, position, managed.avg_price, managed.filled_units, reason)
+
+        if managed.filled_units >= quantity * 0.999:
+            position.status = 'CLOSED'
+            position.closed_at = datetime.now()
+        else:
+            position.quantity = Decimal(str(quantity - managed.filled_units))
+            position.status = 'OPEN'
+        position.current_price = Decimal(str(managed.avg_price))
+
+        return [('close', {
+            'position_id': position.id,
+            'symbol': position.symbol,
+            'position_type': position.position_type,
+            'entry_price': float(position.entry_price),
+            'opened_at': position.opened_at,
+            'exit_price': managed.avg_price,
+            'quantity': managed.filled_units,
+            'pnl': pnl,
+            'pnl_percent': pnl_percent,
+            'exit_reason': reason,
+            'closed': position.status == 'CLOSED'
+        })]
+
+    def _reconcile_add(self, position: Position, managed: ManagedOrder):
+        """추가 매수 체결 → 평균 단가/수량, 손절/익절 재설정"""
+        if managed.filled_units <= 0:
+            return
+        quantity = float(position.quantity)
+        entry_price = float(position.entry_price)
+        total = quantity + managed.filled_units
+        avg_price = (entry_price * quantity + managed.avg_price * managed.filled_units) / total
+
+        position.entry_price = Decimal(str(avg_price))
+        position.quantity = Decimal(str(total))
+        if 'stop_loss_pct' in managed.context:
+            position.stop_loss = Decimal(str(avg_price * (1 - managed.context['stop_loss_pct'])))
+        if 'take_profit_pct' in managed.context:
+            position.take_profit = Decimal(str(avg_price * (1 + managed.context['take_profit_pct'])))
+
+    def submit_add_order(self, position: Position, units: float, price: float,
+                         stop_loss_pct: float, take_profit_pct: float) -> bool:
+        """
+        실전 추가 매수(물타기) 주문 비동기 제출 - 체결 시 평균 단가/손절/익절 갱신
+        Returns:
+            제출 여부
+        """
+        if not self.is_live_mode:
+            return False
 
-        except Exception as e:
-            self._log_error(f"거래소 주문 에러: {str(e)}")
-            return None
+        book = self.pricer.get_orderbook(position.symbol)
+        if self.slicer.needs_slicing(book, 'BUY', units * price):
+            self._start_parent(ParentOrder(
+                position.symbol, 'BUY', config.EXECUTION_SLICE_ALGO, purpose='add', position_id=position.id,
+                krw=units * price, reference_price=price,
+                context={'stop_loss_pct': stop_loss_pct, 'take_profit_pct': take_profit_pct}
+            ))
+            return True
+
+        quote = self.pricer.quote(position.symbol, 'BUY', price, units=units, orderbook=book)
+        if not quote['acceptable']:
+            self._log_error(f"물타기 생략 ({position.symbol}): 예상 슬리피지 {quote['slippage']*100:.2f}%")
+            return False
+        self._submit(ManagedOrder(
+            position.symbol, 'BUY', quote['units'], quote['price'], purpose='add', position_id=position.id,
+            context={**self._quote_context('BUY', quote),
+                     'stop_loss_pct': stop_loss_pct, 'take_profit_pct': take_profit_pct}
+        ))
+        return True
 
     def _execute_paper_order(self, symbol: str, side: str, quantity: float, price: float) -> Dict:
         """페이퍼 트레이딩 (모의 주문)"""
@@ -162,6 +552,7 @@ class OrderExecutor:
             성공 여부
         """
         try:
+            position_id = position.id
             symbol = position.symbol
             quantity_coins = float(position.quantity)  # 코인 개수
             entry_price = float(position.entry_price)
@@ -175,9 +566,7 @@ class OrderExecutor:
                 if balance.get('status') != '0000':
                     self._log_error(f"청산 실패 ({symbol}): 잔고 조회 실패")
                     # 포지션 강제 종료 (DB만 업데이트)
-                    position.status = 'CLOSED'
-                    position.closed_at = datetime.now()
-                    self.db.commit()
+                    self._transition_position(position, 'CLOSED')
                     return False
 
                 # 실제 보유 수량 확인
@@ -185,67 +574,35 @@ class OrderExecutor:
                 if available_coins < quantity_coins * 0.99:  # 1% 여유
                     self._log_error(f"청산 실패 ({symbol}): 보유 수량 부족 (DB: {quantity_coins:.8f}, 실제: {available_coins:.8f})")
                     # 포지션 강제 종료
-                    position.status = 'CLOSED'
-                    position.closed_at = datetime.now()
-                    self.db.commit()
+                    self._transition_position(position, 'CLOSED')
                     return False
 
-                # 실제 주문
-                order_type = 'ask' if side == 'SELL' else 'bid'
-                order_price = round(current_price * 0.995, 0) if side == 'SELL' else round(current_price * 1.005, 0)
-                result = self.api.place_order(symbol, order_type, available_coins, order_price)
+                # 청산 주문 비동기 제출 - 체결분만 거래 기록 (CLOSING → CLOSED / 잔량 OPEN)
+                # 청산은 슬리피지 한도와 무관하게 제출 (손절 지연 방지)
+                quote = self.pricer.quote(symbol, side, current_price, units=min(available_coins, quantity_coins))
+                units, order_price = quote['units'], quote['price']
+                if not self._transition_position(position, 'CLOSING', expected='OPEN'):
+                    return False    # 이미 청산 중이거나 종료된 포지션
+                self._submit(ManagedOrder(symbol, side, units, order_price, purpose='exit', position_id=position_id,
+                                          context={**self._quote_context(side, quote), 'reason': reason}))
+                self._log_info(f"청산 주문 접수: {symbol} {side} {units:.8f} @ {order_price:,.4f}원 | "
+                               f"예상 슬리피지 {quote['slippage']*10000:.1f}bp | 이유: {reason}")
+                return True
 
-                if result.get('status') == '0000':
-                    order_result = {
-                        'order_id': result.get('order_id'),
-                        'filled_price': order_price,
-                        'filled_quantity': available_coins
-                    }
-                else:
-                    self._log_error(f"청산 주문 실패: {result.get('message')}")
-                    return False
-            else:
-                order_result = self._execute_paper_order(symbol, side, quantity_coins, current_price)
+            order_result = self._execute_paper_order(symbol, side, quantity_coins, current_price)
 
             if not order_result:
                 return False
 
-            # 손익 계산
-            if position.position_type == 'LONG':
-                pnl = (current_price - entry_price) * quantity_coins
-            else:
-                pnl = (entry_price - current_price) * quantity_coins
-
-            pnl_percent = (pnl / (entry_price * quantity_coins)) * 100 if (entry_price * quantity_coins) > 0 else 0
+            self.invalidate_balance_cache()
 
-            # 보유 시간 계산
-            holding_time = (datetime.now() - position.opened_at).total_seconds() / 60  # 분
+            # 손익 계산 + 거래 내역 생성
+            pnl, pnl_percent = self._record_trade(self.db, position, current_price, quantity_coins, reason)
 
             # 포지션 업데이트
             position.status = 'CLOSED'
             position.closed_at = datetime.now()
             position.current_price = Decimal(str(current_price))
-            position.unrealized_pnl = Decimal(str(pnl))
-
-            # 거래 내역 생성
-            from database import Trade
-
-            trade = Trade(
-                position_id=position.id,
-                strategy_id=position.strategy_id,
-                symbol=symbol,
-                entry_price=position.entry_price,
-                exit_price=Decimal(str(current_price)),
-                quantity=position.quantity,
-                pnl=Decimal(str(pnl)),
-                pnl_percent=Decimal(str(pnl_percent)),
-                holding_time_minutes=int(holding_time),
-                exit_reason=reason,
-                opened_at=position.opened_at,
-                closed_at=datetime.now()
-            )
-
-            self.db.add(trade)
 
             # 청산 주문 기록
             order = Order(
@@ -267,14 +624,114 @@ class OrderExecutor:
             self._log_info(f"포지션 청산: {symbol} {side} {quantity_coins:.8f} @ {current_price:.0f}원 | "
                           f"손익: {pnl:,.0f}원 ({pnl_percent:+.2f}%) | 이유: {reason}")
 
+            # 실전 청산 체결(_reconcile_exit)과 같은 이벤트로 알림
+            self._emit_position_events([('close', {
+                'position_id': position_id,
+                'symbol': symbol,
+                'position_type': position.position_type,
+                'entry_price': entry_price,
+                'opened_at': position.opened_at,
+                'exit_price': current_price,
+                'quantity': quantity_coins,
+                'pnl': pnl,
+                'pnl_percent': pnl_percent,
+                'exit_reason': reason,
+                'closed': True
+            })])
+
             return True
 
         except Exception as e:
             self._log_error(f"포지션 청산 실패: {str(e)}")
             return False
 
-    def get_account_balance(self) -> Dict:
-        """계좌 잔고 조회"""
+    def _transition_position(self, position: Position, status: str, expected: str = None) -> bool:
+        """
+        실전 청산 포지션 상태 변경 - 실행기 세션에서 id 로 UPDATE 후 커밋
+        호출자(엔진) 세션의 인스턴스는 수정하지 않고 만료시켜 미반영 변경(상태, 지표)을 버림
+        → 체결 추적 스레드가 이후 기록하는 CLOSED/OPEN, 체결가를 호출자 세션 커밋이 덮어쓰지 않음
+        Args:
+            expected: 현재 상태 조건 (다르면 변경하지 않음)
+        Returns:
+            변경 여부
+        """
+        values = {'status': status}
+        if status == 'CLOSED':
+            values['closed_at'] = datetime.now()
+
+        position_id = position.id
+        stmt = update(Position).where(Position.id == position_id)
+        if expected:
+            stmt = stmt.where(Position.status == expected)
+        changed = self.db.execute(stmt.values(**values)).rowcount > 0
+        self.db.commit()
+
+        caller = object_session(position)
+        if caller is not None and caller is not self.db:
+            caller.expire(position)
+        return changed
+
+    def _record_trade(self, db, position: Position, exit_price: float, quantity: float, reason: str):
+        """
+        청산 거래 기록 (Trade) 추가
+        Returns:
+            (손익, 손익률 %)
+        """
+        entry_price = float(position.entry_price)
+        if position.position_type == 'LONG':
+            pnl = (exit_price - entry_price) * quantity
+        else:
+            pnl = (entry_price - exit_price) * quantity
+
+        pnl_percent = (pnl / (entry_price * quantity)) * 100 if (entry_price * quantity) > 0 else 0
+
+        # 보유 시간 계산
+        holding_time = (datetime.now() - position.opened_at).total_seconds() / 60  # 분
+
+        position.unrealized_pnl = Decimal(str(pnl))
+
+        db.add(Trade(
+            position_id=position.id,
+            strategy_id=position.strategy_id,
+            symbol=position.symbol,
+            entry_price=position.entry_price,
+            exit_price=Decimal(str(exit_price)),
+            quantity=Decimal(str(quantity)),
+            pnl=Decimal(str(pnl)),
+            pnl_percent=Decimal(str(pnl_percent)),
+            holding_time_minutes=int(holding_time),
+            exit_reason=reason,
+            opened_at=position.opened_at,
+            closed_at=datetime.now()
+        ))
+        return pnl, pnl_percent
+
+    def get_account_balance(self, use_cache: bool = True) -> Dict:
+        """
+        계좌 잔고 조회
+        Args:
+            use_cache: 짧은 시간 내 반복 조회 시 캐시 사용 여부
+        """
+        now = time.time()
+        if use_cache and self._balance_cache is not None and \
+                now - self._balance_cache_time < config.BALANCE_CACHE_TTL:
+            return dict(self._balance_cache)
+
+        balance = self._fetch_account_balance()
+
+        if balance:
+            self._balance_cache = balance
+            self._balance_cache_time = now
+
+        return dict(balance)
+
+    def invalidate_balance_cache(self):
+        """잔고 캐시 무효화 (주문 체결 후 호출)"""
+        self._balance_cache = None
+        self._balance_cache_time = 0.0
+
+    def _fetch_account_balance(self) -> Dict:
+        """계좌 잔고 실제 조회"""
         try:
             if self.is_live_mode:
                 result = self.api.get_balance('ALL')
@@ -284,27 +741,33 @@ class OrderExecutor:
                     total_krw = float(data.get('total_krw', 0))
                     available_krw = float(data.get('available_krw', 0))
 
-                    # 보유 코인 평가액 계산
+                    # 잔고 응답 키에서 보유 코인 탐색 (total_btc, total_eth ...)
+                    balances = {}
+                    for key, value in data.items():
+                        if not key.startswith('total_') or key == 'total_krw':
+                            continue
+                        coin_balance = float(value or 0)
+                        if coin_balance > 0:
+                            balances[key[len('total_'):].upper()] = coin_balance
+
+                    # 보유 코인 평가액 계산 (시세는 한 번에 조회)
+                    prices = self._get_holding_prices(list(balances.keys()))
+
                     crypto_holdings = {}
                     total_crypto_value = 0
 
-                    for symbol in config.TARGET_PAIRS:
-                        # 보유 수량 조회
-                        coin_balance = float(data.get(f'total_{symbol.lower()}', 0))
+                    for symbol, coin_balance in balances.items():
+                        current_price = prices.get(symbol, 0)
+                        if current_price <= 0:
+                            continue
 
-                        if coin_balance > 0:
-                            # 현재가 조회
-                            ticker = self.api.get_ticker(symbol)
-                            if ticker.get('status') == '0000':
-                                current_price = float(ticker['data'].get('closing_price', 0))
-                                coin_value = coin_balance * current_price
-
-                                crypto_holdings[symbol] = {
-                                    'balance': coin_balance,
-                                    'price': current_price,
-                                    'value': coin_value
-                                }
-                                total_crypto_value += coin_value
+                        coin_value = coin_balance * current_price
+                        crypto_holdings[symbol] = {
+                            'balance': coin_balance,
+                            'price': current_price,
+                            'value': coin_value
+                        }
+                        total_crypto_value += coin_value
 
                     return {
                         'total_krw': total_krw,
@@ -341,6 +804,37 @@ class OrderExecutor:
             self._log_error(f"잔고 조회 실패: {str(e)}")
             return {}
 
+    def _get_holding_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """
+        보유 코인 현재가 조회
+        엔진 시세 캐시를 우선 사용하고, 없는 코인만 ALL 티커 1회 호출로 조회
+        Args:
+            symbols: 코인 심볼 리스트
+        Returns:
+            {symbol: price}
+        """
+        prices = {}
+        missing = []
+
+        for symbol in symbols:
+            entry = self.price_cache.get(symbol) if self.price_cache is not None else None
+            if entry and entry.get('price', 0) > 0 and \
+                    (datetime.now() - entry['timestamp']).total_seconds() <= config.BALANCE_PRICE_MAX_AGE:
+                prices[symbol] = entry['price']
+            else:
+                missing.append(symbol)
+
+        if missing:
+            ticker = self.api.get_ticker('ALL')
+            if ticker.get('status') == '0000':
+                data = ticker.get('data', {})
+                for symbol in missing:
+                    coin = data.get(symbol)
+                    if isinstance(coin, dict):
+                        prices[symbol] = float(coin.get('closing_price', 0))
+
+        return prices
+
     def update_account_balance(self):
         """계좌 잔고 업데이트"""
         try:
@@ -381,19 +875,23 @@ class OrderExecutor:
         except Exception as e:
             self._log_error(f"잔고 업데이트 실패: {str(e)}")
 
-    def _log_info(self, message: str):
-        """정보 로그"""
+    def _log_info(self, message: str, db=None):
+        """정보 로그 (db: 추적 스레드 전용 세션, 기본: 실행기 세션)"""
         print(f"[OrderExecutor] {message}")
-        log = SystemLog(log_level='INFO', module='OrderExecutor', message=message)
-        self.db.add(log)
-        self.db.commit()
+        self._write_log('INFO', message, db)
 
-    def _log_error(self, message: str):
-        """에러 로그"""
+    def _log_error(self, message: str, db=None):
+        """에러 로그 (db: 추적 스레드 전용 세션, 기본: 실행기 세션)"""
         print(f"[OrderExecutor ERROR] {message}")
-        log = SystemLog(log_level='ERROR', module='OrderExecutor', message=message)
-        self.db.add(log)
-        self.db.commit()
+        self._write_log('ERROR', message, db)
+
+    def _write_log(self, level: str, message: str, db=None):
+        session = db or self.db
+        try:
+            session.add(SystemLog(log_level=level, module='OrderExecutor', message=message))
+            session.commit()
+        except Exception:
+            session.rollback()
 
     def __del__(self):
         """소멸자"""
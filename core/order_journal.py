@@ -0,0 +1,130 @@
+"""
+주문 선기록 저널 (write-ahead log)
+- 거래소 주문 요청 전에 주문 의도(intent)를 기록하고 fsync
+- 접수(ack: 거래소 주문 ID), 최종 상태(final)를 이어서 기록
+- 재시작 시 최종 상태가 없는 주문을 reconciler 가 거래소와 대조해 복구
+- JSON Lines 추가 전용 파일, 복구 후 미완료 주문만 남기고 압축
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, List
+
+import config
+
+INTENT = 'intent'
+ACK = 'ack'
+FINAL = 'final'
+
+
+class OrderJournal:
+    """주문 저널 (프로세스 내 스레드 안전)"""
+
+    def __init__(self, path: str = None):
+        """
+        Args:
+            path: 저널 파일 경로 (기본: config.ORDER_JOURNAL_PATH)
+        """
+        self.path = path or config.ORDER_JOURNAL_PATH
+        self._lock = threading.Lock()
+
+    def record(self, event: str, order, **extra):
+        """
+        이벤트 기록 (fsync 후 반환)
+        Args:
+            event: INTENT / ACK / FINAL
+            order: ManagedOrder
+        """
+        entry = {'event': event, 'ts': time.time(), 'client_id': order.client_id}
+        if event == INTENT:
+            entry.update({
+                'symbol': order.symbol,
+                'side': order.side,
+                'units': order.units,
+                'price': order.price,
+                'purpose': order.purpose,
+                'position_id': order.position_id,
+                'record_id': order.record_id,
+                'context': order.context,
+            })
+        elif event == ACK:
+            entry['order_id'] = order.order_id
+        elif event == FINAL:
+            entry.update({
+                'order_id': order.order_id,
+                'state': order.state,
+                'filled_units': order.filled_units,
+                'avg_price': order.avg_price,
+            })
+        entry.update(extra)
+
+        line = json.dumps(entry, ensure_ascii=False, default=str) + '\n'
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def load(self) -> Dict[str, Dict]:
+        """
+        저널 재생 - 주문별 최신 상태
+        Returns:
+            {client_id: {intent 필드..., 'order_id', 'final'}}
+        """
+        orders: Dict[str, Dict] = {}
+        if not os.path.exists(self.path):
+            return orders
+
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue    # 기록 중 종료된 마지막 줄
+                client_id = entry.get('client_id')
+                if entry.get('event') == INTENT:
+                    orders[client_id] = {**entry, 'order_id': None, 'final': None}
+                elif client_id in orders:
+                    if entry.get('order_id'):
+                        orders[client_id]['order_id'] = entry['order_id']
+                    if entry.get('event') == FINAL:
+                        orders[client_id]['final'] = entry.get('state')
+        return orders
+
+    def open_entries(self) -> List[Dict]:
+        """최종 상태가 기록되지 않은 주문 (거래소 상태 확인 필요)"""
+        return [entry for entry in self.load().values() if not entry['final']]
+
+    def compact(self, keep: List[str] = None):
+        """
+        완료 주문 정리 - keep 에 포함된 미완료 주문의 intent/ack 만 남김
+        keep 주문이라도 재생 시 최종 상태가 기록되어 있으면 제외
+        (추적 재개 후 compact 전에 끝난 주문을 미완료로 되살리지 않도록, 재생과 재작성은 같은 잠금 안에서 수행)
+        Args:
+            keep: 유지할 client_id (기본: 미완료 주문 전체)
+        """
+        if not os.path.exists(self.path):
+            return
+        with self._lock:
+            orders = self.load()
+            keep = set(keep) if keep is not None else {cid for cid, entry in orders.items() if not entry['final']}
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for client_id in keep:
+                    entry = orders.get(client_id)
+                    if not entry or entry['final']:
+                        continue
+                    order_id = entry.pop('order_id')
+                    entry.pop('final')
+                    f.write(json.dumps(entry, ensure_ascii=False, default=str) + '\n')
+                    if order_id:
+                        f.write(json.dumps({'event': ACK, 'ts': entry['ts'], 'client_id': client_id,
+                                            'order_id': order_id}) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
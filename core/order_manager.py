@@ -0,0 +1,372 @@
+"""
+비동기 주문 관리자
+- 주문 제출은 스레드 풀에서 수행 (트레이딩 루프는 거래소 응답을 기다리지 않음)
+- 주문 상태 머신: NEW → PARTIAL → FILLED / CANCELED (제출 실패 시 REJECTED)
+- 추적 스레드가 미체결 주문을 종목/방향별로 묶어 get_orders 로 확인하고,
+  체결 변화가 있는 주문만 get_order_detail 로 체결 내역(수량/평균가/수수료) 조회
+- 오래된 미체결 주문은 자동 취소
+- 저널이 주어지면 주문 요청 전 의도를 선기록 (재시작 복구용, core.order_journal)
+"""
+
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from api import BithumbAPI
+from core.order_journal import OrderJournal, INTENT, ACK, FINAL
+from utils import metrics
+import config
+
+NEW = 'NEW'
+PARTIAL = 'PARTIAL'
+FILLED = 'FILLED'
+CANCELED = 'CANCELED'
+REJECTED = 'REJECTED'
+
+OPEN_STATES = (NEW, PARTIAL)
+FINAL_STATES = (FILLED, CANCELED, REJECTED)
+
+VALID_TRANSITIONS = {
+    NEW: {PARTIAL, FILLED, CANCELED, REJECTED},
+    PARTIAL: {PARTIAL, FILLED, CANCELED},
+}
+
+# 빗썸 order_detail 상태 → 내부 상태
+EXCHANGE_STATUS = {
+    'Completed': FILLED,
+    'Cancel': CANCELED,
+}
+
+_client_ids = itertools.count(1)
+
+
+class ManagedOrder:
+    """추적 중인 주문"""
+
+    def __init__(self, symbol: str, side: str, units: float, price: float,
+                 purpose: str = 'entry', position_id: int = None, context: Dict = None):
+        """
+        Args:
+            side: 'BUY' 또는 'SELL'
+            purpose: 'entry' (진입), 'exit' (청산), 'add' (추가 매수)
+            position_id: 연결된 positions.id
+            context: 체결 반영 시 참고할 부가 정보
+        """
+        self.client_id = f"cl_{int(time.time() * 1000)}_{next(_client_ids)}"
+        self.order_id: Optional[str] = None     # 거래소 주문 ID (접수 후 설정)
+        self.symbol = symbol
+        self.side = side
+        self.units = units
+        self.price = price
+        self.purpose = purpose
+        self.position_id = position_id
+        self.context = context or {}
+        self.record_id: Optional[int] = None    # orders.id
+
+        self.state = NEW
+        self.filled_units = 0.0
+        self.avg_price = 0.0
+        self.fee = 0.0
+        self.error: Optional[str] = None
+        self.cancel_requested = False
+        # 콜백 직렬화 - 제출 스레드(접수 응답)와 추적 스레드(체결)가 같은 주문을 동시에 전달하지 않도록
+        self.notify_lock = threading.Lock()
+
+        self.created_at = time.time()
+        self.updated_at = self.created_at
+
+    @property
+    def order_type(self) -> str:
+        return 'bid' if self.side == 'BUY' else 'ask'
+
+    @property
+    def remaining_units(self) -> float:
+        return max(self.units - self.filled_units, 0.0)
+
+    @property
+    def is_open(self) -> bool:
+        return self.state in OPEN_STATES
+
+    def to_dict(self) -> Dict:
+        return {
+            'client_id': self.client_id,
+            'order_id': self.order_id,
+            'symbol': self.symbol,
+            'side': self.side,
+            'units': self.units,
+            'price': self.price,
+            'purpose': self.purpose,
+            'position_id': self.position_id,
+            'state': self.state,
+            'filled_units': self.filled_units,
+            'avg_price': self.avg_price,
+            'fee': self.fee,
+            'error': self.error,
+        }
+
+
+class OrderManager:
+    """비동기 주문 제출 + 체결 추적"""
+
+    def __init__(self, api: BithumbAPI = None, poll_interval: float = None,
+                 stale_after: float = None, max_workers: int = None, journal: OrderJournal = None):
+        """
+        Args:
+            journal: 주문 선기록 저널 (없으면 기록하지 않음)
+            poll_interval: 미체결 주문 조회 주기 (초, 기본: config.ORDER_POLL_INTERVAL)
+            stale_after: 자동 취소까지 대기 시간 (초, 기본: config.ORDER_STALE_SECONDS)
+            max_workers: 동시 제출 스레드 수 (기본: config.ORDER_SUBMIT_WORKERS)
+        """
+        self.api = api or BithumbAPI()
+        self.poll_interval = poll_interval if poll_interval is not None else config.ORDER_POLL_INTERVAL
+        self.stale_after = stale_after if stale_after is not None else config.ORDER_STALE_SECONDS
+        self.journal = journal
+
+        self._pool = ThreadPoolExecutor(max_workers=max_workers or config.ORDER_SUBMIT_WORKERS,
+                                        thread_name_prefix='order-submit')
+        self._orders: Dict[str, ManagedOrder] = {}
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[ManagedOrder, str], None]] = []
+        # 콜백 실패 재전달 대기 {(client_id, 콜백 순번): [주문, 최초 이전 상태, 실패 횟수, 다음 재시도 시각]}
+        self._failed: Dict[tuple, list] = {}
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.is_running = False
+
+    # ===========================
+    # 제출
+    # ===========================
+
+    def add_listener(self, callback: Callable[[ManagedOrder, str], None]):
+        """상태/체결 변경 콜백 등록 - callback(order, previous_state)"""
+        self._listeners.append(callback)
+
+    def submit(self, order: ManagedOrder) -> ManagedOrder:
+        """주문 비동기 제출 (즉시 반환)"""
+        with self._lock:
+            self._orders[order.client_id] = order
+        self._pool.submit(self._send, order)
+        return order
+
+    def adopt(self, order: ManagedOrder) -> ManagedOrder:
+        """이미 거래소에 접수된 주문 추적 재개 (재시작 복구 - 제출하지 않음)"""
+        with self._lock:
+            self._orders[order.client_id] = order
+        self._wakeup.set()
+        return order
+
+    def _send(self, order: ManagedOrder):
+        """거래소 주문 요청 (제출 스레드)"""
+        if self.journal:
+            try:
+                self.journal.record(INTENT, order)
+            except OSError as e:
+                # 기록 없이 제출하면 재시작 시 복구 불가 - 주문하지 않음
+                order.error = f"저널 기록 실패: {str(e)}"
+                self._transition(order, REJECTED)
+                return
+
+        try:
+            with metrics.ORDER_PLACEMENT_SECONDS.time(side=order.side):
+                result = self.api.place_order(
+                    symbol=order.symbol,
+                    order_type=order.order_type,
+                    quantity=order.units,
+                    price=order.price
+                )
+        except Exception as e:
+            result = {'status': 'error', 'message': str(e)}
+
+        ok = result.get('status') == '0000'
+        metrics.ORDERS_TOTAL.inc(side=order.side, result='ok' if ok else 'error')
+
+        if ok:
+            order.order_id = str(result.get('order_id'))
+            order.updated_at = time.time()
+            self._journal(ACK, order)
+            self._notify(order, NEW)
+            self._wakeup.set()
+        else:
+            order.error = result.get('message') or str(result)
+            self._transition(order, REJECTED)
+
+    # ===========================
+    # 추적
+    # ===========================
+
+    def start(self):
+        """체결 추적 스레드 시작"""
+        if self.is_running:
+            return
+        self.is_running = True
+        self._thread = threading.Thread(target=self._run, name='order-tracker', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self.is_running = False
+        self._wakeup.set()
+        self._pool.shutdown(wait=False)
+
+    def open_orders(self) -> List[ManagedOrder]:
+        with self._lock:
+            return [order for order in self._orders.values() if order.is_open]
+
+    def wait_idle(self, timeout: float) -> bool:
+        """추적 중인 주문이 없어질 때까지 대기"""
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            with self._lock:
+                if not self._orders and not self._failed:
+                    return True
+            time.sleep(0.2)
+        return False
+
+    def get(self, client_id: str) -> Optional[ManagedOrder]:
+        return self._orders.get(client_id)
+
+    def _run(self):
+        while self.is_running:
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"[OrderManager ERROR] 체결 조회 에러: {str(e)}")
+            self._retry_failed()
+
+    def poll(self):
+        """
+        미체결 주문 일괄 조회
+        (종목, 방향)별 get_orders 1회 → 잔량 변화/미체결 목록 이탈 주문만 get_order_detail
+        """
+        groups: Dict[tuple, List[ManagedOrder]] = {}
+        for order in self.open_orders():
+            if order.order_id:
+                groups.setdefault((order.symbol, order.order_type), []).append(order)
+
+        for (symbol, order_type), orders in groups.items():
+            result = self.api.get_orders(symbol, order_type)
+            if result.get('status') == '0000':
+                pending = {str(item['order_id']): float(item.get('units_remaining', 0))
+                           for item in result.get('data', [])}
+            elif result.get('status') == '5600':
+                pending = {}    # 거래 진행중인 내역 없음
+            else:
+                continue
+
+            for order in orders:
+                remaining = pending.get(order.order_id)
+                if remaining is None or order.units - remaining > order.filled_units + 1e-12:
+                    self._refresh(order)
+
+        self._cancel_stale()
+
+        with self._lock:
+            for client_id in [cid for cid, order in self._orders.items() if not order.is_open]:
+                del self._orders[client_id]
+
+    def _refresh(self, order: ManagedOrder):
+        """get_order_detail 체결 내역 반영"""
+        result = self.api.get_order_detail(order.order_id, order.symbol, order.order_type)
+        if result.get('status') != '0000':
+            return
+
+        data = result.get('data', {})
+        contracts = data.get('contract') or []
+        filled = sum(float(c['units']) for c in contracts)
+        notional = sum(float(c['units']) * float(c['price']) for c in contracts)
+        fee = sum(float(c.get('fee', 0)) for c in contracts)
+
+        previous_filled = order.filled_units
+        order.filled_units = filled
+        order.avg_price = notional / filled if filled > 0 else 0.0
+        order.fee = fee
+
+        state = EXCHANGE_STATUS.get(data.get('order_status'))
+        if state is None:
+            state = PARTIAL if filled > 0 else NEW
+
+        if state != order.state:
+            self._transition(order, state)
+        elif filled > previous_filled:
+            order.updated_at = time.time()
+            self._notify(order, order.state)
+
+    def _cancel_stale(self):
+        """stale_after 초과 미체결 주문 취소 요청 (결과는 다음 조회에서 반영)"""
+        now = time.time()
+        for order in self.open_orders():
+            if order.order_id and not order.cancel_requested and now - order.created_at > self.stale_after:
+                result = self.api.cancel_order(order.order_type, order.order_id, order.symbol)
+                order.cancel_requested = True
+                if result.get('status') != '0000':
+                    # 이미 체결/취소된 주문 - 상세 조회로 최종 상태 확인
+                    self._refresh(order)
+
+    def cancel(self, client_id: str) -> bool:
+        """주문 취소 요청"""
+        order = self._orders.get(client_id)
+        if not order or not order.is_open or not order.order_id:
+            return False
+        result = self.api.cancel_order(order.order_type, order.order_id, order.symbol)
+        order.cancel_requested = True
+        self._wakeup.set()
+        return result.get('status') == '0000'
+
+    # ===========================
+    # 상태 머신
+    # ===========================
+
+    def _transition(self, order: ManagedOrder, state: str):
+        previous = order.state
+        if state not in VALID_TRANSITIONS.get(previous, ()):
+            raise ValueError(f"잘못된 주문 상태 전이: {previous} → {state} ({order.client_id})")
+        order.state = state
+        order.updated_at = time.time()
+        if state in FINAL_STATES:
+            self._journal(FINAL, order)
+        self._notify(order, previous)
+
+    def _journal(self, event: str, order: ManagedOrder):
+        if not self.journal:
+            return
+        try:
+            self.journal.record(event, order)
+        except OSError as e:
+            print(f"[OrderManager ERROR] 저널 기록 실패 ({order.client_id}): {str(e)}")
+
+    def _notify(self, order: ManagedOrder, previous: str):
+        for index, callback in enumerate(self._listeners):
+            self._deliver(index, order, previous)
+
+    def _deliver(self, index: int, order: ManagedOrder, previous: str):
+        """
+        콜백 1회 전달 - 실패하면 추적 주기마다 재전달 (지수 백오프, 최대 ORDER_CALLBACK_RETRY_MAX 초)
+        재전달은 주문의 최신 상태로 하므로 이후 전달이 성공하면 대기 중인 재전달은 취소
+        같은 주문의 콜백은 notify_lock 으로 순차 실행 (접수 응답/체결 반영 동시 전달 방지)
+        """
+        key = (order.client_id, index)
+        try:
+            with order.notify_lock:
+                self._listeners[index](order, previous)
+        except Exception as e:
+            with self._lock:
+                entry = self._failed.setdefault(key, [order, previous, 0, 0.0])
+                entry[2] += 1
+                entry[3] = time.time() + min(self.poll_interval * 2 ** entry[2], config.ORDER_CALLBACK_RETRY_MAX)
+                attempts = entry[2]
+            if attempts == 1:
+                print(f"[OrderManager ERROR] 주문 콜백 에러 ({order.symbol}) - 재시도 예정: {str(e)}")
+        else:
+            with self._lock:
+                self._failed.pop(key, None)
+
+    def _retry_failed(self):
+        """재시도 시각이 된 실패 콜백 재전달 (추적 스레드)"""
+        now = time.time()
+        with self._lock:
+            due = [(key, entry[0], entry[1]) for key, entry in self._failed.items() if entry[3] <= now]
+        for (_, index), order, previous in due:
+            self._deliver(index, order, previous)
@@ -0,0 +1,275 @@
+"""
+재시작 시 주문/포지션 자동 복구
+- 주문 저널의 미완료 주문 ↔ 거래소 미체결 주문(get_orders) ↔ 체결 내역(get_user_transactions)
+  ↔ 포지션(positions)을 일괄 대조
+- 거래소에 남아 있는 주문은 OrderManager 추적 재개, 접수 응답 없이 종료된 주문은
+  미체결 목록/체결 내역으로 찾아 반영, 거래소에 없는 주문은 거부 처리
+- 활성 주문이 없는 PENDING/CLOSING 포지션 정리, 거래소 잔고보다 많은 포지션 수량 보정
+  (cleanup_phantom_positions.py, sync_balance.py, force_close_all_positions.py 수동 정리 대체)
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, Optional, Set, Tuple
+
+from database import SessionLocal, Position
+from core.order_journal import OrderJournal
+from core.order_manager import ManagedOrder, NEW, FILLED, CANCELED, REJECTED
+import config
+
+PHANTOM_RATIO = 0.01        # 거래소 잔고가 DB 수량의 1% 미만이면 팬텀 포지션
+SHORTFALL_RATIO = 0.99      # 거래소 잔고가 DB 수량의 99% 미만이면 수량 보정
+
+
+class OrderReconciler:
+    """저널 + 거래소 + 포지션 대조 복구"""
+
+    def __init__(self, executor, journal: OrderJournal = None):
+        """
+        Args:
+            executor: OrderExecutor (API, 주문 추적, 체결 반영 로직 사용)
+            journal: 주문 저널 (기본: executor.journal)
+        """
+        self.executor = executor
+        self.api = executor.api
+        self.journal = journal or executor.journal
+
+    def run(self) -> Dict:
+        """
+        복구 실행
+        Returns:
+            {'adopted', 'recovered', 'rejected', 'positions_reopened', 'positions_canceled',
+             'positions_closed', 'positions_resized', 'orphan_orders'}
+        """
+        summary = dict.fromkeys(['adopted', 'recovered', 'rejected', 'positions_reopened',
+                                 'positions_canceled', 'positions_closed', 'positions_resized',
+                                 'orphan_orders'], 0)
+
+        all_entries = self.journal.load()
+        entries = [entry for entry in all_entries.values() if not entry['final']]
+
+        db = SessionLocal()
+        try:
+            positions = db.query(Position).filter(Position.status.in_(Position.ACTIVE_STATUSES)).all()
+            symbols = {entry['symbol'] for entry in entries} | {position.symbol for position in positions}
+
+            exchange_orders = self._fetch_open_orders(symbols)
+            transactions = self._fetch_transactions({entry['symbol'] for entry in entries if not entry['order_id']})
+
+            known_ids = {entry['order_id'] for entry in entries if entry['order_id']}
+            claimed: Set[str] = set()
+            live_positions: Set[int] = set()
+            adopted: List[str] = []
+
+            for entry in sorted(entries, key=lambda e: e['ts']):
+                managed = self._restore(entry, all_entries)
+
+                if not managed.order_id:
+                    managed.order_id = self._match_open_order(entry, exchange_orders, known_ids | claimed)
+                    if managed.order_id:
+                        claimed.add(managed.order_id)
+
+                if managed.order_id:
+                    # 거래소 접수 주문 - 추적 재개 (체결/취소 여부는 다음 조회에서 반영)
+                    self.executor.adopt_order(managed)
+                    adopted.append(managed.client_id)
+                    if managed.position_id:
+                        live_positions.add(managed.position_id)
+                    summary['adopted'] += 1
+                    continue
+
+                filled, notional, fee = self._match_transactions(entry, transactions)
+                if filled > 0:
+                    managed.filled_units = filled
+                    managed.avg_price = notional / filled
+                    managed.fee = fee
+                    managed.state = FILLED if filled >= managed.units * 0.999 else CANCELED
+                    summary['recovered'] += 1
+                else:
+                    managed.state = REJECTED
+                    managed.error = '재시작 복구: 거래소 주문 없음'
+                    summary['rejected'] += 1
+                self.executor._on_order_update(managed, NEW)
+
+            summary['orphan_orders'] = sum(1 for order_id in exchange_orders
+                                           if order_id not in known_ids and order_id not in claimed)
+
+            # 주문 반영 결과를 포함해 포지션 재조회
+            db.expire_all()
+            self._reconcile_positions(db, live_positions, summary)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        # 추적 재개 주문 중 이미 끝난 주문(FINAL 기록)은 compact 가 제외
+        self.journal.compact(keep=adopted)
+        return summary
+
+    # ===========================
+    # 거래소 조회 (일괄)
+    # ===========================
+
+    def _fetch_open_orders(self, symbols: Set[str]) -> Dict[str, Dict]:
+        """(종목, 방향)별 미체결 주문 조회 → {order_id: {symbol, side, price, units, remaining, ts}}"""
+        orders = {}
+        for symbol in symbols:
+            for order_type, side in (('bid', 'BUY'), ('ask', 'SELL')):
+                result = self.api.get_orders(symbol, order_type)
+                if result.get('status') != '0000':
+                    continue
+                for item in result.get('data', []):
+                    orders[str(item['order_id'])] = {
+                        'symbol': symbol,
+                        'side': side,
+                        'price': float(item.get('price', 0)),
+                        'units': float(item.get('units', 0)),
+                        'remaining': float(item.get('units_remaining', 0)),
+                        'ts': int(item.get('order_date', 0)) / 1_000_000,
+                    }
+        return orders
+
+    def _fetch_transactions(self, symbols: Set[str]) -> Dict[str, List[Dict]]:
+        """종목별 최근 체결 내역 → {symbol: [{side, price, units, fee, ts, used}]}"""
+        transactions = {}
+        for symbol in symbols:
+            result = self.api.get_user_transactions(symbol, count=50)
+            if result.get('status') != '0000':
+                continue
+            transactions[symbol] = [{
+                'side': 'BUY' if str(item.get('search')) == '1' else 'SELL',
+                'price': float(item.get('price', 0)),
+                'units': float(item.get('units', 0)),
+                'fee': float(item.get('fee', 0) or 0),
+                'ts': int(item.get('transfer_date', 0)) / 1_000_000,
+                'used': False,
+            } for item in result.get('data', []) if str(item.get('search')) in ('1', '2')]
+        return transactions
+
+    # ===========================
+    # 주문 대조
+    # ===========================
+
+    @staticmethod
+    def _restore(entry: Dict, all_entries: Dict[str, Dict]) -> ManagedOrder:
+        """저널 기록 → ManagedOrder (client_id/주문 기록 ID 유지)"""
+        context = dict(entry.get('context') or {})
+        parent_id = context.get('parent_id')
+        if parent_id:
+            # 분할 주문 상태는 재시작 시 사라짐 - 형제 자식 주문 기록으로 합산 반영
+            context['recovered_records'] = [
+                sibling['record_id'] for sibling in all_entries.values()
+                if (sibling.get('context') or {}).get('parent_id') == parent_id and sibling.get('record_id')
+            ]
+
+        managed = ManagedOrder(entry['symbol'], entry['side'], float(entry['units']), float(entry['price']),
+                               purpose=entry.get('purpose', 'entry'), position_id=entry.get('position_id'),
+                               context=context)
+        managed.client_id = entry['client_id']
+        managed.order_id = entry.get('order_id')
+        managed.record_id = entry.get('record_id')
+        managed.created_at = entry['ts']
+        return managed
+
+    @staticmethod
+    def _match_open_order(entry: Dict, exchange_orders: Dict[str, Dict], excluded: Set[str]) -> Optional[str]:
+        """접수 응답 전 종료된 주문 - 방향/가격/수량/시각이 같은 미체결 주문 탐색"""
+        for order_id, order in exchange_orders.items():
+            if order_id in excluded or order['symbol'] != entry['symbol'] or order['side'] != entry['side']:
+                continue
+            if abs(order['price'] - float(entry['price'])) > float(entry['price']) * 1e-9:
+                continue
+            if abs(order['units'] - float(entry['units'])) > 1e-8:
+                continue
+            if entry['ts'] - 5 <= order['ts'] <= entry['ts'] + config.ORDER_RECOVERY_MATCH_WINDOW:
+                return order_id
+        return None
+
+    @staticmethod
+    def _match_transactions(entry: Dict, transactions: Dict[str, List[Dict]]) -> Tuple[float, float, float]:
+        """
+        접수 응답 전 종료 + 미체결 목록에 없는 주문 - 주문 직후 지정가 이내 체결분 합산
+        Returns:
+            (체결 수량, 체결 금액, 수수료)
+        """
+        units, limit = float(entry['units']), float(entry['price'])
+        filled = notional = fee = 0.0
+        for tx in sorted(transactions.get(entry['symbol'], []), key=lambda t: t['ts']):
+            if tx['used'] or tx['side'] != entry['side']:
+                continue
+            if not entry['ts'] - 5 <= tx['ts'] <= entry['ts'] + config.ORDER_RECOVERY_MATCH_WINDOW:
+                continue
+            if (entry['side'] == 'BUY' and tx['price'] > limit) or (entry['side'] == 'SELL' and tx['price'] < limit):
+                continue
+            if filled + tx['units'] > units + 1e-8:
+                continue
+            tx['used'] = True
+            filled += tx['units']
+            notional += tx['units'] * tx['price']
+            fee += tx['fee']
+            if filled >= units - 1e-8:
+                break
+        return filled, notional, fee
+
+    # ===========================
+    # 포지션 대조
+    # ===========================
+
+    def _reconcile_positions(self, db, live_positions: Set[int], summary: Dict):
+        """활성 주문 없는 PENDING/CLOSING 정리 + 거래소 잔고 대비 OPEN 수량 검증"""
+        positions = db.query(Position).filter(Position.status.in_(Position.ACTIVE_STATUSES)).all()
+
+        for position in positions:
+            if position.id in live_positions:
+                continue
+            if position.status == 'PENDING':
+                if float(position.quantity or 0) > 0:
+                    position.status = 'OPEN'
+                    summary['positions_reopened'] += 1
+                else:
+                    position.status = 'CANCELED'
+                    position.closed_at = datetime.now()
+                    summary['positions_canceled'] += 1
+            elif position.status == 'CLOSING':
+                position.status = 'OPEN'
+                summary['positions_reopened'] += 1
+
+        open_positions = [p for p in positions if p.status == 'OPEN' and p.id not in live_positions]
+        if not open_positions:
+            return
+
+        balance = self.api.get_balance('ALL')
+        if balance.get('status') != '0000':
+            print("[OrderReconciler ERROR] 잔고 조회 실패 - 포지션 수량 검증 생략")
+            return
+        data = balance.get('data', {})
+
+        by_symbol: Dict[str, List[Position]] = {}
+        for position in open_positions:
+            by_symbol.setdefault(position.symbol, []).append(position)
+
+        prices = self.executor._get_holding_prices(list(by_symbol.keys()))
+
+        for symbol, symbol_positions in by_symbol.items():
+            held = float(data.get(f'total_{symbol.lower()}', 0) or 0)
+            db_quantity = sum(float(p.quantity) for p in symbol_positions)
+            if db_quantity <= 0 or held >= db_quantity * SHORTFALL_RATIO:
+                continue
+
+            if held < db_quantity * PHANTOM_RATIO:
+                # 거래소에 없는 포지션 - 현재가로 청산 기록
+                exit_price = prices.get(symbol) or float(symbol_positions[0].current_price or 0)
+                for position in symbol_positions:
+                    self.executor._record_trade(db, position, exit_price, float(position.quantity),
+                                                'RECONCILE_PHANTOM')
+                    position.status = 'CLOSED'
+                    position.closed_at = datetime.now()
+                    summary['positions_closed'] += 1
+            else:
+                # 일부만 보유 - 보유 수량 비율로 축소
+                ratio = held / db_quantity
+                for position in symbol_positions:
+                    position.quantity = Decimal(str(float(position.quantity) * ratio))
+                    summary['positions_resized'] += 1
@@ -6,7 +6,8 @@
 from typing import Dict, List, Optional
 from datetime import datetime, date
 from decimal import Decimal
-from database import SessionLocal, Position, DailyPerformance, AccountBalance, SystemLog
+from database import SessionLocal, Position, DailyPerformance, SystemLog
+from database import queries
 import config
 
 
@@ -98,8 +99,9 @@ class RiskManager:
         Returns:
             추가 포지션 가능 여부
         """
+        # 체결 대기 중인 진입/청산 주문도 한도에 포함
         open_positions = self.db.query(Position).filter(
-            Position.status == 'OPEN'
+            Position.status.in_(Position.ACTIVE_STATUSES)
         ).count()
 
         if open_positions >= config.MAX_OPEN_POSITIONS:
@@ -242,27 +244,21 @@ class RiskManager:
         """일일 성과 업데이트"""
         today = date.today()
 
-        # 오늘의 모든 거래 조회
-        from database import Trade
-
+        # 오늘의 청산 거래 집계 (DB 에서 계산)
         today_start = datetime.combine(today, datetime.min.time())
-        today_trades = self.db.query(Trade).filter(
-            Trade.closed_at >= today_start
-        ).all()
+        summary = queries.trade_summary(self.db, since=today_start)
 
-        total_trades = len(today_trades)
-        winning_trades = sum(1 for t in today_trades if float(t.pnl) > 0)
-        losing_trades = total_trades - winning_trades
-        total_pnl = sum(float(t.pnl) for t in today_trades)
+        total_trades = summary['total_trades']
+        winning_trades = summary['winning_trades']
+        losing_trades = summary['losing_trades']
+        total_pnl = summary['total_pnl']
 
         # 계좌 잔고 조회
-        latest_balance = self.db.query(AccountBalance).order_by(
-            AccountBalance.timestamp.desc()
-        ).first()
+        latest_balance = queries.latest_total_value(self.db)
 
-        if latest_balance:
-            starting_balance = float(latest_balance.total_value) - total_pnl
-            ending_balance = float(latest_balance.total_value)
+        if latest_balance is not None:
+            starting_balance = latest_balance - total_pnl
+            ending_balance = latest_balance
             pnl_percent = (total_pnl / starting_balance * 100) if starting_balance > 0 else 0
         else:
             starting_balance = config.INITIAL_CAPITAL
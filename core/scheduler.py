@@ -0,0 +1,293 @@
+"""
+적응형 수집 스케줄러
+- (종목, 데이터 종류)별 다음 수집 시각을 우선순위 큐(heap)로 관리하고 예정 시각에 작업 스레드로 실행
+- 기준 주기(유니버스 티어 등)에 종목 상태 배수 적용: 보유 포지션/최근 시그널/변동성 높은 종목은 가속,
+  한산한 종목은 감속
+- 예약 작업의 예상 초당 요청 수가 전역 한도를 넘으면 전체 주기를 같은 비율로 늘림 (보유 포지션 제외)
+- 같은 (종목, 종류) 작업은 동시에 실행되지 않음 (완료 시점 기준으로 다음 시각 예약)
+"""
+
+import heapq
+import itertools
+import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+import numpy as np
+
+from utils import metrics
+import config
+
+IntervalSpec = Union[float, Callable[[Optional[str]], Optional[float]]]
+
+
+class _Kind:
+    """데이터 종류별 작업 설정"""
+
+    __slots__ = ('name', 'handler', 'interval', 'cost', 'adaptive', 'per_symbol', 'initial_delay', 'pool')
+
+    def __init__(self, name, handler, interval, cost, adaptive, per_symbol, initial_delay, pool):
+        self.name = name
+        self.handler = handler
+        self.interval = interval
+        self.cost = cost
+        self.adaptive = adaptive
+        self.per_symbol = per_symbol
+        self.initial_delay = initial_delay
+        self.pool = pool
+
+
+class PollScheduler:
+    """(종목, 데이터 종류)별 적응형 수집 스케줄러 (스레드 안전)"""
+
+    def __init__(self, budget: float = None, workers: int = None,
+                 on_error: Optional[Callable[[str], None]] = None, name: str = 'poll'):
+        """
+        Args:
+            budget: 예약 작업 전체 초당 요청 한도 (기본: config.SCHEDULER_REQUEST_BUDGET, 0 이하면 무제한)
+            workers: 공유 작업 스레드 수 (기본: config.SCHEDULER_WORKERS)
+            on_error: 작업 예외 시 호출 (메시지)
+            name: 작업 스레드 이름 접두어
+        """
+        self.budget = budget if budget is not None else config.SCHEDULER_REQUEST_BUDGET
+        self.on_error = on_error
+        self.name = name
+        self.stretch = 1.0
+
+        self._kinds: Dict[str, _Kind] = {}
+        self._shared_pool = ThreadPoolExecutor(max_workers=workers or config.SCHEDULER_WORKERS,
+                                               thread_name_prefix=name)
+        self._pools = [self._shared_pool]
+        self._heap: List[tuple] = []
+        self._seq = itertools.count()
+        self._versions: Dict[tuple, int] = {}
+        self._active = set()  # 예약 중이거나 실행 중인 (종목, 종류)
+        self._demand: Dict[tuple, float] = {}
+        self._demand_total = 0.0
+        self._cond = threading.Condition()
+
+        # 종목 상태 (가속/감속 배수 입력)
+        self.held = frozenset()
+        self._signal_until: Dict[str, float] = {}
+        self._last_price: Dict[str, float] = {}
+        self._volatility: Dict[str, float] = {}
+        self._volatility_median = 0.0
+        self._alpha = 1 - 0.5 ** (1 / config.SCHEDULER_VOLATILITY_HALFLIFE)
+
+    # ===========================
+    # 작업 등록/예약
+    # ===========================
+
+    def add_kind(self, kind: str, handler: Callable, interval: IntervalSpec, cost: float = 0,
+                 adaptive: bool = False, per_symbol: bool = True, initial_delay: float = 0.0,
+                 workers: int = None):
+        """
+        데이터 종류 등록
+        Args:
+            handler: 작업 함수 - 종목별이면 handler(symbol), 전역이면 handler()
+            interval: 기준 주기 (초) 또는 종목 → 주기 함수 (None 반환 시 예약 중단 - cold 종목 등)
+            cost: 실행 1회당 API 요청 수 (요청 한도 계산, DB 작업은 0)
+            adaptive: 종목 상태 배수 적용 여부
+            per_symbol: False 면 종목 없는 전역 작업 (등록 시 예약)
+            initial_delay: 최초 실행 지연 (초)
+            workers: 전용 작업 스레드 수 (공유 세션을 쓰는 작업의 직렬화 등, 기본: 공유 스레드)
+        """
+        pool = self._shared_pool
+        if workers:
+            pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"{self.name}-{kind}")
+            self._pools.append(pool)
+        self._kinds[kind] = _Kind(kind, handler, interval, cost, adaptive, per_symbol, initial_delay, pool)
+        if not per_symbol:
+            self.schedule(None, kind, initial_delay)
+
+    def schedule(self, symbol: Optional[str], kind: str, delay: float = 0.0):
+        """작업 예약 (이미 예약된 작업은 기존 예약 무효화 후 재예약)"""
+        key = (symbol, kind)
+        with self._cond:
+            version = self._versions.get(key, 0) + 1
+            self._versions[key] = version
+            self._active.add(key)
+            heapq.heappush(self._heap, (time.monotonic() + delay, next(self._seq), symbol, kind, version))
+            self._cond.notify()
+
+    def trigger(self, symbol: Optional[str], kind: str):
+        """즉시 실행 예약 (등록되지 않은 종류는 무시)"""
+        if kind in self._kinds:
+            self.schedule(symbol, kind)
+
+    def unschedule(self, symbol: str):
+        """종목의 모든 작업 예약 취소 (큐에 남은 항목은 꺼낼 때 무시)"""
+        with self._cond:
+            for kind in self._kinds:
+                key = (symbol, kind)
+                if key in self._active:
+                    self._active.discard(key)
+                    self._versions[key] += 1
+                    self._set_demand(key, 0.0)
+
+    def sync(self, symbols: Iterable[str]):
+        """
+        종목별 작업 대상 동기화 - 신규 종목은 즉시 예약, 빠진 종목은 예약 취소
+        (cold 전환 등 주기 함수가 None 을 반환하는 종목은 다음 실행 후 자연히 빠짐)
+        """
+        symbols = list(dict.fromkeys(symbols))
+        wanted = set(symbols)
+        with self._cond:
+            scheduled = {symbol for symbol, _ in self._active if symbol is not None}
+        for symbol in scheduled - wanted:
+            self.unschedule(symbol)
+        for i, symbol in enumerate(symbols):
+            for kind in self._kinds.values():
+                if not kind.per_symbol:
+                    continue
+                if (symbol, kind.name) not in self._active:
+                    # 시작 시 일제 요청 방지 - 기준 주기 안에서 종목별로 분산
+                    base = self._base_interval(kind, symbol)
+                    if base is not None:
+                        self.schedule(symbol, kind.name, kind.initial_delay + base * i / max(len(symbols), 1))
+
+    # ===========================
+    # 종목 상태
+    # ===========================
+
+    def set_held(self, symbols: Iterable[str]):
+        """보유 포지션 종목 (가장 빠른 배수, 요청 한도 초과 시에도 주기 유지)"""
+        self.held = frozenset(symbols)
+
+    def boost(self, symbol: str, seconds: float = None):
+        """최근 시그널 종목 가속 (seconds 동안)"""
+        self._signal_until[symbol] = time.monotonic() + (seconds or config.SCHEDULER_SIGNAL_BOOST_SECONDS)
+
+    def observe_prices(self, prices: Dict[str, float]):
+        """
+        가격 관측 → 종목별 절대 로그 수익률 EWMA (변동성) + 종목 간 중앙값 갱신
+        변동성 배수 = 중앙값 / 종목 변동성 (변동성 높을수록 짧은 주기)
+        """
+        alpha = self._alpha
+        for symbol, price in prices.items():
+            if price <= 0:
+                continue
+            previous = self._last_price.get(symbol)
+            self._last_price[symbol] = price
+            if previous is None:
+                continue
+            move = abs(math.log(price / previous))
+            current = self._volatility.get(symbol)
+            self._volatility[symbol] = move if current is None else current + alpha * (move - current)
+        if self._volatility:
+            self._volatility_median = float(np.median(np.fromiter(self._volatility.values(), dtype=float)))
+
+    def factor(self, symbol: Optional[str]) -> float:
+        """종목 상태 주기 배수 (1 미만 가속, 1 초과 감속)"""
+        if symbol is None:
+            return 1.0
+        if symbol in self.held:
+            return config.SCHEDULER_POSITION_FACTOR
+
+        factor = 1.0
+        volatility = self._volatility.get(symbol)
+        median = self._volatility_median
+        if volatility is not None and median > 0:
+            factor = median / volatility if volatility > 0 else config.SCHEDULER_MAX_BACKOFF
+            factor = min(max(factor, config.SCHEDULER_MAX_SPEEDUP), config.SCHEDULER_MAX_BACKOFF)
+        if self._signal_until.get(symbol, 0.0) > time.monotonic():
+            factor = min(factor, config.SCHEDULER_SIGNAL_FACTOR)
+        return factor
+
+    def interval(self, symbol: Optional[str], kind: str) -> Optional[float]:
+        """다음 실행까지 주기 (초, None 이면 예약 중단) - 요청 한도 배수 포함"""
+        spec = self._kinds[kind]
+        base = self._base_interval(spec, symbol)
+        if base is None:
+            return None
+        if not spec.adaptive:
+            return base
+        interval = max(base * self.factor(symbol), config.SCHEDULER_MIN_INTERVAL)
+        if symbol not in self.held:
+            interval *= self.stretch
+        return interval
+
+    @staticmethod
+    def _base_interval(kind: _Kind, symbol: Optional[str]) -> Optional[float]:
+        return kind.interval(symbol) if callable(kind.interval) else kind.interval
+
+    def _set_demand(self, key: tuple, rate: float):
+        """작업별 예상 초당 요청 수 갱신 → 요청 한도 배수 재계산 (self._cond 보유 상태에서 호출)"""
+        self._demand_total += rate - self._demand.pop(key, 0.0)
+        if rate > 0:
+            self._demand[key] = rate
+        self.stretch = max(1.0, self._demand_total / self.budget) if self.budget > 0 else 1.0
+
+    # ===========================
+    # 실행
+    # ===========================
+
+    def run(self, is_running: Callable[[], bool] = lambda: True):
+        """디스패치 루프 (블로킹) - 예정 시각이 된 작업을 작업 스레드로 실행"""
+        while is_running():
+            with self._cond:
+                if not self._heap:
+                    self._cond.wait(1.0)
+                    continue
+                due, _, symbol, kind, version = self._heap[0]
+                wait = due - time.monotonic()
+                if wait > 0:
+                    self._cond.wait(min(wait, 1.0))
+                    continue
+                heapq.heappop(self._heap)
+                if self._versions.get((symbol, kind)) != version:
+                    continue
+
+            metrics.SCHEDULER_LAG_SECONDS.observe(-wait, kind=kind)
+            self._kinds[kind].pool.submit(self._execute, symbol, kind, version)
+
+    def start(self, is_running: Callable[[], bool] = lambda: True) -> threading.Thread:
+        """디스패치 루프 백그라운드 실행"""
+        thread = threading.Thread(target=self.run, args=(is_running,), name=f"{self.name}-dispatch", daemon=True)
+        thread.start()
+        return thread
+
+    def shutdown(self):
+        """작업 스레드 종료 (실행 중 작업은 완료까지 대기하지 않음)"""
+        for pool in self._pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _execute(self, symbol: Optional[str], kind: str, version: int):
+        spec = self._kinds[kind]
+        try:
+            if spec.per_symbol:
+                spec.handler(symbol)
+            else:
+                spec.handler()
+        except Exception as e:
+            if self.on_error:
+                self.on_error(f"예약 작업 에러 ({kind}{'/' + symbol if symbol else ''}): {str(e)}")
+
+        # 완료 시점 기준 다음 예약 (이번 실행 중 재예약/취소됐으면 생략)
+        key = (symbol, kind)
+        interval = self.interval(symbol, kind)
+        with self._cond:
+            if self._versions.get(key) != version:
+                return
+            if interval is None:
+                self._active.discard(key)
+                self._set_demand(key, 0.0)
+                return
+            if spec.cost:
+                self._set_demand(key, spec.cost / (interval / self.stretch if symbol not in self.held else interval))
+            heapq.heappush(self._heap, (time.monotonic() + interval, next(self._seq), symbol, kind, version))
+            self._cond.notify()
+        metrics.SCHEDULER_BUDGET_STRETCH.set(self.stretch)
+        metrics.SCHEDULER_REQUEST_RATE.set(self._demand_total)
+
+    def stats(self) -> Dict:
+        """상태 요약 (대기 작업 수, 예상 초당 요청 수, 한도 배수)"""
+        with self._cond:
+            return {
+                'queued': len(self._heap),
+                'request_rate': self._demand_total,
+                'budget': self.budget,
+                'stretch': self.stretch,
+            }
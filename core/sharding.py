@@ -0,0 +1,271 @@
+"""
+멀티 프로세스 종목 샤딩
+- 워커 프로세스: 담당 종목의 시세/호가창 수집, 지표 계산, 시그널 생성 (GIL 분리)
+- 코디네이터: 전역 리스크 (최대 포지션, 일일 손실)와 주문 실행을 단독 수행
+- 워커 → 코디네이터: multiprocessing.Queue 로 사이클마다 시세 + 시그널 전송
+"""
+
+import os
+import queue
+import threading
+import time
+import multiprocessing as mp
+from typing import Dict, List
+
+from core.trading_engine_v2 import TradingEngineV2
+from utils import metrics
+import config
+
+
+def partition_symbols(symbols: List[str], shards: int) -> List[List[str]]:
+    """
+    종목 분할 (라운드 로빈 - 거래량 순 정렬된 목록이면 샤드 간 부하가 고르게 분산)
+    Returns:
+        샤드별 종목 리스트 (빈 샤드 제외)
+    """
+    symbols = list(dict.fromkeys(symbols))
+    shards = max(1, min(shards, len(symbols)))
+    return [symbols[i::shards] for i in range(shards)]
+
+
+def resolve_shard_count(shards: int = None) -> int:
+    """샤드 수 결정 (0이면 CPU 코어 수)"""
+    shards = config.ENGINE_SHARDS if shards is None else shards
+    return shards if shards > 0 else (os.cpu_count() or 1)
+
+
+def run_shard_worker(shard_id: int, symbols: List[str], outbox, stop_event, interval: float,
+                     bootstrap: bool = False, request_budget: float = None):
+    """
+    워커 프로세스 진입점 - 담당 종목만 수집/계산하고 시그널을 코디네이터로 전송
+    주문/포지션 관리는 하지 않음
+    Args:
+        request_budget: 워커 수집 스케줄러 초당 요청 한도 (전역 한도의 샤드 몫)
+    """
+    engine = TradingEngineV2(
+        symbols=symbols,
+        snapshot_path=os.path.join(config.SNAPSHOT_PATH, f"shard-{shard_id}")
+    )
+    if request_budget is not None:
+        engine.scheduler.budget = request_budget
+    print(f"[샤드 {shard_id}] 시작: {len(symbols)}개 종목 (pid {os.getpid()})")
+
+    if bootstrap:
+        from collectors.bootstrap import HistoryBootstrap
+        engine.require_bootstrap()
+        HistoryBootstrap(symbols, on_ready=engine.mark_symbol_ready).start()
+
+    try:
+        if engine.restore_snapshot():
+            engine._prices_loaded.set()
+        engine.start_data_collection()
+        engine._prices_loaded.wait(30)
+
+        while not stop_event.is_set():
+            cycle_start = time.time()
+            try:
+                signals = engine.screen_symbols()
+                outbox.put({
+                    'shard': shard_id,
+                    'sent_at': time.time(),
+                    'prices': {symbol: engine.market_data_cache[symbol]
+                               for symbol in symbols if symbol in engine.market_data_cache},
+                    'signals': signals,
+                })
+            except Exception as e:
+                engine._log_error(f"[샤드 {shard_id}] 시그널 계산 에러: {str(e)}")
+
+            stop_event.wait(max(interval - (time.time() - cycle_start), 0.5))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        engine.stop()
+        print(f"[샤드 {shard_id}] 종료")
+
+
+class ShardCoordinator(TradingEngineV2):
+    """
+    샤드 워커를 관리하고 수신한 시그널로 주문을 실행하는 엔진
+    워커가 수집을 전담하므로 코디네이터는 수집 스레드 없이 큐만 소비
+    (워커의 Prometheus 메트릭은 각 프로세스 레지스트리에 남음)
+    """
+
+    def __init__(self, shards: int = None, symbols: List[str] = None, bootstrap: bool = False,
+                 signal_max_age: float = None):
+        """
+        Args:
+            shards: 워커 프로세스 수 (기본: config.ENGINE_SHARDS, 0이면 CPU 코어 수)
+            bootstrap: 워커별 과거 데이터 부트스트랩 실행 여부
+            signal_max_age: 실행할 시그널 허용 경과 시간 (초, 기본: config.SHARD_SIGNAL_MAX_AGE)
+        """
+        # 전략 ID 조회/생성은 코디네이터에서 먼저 수행 (워커 간 생성 경쟁 방지)
+        super().__init__(symbols=symbols)
+        self.shards = partition_symbols(self.symbols, resolve_shard_count(shards))
+        self.bootstrap = bootstrap
+        self.signal_max_age = signal_max_age if signal_max_age is not None else config.SHARD_SIGNAL_MAX_AGE
+
+        # spawn: 부모의 DB 커넥션/스레드를 복제하지 않음
+        self._ctx = mp.get_context('spawn')
+        self._outbox = self._ctx.Queue()
+        self._stop_event = self._ctx.Event()
+        self._workers: Dict[int, mp.Process] = {}
+        self._interval = 10
+
+        # 수신 시그널 {symbol: (워커 전송 시각, [시그널])}
+        self._pending_signals: Dict[str, tuple] = {}
+        self._pending_lock = threading.Lock()
+        self.shard_heartbeats: Dict[int, float] = {}
+
+    # ===========================
+    # 워커 관리
+    # ===========================
+
+    def _spawn_worker(self, shard_id: int):
+        process = self._ctx.Process(
+            target=run_shard_worker,
+            args=(shard_id, self.shards[shard_id], self._outbox, self._stop_event,
+                  self._interval, self.bootstrap, config.SCHEDULER_REQUEST_BUDGET / len(self.shards)),
+            name=f"shard-{shard_id}",
+            daemon=True
+        )
+        process.start()
+        self._workers[shard_id] = process
+
+    def start_data_collection(self):
+        """워커 프로세스 시작 + 큐 수신 스레드"""
+        self.is_running = True
+
+        for shard_id in range(len(self.shards)):
+            self._spawn_worker(shard_id)
+
+        def receive():
+            while self.is_running:
+                try:
+                    message = self._outbox.get(timeout=1)
+                except queue.Empty:
+                    continue
+                except (EOFError, OSError):
+                    break
+                self._handle_message(message)
+
+        def supervise():
+            """비정상 종료된 워커 재시작"""
+            while self.is_running:
+                time.sleep(config.SHARD_RESTART_DELAY)
+                for shard_id, process in list(self._workers.items()):
+                    if self.is_running and not process.is_alive():
+                        self._log_error(f"샤드 {shard_id} 워커 종료 (exit {process.exitcode}) - 재시작")
+                        self._spawn_worker(shard_id)
+
+        for target in (receive, supervise):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self.data_threads.append(thread)
+
+        self._log_info(f"샤드 워커 {len(self.shards)}개 시작 "
+                       f"({', '.join(str(len(s)) for s in self.shards)}개 종목)")
+
+    def _handle_message(self, message: Dict):
+        """워커 사이클 결과 반영 - 시세 캐시 갱신, 담당 종목 시그널 교체"""
+        received_at = time.time()
+        self.shard_heartbeats[message['shard']] = received_at
+
+        # 잔고 평가/포지션 관리가 참조하는 캐시 (dict 객체는 유지)
+        self.market_data_cache.update(message['prices'])
+        if message['prices']:
+            self._prices_loaded.set()
+
+        with self._pending_lock:
+            for symbol in self.shards[message['shard']]:
+                self._pending_signals.pop(symbol, None)
+            for symbol, signals in message['signals'].items():
+                self._pending_signals[symbol] = (message['sent_at'], signals)
+
+    def stop_workers(self, timeout: float = 10):
+        """워커 종료 신호 후 대기 (미종료 시 강제 종료)"""
+        self._stop_event.set()
+        for process in self._workers.values():
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        self._workers.clear()
+
+    # ===========================
+    # 트레이딩 사이클 (전역 리스크 + 주문)
+    # ===========================
+
+    def execute_trading_cycle(self):
+        """워커 시그널로 주문 실행 - 리스크 한도는 전체 종목 기준으로 한 곳에서 검증"""
+
+        print(f"\n대상 코인: {len(self.symbols)}개 (샤드 {len(self.shards)}개)")
+
+        cycle_start = time.perf_counter()
+
+        self._check_all_positions()
+
+        with self._pending_lock:
+            pending, self._pending_signals = self._pending_signals, {}
+
+        now = time.time()
+        for symbol in self.symbols:
+            if symbol not in pending:
+                continue
+
+            sent_at, signals = pending[symbol]
+            if now - sent_at > self.signal_max_age:
+                continue
+
+            symbol_start = time.perf_counter()
+            try:
+                current_price = self.market_data_cache[symbol]['price']
+                print(f"\n[{symbol}] 현재가: {current_price:,.0f}원")
+
+                if not self.risk_manager.check_daily_loss_limit():
+                    print("  일일 손실 한도 초과 - 거래 중단")
+                    break
+
+                if not self.risk_manager.check_max_open_positions():
+                    print("  최대 포지션 수 도달")
+                    break
+
+                self._execute_best_signal(symbol, signals)
+
+            except Exception as e:
+                self._log_error(f"[{symbol}] 트레이딩 사이클 에러: {str(e)}")
+                import traceback
+                traceback.print_exc()
+            finally:
+                metrics.TRADING_CYCLE_SYMBOL_SECONDS.observe(time.perf_counter() - symbol_start)
+
+        metrics.TRADING_CYCLE_SECONDS.observe(time.perf_counter() - cycle_start)
+
+    def save_snapshot(self):
+        """스냅샷은 워커가 샤드별로 저장"""
+
+    def restore_snapshot(self) -> bool:
+        return False
+
+    def run(self, interval: int = 300):
+        """워커 시작 후 코디네이터 루프 실행 (종료 시 워커 정리)"""
+        self._interval = interval
+        try:
+            super().run(interval=interval)
+        finally:
+            self.is_running = False
+            self.stop_workers()
+
+    def stop(self):
+        self.is_running = False
+        self.stop_workers()
+
+    def status(self) -> Dict:
+        """샤드별 상태 (종목 수, 생존 여부, 마지막 수신 경과 시간)"""
+        now = time.time()
+        return {
+            shard_id: {
+                'symbols': len(symbols),
+                'alive': shard_id in self._workers and self._workers[shard_id].is_alive(),
+                'last_seen': now - self.shard_heartbeats[shard_id] if shard_id in self.shard_heartbeats else None,
+            }
+            for shard_id, symbols in enumerate(self.shards)
+        }
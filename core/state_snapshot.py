@@ -0,0 +1,251 @@
+"""
+엔진 상태 스냅샷 (웜 리스타트)
+시세/호가창/지표 캐시와 전략 상태를 NumPy 배열(.npy, 메모리 매핑 로드) + JSON 헤더로 저장
+재시작 시 신선도를 검증해 유효한 항목만 복원
+"""
+
+import json
+import os
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from analysis import orderbook_analytics
+import config
+
+SNAPSHOT_VERSION = 1
+HEADER_FILE = 'header.json'
+
+PRICE_DTYPE = np.dtype([('price', 'f8'), ('volume', 'f8'), ('timestamp', 'f8')])
+ORDERBOOK_META_DTYPE = np.dtype([('timestamp', 'f8'), ('bid_levels', 'i4'), ('ask_levels', 'i4')])
+
+
+class EngineSnapshot:
+    """엔진 캐시 체크포인트 저장/복원"""
+
+    def __init__(self, path: str = None, orderbook_levels: int = 30):
+        """
+        Args:
+            path: 스냅샷 디렉토리 (기본: config.SNAPSHOT_PATH)
+            orderbook_levels: 저장할 호가 단계 수
+        """
+        self.path = path or config.SNAPSHOT_PATH
+        self.orderbook_levels = orderbook_levels
+
+    # ===========================
+    # 저장
+    # ===========================
+
+    def save(self, symbols: List[str], market_data_cache: Dict, orderbook_cache: Dict,
+             indicators_cache: Dict, strategy_states: Dict) -> Dict:
+        """
+        체크포인트 저장
+        배열 파일을 세대 번호로 먼저 쓰고 헤더를 원자적으로 교체 - 저장 중 크래시에도 이전 스냅샷 유지
+        Args:
+            symbols: 종목 리스트 (배열 행 순서)
+            strategy_states: {strategy_id: BaseStrategy.get_state()}
+        Returns:
+            헤더
+        """
+        os.makedirs(self.path, exist_ok=True)
+        generation = int(time.time() * 1000)
+        symbols = list(dict.fromkeys(symbols))
+
+        arrays = {
+            'prices': self._pack_prices(symbols, market_data_cache),
+        }
+        arrays.update(self._pack_orderbooks(symbols, orderbook_cache))
+        indicator_keys, indicator_values, indicator_times = self._pack_indicators(symbols, indicators_cache)
+        arrays['indicators'] = indicator_values
+        arrays['indicator_times'] = indicator_times
+
+        files = {}
+        for name, array in arrays.items():
+            filename = f"{name}.{generation}.npy"
+            np.save(os.path.join(self.path, filename), array)
+            files[name] = filename
+
+        header = {
+            'version': SNAPSHOT_VERSION,
+            'saved_at': time.time(),
+            'generation': generation,
+            'symbols': symbols,
+            'indicator_keys': indicator_keys,
+            'orderbook_levels': self.orderbook_levels,
+            'files': files,
+            'strategies': {str(k): v for k, v in strategy_states.items()},
+        }
+
+        tmp_path = os.path.join(self.path, HEADER_FILE + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(header, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, os.path.join(self.path, HEADER_FILE))
+
+        self._cleanup(generation)
+        return header
+
+    def _pack_prices(self, symbols: List[str], cache: Dict) -> np.ndarray:
+        prices = np.zeros(len(symbols), dtype=PRICE_DTYPE)
+        prices['timestamp'] = np.nan
+        for i, symbol in enumerate(symbols):
+            entry = cache.get(symbol)
+            if entry:
+                prices[i] = (entry['price'], entry['volume'], entry['timestamp'].timestamp())
+        return prices
+
+    def _pack_orderbooks(self, symbols: List[str], cache: Dict) -> Dict[str, np.ndarray]:
+        """호가창 → (종목, 단계, [가격, 수량]) 배열"""
+        levels = self.orderbook_levels
+        bids = np.zeros((len(symbols), levels, 2))
+        asks = np.zeros((len(symbols), levels, 2))
+        meta = np.zeros(len(symbols), dtype=ORDERBOOK_META_DTYPE)
+        meta['timestamp'] = np.nan
+
+        for i, symbol in enumerate(symbols):
+            book = cache.get(symbol)
+            if not book:
+                continue
+            for side, out, field in ((book['bids'], bids, 'bid_levels'), (book['asks'], asks, 'ask_levels')):
+                side = side[:levels]
+                for j, level in enumerate(side):
+                    out[i, j] = (float(level['price']), float(level['quantity']))
+                meta[field][i] = len(side)
+            meta['timestamp'][i] = book['timestamp'].timestamp()
+
+        return {'orderbook_bids': bids, 'orderbook_asks': asks, 'orderbook_meta': meta}
+
+    def _pack_indicators(self, symbols: List[str], cache: Dict):
+        """숫자 지표만 (종목, 지표) 배열로 저장 - None은 NaN"""
+        keys = sorted({
+            key for indicators in cache.values() for key, value in indicators.items()
+            if value is None or isinstance(value, (int, float)) and not isinstance(value, bool)
+        })
+        values = np.full((len(symbols), len(keys)), np.nan)
+        times = np.full(len(symbols), np.nan)
+
+        for i, symbol in enumerate(symbols):
+            indicators = cache.get(symbol)
+            if not indicators:
+                continue
+            for j, key in enumerate(keys):
+                value = indicators.get(key)
+                if isinstance(value, (int, float)):
+                    values[i, j] = value
+            timestamp = indicators.get('timestamp')
+            if timestamp is not None:
+                times[i] = timestamp.timestamp()
+
+        return keys, values, times
+
+    def _cleanup(self, keep_generation: int):
+        """이전 세대 배열 파일 삭제"""
+        suffix = f".{keep_generation}.npy"
+        for filename in os.listdir(self.path):
+            if filename.endswith('.npy') and not filename.endswith(suffix):
+                try:
+                    os.remove(os.path.join(self.path, filename))
+                except OSError:
+                    pass
+
+    # ===========================
+    # 복원
+    # ===========================
+
+    def load(self, symbols: List[str], max_age: float = None) -> Optional[Dict]:
+        """
+        체크포인트 로드 + 신선도 검증
+        Args:
+            symbols: 현재 대상 종목 (스냅샷에 없는 종목은 무시)
+            max_age: 스냅샷 전체 허용 경과 시간 (초, 기본: config.SNAPSHOT_MAX_AGE)
+        Returns:
+            {'market_data', 'orderbooks', 'indicators', 'strategies', 'age'} 또는 None
+        """
+        max_age = max_age if max_age is not None else config.SNAPSHOT_MAX_AGE
+        header_path = os.path.join(self.path, HEADER_FILE)
+        if not os.path.exists(header_path):
+            return None
+
+        try:
+            with open(header_path, 'r', encoding='utf-8') as f:
+                header = json.load(f)
+
+            if header.get('version') != SNAPSHOT_VERSION:
+                return None
+
+            now = time.time()
+            age = now - header['saved_at']
+            if age > max_age:
+                print(f"스냅샷 만료 ({age:.0f}초 경과) - 무시")
+                return None
+
+            arrays = {
+                name: np.load(os.path.join(self.path, filename), mmap_mode='r')
+                for name, filename in header['files'].items()
+            }
+        except (OSError, ValueError, KeyError) as e:
+            print(f"스냅샷 로드 실패: {e}")
+            return None
+
+        wanted = set(symbols)
+        index = [(i, symbol) for i, symbol in enumerate(header['symbols']) if symbol in wanted]
+
+        return {
+            'market_data': self._unpack_prices(arrays['prices'], index, now),
+            'orderbooks': self._unpack_orderbooks(arrays, index, now),
+            'indicators': self._unpack_indicators(arrays, header['indicator_keys'], index),
+            'strategies': header.get('strategies', {}),
+            'saved_at': header['saved_at'],
+            'age': age,
+        }
+
+    @staticmethod
+    def _fresh(timestamp: float, now: float, max_age: float) -> bool:
+        return not np.isnan(timestamp) and now - timestamp <= max_age
+
+    def _unpack_prices(self, prices: np.ndarray, index, now: float) -> Dict:
+        result = {}
+        for i, symbol in index:
+            row = prices[i]
+            if self._fresh(row['timestamp'], now, config.SNAPSHOT_PRICE_MAX_AGE) and row['price'] > 0:
+                result[symbol] = {
+                    'price': float(row['price']),
+                    'volume': float(row['volume']),
+                    'timestamp': datetime.fromtimestamp(float(row['timestamp']))
+                }
+        return result
+
+    def _unpack_orderbooks(self, arrays: Dict, index, now: float) -> Dict:
+        result = {}
+        meta, bids, asks = arrays['orderbook_meta'], arrays['orderbook_bids'], arrays['orderbook_asks']
+        for i, symbol in index:
+            if not self._fresh(meta[i]['timestamp'], now, config.SNAPSHOT_ORDERBOOK_MAX_AGE):
+                continue
+            bid_levels, ask_levels = bids[i, :meta[i]['bid_levels']], asks[i, :meta[i]['ask_levels']]
+            book_bids = [{'price': str(p), 'quantity': str(q)} for p, q in bid_levels]
+            book_asks = [{'price': str(p), 'quantity': str(q)} for p, q in ask_levels]
+            # 배열에서 바로 분석 (문자열 재파싱 없음)
+            parsed = orderbook_analytics.ParsedBook(
+                np.ascontiguousarray(bid_levels[:, 0]), np.ascontiguousarray(bid_levels[:, 1]),
+                np.ascontiguousarray(ask_levels[:, 0]), np.ascontiguousarray(ask_levels[:, 1])
+            )
+            result[symbol] = orderbook_analytics.cache_entry(
+                book_bids, book_asks, datetime.fromtimestamp(float(meta[i]['timestamp'])), book=parsed
+            )
+        return result
+
+    def _unpack_indicators(self, arrays: Dict, keys: List[str], index) -> Dict:
+        """지표는 스냅샷 전체 신선도(max_age)만 검증 - 다음 지표 계산 주기에 갱신됨"""
+        result = {}
+        values, times = arrays['indicators'], arrays['indicator_times']
+        for i, symbol in index:
+            row = values[i]
+            if np.isnan(row).all():
+                continue
+            indicators = {key: (None if np.isnan(value) else float(value)) for key, value in zip(keys, row)}
+            indicators['symbol'] = symbol
+            if not np.isnan(times[i]):
+                indicators['timestamp'] = datetime.fromtimestamp(float(times[i]))
+            result[symbol] = indicators
+        return result
@@ -9,23 +9,36 @@ from typing import Dict, List, Optional
 from datetime import datetime
 from decimal import Decimal
 
+import numpy as np
+
 from database import SessionLocal, TradingSignal, Position, Strategy, SystemLog, OHLCVData
-from strategies import (
-    OrderbookScalpingStrategy
-)
+from strategies.registry import create_strategies, DataRequirements
 from strategies.strategy_selector import StrategySelector
 from core.risk_manager import RiskManager
 from core.order_executor import OrderExecutor
+from core.state_snapshot import EngineSnapshot
+from core.universe import UniverseManager
+from core.scheduler import PollScheduler
 from analysis.indicators import IndicatorEngine
+from analysis import orderbook_analytics
+from analysis.orderbook_features import OrderbookFeatureHistory
+from analysis.anomaly_labeler import AnomalyLabeler
+from collectors.trade_tape import TradeTape, TradeTapeStream
 from api import BithumbAPI
 from utils.telegram_notifier import TelegramNotifier
+from utils import metrics
 import config
 
 
 class TradingEngineV2:
     """완전히 작동하는 메인 트레이딩 엔진"""
 
-    def __init__(self):
+    def __init__(self, symbols: List[str] = None, snapshot_path: str = None):
+        """
+        Args:
+            symbols: 대상 종목 (기본: UniverseManager 유동성 순위 hot + warm, 샤드 워커는 담당 종목만)
+            snapshot_path: 스냅샷 디렉토리 (기본: config.SNAPSHOT_PATH)
+        """
         self.db = SessionLocal()
         self.api = BithumbAPI()
         self.notifier = TelegramNotifier()
@@ -39,170 +52,325 @@ class TradingEngineV2:
         self.order_executor = OrderExecutor()
         self.indicator_engine = IndicatorEngine()
 
+        # 활성 전략이 소비하는 입력만 수집/계산
+        self.data_requirements = DataRequirements(
+            [info['instance'] for info in self.strategies.values()]
+        )
+
         # 캐시 (최근 데이터 저장)
         self.market_data_cache = {}
-        self.indicators_cache = {}
+        self.indicator_caches = {tf: {} for tf in self.data_requirements.indicators}
+        self.indicators_cache = self.indicator_caches.setdefault('15m', {})
         self.orderbook_cache = {}
+        self.orderbook_features = OrderbookFeatureHistory()  # 종목별 호가창 특성 시계열
+        self.anomaly_hit_rates = {}  # 이상 패턴 유형별 적중률 (AnomalyLabeler.hit_rates)
+        self.trade_tape = TradeTape()  # 종목별 초 단위 체결 바 (단기 volume_ratio)
+        self.trade_stream = None  # 실시간 체결 구독 (TRADE_TAPE_SOURCE='ws')
+
+        # 잔고 평가 시 시세 캐시 재사용
+        self.order_executor.price_cache = self.market_data_cache
+        self.order_executor.pricer.orderbook_cache = self.orderbook_cache
+        self.order_executor.position_listeners.append(self._on_position_event)
 
         # 상태
         self.is_running = False
-        self.symbols = config.TARGET_PAIRS
+        # 거래 대상 유니버스 (종목 지정 시 고정, 아니면 ALL 시세 순위로 주기적 갱신)
+        self.universe = UniverseManager(api=self.api, symbols=symbols)
+        self.universe.pin(self._held_symbols(self.db))
+        self.universe.refresh()
+        self.symbols = self.universe.tradable()
+
+        # 과거 데이터 준비 완료 종목 (None이면 전체 준비 완료로 간주)
+        self.ready_symbols = None
+        self._prices_loaded = threading.Event()
 
-        # 데이터 수집 스레드
+        # 웜 리스타트 스냅샷
+        self.snapshot = EngineSnapshot(path=snapshot_path)
+
+        # 데이터 수집 스케줄러 (종목/데이터 종류별 다음 수집 시각)
+        self.scheduler = PollScheduler(on_error=self._log_error)
         self.data_threads = []
 
     def _initialize_strategies(self) -> Dict:
-        """전략 초기화 - 초공격적 스캘핑"""
+        """활성 전략 초기화 (config.ACTIVE_STRATEGIES, strategies.registry)"""
         strategies = {}
 
-        # 초공격적 스캘핑 전략 (0.1% 움직임만 있어도 진입)
-        from strategies.hyper_scalping_strategy import HyperScalpingStrategy
-        hyper_scalp = HyperScalpingStrategy()
+        for strategy in create_strategies(config.ACTIVE_STRATEGIES):
+            strategy_id = strategy.default_strategy_id or self._resolve_strategy_id(strategy)
+            if strategy_id in strategies:
+                raise ValueError(f"전략 ID 중복: {strategy.registry_key} ({strategy_id})")
 
-        strategies[1] = {
-            'instance': hyper_scalp,
-            'name': 'Hyper Scalping',
-            'type': 'ultra_fast'
-        }
+            strategies[strategy_id] = {
+                'instance': strategy,
+                'name': strategy.name,
+                'type': strategy.strategy_type
+            }
 
         return strategies
 
+    def _resolve_strategy_id(self, strategy) -> int:
+        """전략 이름으로 strategies.id 조회 (없으면 생성)"""
+        record = self.db.query(Strategy).filter(Strategy.name == strategy.name).first()
+        if not record:
+            record = Strategy(
+                name=strategy.name,
+                strategy_type=strategy.strategy_type,
+                parameters=strategy.parameters,
+                is_active=True
+            )
+            self.db.add(record)
+            self.db.commit()
+            self.db.refresh(record)
+        return record.id
+
     def start_data_collection(self):
-        """백그라운드에서 데이터 수집 시작"""
+        """백그라운드 데이터 수집 시작 (종목/데이터 종류별 적응형 스케줄러)"""
         self.is_running = True
+        scheduler = self.scheduler
+
+        # 스레드 전용 DB 세션 (1분봉 저장 - 가격 작업은 동시에 실행되지 않음)
+        price_db = SessionLocal()
+        last_save_minute = None
 
         def collect_prices():
-            """가격 데이터 지속 수집 (캐시 + DB 저장)"""
-            from decimal import Decimal
+            """가격 데이터 수집 (ALL 시세 1회 조회, 캐시 + DB 저장)"""
+            nonlocal last_save_minute
+            current_time = datetime.now()
+            current_minute = current_time.replace(second=0, microsecond=0)
+
+            # ALL 시세 1회 조회 - 거래 대상 외 종목(보유 코인 잔고 평가 등)도 캐시
+            ticker = self.api.get_ticker('ALL')
+            tickers = ticker.get('data', {}) if ticker.get('status') == '0000' else {}
+            for symbol, data in tickers.items():
+                if not isinstance(data, dict):
+                    continue
+                self.market_data_cache[symbol] = {
+                    'price': float(data.get('closing_price', 0)),
+                    'volume': float(data.get('units_traded_24H', 0)),
+                    'timestamp': current_time
+                }
 
-            # 스레드 전용 DB 세션
-            thread_db = SessionLocal()
+            # 거래 대상 종목 변동성 → 수집 주기 배수
+            scheduler.observe_prices({
+                symbol: self.market_data_cache[symbol]['price']
+                for symbol in self.symbols if symbol in tickers
+            })
 
-            last_save_minute = None
+            for symbol in self.symbols:
+                entry = self.market_data_cache.get(symbol)
+                if symbol in tickers and entry:
+                    price = entry['price']
+                    volume = entry['volume']
 
-            while self.is_running:
-                try:
-                    current_time = datetime.now()
-                    current_minute = current_time.replace(second=0, microsecond=0)
-
-                    for symbol in self.symbols:
-                        ticker = self.api.get_ticker(symbol)
-                        if ticker.get('status') == '0000':
-                            data = ticker['data']
-                            price = float(data.get('closing_price', 0))
-                            volume = float(data.get('units_traded_24H', 0))
-
-                            # 캐시 업데이트
-                            self.market_data_cache[symbol] = {
-                                'price': price,
-                                'volume': volume,
-                                'timestamp': current_time
-                            }
-
-                            # 1분마다 DB에 저장 (1분봉)
-                            if last_save_minute != current_minute:
-                                try:
-                                    # 중복 체크
-                                    exists = thread_db.query(OHLCVData).filter(
-                                        OHLCVData.symbol == symbol,
-                                        OHLCVData.timeframe == '1m',
-                                        OHLCVData.timestamp == current_minute
-                                    ).first()
-
-                                    if not exists:
-                                        ohlcv = OHLCVData(
-                                            symbol=symbol,
-                                            timeframe='1m',
-                                            timestamp=current_minute,
-                                            open=Decimal(str(price)),
-                                            high=Decimal(str(price)),
-                                            low=Decimal(str(price)),
-                                            close=Decimal(str(price)),
-                                            volume=Decimal(str(volume))
-                                        )
-                                        thread_db.add(ohlcv)
-                                except Exception as e:
-                                    print(f"  [DB 저장 에러] {symbol}: {str(e)}")
-
-                    # 1분마다 커밋
+                    # 1분마다 DB에 저장 (1분봉, 거래 대상 종목만)
                     if last_save_minute != current_minute:
                         try:
-                            thread_db.commit()
-                            print(f"  [DB 저장] 1분봉 {len(self.symbols)}개 코인 저장 완료")
-                            last_save_minute = current_minute
+                            # 중복 체크
+                            exists = price_db.query(OHLCVData).filter(
+                                OHLCVData.symbol == symbol,
+                                OHLCVData.timeframe == '1m',
+                                OHLCVData.timestamp == current_minute
+                            ).first()
+
+                            if not exists:
+                                ohlcv = OHLCVData(
+                                    symbol=symbol,
+                                    timeframe='1m',
+                                    timestamp=current_minute,
+                                    open=Decimal(str(price)),
+                                    high=Decimal(str(price)),
+                                    low=Decimal(str(price)),
+                                    close=Decimal(str(price)),
+                                    volume=Decimal(str(volume))
+                                )
+                                price_db.add(ohlcv)
                         except Exception as e:
-                            # UniqueViolation 에러는 무시 (중복 데이터)
-                            if 'UniqueViolation' in str(e) or 'duplicate key' in str(e):
-                                print(f"  [DB 중복 무시] 1분봉 데이터 이미 존재")
-                                thread_db.rollback()
-                                last_save_minute = current_minute
-                            else:
-                                print(f"  [DB 커밋 에러] {str(e)}")
-                                thread_db.rollback()
-
-                    time.sleep(5)  # 5초마다
-                except Exception as e:
-                    self._log_error(f"가격 수집 에러: {str(e)}")
-                    time.sleep(5)
+                            print(f"  [DB 저장 에러] {symbol}: {str(e)}")
 
-            # 스레드 종료 시 세션 닫기
-            thread_db.close()
+            self._prices_loaded.set()
 
-        def collect_orderbooks():
-            """호가창 데이터 지속 수집"""
-            while self.is_running:
+            # 1분마다 커밋
+            if last_save_minute != current_minute:
                 try:
-                    for symbol in self.symbols:
-                        orderbook = self.api.get_orderbook(symbol)
-                        if orderbook.get('status') == '0000':
-                            data = orderbook['data']
-                            bids = data.get('bids', [])
-                            asks = data.get('asks', [])
-
-                            bid_total = sum(float(b['quantity']) for b in bids)
-                            ask_total = sum(float(a['quantity']) for a in asks)
-
-                            self.orderbook_cache[symbol] = {
-                                'bids': bids,
-                                'asks': asks,
-                                'bid_total_volume': bid_total,
-                                'ask_total_volume': ask_total,
-                                'imbalance_ratio': bid_total / ask_total if ask_total > 0 else 1.0,
-                                'best_bid': float(bids[0]['price']) if bids else 0,
-                                'best_ask': float(asks[0]['price']) if asks else 0,
-                                'spread': float(asks[0]['price']) - float(bids[0]['price']) if (bids and asks) else 0,
-                                'timestamp': datetime.now()
-                            }
-                    time.sleep(1)  # 1초마다
+                    with metrics.DB_COMMIT_SECONDS.time(component='price_collector'):
+                        price_db.commit()
+                    print(f"  [DB 저장] 1분봉 {len(self.symbols)}개 코인 저장 완료")
+                    last_save_minute = current_minute
                 except Exception as e:
-                    self._log_error(f"호가창 수집 에러: {str(e)}")
-                    time.sleep(1)
+                    # UniqueViolation 에러는 무시 (중복 데이터)
+                    if 'UniqueViolation' in str(e) or 'duplicate key' in str(e):
+                        print(f"  [DB 중복 무시] 1분봉 데이터 이미 존재")
+                        price_db.rollback()
+                        last_save_minute = current_minute
+                    else:
+                        print(f"  [DB 커밋 에러] {str(e)}")
+                        price_db.rollback()
+
+        def collect_orderbook(symbol: str):
+            """종목 호가창 수집 (유니버스 티어별 호가 단계 수)"""
+            orderbook = self.api.get_orderbook(
+                symbol, self.universe.depth(symbol, self.data_requirements.orderbook_depth)
+            )
+            if orderbook.get('status') == '0000':
+                data = orderbook['data']
+                entry = orderbook_analytics.cache_entry(
+                    data.get('bids', []), data.get('asks', []), datetime.now()
+                )
+                # 최근 구간 대비 특성 (OFI, z-score, EWMA 기준선) - 전략에서 사용
+                entry['features'] = self.orderbook_features.update(
+                    symbol, entry, entry['timestamp'].timestamp()
+                )
+                self.orderbook_cache[symbol] = entry
+
+        def calculate_indicators(symbol: str):
+            """종목 기술적 지표 계산 (과거 데이터 준비 시 즉시 실행 - mark_symbol_ready)"""
+            if not self.is_symbol_ready(symbol):
+                return
+            for timeframe, required in self.data_requirements.indicators.items():
+                indicators = self.indicator_engine.calculate_all_indicators(symbol, timeframe, required)
+                if indicators:
+                    self.indicator_caches[timeframe][symbol] = indicators
+
+        def collect_trades(symbol: str):
+            """종목 체결 내역 조회 (transaction_history 폴링)"""
+            result = self.api.get_transaction_history(symbol, config.TRADE_TAPE_FETCH_COUNT)
+            if result.get('status') == '0000':
+                self.trade_tape.ingest(symbol, result.get('data', []))
+
+        def refresh_anomaly_stats():
+            """이상 패턴 유형별 적중률 갱신 (호가창 전략 입력)"""
+            self.anomaly_hit_rates = self._anomaly_labeler.hit_rates()
+
+        def refresh_universe():
+            """유니버스 순위 갱신 - 신규 종목은 부트스트랩 후 거래, 제외 종목은 신규 진입 중단"""
+            self.universe.pin(self._held_symbols(universe_db))
+            self._apply_universe_changes(self.universe.refresh())
+
+        # 작업 등록 (활성 전략이 필요로 하는 수집/계산만)
+        scheduler.add_kind('prices', collect_prices, config.PRICE_INTERVAL, cost=1, per_symbol=False)
+        if self.data_requirements.requires_orderbook:
+            scheduler.add_kind('orderbook', collect_orderbook,
+                               lambda symbol: self.universe.interval(symbol, 'orderbook'),
+                               cost=1, adaptive=True)
+            self._anomaly_labeler = AnomalyLabeler()
+            scheduler.add_kind('anomaly_stats', refresh_anomaly_stats, config.ANOMALY_STATS_REFRESH,
+                               per_symbol=False)
+        if self.data_requirements.indicators:
+            # IndicatorEngine 은 DB 세션 1개를 공유하므로 전용 스레드 1개에서 순차 실행
+            scheduler.add_kind('indicators', calculate_indicators, config.INDICATOR_INTERVAL,
+                               adaptive=True, workers=1)
+        if self.data_requirements.requires_trades:
+            self.trade_tape.watch(self.symbols)
+            if config.TRADE_TAPE_SOURCE == 'ws':
+                self.trade_stream = TradeTapeStream(self.trade_tape, self.symbols)
+                threading.Thread(target=self.trade_stream.run_loop, args=(lambda: self.is_running,),
+                                 daemon=True).start()
+            else:
+                scheduler.add_kind('trades', collect_trades,
+                                   lambda symbol: self.universe.interval(symbol, 'trades'),
+                                   cost=1, adaptive=True)
+            scheduler.add_kind('trade_flush', self.trade_tape.flush, config.TRADE_TAPE_FLUSH_INTERVAL,
+                               per_symbol=False, initial_delay=config.TRADE_TAPE_FLUSH_INTERVAL)
+        if self.universe.mode != 'static':
+            universe_db = SessionLocal()
+            scheduler.add_kind('universe', refresh_universe, config.UNIVERSE_REFRESH_INTERVAL, cost=2,
+                               per_symbol=False, initial_delay=config.UNIVERSE_REFRESH_INTERVAL)
+        if config.SNAPSHOT_INTERVAL > 0:
+            scheduler.add_kind('snapshot', self.save_snapshot, config.SNAPSHOT_INTERVAL,
+                               per_symbol=False, initial_delay=config.SNAPSHOT_INTERVAL)
+
+        scheduler.sync(self.symbols)
+        self.data_threads.append(scheduler.start(lambda: self.is_running))
+
+        self._log_info("데이터 수집 스케줄러 시작")
+
+    @staticmethod
+    def _held_symbols(db) -> List[str]:
+        """보유 포지션 종목 (유니버스 순위와 무관하게 호가창 유지, 조회 실패 시 빈 목록)"""
+        try:
+            rows = db.query(Position.symbol).filter(Position.status.in_(Position.ACTIVE_STATUSES)).distinct().all()
+            return [row[0] for row in rows]
+        except Exception:
+            db.rollback()
+            return []
+
+    def _apply_universe_changes(self, changes: Dict[str, List[str]]):
+        """유니버스 변경 반영 (거래 대상 목록, 체결 테이프, 호가창 특성, 신규 종목 부트스트랩)"""
+        if not (changes['added'] or changes['removed'] or changes['moved']):
+            return
+
+        self.symbols = self.universe.tradable()
+        self.scheduler.sync(self.symbols)
+        self.trade_tape.watch(changes['added'])
+        if self.trade_stream is not None:
+            self.trade_stream.update_symbols(self.symbols)
+        # 호가 단계 수가 바뀐 종목은 물량 특성 분포가 달라지므로 기준선 재수집
+        for symbol in changes['moved'] + changes['removed']:
+            self.orderbook_features.reset(symbol)
+            if symbol in changes['removed']:
+                self.orderbook_cache.pop(symbol, None)
+
+        if changes['added'] and self.ready_symbols is not None:
+            from collectors.bootstrap import HistoryBootstrap
+            HistoryBootstrap(changes['added'], on_ready=self.mark_symbol_ready).start()
+
+        self._log_info(
+            f"유니버스 갱신 ({self.universe.describe()}): 추가 {len(changes['added'])}, "
+            f"제외 {len(changes['removed'])}, 티어 이동 {len(changes['moved'])}"
+        )
 
-        def calculate_indicators():
-            """기술적 지표 지속 계산"""
-            while self.is_running:
-                try:
-                    for symbol in self.symbols:
-                        indicators = self.indicator_engine.calculate_all_indicators(symbol, '15m')
-                        if indicators:
-                            self.indicators_cache[symbol] = indicators
-                    time.sleep(60)  # 60초마다
-                except Exception as e:
-                    self._log_error(f"지표 계산 에러: {str(e)}")
-                    time.sleep(60)
-
-        # 스레드 시작
-        threads = [
-            threading.Thread(target=collect_prices, daemon=True),
-            threading.Thread(target=collect_orderbooks, daemon=True),
-            threading.Thread(target=calculate_indicators, daemon=True)
-        ]
+    def save_snapshot(self):
+        """캐시/지표/전략 상태 체크포인트 저장"""
+        try:
+            self.snapshot.save(
+                self.symbols,
+                dict(self.market_data_cache),
+                dict(self.orderbook_cache),
+                dict(self.indicators_cache),
+                {sid: info['instance'].get_state() for sid, info in self.strategies.items()}
+            )
+        except Exception as e:
+            print(f"[스냅샷 저장 에러] {str(e)}")
+
+    def restore_snapshot(self) -> bool:
+        """
+        스냅샷 복원 (신선한 항목만)
+        Returns:
+            시세 캐시 복원 여부
+        """
+        state = self.snapshot.load(self.symbols)
+        if not state:
+            return False
+
+        self.market_data_cache.update(state['market_data'])
+        self.orderbook_cache.update(state['orderbooks'])
+        self.indicators_cache.update(state['indicators'])
+
+        for sid, strategy_state in state['strategies'].items():
+            info = self.strategies.get(int(sid))
+            if info:
+                info['instance'].load_state(strategy_state, state['age'])
+
+        self._log_info(
+            f"스냅샷 복원 ({state['age']:.0f}초 전): 시세 {len(state['market_data'])}, "
+            f"호가창 {len(state['orderbooks'])}, 지표 {len(state['indicators'])}개 종목"
+        )
+        return bool(state['market_data'])
+
+    def require_bootstrap(self):
+        """부트스트랩 모드 - mark_symbol_ready로 등록된 종목만 신규 진입"""
+        self.ready_symbols = set()
 
-        for thread in threads:
-            thread.start()
-            self.data_threads.append(thread)
+    def mark_symbol_ready(self, symbol: str):
+        """과거 데이터 준비 완료 종목 등록 (지표 스레드가 즉시 계산)"""
+        if self.ready_symbols is None:
+            return
+        self.ready_symbols.add(symbol)
+        self.scheduler.trigger(symbol, 'indicators')
 
-        self._log_info("데이터 수집 백그라운드 스레드 시작")
+    def is_symbol_ready(self, symbol: str) -> bool:
+        """종목 거래 가능 여부 (과거 데이터 준비 완료)"""
+        return self.ready_symbols is None or symbol in self.ready_symbols
 
     def generate_signal(self, symbol: str, strategy_id: int) -> Optional[Dict]:
         """특정 전략으로 시그널 생성"""
@@ -215,32 +383,41 @@ class TradingEngineV2:
 
         # 캐시에서 데이터 가져오기
         market_data_entry = self.market_data_cache.get(symbol)
-        indicators = self.indicators_cache.get(symbol, {})  # 없으면 빈 딕셔너리
+        # 전략 타임프레임 지표 (엔진 파생값을 병합하므로 복사본 사용)
+        indicators = dict(self.indicator_caches.get(strategy.timeframe, {}).get(symbol, {}))
         orderbook = self.orderbook_cache.get(symbol)
 
         if not market_data_entry:
             return None
 
-        # 거래량 비율 계산
+        metrics.MARKET_DATA_AGE_SECONDS.observe(
+            (datetime.now() - market_data_entry['timestamp']).total_seconds()
+        )
+
+        # 거래량 비율 계산 (체결 테이프 단기 거래량, 수집 기간 부족 시 24시간 거래량 / 거래량 SMA)
         current_volume = market_data_entry['volume']
-        avg_volume = indicators.get('volume_sma_20', current_volume)
-        volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1.0
+        volume_ratio = self.trade_tape.volume_ratio(symbol)
+        if volume_ratio is None:
+            avg_volume = indicators.get('volume_sma_20', current_volume)
+            volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1.0
 
         # 시장 데이터 준비
         market_data = {
             'current_price': market_data_entry['price'],
             'current_volume': current_volume,
-            'orderbook': orderbook
+            'orderbook': orderbook,
+            'anomaly_hit_rates': self.anomaly_hit_rates
         }
 
         # indicators에 추가 정보 병합
         indicators['volume_ratio'] = volume_ratio
-        indicators['rsi'] = indicators.get('rsi_14', 50)
+        indicators['rsi'] = indicators.get('rsi_14')    # 없음/None/NaN 은 전략에서 50 (일괄 컬럼과 동일)
         indicators['orderbook_imbalance'] = orderbook.get('imbalance_ratio', 1.0) if orderbook else 1.0
 
         try:
             # 전략 실행
-            signal = strategy.generate_signal(symbol, market_data, indicators)
+            with metrics.SIGNAL_SECONDS.time(strategy=strategy_info['name']):
+                signal = strategy.generate_signal(symbol, market_data, indicators)
 
             if signal:
                 # 시장 상황 계산
@@ -262,18 +439,142 @@ class TradingEngineV2:
 
         return None
 
+    # 일괄 스크리닝 입력 컬럼 → (지표 키, 누락 시 기본값)
+    BATCH_INDICATOR_COLUMNS = {
+        'price_change_5m': ('price_change_5m', 0.0),
+        'price_change_15m': ('price_change_15m', np.nan),   # 누락 시 5분 값 사용
+        'macd': ('macd', 0.0),
+        'macd_signal': ('macd_signal', 0.0),
+        'bb_position': ('bb_position', 0.5),
+    }
+
+    def _build_signal_columns(self, symbols: List[str], timeframe: str) -> Dict[str, np.ndarray]:
+        """캐시 → 종목별 컬럼 배열 (generate_signal 의 파생값/기본값과 동일)"""
+        n = len(symbols)
+        indicators_cache = self.indicator_caches.get(timeframe, {})
+        columns = {name: np.empty(n) for name in
+                   ('price', 'volume', 'volume_ratio', 'rsi', 'orderbook_imbalance', *self.BATCH_INDICATOR_COLUMNS)}
+
+        for i, symbol in enumerate(symbols):
+            entry = self.market_data_cache[symbol]
+            indicators = indicators_cache.get(symbol, {})
+            orderbook = self.orderbook_cache.get(symbol)
+
+            columns['price'][i] = entry['price']
+            columns['volume'][i] = entry['volume']
+            volume_ratio = self.trade_tape.volume_ratio(symbol)
+            if volume_ratio is None:
+                avg_volume = indicators.get('volume_sma_20')
+                volume_ratio = entry['volume'] / avg_volume if avg_volume and avg_volume > 0 else 1.0
+            columns['volume_ratio'][i] = volume_ratio
+            rsi = indicators.get('rsi_14')
+            columns['rsi'][i] = 50 if rsi is None or np.isnan(rsi) else rsi
+            columns['orderbook_imbalance'][i] = orderbook.get('imbalance_ratio', 1.0) if orderbook else 1.0
+            for name, (key, default) in self.BATCH_INDICATOR_COLUMNS.items():
+                value = indicators.get(key)
+                columns[name][i] = default if value is None else value
+
+        missing_15m = np.isnan(columns['price_change_15m'])
+        columns['price_change_15m'][missing_15m] = columns['price_change_5m'][missing_15m]
+        return columns
+
+    def _generate_signals_batch(self, symbols: List[str]) -> Dict[str, List[Dict]]:
+        """
+        전 종목 일괄 시그널 생성 (모든 활성 전략이 supports_batch 인 경우)
+        Returns:
+            {symbol: [검증 통과 시그널]}
+        """
+        results: Dict[str, List[Dict]] = {}
+        if not symbols:
+            return results
+
+        now = datetime.now()
+        for symbol in symbols:
+            metrics.MARKET_DATA_AGE_SECONDS.observe(
+                (now - self.market_data_cache[symbol]['timestamp']).total_seconds()
+            )
+
+        columns_by_timeframe = {}
+        for strategy_id, strategy_info in self.strategies.items():
+            strategy = strategy_info['instance']
+            try:
+                columns = columns_by_timeframe.get(strategy.timeframe)
+                if columns is None:
+                    columns = columns_by_timeframe[strategy.timeframe] = \
+                        self._build_signal_columns(symbols, strategy.timeframe)
+
+                with metrics.SIGNAL_SECONDS.time(strategy=strategy_info['name']):
+                    batch = strategy.generate_signals_batch(symbols, columns)
+                    signals = strategy.signals_from_batch(symbols, columns, batch)
+
+                adx_cache = self.indicator_caches.get(strategy.timeframe, {})
+                for symbol, signal in signals.items():
+                    orderbook = self.orderbook_cache.get(symbol)
+                    market_conditions = {
+                        'trend_strength': adx_cache.get(symbol, {}).get('adx_14', 0),
+                        'volatility': 0.05,  # 임시값
+                        'volume_ratio': 1.0,
+                        'orderbook_imbalance': orderbook.get('imbalance_ratio', 1.0) if orderbook else 1.0
+                    }
+                    if strategy.validate_signal(signal, market_conditions):
+                        signal['strategy_id'] = strategy_id
+                        signal['strategy_name'] = strategy_info['name']
+                        results.setdefault(symbol, []).append(signal)
+
+            except Exception as e:
+                self._log_error(f"일괄 시그널 생성 에러 ({strategy_info['name']}): {str(e)}")
+
+        return results
+
+    def _eligible_symbols(self) -> List[str]:
+        """시세가 있고 과거 데이터가 준비된 종목"""
+        return [
+            symbol for symbol in self.symbols
+            if symbol in self.market_data_cache and self.is_symbol_ready(symbol)
+            and self.market_data_cache[symbol]['price'] > 0
+        ]
+
+    def screen_symbols(self) -> Dict[str, List[Dict]]:
+        """
+        거래 가능 전 종목 시그널 계산 (리스크/주문 없이 - 샤드 워커용)
+        Returns:
+            {symbol: [검증 통과 시그널]}
+        """
+        symbols = self._eligible_symbols()
+        if self.strategies and all(info['instance'].supports_batch for info in self.strategies.values()):
+            results = self._generate_signals_batch(symbols)
+        else:
+            results = {}
+            for symbol in symbols:
+                signals = [signal for signal in (self.generate_signal(symbol, sid) for sid in self.strategies) if signal]
+                if signals:
+                    results[symbol] = signals
+
+        # 시그널 종목은 수집 가속 (워커는 포지션을 모르므로 시그널 기준)
+        for symbol in results:
+            self.scheduler.boost(symbol)
+        return results
+
     def execute_trading_cycle(self):
         """트레이딩 사이클 실행 - 매수만 자동, 매도는 수동"""
 
         print(f"\n대상 코인: {len(self.symbols)}개")
 
+        cycle_start = time.perf_counter()
+
         # 모든 포지션 체크 및 자동 청산 (활성화)
         self._check_all_positions()
 
+        # 모든 전략이 일괄 스크리닝을 지원하면 전 종목 시그널을 한 번에 계산
+        batch_signals = None
+        if self.strategies and all(info['instance'].supports_batch for info in self.strategies.values()):
+            batch_signals = self._generate_signals_batch(self._eligible_symbols())
+
         for symbol in self.symbols:
+            symbol_start = time.perf_counter()
             try:
-                # 1. 현재가 확인
-                if symbol not in self.market_data_cache:
+                # 1. 현재가 확인 (과거 데이터 미준비 종목 제외)
+                if symbol not in self.market_data_cache or not self.is_symbol_ready(symbol):
                     continue
 
                 current_price = self.market_data_cache[symbol]['price']
@@ -293,82 +594,136 @@ class TradingEngineV2:
                     continue
 
                 # 3. 모든 전략에서 시그널 생성
-                signals = []
-                for strategy_id in self.strategies.keys():
-                    signal = self.generate_signal(symbol, strategy_id)
-                    if signal:
-                        signals.append(signal)
+                if batch_signals is not None:
+                    signals = batch_signals.get(symbol, [])
+                else:
+                    signals = []
+                    for strategy_id in self.strategies.keys():
+                        signal = self.generate_signal(symbol, strategy_id)
+                        if signal:
+                            signals.append(signal)
 
                 if not signals:
                     continue
 
-                print(f"  시그널 {len(signals)}개 생성")
-
-                # 4. 최적 시그널 선택
-                best_signal = self._select_best_signal(signals)
-
-                if not best_signal:
-                    continue
-
-                print(f"  최적 시그널: {best_signal['signal_type']} "
-                      f"(전략: {best_signal['strategy_name']}, "
-                      f"신뢰도: {best_signal['confidence']:.1%})")
-
-                # 5. BUY 시그널만 처리 (SELL은 자동 청산에서 처리)
-                if best_signal['signal_type'] != 'BUY':
-                    continue
-
-                # 6. 계좌 잔고 확인
-                balance = self.order_executor.get_account_balance()
-                available_krw = balance.get('available_krw', 0)
-
-                if available_krw < 5000:  # 최소 5천원
-                    print(f"  잔고 부족: {available_krw:,.0f}원")
-                    continue
-
-                # 7. 리스크 검증
-                is_valid, reason = self.risk_manager.validate_signal_risk(best_signal, available_krw)
-
-                if not is_valid:
-                    print(f"  리스크 검증 실패: {reason}")
-                    continue
-
-                # 8. 포지션 크기 계산
-                position_size = self.risk_manager.calculate_position_size(best_signal, available_krw)
-
-                print(f"  포지션 크기: {position_size:,.0f}원")
-
-                # 9. 시그널 DB 저장
-                signal_record = self._save_signal(best_signal, symbol)
-
-                # 10. 주문 실행
-                position = self.order_executor.execute_signal(signal_record, position_size)
-
-                if position:
-                    print(f"  ✓ 포지션 오픈 성공: {position.id}")
-
-                    # 텔레그램 알림
-                    self.notifier.notify_trade_open({
-                        'symbol': symbol,
-                        'position_type': position.position_type,
-                        'entry_price': float(position.entry_price),
-                        'quantity': float(position.quantity),
-                        'investment': position_size,
-                        'take_profit': float(position.take_profit),
-                        'stop_loss': float(position.stop_loss),
-                        'strategy_name': best_signal['strategy_name'],
-                        'confidence': best_signal['confidence']
-                    })
+                self._execute_best_signal(symbol, signals)
 
             except Exception as e:
                 self._log_error(f"[{symbol}] 트레이딩 사이클 에러: {str(e)}")
                 import traceback
                 traceback.print_exc()
+            finally:
+                metrics.TRADING_CYCLE_SYMBOL_SECONDS.observe(time.perf_counter() - symbol_start)
+
+        metrics.TRADING_CYCLE_SECONDS.observe(time.perf_counter() - cycle_start)
+
+    def _execute_best_signal(self, symbol: str, signals: List[Dict]):
+        """종목 시그널 중 최적 시그널 선택 → 잔고/리스크 검증 → 주문 실행"""
+
+        print(f"  시그널 {len(signals)}개 생성")
+        self.scheduler.boost(symbol)
+
+        # 4. 최적 시그널 선택
+        best_signal = self._select_best_signal(signals)
+
+        if not best_signal:
+            return
+
+        print(f"  최적 시그널: {best_signal['signal_type']} "
+              f"(전략: {best_signal['strategy_name']}, "
+              f"신뢰도: {best_signal['confidence']:.1%})")
+
+        # 5. BUY 시그널만 처리 (SELL은 자동 청산에서 처리)
+        if best_signal['signal_type'] != 'BUY':
+            return
+
+        # 6. 계좌 잔고 확인
+        balance = self.order_executor.get_account_balance()
+        available_krw = balance.get('available_krw', 0)
+
+        if available_krw < 5000:  # 최소 5천원
+            print(f"  잔고 부족: {available_krw:,.0f}원")
+            return
+
+        # 7. 리스크 검증
+        is_valid, reason = self.risk_manager.validate_signal_risk(best_signal, available_krw)
+
+        if not is_valid:
+            print(f"  리스크 검증 실패: {reason}")
+            return
+
+        # 8. 포지션 크기 계산
+        position_size = self.risk_manager.calculate_position_size(best_signal, available_krw)
+
+        print(f"  포지션 크기: {position_size:,.0f}원")
+
+        # 9. 시그널 DB 저장
+        signal_record = self._save_signal(best_signal, symbol)
+
+        # 10. 주문 실행
+        position = self.order_executor.execute_signal(signal_record, position_size)
+
+        if position:
+            metrics.TICK_TO_ORDER_SECONDS.observe(
+                (datetime.now() - self.market_data_cache[symbol]['timestamp']).total_seconds()
+            )
+
+            if position.status == 'PENDING':
+                # 실전 주문 - 체결 후 _on_position_event 에서 알림
+                print(f"  ✓ 주문 접수 (체결 대기): {position.id}")
+                return
+
+            print(f"  ✓ 포지션 오픈 성공: {position.id}")
+
+            # 텔레그램 알림
+            self.notifier.notify_trade_open({
+                'symbol': symbol,
+                'position_type': position.position_type,
+                'entry_price': float(position.entry_price),
+                'quantity': float(position.quantity),
+                'investment': position_size,
+                'take_profit': float(position.take_profit),
+                'stop_loss': float(position.stop_loss),
+                'strategy_name': best_signal['strategy_name'],
+                'confidence': best_signal['confidence']
+            })
+
+    def _on_position_event(self, event: str, info: Dict):
+        """
+        포지션 체결 반영 이벤트 → 텔레그램 알림 + 로그
+        (실전은 주문 추적 스레드, 페이퍼 청산은 엔진 스레드에서 호출 - 로그는 전용 세션 사용)
+        """
+        if event == 'open':
+            strategy = self.strategies.get(info['strategy_id'])
+            self.notifier.notify_trade_open({
+                **info,
+                'strategy_name': strategy['name'] if strategy else '',
+            })
+            return
+
+        if event == 'close':
+            holding_time = (datetime.now() - info['opened_at']).total_seconds() / 60 if info.get('opened_at') else 0
+            holding_time_str = f"{int(holding_time)}분" if holding_time < 60 else f"{holding_time/60:.1f}시간"
+            self.notifier.notify_trade_close({**info, 'holding_time': holding_time_str})
+            message = (f"포지션 {'청산' if info['closed'] else '부분 청산'}: {info['symbol']} "
+                       f"{info['quantity']:.8f} @ {info['exit_price']:,.0f}원 | "
+                       f"손익: {info['pnl']:,.0f}원 ({info['pnl_percent']:+.2f}%) | 이유: {info['exit_reason']}")
+        elif event == 'canceled':
+            message = f"진입 주문 미체결 취소: {info['symbol']} (포지션 {info['position_id']})"
+        else:
+            return
+
+        db = SessionLocal()
+        try:
+            self._log_info(message, db)
+        finally:
+            db.close()
 
     def _check_all_positions(self):
         """모든 오픈 포지션 체크 및 1분 이상 포지션 강제 청산"""
         try:
             all_positions = self.db.query(Position).filter(Position.status == 'OPEN').all()
+            self.scheduler.set_held(position.symbol for position in all_positions)
 
             for position in all_positions:
                 try:
@@ -426,37 +781,9 @@ class TradingEngineV2:
                 should_close, reason = self.risk_manager.should_close_position(position, current_price)
 
                 if should_close:
-                    success = self.order_executor.close_position(position, current_price, reason)
-
-                    if success:
-                        print(f"  ✓ 포지션 청산: {position.symbol} (이유: {reason})")
-
-                        # 손익 계산
-                        entry_price = float(position.entry_price)
-                        quantity = float(position.quantity)
-
-                        if position.position_type == 'LONG':
-                            pnl = (current_price - entry_price) * quantity
-                        else:
-                            pnl = (entry_price - current_price) * quantity
-
-                        pnl_percent = (pnl / (entry_price * quantity)) * 100
-
-                        # 보유 시간
-                        holding_time = (datetime.now() - position.opened_at).total_seconds() / 60
-                        holding_time_str = f"{int(holding_time)}분" if holding_time < 60 else f"{holding_time/60:.1f}시간"
-
-                        # 텔레그램 알림
-                        self.notifier.notify_trade_close({
-                            'symbol': symbol,
-                            'position_type': position.position_type,
-                            'entry_price': entry_price,
-                            'exit_price': current_price,
-                            'pnl': pnl,
-                            'pnl_percent': pnl_percent,
-                            'holding_time': holding_time_str,
-                            'exit_reason': reason
-                        })
+                    # 청산 알림은 체결 반영 후 _on_position_event 에서 (실전은 접수 시점에 미체결)
+                    if self.order_executor.close_position(position, current_price, reason):
+                        print(f"  ✓ 포지션 청산 요청: {symbol} (이유: {reason})")
 
             except Exception as e:
                 self._log_error(f"포지션 관리 에러: {str(e)}")
@@ -486,15 +813,16 @@ class TradingEngineV2:
 
             print(f"  🔄 물타기 실행: {symbol} {additional_quantity:.8f}개 추가매수 ({additional_size:,.0f}원)")
 
-            # 실제 주문 실행
+            # 실전: 비동기 제출 - 체결 시 평균단가/손절/익절 갱신
             if self.order_executor.is_live_mode:
-                order_type = 'bid'
-                order_price = round(current_price * 1.005, 0)
-                result = self.order_executor.api.place_order(symbol, order_type, additional_quantity, order_price)
+                submitted = self.order_executor.submit_add_order(
+                    position, additional_quantity, current_price, stop_loss_pct=0.015, take_profit_pct=0.012
+                )
+                if submitted:
+                    print(f"  🔄 물타기 주문 접수: {symbol}")
+                return submitted
 
-                if result.get('status') != '0000':
-                    print(f"  ❌ 물타기 주문 실패: {result.get('message')}")
-                    return False
+            self.order_executor.invalidate_balance_cache()
 
             # 포지션 평균단가 계산
             total_quantity = quantity + additional_quantity
@@ -564,19 +892,33 @@ class TradingEngineV2:
         print("=" * 70)
         print("Auto Coin Trading V2 시작")
         print(f"모드: {'실전' if config.TRADE_MODE == 'live' else '페이퍼'}")
-        print(f"대상: {', '.join(self.symbols)}")
+        print(f"대상 ({self.universe.describe()}): {', '.join(self.symbols)}")
         print(f"주기: {interval}초")
+        print(f"전략: {', '.join(info['name'] for info in self.strategies.values())}")
+        print(f"입력: {self.data_requirements.describe()}")
         print("=" * 70)
 
         # 텔레그램 알림
         self.notifier.notify_system_start()
 
+        # 이전 실행 상태 복원 (신선한 시세가 있으면 수집 대기 생략)
+        if self.restore_snapshot():
+            self._prices_loaded.set()
+
+        # 이전 실행의 미완료 주문/포지션 복구 (주문 저널 ↔ 거래소 ↔ DB)
+        if self.order_executor.is_live_mode:
+            try:
+                self.order_executor.recover_orders()
+            except Exception as e:
+                self._log_error(f"주문 복구 실패: {str(e)}")
+
         # 데이터 수집 시작
         self.start_data_collection()
 
-        # 초기 데이터 로딩 대기
-        print("\n초기 데이터 수집 중... (30초)")
-        time.sleep(30)
+        # 첫 시세 수집 완료까지 대기 (최대 30초)
+        print("\n초기 시세 수집 중...")
+        if not self._prices_loaded.wait(30):
+            print("⚠️  초기 시세 수집 지연 - 수집된 종목부터 시작")
 
         # 전략 가중치 계산
         self.strategy_selector.calculate_strategy_weights()
@@ -611,7 +953,10 @@ class TradingEngineV2:
             except KeyboardInterrupt:
                 print("\n\n트레이딩 봇 중단")
                 self.is_running = False
+                self.save_snapshot()
+                self.trade_tape.flush(final=True)
                 self.notifier.notify_system_stop()
+                self.notifier.flush()
                 break
 
             except Exception as e:
@@ -623,16 +968,19 @@ class TradingEngineV2:
     def stop(self):
         """트레이딩 봇 중단"""
         self.is_running = False
+        self.scheduler.shutdown()
+        self.save_snapshot()
 
-    def _log_info(self, message: str):
-        """정보 로그"""
+    def _log_info(self, message: str, db=None):
+        """정보 로그 (db: 다른 스레드 호출 시 전용 세션, 기본: 엔진 세션)"""
         print(f"[INFO] {message}")
+        session = db or self.db
         try:
             log = SystemLog(log_level='INFO', module='TradingEngineV2', message=message)
-            self.db.add(log)
-            self.db.commit()
+            session.add(log)
+            session.commit()
         except:
-            pass
+            session.rollback()
 
     def _log_error(self, message: str):
         """에러 로그"""
@@ -0,0 +1,220 @@
+"""
+유동성 순위 기반 거래 대상 유니버스
+- ALL 시세 1회 조회로 빗썸 KRW 전체 마켓을 24시간 거래대금, 변동폭, 스프레드 백분위로 순위화
+- 상위 종목을 hot/warm 티어로 나누고 나머지는 cold (시세만, 호가창/체결 수집 없음)
+- 티어별 호가창/체결 수집 주기와 호가 단계 수를 달리해 수집 비용을 거래 기회에 집중
+- 보유 포지션 종목은 순위와 무관하게 최소 warm 유지 (청산 판단용 호가창)
+"""
+
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from api import BithumbAPI
+import config
+
+TIERS = ('hot', 'warm')
+COLD = 'cold'
+
+
+def percentile_rank(values: np.ndarray) -> np.ndarray:
+    """0~1 백분위 순위 (작은 값 0, 큰 값 1, 종목 1개면 1)"""
+    if values.size <= 1:
+        return np.ones(values.size)
+    return values.argsort(kind='stable').argsort(kind='stable') / (values.size - 1)
+
+
+def _float(value) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class UniverseManager:
+    """거래 대상 종목 티어 관리 (스레드 안전)"""
+
+    def __init__(self, api: BithumbAPI = None, symbols: List[str] = None, mode: str = None,
+                 tiers: Dict[str, Dict] = None):
+        """
+        Args:
+            api: 빗썸 API 클라이언트
+            symbols: 고정 종목 (지정 시 static 모드 - 샤드 워커 담당 종목 등)
+            mode: 'dynamic' 또는 'static' (기본: config.UNIVERSE_MODE, static 은 TARGET_PAIRS 전체 hot)
+            tiers: 티어 설정 (기본: config.UNIVERSE_TIERS)
+        """
+        self.api = api or BithumbAPI()
+        self.mode = 'static' if symbols is not None else (mode or config.UNIVERSE_MODE)
+        self.tier_config = tiers or config.UNIVERSE_TIERS
+        self.pinned = set()
+        self.scores: Dict[str, Dict] = {}  # 마지막 순위 계산 결과 {symbol: {'score', 'trade_value', ...}}
+        self.updated_at: Optional[datetime] = None
+
+        self._members: Dict[str, List[str]] = {tier: [] for tier in TIERS}
+        self._tier_of: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        if self.mode == 'static':
+            self._assign({'hot': symbols if symbols is not None else config.TARGET_PAIRS, 'warm': []})
+
+    # ===========================
+    # 조회
+    # ===========================
+
+    def tier(self, symbol: str) -> str:
+        """종목 티어 ('hot', 'warm', 'cold')"""
+        return self._tier_of.get(symbol, COLD)
+
+    def symbols(self, tier: str) -> List[str]:
+        """티어 종목 (순위순)"""
+        return list(self._members.get(tier, []))
+
+    def tradable(self) -> List[str]:
+        """거래 대상 종목 (hot + warm, 순위순)"""
+        members = self._members
+        return members['hot'] + members['warm']
+
+    def depth(self, symbol: str, requested: int) -> int:
+        """종목 호가 조회 단계 수 (전략 요구 단계 수를 티어 한도로 제한)"""
+        limit = self.tier_config.get(self.tier(symbol), {}).get('orderbook_depth')
+        return min(requested, limit) if limit else requested
+
+    def interval(self, symbol: str, kind: str) -> Optional[float]:
+        """
+        종목 티어의 기준 수집 주기 (초, cold 면 None)
+        Args:
+            kind: 'orderbook' 또는 'trades' (티어 설정 '{kind}_interval')
+        """
+        return self.tier_config.get(self.tier(symbol), {}).get(f"{kind}_interval")
+
+    # ===========================
+    # 순위 갱신
+    # ===========================
+
+    def pin(self, symbols: Iterable[str]):
+        """순위와 무관하게 최소 warm 으로 유지할 종목 (보유 포지션) - 다음 refresh 부터 적용"""
+        self.pinned = set(symbols)
+
+    def fetch_spreads(self) -> Dict[str, float]:
+        """ALL 호가 1단계 조회 → 종목별 스프레드 (bp, 조회 실패 시 빈 dict)"""
+        result = self.api.get_orderbook('ALL', 1)
+        if result.get('status') != '0000':
+            return {}
+
+        spreads = {}
+        for symbol, book in result.get('data', {}).items():
+            if not isinstance(book, dict) or not book.get('bids') or not book.get('asks'):
+                continue
+            bid = _float(book['bids'][0].get('price'))
+            ask = _float(book['asks'][0].get('price'))
+            if bid > 0 and ask >= bid:
+                spreads[symbol] = (ask - bid) / ((ask + bid) / 2) * 10000
+        return spreads
+
+    def rank(self, tickers: Dict[str, Dict], spreads: Dict[str, float] = None) -> List[str]:
+        """
+        ALL 시세 (+ 스프레드) → 거래 가능 종목 점수순
+        점수 = 거래대금/변동폭/스프레드(역순) 백분위의 가중합 (+ 기존 hot/warm 가산점)
+        스프레드를 모르는 종목은 스프레드 순위 중간값 사용
+        """
+        spreads = spreads or {}
+        symbols = [s for s, data in tickers.items() if isinstance(data, dict)]
+        if not symbols:
+            self.scores = {}
+            return []
+
+        columns = np.array([
+            [_float(tickers[s].get(key)) for key in
+             ('acc_trade_value_24H', 'opening_price', 'min_price', 'max_price', 'closing_price')]
+            for s in symbols
+        ])
+        trade_value, opening, low, high, price = columns.T
+        volatility = np.divide(high - low, opening, out=np.zeros(len(symbols)), where=opening > 0)
+        spread = np.array([spreads.get(s, np.nan) for s in symbols])
+
+        eligible = (price > 0) & (trade_value >= config.UNIVERSE_MIN_TRADE_VALUE) & \
+            ~(spread > config.UNIVERSE_MAX_SPREAD_BPS)
+        index = np.flatnonzero(eligible)
+        if not index.size:
+            self.scores = {}
+            return []
+
+        weights = config.UNIVERSE_SCORE_WEIGHTS
+        known = ~np.isnan(spread[index])
+        spread_rank = np.full(index.size, 0.5)
+        if known.any():
+            spread_rank[known] = 1 - percentile_rank(spread[index][known])
+
+        score = weights['trade_value'] * percentile_rank(trade_value[index]) + \
+            weights['volatility'] * percentile_rank(volatility[index]) + \
+            weights['spread'] * spread_rank
+        current = self._tier_of
+        score += config.UNIVERSE_STICKINESS * np.array([symbols[i] in current for i in index])
+
+        order = np.argsort(-score, kind='stable')
+        self.scores = {
+            symbols[index[i]]: {
+                'score': float(score[i]),
+                'trade_value': float(trade_value[index[i]]),
+                'volatility': float(volatility[index[i]]),
+                'spread_bps': None if np.isnan(spread[index[i]]) else float(spread[index[i]]),
+            }
+            for i in order.tolist()
+        }
+        return list(self.scores)
+
+    def refresh(self, tickers: Dict[str, Dict] = None) -> Dict[str, List[str]]:
+        """
+        순위 재계산 후 티어 재배정 (static 모드는 변경 없음)
+        Args:
+            tickers: ALL 시세 응답 data (없으면 조회)
+        Returns:
+            {'added': 신규 거래 대상, 'removed': 제외 종목, 'moved': hot/warm 간 이동 종목}
+        """
+        changes = {'added': [], 'removed': [], 'moved': []}
+        if self.mode == 'static':
+            return changes
+
+        if tickers is None:
+            result = self.api.get_ticker('ALL')
+            if result.get('status') != '0000':
+                if not self._tier_of:
+                    # 최초 조회 실패 - 고정 목록으로 시작하고 다음 갱신에서 재시도
+                    self._assign({'hot': config.TARGET_PAIRS, 'warm': []})
+                    changes['added'] = self.tradable()
+                return changes
+            tickers = result['data']
+
+        ranked = self.rank(tickers, self.fetch_spreads())
+        hot_size = self.tier_config['hot']['size']
+        warm_size = self.tier_config['warm']['size']
+        hot = ranked[:hot_size]
+        warm = ranked[hot_size:hot_size + warm_size]
+        members = set(hot) | set(warm)
+        warm += sorted(symbol for symbol in self.pinned if symbol not in members)
+
+        previous = dict(self._tier_of)
+        self._assign({'hot': hot, 'warm': warm})
+        self.updated_at = datetime.now()
+
+        current = self._tier_of
+        changes['added'] = [s for s in self.tradable() if s not in previous]
+        changes['removed'] = [s for s in previous if s not in current]
+        changes['moved'] = [s for s, tier in current.items() if s in previous and previous[s] != tier]
+        return changes
+
+    def _assign(self, members: Dict[str, List[str]]):
+        """티어 교체 (조회 스레드는 교체 전/후 중 하나만 보도록 참조를 한 번에 교체)"""
+        assigned = {tier: list(dict.fromkeys(members.get(tier, []))) for tier in TIERS}
+        assigned['warm'] = [s for s in assigned['warm'] if s not in set(assigned['hot'])]
+        with self._lock:
+            self._tier_of = {s: tier for tier in TIERS for s in assigned[tier]}
+            self._members = assigned
+
+    def describe(self) -> str:
+        """로그용 요약"""
+        if self.mode == 'static':
+            return f"고정 {len(self._members['hot'])}개"
+        return f"hot {len(self._members['hot'])}개, warm {len(self._members['warm'])}개"
@@ -3,12 +3,14 @@
 실시간 포지션, 거래내역, 성과 확인
 """
 
-from flask import Flask, render_template, jsonify
+from flask import Flask, Response, render_template, jsonify
 from datetime import datetime, timedelta
 from decimal import Decimal
 from database import SessionLocal, Position, Trade, DailyPerformance, TradingSignal, Strategy, AccountBalance
+from database import queries
 from sqlalchemy import func, desc
 import config
+from utils import metrics
 
 app = Flask(__name__)
 
@@ -19,6 +21,12 @@ def dashboard():
     return render_template('dashboard.html')
 
 
+@app.route('/metrics')
+def get_metrics():
+    """Prometheus 형식 성능 메트릭"""
+    return Response(metrics.REGISTRY.render(), content_type=metrics.CONTENT_TYPE)
+
+
 @app.route('/api/version')
 def get_version():
     """버전 확인 (배포 확인용)"""
@@ -137,24 +145,22 @@ def get_trades():
     """최근 거래 내역 (50건)"""
     db = SessionLocal()
     try:
-        trades = db.query(Trade).order_by(
-            Trade.closed_at.desc()
-        ).limit(50).all()
+        trades = queries.recent_trades(db, limit=50)
 
         result = []
         for trade in trades:
             result.append({
-                'id': trade.id,
-                'symbol': trade.symbol,
-                'entry_price': float(trade.entry_price),
-                'exit_price': float(trade.exit_price),
-                'quantity': float(trade.quantity),
-                'pnl': float(trade.pnl),
-                'pnl_percent': float(trade.pnl_percent),
-                'exit_reason': trade.exit_reason,
-                'holding_time': trade.holding_time_minutes,
-                'opened_at': trade.opened_at.isoformat(),
-                'closed_at': trade.closed_at.isoformat()
+                'id': trade['id'],
+                'symbol': trade['symbol'],
+                'entry_price': trade['entry_price'],
+                'exit_price': trade['exit_price'],
+                'quantity': trade['quantity'],
+                'pnl': trade['pnl'],
+                'pnl_percent': trade['pnl_percent'],
+                'exit_reason': trade['exit_reason'],
+                'holding_time': trade['holding_time_minutes'],
+                'opened_at': trade['opened_at'].isoformat(),
+                'closed_at': trade['closed_at'].isoformat()
             })
 
         return jsonify(result)
@@ -178,26 +184,24 @@ def get_performance():
         for i in range(29, -1, -1):
             target_date = today - timedelta(days=i)
 
-            # 해당일 청산 완료된 거래
-            day_trades = db.query(Trade).filter(
-                Trade.closed_at >= datetime.combine(target_date, datetime.min.time()),
-                Trade.closed_at < datetime.combine(target_date + timedelta(days=1), datetime.min.time())
-            ).all()
+            # 해당일 청산 완료된 거래 집계 (DB 에서 계산)
+            summary = queries.trade_summary(
+                db,
+                since=datetime.combine(target_date, datetime.min.time()),
+                until=datetime.combine(target_date + timedelta(days=1), datetime.min.time())
+            )
+            total_trades = summary['total_trades']
 
-            if not day_trades:
+            if not total_trades:
                 continue
 
-            day_pnl = sum(float(t.pnl) for t in day_trades)
-            winning = len([t for t in day_trades if float(t.pnl) > 0])
-            losing = len([t for t in day_trades if float(t.pnl) <= 0])
-
             result.append({
                 'date': target_date.isoformat(),
-                'pnl': day_pnl,
-                'total_trades': len(day_trades),
-                'winning_trades': winning,
-                'losing_trades': losing,
-                'win_rate': (winning / len(day_trades) * 100) if day_trades else 0
+                'pnl': summary['total_pnl'],
+                'total_trades': total_trades,
+                'winning_trades': summary['winning_trades'],
+                'losing_trades': summary['losing_trades'],
+                'win_rate': summary['winning_trades'] / total_trades * 100
             })
 
         return jsonify(result)
@@ -1,5 +1,5 @@
 from .models import (
-    Base, engine, SessionLocal, get_db, init_db,
+    Base, get_engine, SessionLocal, get_db, init_db,
     OHLCVData, OrderbookSnapshot, OrderbookAnomaly,
     TechnicalIndicator, WhaleTransaction, Strategy,
     StrategyPerformance, TradingSignal, Position,
@@ -8,10 +8,17 @@ from .models import (
 )
 
 __all__ = [
-    'Base', 'engine', 'SessionLocal', 'get_db', 'init_db',
+    'Base', 'engine', 'get_engine', 'SessionLocal', 'get_db', 'init_db',
     'OHLCVData', 'OrderbookSnapshot', 'OrderbookAnomaly',
     'TechnicalIndicator', 'WhaleTransaction', 'Strategy',
     'StrategyPerformance', 'TradingSignal', 'Position',
     'Order', 'Trade', 'DailyPerformance', 'AccountBalance',
     'SystemLog', 'Notification', 'BacktestRun'
 ]
+
+
+def __getattr__(name):
+    # DB 엔진은 첫 접근 시 생성
+    if name == 'engine':
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,362 @@
+"""
+Parquet 아카이브 (연구/백테스트용 로컬 컬럼 저장소)
+- ohlcv_data, orderbook_snapshots, trades, orderbook_anomalies 를 일자/종목별 Parquet 파티션으로 내보내기
+  ({ARCHIVE_PATH}/{테이블}/date=YYYY-MM-DD/symbol={종목}/part-0.parquet)
+- 완료된 일자만 내보내고 이미 내보낸 일자는 건너뜀 (일자 단위로 원자적 교체)
+- 읽기: 메모리 매핑 Arrow 데이터셋에서 필요한 컬럼만, 일자/종목 파티션 가지치기 후 로드
+  (Postgres 조회 없이 디스크 속도로 백테스트/분석)
+
+사용법:
+    python -m database.archive export                              # 어제까지 미보관 일자 전체
+    python -m database.archive export --tables ohlcv_data --start 2025-01-01 --end 2025-01-31
+    python -m database.archive info
+"""
+
+import argparse
+import json
+import os
+import shutil
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+from sqlalchemy import Float, cast, func, select
+from sqlalchemy.types import DateTime, Integer, Numeric
+
+from database import SessionLocal, OHLCVData, OrderbookSnapshot, OrderbookAnomaly, Trade
+import config
+
+# 테이블 → (모델, 파티션 기준 시각 컬럼, 내보낼 컬럼)
+# symbol 은 파티션 경로로 보관 (파일 컬럼에서 제외, 읽을 때 복원)
+ARCHIVE_TABLES = {
+    'ohlcv_data': (OHLCVData, 'timestamp',
+                   ['timeframe', 'timestamp', 'open', 'high', 'low', 'close', 'volume']),
+    'orderbook_snapshots': (OrderbookSnapshot, 'timestamp',
+                            ['timestamp', 'bids', 'asks', 'bid_total_volume', 'ask_total_volume',
+                             'imbalance_ratio', 'spread']),
+    'trades': (Trade, 'closed_at',
+               ['id', 'position_id', 'strategy_id', 'entry_price', 'exit_price', 'quantity', 'pnl',
+                'pnl_percent', 'fees', 'holding_time_minutes', 'exit_reason', 'opened_at', 'closed_at']),
+    'orderbook_anomalies': (OrderbookAnomaly, 'timestamp',
+                            ['id', 'timestamp', 'anomaly_type', 'severity', 'details', 'price_before',
+                             'price_after']),
+}
+
+# 호가 JSON([{'price', 'quantity'}]) → 가격/수량 리스트 컬럼 (orderbook_analytics.ParsedBook 과 같은 배열 구성)
+BOOK_COLUMNS = {'bids': ('bid_prices', 'bid_quantities'), 'asks': ('ask_prices', 'ask_quantities')}
+
+PARTITIONING = ds.partitioning(pa.schema([('date', pa.string()), ('symbol', pa.string())]), flavor='hive')
+
+
+def _arrow_type(column) -> pa.DataType:
+    if isinstance(column.type, Numeric):
+        return pa.float64()
+    if isinstance(column.type, Integer):
+        return pa.int64()
+    if isinstance(column.type, DateTime):
+        return pa.timestamp('us')
+    return pa.string()
+
+
+class ParquetArchiver:
+    """DB 테이블 → 일자/종목 파티션 Parquet 내보내기"""
+
+    def __init__(self, root: str = None, session_factory=SessionLocal, batch_size: int = None):
+        """
+        Args:
+            root: 아카이브 디렉토리 (기본: config.ARCHIVE_PATH)
+            session_factory: DB 세션 팩토리
+            batch_size: 서버 측 커서 배치 행 수 (기본: config.ARCHIVE_BATCH_SIZE)
+        """
+        self.root = root or config.ARCHIVE_PATH
+        self.session_factory = session_factory
+        self.batch_size = batch_size or config.ARCHIVE_BATCH_SIZE
+
+    # ===========================
+    # 스키마
+    # ===========================
+
+    @staticmethod
+    def schema(table: str) -> pa.Schema:
+        """Parquet 파일 스키마 (Numeric → float64, JSON 호가 → 리스트 컬럼, 기타 JSON → 문자열)"""
+        model, _, columns = ARCHIVE_TABLES[table]
+        fields = []
+        for name in columns:
+            if name in BOOK_COLUMNS:
+                fields.extend(pa.field(n, pa.list_(pa.float64())) for n in BOOK_COLUMNS[name])
+            else:
+                fields.append(pa.field(name, _arrow_type(model.__table__.c[name])))
+        return pa.schema(fields)
+
+    @staticmethod
+    def _select_columns(table: str) -> list:
+        """조회 컬럼 (Numeric 은 DB 에서 float 로 변환 - 행마다 Decimal 생성 방지)"""
+        model, _, columns = ARCHIVE_TABLES[table]
+        selected = [model.__table__.c.symbol]
+        for name in columns:
+            column = model.__table__.c[name]
+            selected.append(cast(column, Float).label(name) if isinstance(column.type, Numeric) else column)
+        return selected
+
+    # ===========================
+    # 내보내기
+    # ===========================
+
+    def table_path(self, table: str) -> str:
+        return os.path.join(self.root, table)
+
+    def exported_days(self, table: str) -> List[date]:
+        """내보낸 일자 (오름차순)"""
+        path = self.table_path(table)
+        if not os.path.isdir(path):
+            return []
+        return sorted(date.fromisoformat(name[5:]) for name in os.listdir(path) if name.startswith('date='))
+
+    def export_day(self, table: str, day: date, overwrite: bool = False) -> Dict:
+        """
+        테이블 1일치 내보내기 (임시 디렉토리에 종목별 파일 작성 후 일자 디렉토리로 교체)
+        Returns:
+            {'rows': 행 수, 'symbols': 종목 수} (이미 내보낸 일자면 rows=None)
+        """
+        model, time_column, _ = ARCHIVE_TABLES[table]
+        target = os.path.join(self.table_path(table), f"date={day.isoformat()}")
+        if os.path.isdir(target) and not overwrite:
+            return {'rows': None, 'symbols': 0}
+
+        time_col = model.__table__.c[time_column]
+        start = datetime.combine(day, datetime.min.time())
+        stmt = (
+            select(*self._select_columns(table))
+            .where(time_col >= start, time_col < start + timedelta(days=1))
+            .order_by(model.__table__.c.symbol, time_col)
+            .execution_options(yield_per=self.batch_size)
+        )
+
+        staging = os.path.join(self.table_path(table), f".staging-date={day.isoformat()}")
+        shutil.rmtree(staging, ignore_errors=True)
+        schema = self.schema(table)
+        rows = symbols = 0
+
+        db = self.session_factory()
+        try:
+            current, buffer = None, []
+            for partition in db.execute(stmt).partitions():
+                for row in partition:
+                    if row[0] != current:
+                        if buffer:
+                            self._write_symbol(staging, current, buffer, table, schema)
+                            symbols += 1
+                        current, buffer = row[0], []
+                    buffer.append(row[1:])
+                    rows += 1
+            if buffer:
+                self._write_symbol(staging, current, buffer, table, schema)
+                symbols += 1
+        finally:
+            db.close()
+
+        if not rows:
+            return {'rows': 0, 'symbols': 0}
+
+        if os.path.isdir(target):
+            shutil.rmtree(target)
+        os.replace(staging, target)
+        return {'rows': rows, 'symbols': symbols}
+
+    def _write_symbol(self, staging: str, symbol: str, rows: List[tuple], table: str, schema: pa.Schema):
+        """종목 1일치 행 → Parquet 파일"""
+        _, _, columns = ARCHIVE_TABLES[table]
+        arrays = []
+        for i, name in enumerate(columns):
+            values = [row[i] for row in rows]
+            if name in BOOK_COLUMNS:
+                prices, quantities = [], []
+                for levels in values:
+                    levels = json.loads(levels) if isinstance(levels, str) else (levels or [])
+                    prices.append([float(level['price']) for level in levels])
+                    quantities.append([float(level['quantity']) for level in levels])
+                arrays.extend([pa.array(prices, pa.list_(pa.float64())),
+                               pa.array(quantities, pa.list_(pa.float64()))])
+            else:
+                field = schema.field(name)
+                if pa.types.is_string(field.type):
+                    values = [v if v is None or isinstance(v, str) else json.dumps(v, default=str) for v in values]
+                arrays.append(pa.array(values, field.type))
+
+        directory = os.path.join(staging, f"symbol={symbol}")
+        os.makedirs(directory, exist_ok=True)
+        pq.write_table(pa.Table.from_arrays(arrays, schema=schema), os.path.join(directory, 'part-0.parquet'),
+                       compression=config.ARCHIVE_COMPRESSION)
+
+    def _first_day(self, table: str) -> Optional[date]:
+        model, time_column, _ = ARCHIVE_TABLES[table]
+        db = self.session_factory()
+        try:
+            first = db.execute(select(func.min(model.__table__.c[time_column]))).scalar()
+        finally:
+            db.close()
+        return first.date() if first else None
+
+    def export(self, tables: Iterable[str] = None, start: date = None, end: date = None,
+               overwrite: bool = False) -> Dict[str, int]:
+        """
+        기간 내보내기 (기본: 마지막 내보낸 일자 다음날 ~ 어제, 당일은 미완료이므로 제외)
+        Returns:
+            {테이블: 내보낸 행 수}
+        """
+        end = end or date.today() - timedelta(days=1)
+        totals = {}
+        for table in tables or ARCHIVE_TABLES:
+            first = start
+            if first is None:
+                exported = self.exported_days(table)
+                first = exported[-1] + timedelta(days=1) if exported else self._first_day(table)
+            total = 0
+            day = first
+            while day is not None and day <= end:
+                result = self.export_day(table, day, overwrite)
+                if result['rows']:
+                    total += result['rows']
+                    print(f"[Archive] {table} {day}: {result['rows']:,}행, {result['symbols']}개 종목")
+                day += timedelta(days=1)
+            totals[table] = total
+        return totals
+
+
+# ===========================
+# 읽기
+# ===========================
+
+def dataset(table: str, root: str = None) -> Optional[ds.Dataset]:
+    """테이블 아카이브 데이터셋 (메모리 매핑 파일 시스템, 아카이브 없으면 None)"""
+    path = os.path.join(root or config.ARCHIVE_PATH, table)
+    if not os.path.isdir(path):
+        return None
+    return ds.dataset(path, format='parquet', partitioning=PARTITIONING,
+                      filesystem=pafs.LocalFileSystem(use_mmap=True),
+                      exclude_invalid_files=True, ignore_prefixes=['.', '_'])
+
+
+def _as_datetime(value) -> Optional[datetime]:
+    if value is None or isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, datetime.min.time())
+    return datetime.fromisoformat(str(value))
+
+
+def read_table(table: str, columns: Sequence[str] = None, symbols: Iterable[str] = None,
+               start=None, end=None, where: ds.Expression = None, root: str = None) -> pa.Table:
+    """
+    아카이브 읽기 - 필요한 컬럼만, 일자/종목 파티션 가지치기 후 로드
+    Args:
+        columns: 읽을 컬럼 (기본: 전체, 'symbol'/'date' 파티션 컬럼 포함 가능)
+        symbols: 종목 필터
+        start/end: 기준 시각 범위 [start, end) (datetime, date 또는 ISO 문자열)
+        where: 추가 pyarrow.dataset 필터 (예: ds.field('timeframe') == '1m')
+    """
+    source = dataset(table, root)
+    if source is None:
+        schema = ParquetArchiver.schema(table)
+        schema = schema.append(pa.field('date', pa.string())).append(pa.field('symbol', pa.string()))
+        empty = schema.empty_table()
+        return empty.select(list(columns)) if columns else empty
+
+    _, time_column, _ = ARCHIVE_TABLES[table]
+    start, end = _as_datetime(start), _as_datetime(end)
+    expression = where
+    conditions = []
+    if symbols is not None:
+        conditions.append(ds.field('symbol').isin(list(symbols)))
+    if start is not None:
+        conditions.append(ds.field('date') >= start.date().isoformat())
+        conditions.append(ds.field(time_column) >= pa.scalar(start, pa.timestamp('us')))
+    if end is not None:
+        conditions.append(ds.field('date') <= end.date().isoformat())
+        conditions.append(ds.field(time_column) < pa.scalar(end, pa.timestamp('us')))
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+
+    return source.to_table(columns=list(columns) if columns else None, filter=expression)
+
+
+def read_frame(table: str, columns: Sequence[str] = None, symbols: Iterable[str] = None,
+               start=None, end=None, where: ds.Expression = None, root: str = None) -> pd.DataFrame:
+    """read_table 결과 DataFrame (종목, 기준 시각 순 정렬)"""
+    frame = read_table(table, columns, symbols, start, end, where, root).to_pandas()
+    _, time_column, _ = ARCHIVE_TABLES[table]
+    keys = [key for key in ('symbol', time_column) if key in frame.columns]
+    if keys and len(frame):
+        frame = frame.sort_values(keys, kind='stable').reset_index(drop=True)
+    return frame
+
+
+def read_ohlcv(symbol: str, timeframe: str, start=None, end=None,
+               columns: Sequence[str] = ('timestamp', 'open', 'high', 'low', 'close', 'volume'),
+               root: str = None) -> pd.DataFrame:
+    """
+    종목 OHLCV (IndicatorEngine.get_ohlcv_data 와 같은 컬럼 구성, 시간순)
+    """
+    return read_frame('ohlcv_data', columns, [symbol], start, end,
+                      ds.field('timeframe') == timeframe, root).reset_index(drop=True)
+
+
+def read_ohlcv_arrays(symbols: Sequence[str], timeframe: str, start=None, end=None,
+                      fields: Sequence[str] = ('open', 'high', 'low', 'close', 'volume'),
+                      root: str = None) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    종목별 OHLCV 배열 (백테스트용, 시간순)
+    Returns:
+        {symbol: {'timestamp': datetime64[us] 배열, 필드: float64 배열}}
+    """
+    table = read_table('ohlcv_data', ['symbol', 'timestamp', *fields], symbols, start, end,
+                       ds.field('timeframe') == timeframe, root)
+    if not table.num_rows:
+        return {}
+    table = table.sort_by([('symbol', 'ascending'), ('timestamp', 'ascending')])
+    symbol_column = table.column('symbol').to_numpy(zero_copy_only=False)
+    boundaries = np.flatnonzero(symbol_column[1:] != symbol_column[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(symbol_column)]))
+    columns = {name: table.column(name).to_numpy() for name in ('timestamp', *fields)}
+    return {
+        symbol_column[a]: {name: values[a:b] for name, values in columns.items()}
+        for a, b in zip(starts.tolist(), ends.tolist())
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parquet 아카이브')
+    sub = parser.add_subparsers(dest='command', required=True)
+    export = sub.add_parser('export', help='DB → Parquet 내보내기')
+    export.add_argument('--tables', nargs='+', choices=list(ARCHIVE_TABLES), default=list(ARCHIVE_TABLES))
+    export.add_argument('--start', type=date.fromisoformat, default=None, help='시작 일자 (기본: 미보관 첫 일자)')
+    export.add_argument('--end', type=date.fromisoformat, default=None, help='종료 일자 (기본: 어제)')
+    export.add_argument('--overwrite', action='store_true', help='이미 내보낸 일자도 다시 작성')
+    export.add_argument('--root', default=None, help='아카이브 디렉토리 (기본: config.ARCHIVE_PATH)')
+    info = sub.add_parser('info', help='보관 현황')
+    info.add_argument('--root', default=None)
+    args = parser.parse_args()
+
+    if args.command == 'export':
+        archiver = ParquetArchiver(root=args.root)
+        totals = archiver.export(args.tables, args.start, args.end, args.overwrite)
+        for table, rows in totals.items():
+            print(f"✓ {table}: {rows:,}행")
+    else:
+        archiver = ParquetArchiver(root=args.root)
+        for table in ARCHIVE_TABLES:
+            days = archiver.exported_days(table)
+            source = dataset(table, args.root)
+            rows = source.count_rows() if source is not None else 0
+            span = f"{days[0]} ~ {days[-1]}" if days else '-'
+            print(f"{table:<22} {len(days):>5}일 {rows:>14,}행  {span}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,6 @@
 """
 데이터베이스 초기화 스크립트
-전용 스키마 생성 및 기본 전략 데이터 삽입
+전용 스키마 생성, 핫 쿼리 인덱스 생성 및 기본 전략 데이터 삽입
 """
 
 import sys
@@ -13,8 +13,74 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
-from database.models import init_db, SessionLocal, Strategy
+from typing import List
+from sqlalchemy import text
+from database.models import init_db, get_engine, SessionLocal, Strategy
 from datetime import datetime
+import config
+
+# 핫 쿼리용 복합/커버링 인덱스 (이름, 테이블, 정의)
+# INCLUDE 컬럼은 테이블 접근 없이 인덱스만으로 조회를 끝내기 위한 커버링 컬럼 (PostgreSQL 11+)
+# 조회 계획 회귀 검사: test_query_plans.py
+HOT_INDEXES = [
+    # 지표 계산: symbol + timeframe 최근 캔들 (ORDER BY timestamp DESC LIMIT N), 라벨러 1분봉 조회
+    ('idx_ohlcv_symbol_tf_time_cover', 'ohlcv_data',
+     '(symbol, timeframe, timestamp DESC) INCLUDE (open, high, low, close, volume)'),
+    # 활성 포지션 (status IN ...), 종목별 오픈 포지션 (symbol + status)
+    ('idx_positions_status', 'positions', '(status, symbol)'),
+    # 전략별 최근 손익 (strategy_id + closed_at 범위)
+    ('idx_trades_strategy_closed', 'trades', '(strategy_id, closed_at) INCLUDE (pnl)'),
+    # 일별 거래 집계 (closed_at 범위 → 건수/승리 수/손익 합계), 최근 거래 목록
+    ('idx_trades_closed_cover', 'trades', '(closed_at DESC) INCLUDE (pnl)'),
+    # 최근 잔고 (ORDER BY timestamp DESC LIMIT 1)
+    ('idx_balance_time_cover', 'account_balance', '(timestamp DESC) INCLUDE (total_value)'),
+    # 결과 라벨링 대기 이상 패턴 (라벨 완료 행은 인덱스에서 제외)
+    ('idx_anomaly_unlabeled', 'orderbook_anomalies', "(timestamp) WHERE (details -> 'outcome') IS NULL"),
+]
+
+# HOT_INDEXES 가 대체하는 이전 schema.sql 인덱스 (남아 있으면 쓰기 비용만 늘어나므로 제거)
+SUPERSEDED_INDEXES = ['idx_ohlcv_symbol_timeframe', 'idx_balance_time']
+
+
+def create_indexes(engine=None, schema: str = None) -> List[str]:
+    """
+    핫 쿼리 인덱스 생성 (이미 있으면 건너뜀)
+    운영 중 테이블 쓰기를 막지 않도록 CONCURRENTLY 로 생성
+    Args:
+        engine: DB 엔진 (기본: 운영 DB)
+        schema: 대상 스키마 (기본: config.DB_SCHEMA)
+    Returns:
+        새로 생성한 인덱스 이름
+    """
+    engine = engine or get_engine()
+    schema = schema or config.DB_SCHEMA
+    created = []
+
+    # CONCURRENTLY 는 트랜잭션 밖에서만 실행 가능
+    with engine.execution_options(isolation_level='AUTOCOMMIT').connect() as conn:
+        existing = dict(conn.execute(text("""
+            SELECT c.relname, i.indisvalid
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = :schema
+        """), {'schema': schema}).all())
+
+        for name, table, definition in HOT_INDEXES:
+            if existing.get(name):
+                continue
+            if name in existing:
+                # 이전 CONCURRENTLY 생성이 중단되어 남은 INVALID 인덱스 - IF NOT EXISTS 가 건너뛰므로 제거 후 재생성
+                conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {schema}.{name}"))
+            conn.execute(text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {schema}.{table} {definition}"))
+            created.append(name)
+
+        for name in SUPERSEDED_INDEXES:
+            if name in existing:
+                conn.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {schema}.{name}"))
+
+    return created
+
 
 def create_default_strategies():
     """기본 전략 데이터 생성"""
@@ -110,12 +176,17 @@ def main():
 
     try:
         # 1. 스키마 및 테이블 생성
-        print("\n[1/2] 스키마 및 테이블 생성 중...")
+        print("\n[1/3] 스키마 및 테이블 생성 중...")
         init_db()
         print("✓ 스키마 및 테이블 생성 완료!")
 
-        # 2. 기본 전략 데이터 삽입
-        print("\n[2/2] 기본 전략 데이터 삽입 중...")
+        # 2. 핫 쿼리 인덱스 생성
+        print("\n[2/3] 인덱스 생성 중...")
+        created = create_indexes()
+        print(f"✓ 인덱스 생성 완료! (신규 {len(created)}개)")
+
+        # 3. 기본 전략 데이터 삽입
+        print("\n[3/3] 기본 전략 데이터 삽입 중...")
         create_default_strategies()
 
         print("\n" + "=" * 60)
@@ -1,7 +1,7 @@
 from sqlalchemy import create_engine, Column, Integer, String, Numeric, DateTime, Boolean, Text, ForeignKey, Date, Index, UniqueConstraint
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import relationship, sessionmaker
+from sqlalchemy.orm import relationship, sessionmaker, Session
 from datetime import datetime
 import pytz
 import config
@@ -15,18 +15,43 @@ def now_kst():
 
 Base = declarative_base()
 
-# Database Engine
-engine = create_engine(
-    config.DATABASE_URL,
-    connect_args={
-        'options': f'-c search_path={config.DB_SCHEMA}'
-    },
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20
-)
+# Database Engine (첫 사용 시 생성 - import만으로 드라이버 로드/커넥션 풀 생성 방지)
+_engine = None
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def get_engine():
+    """DB 엔진 반환 (최초 호출 시 생성)"""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(
+            config.DATABASE_URL,
+            connect_args={
+                'options': f'-c search_path={config.DB_SCHEMA}'
+            },
+            pool_pre_ping=True,
+            pool_size=10,
+            max_overflow=20
+        )
+    return _engine
+
+
+class _LazySession(Session):
+    """바인딩이 없으면 첫 쿼리 시점에 기본 엔진 사용"""
+
+    def get_bind(self, *args, **kwargs):
+        if self.bind is None and not self.binds:
+            self.bind = get_engine()
+        return super().get_bind(*args, **kwargs)
+
+
+SessionLocal = sessionmaker(class_=_LazySession, autocommit=False, autoflush=False)
+
+
+def __getattr__(name):
+    # 하위 호환: models.engine 접근 시 생성
+    if name == 'engine':
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ===========================
 # 1. 시세 데이터 모델
@@ -214,6 +239,9 @@ class Position(Base):
     __tablename__ = 'positions'
     __table_args__ = {'schema': config.DB_SCHEMA}
 
+    # PENDING: 진입 주문 체결 대기, CLOSING: 청산 주문 체결 대기
+    ACTIVE_STATUSES = ('PENDING', 'OPEN', 'CLOSING')
+
     id = Column(Integer, primary_key=True, index=True)
     symbol = Column(String(20), nullable=False, index=True)
     strategy_id = Column(Integer, ForeignKey(f'{config.DB_SCHEMA}.strategies.id'))
@@ -388,6 +416,8 @@ def init_db():
     """데이터베이스 스키마 및 테이블 생성"""
     from sqlalchemy import text
 
+    engine = get_engine()
+
     # 스키마 생성
     with engine.connect() as conn:
         conn.execute(text(f"CREATE SCHEMA IF NOT EXISTS {config.DB_SCHEMA}"))
@@ -0,0 +1,187 @@
+"""
+대량 조회용 데이터 접근 계층 (ORM 객체 생성 없이 컬럼 단위 조회)
+- 필요한 컬럼만 SQLAlchemy Core select 로 조회하고 Numeric 컬럼은 DB 에서 FLOAT 로 변환
+  (행마다 ORM 객체 + Decimal 생성 후 float() 변환하던 비용 제거)
+- 결과는 컬럼별 NumPy 배열 또는 DataFrame 으로 반환 (pandas 는 DataFrame 요청 시에만 import)
+- 집계(거래 수/승리 수/손익 합계)는 DB 에서 계산해 1행만 수신
+"""
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import Float, case, cast, func, select
+from sqlalchemy.types import DateTime, Numeric
+
+from database import OHLCVData, Trade, AccountBalance, Strategy
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+OHLCV_COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+TRADE_COLUMNS = ('id', 'symbol', 'entry_price', 'exit_price', 'quantity', 'pnl', 'pnl_percent',
+                 'exit_reason', 'holding_time_minutes', 'opened_at', 'closed_at')
+
+
+def columns_of(model, names: Sequence[str]) -> List:
+    """모델 컬럼 선택 (Numeric 은 DB 에서 FLOAT 로 변환, 라벨은 컬럼명 유지)"""
+    table = model.__table__
+    selected = []
+    for name in names:
+        column = table.c[name]
+        if isinstance(column.type, Numeric):
+            column = cast(column, Float).label(name)
+        selected.append(column)
+    return selected
+
+
+def fetch_arrays(db, stmt, reverse: bool = False) -> Dict[str, np.ndarray]:
+    """
+    select 결과 → {컬럼명: NumPy 배열}
+    FLOAT 컬럼은 float64, DateTime 컬럼은 datetime64[us], 나머지는 object 배열
+    Args:
+        reverse: 행 순서 뒤집기 (DESC + LIMIT 로 최근 N건 조회 후 시간순 변환)
+    """
+    result = db.execute(stmt)
+    keys = list(result.keys())
+    rows = result.all()
+    if reverse:
+        rows.reverse()
+
+    types = {column.key: column.type for column in stmt.selected_columns}
+    values = list(zip(*rows)) if rows else [()] * len(keys)
+    arrays = {}
+    for key, column in zip(keys, values):
+        column_type = types.get(key)
+        if isinstance(column_type, Float):
+            arrays[key] = np.array(column, dtype=np.float64)
+        elif isinstance(column_type, DateTime):
+            arrays[key] = np.array(column, dtype='datetime64[us]')
+        else:
+            arrays[key] = np.array(column, dtype=object)
+    return arrays
+
+
+def fetch_frame(db, stmt, reverse: bool = False) -> 'pd.DataFrame':
+    """select 결과 → DataFrame (조회 결과가 없으면 빈 DataFrame)"""
+    # pandas 는 사용 시점에 import (core.risk_manager 등 배열/집계만 쓰는 모듈의 import 경량화)
+    import pandas as pd
+
+    arrays = fetch_arrays(db, stmt, reverse=reverse)
+    if not arrays or not len(next(iter(arrays.values()))):
+        return pd.DataFrame()
+    return pd.DataFrame(arrays)
+
+
+# ===========================
+# OHLCV
+# ===========================
+
+def ohlcv_statement(symbol: str, timeframe: str, limit: int = 200,
+                    columns: Sequence[str] = OHLCV_COLUMNS):
+    """종목/타임프레임 최근 캔들 limit 개 조회문 (최신순)"""
+    return (
+        select(*columns_of(OHLCVData, columns))
+        .where(OHLCVData.symbol == symbol, OHLCVData.timeframe == timeframe)
+        .order_by(OHLCVData.timestamp.desc())
+        .limit(limit)
+    )
+
+
+def ohlcv_frame(db, symbol: str, timeframe: str, limit: int = 200,
+                columns: Sequence[str] = OHLCV_COLUMNS) -> 'pd.DataFrame':
+    """최근 캔들 limit 개 DataFrame (시간순, IndicatorEngine.get_ohlcv_data 형식)"""
+    return fetch_frame(db, ohlcv_statement(symbol, timeframe, limit, columns), reverse=True)
+
+
+def ohlcv_arrays(db, symbol: str, timeframe: str, limit: int = 200,
+                 columns: Sequence[str] = OHLCV_COLUMNS) -> Dict[str, np.ndarray]:
+    """최근 캔들 limit 개 {컬럼명: 배열} (시간순)"""
+    return fetch_arrays(db, ohlcv_statement(symbol, timeframe, limit, columns), reverse=True)
+
+
+# ===========================
+# 거래 내역
+# ===========================
+
+def _closed_between(since: Optional[datetime], until: Optional[datetime]) -> List:
+    conditions = []
+    if since is not None:
+        conditions.append(Trade.closed_at >= since)
+    if until is not None:
+        conditions.append(Trade.closed_at < until)
+    return conditions
+
+
+def trade_summary(db, since: datetime = None, until: datetime = None) -> Dict:
+    """
+    기간 내 청산 거래 집계 (DB 에서 계산)
+    Returns:
+        {'total_trades', 'winning_trades', 'losing_trades', 'total_pnl'}
+    """
+    pnl = cast(Trade.pnl, Float)
+    row = db.execute(
+        select(
+            func.count(Trade.id),
+            func.coalesce(func.sum(case((Trade.pnl > 0, 1), else_=0)), 0),
+            func.coalesce(func.sum(pnl), 0.0),
+        ).where(*_closed_between(since, until))
+    ).one()
+    total, winning, total_pnl = int(row[0]), int(row[1]), float(row[2])
+    return {
+        'total_trades': total,
+        'winning_trades': winning,
+        'losing_trades': total - winning,
+        'total_pnl': total_pnl,
+    }
+
+
+def trade_pnls_by_strategy(db, since: datetime = None,
+                           strategy_ids: Iterable[int] = None) -> Dict[int, np.ndarray]:
+    """
+    전략별 청산 손익 배열 (전략 수만큼 조회하지 않고 1회 조회 후 분할)
+    Returns:
+        {strategy_id: 손익 배열 (청산순)} - 거래가 없는 전략은 제외
+    """
+    stmt = (
+        select(Trade.strategy_id, cast(Trade.pnl, Float).label('pnl'))
+        .where(Trade.strategy_id.isnot(None), *_closed_between(since, None))
+        .order_by(Trade.strategy_id, Trade.closed_at)
+    )
+    if strategy_ids is not None:
+        stmt = stmt.where(Trade.strategy_id.in_(list(strategy_ids)))
+
+    arrays = fetch_arrays(db, stmt)
+    ids = arrays['strategy_id'].astype(np.int64)
+    if not ids.size:
+        return {}
+    starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+    return {
+        int(ids[start]): pnls
+        for start, pnls in zip(starts, np.split(arrays['pnl'], starts[1:]))
+    }
+
+
+def recent_trades(db, limit: int = 50, columns: Sequence[str] = TRADE_COLUMNS) -> List[Dict]:
+    """최근 청산 거래 (최신순, 숫자 컬럼은 float)"""
+    stmt = select(*columns_of(Trade, columns)).order_by(Trade.closed_at.desc()).limit(limit)
+    return [dict(row) for row in db.execute(stmt).mappings()]
+
+
+# ===========================
+# 계좌 / 전략
+# ===========================
+
+def latest_total_value(db) -> Optional[float]:
+    """최근 계좌 총 평가액 (기록 없으면 None)"""
+    return db.execute(
+        select(cast(AccountBalance.total_value, Float))
+        .order_by(AccountBalance.timestamp.desc())
+        .limit(1)
+    ).scalar()
+
+
+def active_strategy_ids(db) -> List[int]:
+    """활성 전략 ID"""
+    return list(db.execute(select(Strategy.id).where(Strategy.is_active.is_(True))).scalars())
@@ -24,7 +24,7 @@ CREATE TABLE IF NOT EXISTS ohlcv_data (
     UNIQUE(symbol, timeframe, timestamp)
 );
 
-CREATE INDEX idx_ohlcv_symbol_timeframe ON ohlcv_data(symbol, timeframe, timestamp DESC);
+CREATE INDEX idx_ohlcv_symbol_tf_time_cover ON ohlcv_data(symbol, timeframe, timestamp DESC) INCLUDE (open, high, low, close, volume);
 
 -- 호가창 스냅샷 (핵심 차별화 데이터)
 CREATE TABLE IF NOT EXISTS orderbook_snapshots (
@@ -56,6 +56,7 @@ CREATE TABLE IF NOT EXISTS orderbook_anomalies (
 );
 
 CREATE INDEX idx_anomaly_symbol_type ON orderbook_anomalies(symbol, anomaly_type, timestamp DESC);
+CREATE INDEX idx_anomaly_unlabeled ON orderbook_anomalies(timestamp) WHERE (details -> 'outcome') IS NULL;
 
 -- ===========================
 -- 2. 기술적 지표 테이블
@@ -229,6 +230,8 @@ CREATE TABLE IF NOT EXISTS trades (
 );
 
 CREATE INDEX idx_trades_symbol_time ON trades(symbol, closed_at DESC);
+CREATE INDEX idx_trades_strategy_closed ON trades(strategy_id, closed_at) INCLUDE (pnl);
+CREATE INDEX idx_trades_closed_cover ON trades(closed_at DESC) INCLUDE (pnl);
 
 -- ===========================
 -- 6. 리스크 관리 테이블
@@ -264,7 +267,7 @@ CREATE TABLE IF NOT EXISTS account_balance (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
-CREATE INDEX idx_balance_time ON account_balance(timestamp DESC);
+CREATE INDEX idx_balance_time_cover ON account_balance(timestamp DESC) INCLUDE (total_value);
 
 -- ===========================
 -- 7. 시스템 로그 테이블
@@ -33,6 +33,10 @@ try:
         except Exception as e:
             print(f"  ❌ 에러: {str(e)}")
 
+    # 실전 모드: 청산 주문 체결 대기
+    if not executor.wait_for_orders():
+        print("\n⚠️  일부 청산 주문 체결 대기 시간 초과")
+
     print(f"\n\n전체 청산 완료!")
 
 except Exception as e:
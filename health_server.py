@@ -6,6 +6,7 @@ Koyeb health check를 위한 간단한 HTTP 엔드포인트
 from http.server import HTTPServer, BaseHTTPRequestHandler
 import threading
 import logging
+from utils import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,13 @@ class HealthCheckHandler(BaseHTTPRequestHandler):
             self.send_header('Content-type', 'text/plain')
             self.end_headers()
             self.wfile.write(b'OK')
+        elif self.path == '/metrics':
+            body = metrics.REGISTRY.render().encode('utf-8')
+            self.send_response(200)
+            self.send_header('Content-type', metrics.CONTENT_TYPE)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
         else:
             self.send_response(404)
             self.end_headers()
@@ -12,10 +12,13 @@ from health_server import start_health_server
 
 def main():
     parser = argparse.ArgumentParser(description='Auto Coin Trading System V2')
-    parser.add_argument('--mode', choices=['init', 'run', 'collect'], default='run',
-                       help='실행 모드 (init: DB 초기화, run: 트레이딩 실행, collect: 데이터 수집)')
+    parser.add_argument('--mode', choices=['init', 'run', 'sharded', 'collect'], default='run',
+                       help='실행 모드 (init: DB 초기화, run: 트레이딩 실행, '
+                            'sharded: 멀티 프로세스 트레이딩, collect: 데이터 수집)')
     parser.add_argument('--interval', type=int, default=300,
                        help='트레이딩 주기 (초, 기본값: 300)')
+    parser.add_argument('--shards', type=int, default=None,
+                       help='sharded 모드 워커 프로세스 수 (기본값: ENGINE_SHARDS, 0이면 CPU 코어 수)')
 
     args = parser.parse_args()
 
@@ -23,14 +26,18 @@ def main():
         print("데이터베이스 초기화 중...")
         init_database()
 
-    elif args.mode == 'run':
+    elif args.mode in ('run', 'sharded'):
         print("트레이딩 시스템 V2 시작...")
 
         # Health check 서버 시작 (Koyeb용)
         start_health_server(port=8000)
 
         try:
-            engine = TradingEngineV2()
+            if args.mode == 'sharded':
+                from core.sharding import ShardCoordinator
+                engine = ShardCoordinator(shards=args.shards)
+            else:
+                engine = TradingEngineV2()
             engine.run(interval=args.interval)
         except KeyboardInterrupt:
             print("\n시스템 종료 중...")
@@ -43,6 +50,7 @@ def main():
             try:
                 notifier = TelegramNotifier()
                 notifier.notify_error(f"치명적 에러: {str(e)}")
+                notifier.flush()
             except:
                 pass
 
@@ -51,6 +59,7 @@ def main():
         from collectors.orderbook_collector import OrderbookCollector
         from collectors.price_collector import PriceCollector
         from analysis.indicators import IndicatorEngine
+        from analysis.anomaly_labeler import AnomalyLabeler
         import config
         import threading
 
@@ -68,10 +77,15 @@ def main():
             timeframes = ['5m', '15m', '1h']
             engine.run_calculation_loop(config.TARGET_PAIRS, timeframes, interval=60)
 
+        def run_anomaly_labeler():
+            labeler = AnomalyLabeler()
+            labeler.run_loop(config.ANOMALY_LABEL_INTERVAL)
+
         threads = [
             threading.Thread(target=run_orderbook_collector, daemon=True),
             threading.Thread(target=run_price_collector, daemon=True),
-            threading.Thread(target=run_indicator_engine, daemon=True)
+            threading.Thread(target=run_indicator_engine, daemon=True),
+            threading.Thread(target=run_anomaly_labeler, daemon=True)
         ]
 
         for thread in threads:
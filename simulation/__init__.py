@@ -0,0 +1,4 @@
+"""
+오프라인 시뮬레이션 도구
+모의 거래소 및 합성 시장 데이터
+"""
@@ -0,0 +1,278 @@
+"""
+실시간 시장 시뮬레이터
+랜덤워크 또는 녹화된 시세로 종목별 현재가/캔들/체결/호가창을 갱신
+"""
+
+import csv
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+import pytz
+
+from simulation.market_data import correlated_returns
+
+# 빗썸 캔들 간격 (초)
+CANDLE_INTERVALS = {
+    '1m': 60, '3m': 180, '5m': 300, '10m': 600, '30m': 1800,
+    '1h': 3600, '6h': 21600, '12h': 43200, '24h': 86400
+}
+
+HISTORY_BARS = 300       # 시작 시 생성할 과거 캔들 수
+MAX_CANDLES = 1500       # 간격별 보관 캔들 수
+MAX_TRADES = 200         # 종목별 보관 체결 수
+
+KST = pytz.timezone('Asia/Seoul')  # 빗썸 체결 시각 문자열 기준 (시간대 표기 없음)
+
+
+def price_step(price: float) -> float:
+    """호가 간격 근사 (가격의 0.05%, 최소 0.0001)"""
+    return max(price * 0.0005, 0.0001)
+
+
+def round_price(price: float) -> float:
+    """가격 자릿수 정리 (저가 코인 소수점 유지)"""
+    if price >= 100:
+        return round(price, 1)
+    if price >= 1:
+        return round(price, 3)
+    return round(price, 4)
+
+
+class SymbolState:
+    """종목별 시장 상태"""
+
+    def __init__(self, symbol: str, price: float, volume_24h: float):
+        self.symbol = symbol
+        self.price = price
+        self.opening_price = price
+        self.prev_closing_price = price
+        self.min_price = price
+        self.max_price = price
+        self.units_traded_24h = volume_24h
+        self.value_24h = volume_24h * price
+        self.candles = {interval: deque(maxlen=MAX_CANDLES) for interval in CANDLE_INTERVALS}
+        self.trades = deque(maxlen=MAX_TRADES)
+        self.new_trades = []          # 직전 틱에서 발생한 체결 (WebSocket 전송용)
+        self.book = None              # (bids, asks) 캐시
+        self.book_tick = -1
+
+
+class MarketSimulator:
+    """종목 유니버스 시장 시뮬레이터"""
+
+    def __init__(self, symbols: List[str], seed: Optional[int] = None,
+                 volatility: float = 0.002, book_levels: int = 30,
+                 recorded: Optional[Dict[str, List[float]]] = None,
+                 correlation: float = 0.0):
+        """
+        Args:
+            symbols: 종목 심볼 리스트
+            seed: 난수 시드 (재현용)
+            volatility: 틱당 수익률 표준편차
+            book_levels: 호가 단계 수
+            recorded: 녹화된 종가 시퀀스 {symbol: [price, ...]} - 있으면 랜덤워크 대신 재생
+            correlation: 종목 간 시장 상관 계수 (0이면 독립 랜덤워크)
+        """
+        self.rng = np.random.default_rng(seed)
+        self.symbols = list(dict.fromkeys(symbols))
+        self.volatility = volatility
+        self.book_levels = book_levels
+        self.recorded = recorded or {}
+        self.market_beta = np.full(len(self.symbols), correlation)
+        self.tick_count = 0
+        self.trade_seq = 0
+
+        start_prices = np.exp(self.rng.uniform(np.log(1), np.log(5_000_000), len(self.symbols)))
+        volumes = self.rng.lognormal(mean=14, sigma=1.5, size=len(self.symbols)) / np.sqrt(start_prices)
+
+        self.states = {}
+        now = time.time()
+        for i, symbol in enumerate(self.symbols):
+            price = self.recorded[symbol][0] if self.recorded.get(symbol) else float(start_prices[i])
+            state = SymbolState(symbol, round_price(price), float(volumes[i]))
+            self._seed_history(state, now)
+            self.states[symbol] = state
+
+    # ===========================
+    # 초기화
+    # ===========================
+
+    def _seed_history(self, state: SymbolState, now: float):
+        """현재가에서 끝나는 과거 캔들 생성"""
+        for interval, seconds in CANDLE_INTERVALS.items():
+            scale = self.volatility * np.sqrt(seconds)
+            returns = self.rng.normal(0, scale, HISTORY_BARS)
+            path = np.cumsum(returns)
+            closes = state.price * np.exp(path - path[-1])
+            opens = np.concatenate(([closes[0]], closes[:-1]))
+            wiggle = np.abs(self.rng.normal(0, scale / 2, HISTORY_BARS)) * closes
+            highs = np.maximum(opens, closes) + wiggle
+            lows = np.maximum(np.minimum(opens, closes) - wiggle, closes * 0.5)
+            volumes = self.rng.lognormal(0, 0.5, HISTORY_BARS) * state.units_traded_24h * seconds / 86400
+
+            bucket = int(now // seconds) * seconds
+            for j in range(HISTORY_BARS):
+                start = bucket - (HISTORY_BARS - 1 - j) * seconds
+                state.candles[interval].append([
+                    int(start * 1000), float(opens[j]), float(closes[j]),
+                    float(highs[j]), float(lows[j]), float(volumes[j])
+                ])
+
+    @staticmethod
+    def load_recorded(csv_path: str) -> Dict[str, List[float]]:
+        """
+        녹화 시세 로드
+        CSV 컬럼: symbol, timestamp, close (timestamp 순 정렬 가정)
+        """
+        recorded = {}
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                recorded.setdefault(row['symbol'].upper(), []).append(float(row['close']))
+        return recorded
+
+    # ===========================
+    # 시뮬레이션
+    # ===========================
+
+    def step(self, now: float = None):
+        """모든 종목 1틱 진행"""
+        now = now or time.time()
+        self.tick_count += 1
+
+        returns = correlated_returns(
+            self.rng, len(self.symbols), 1,
+            np.full(len(self.symbols), self.volatility), self.market_beta
+        )[:, 0]
+        trade_counts = self.rng.poisson(2.0, len(self.symbols))
+
+        for i, symbol in enumerate(self.symbols):
+            state = self.states[symbol]
+
+            series = self.recorded.get(symbol)
+            if series:
+                new_price = series[self.tick_count % len(series)]
+            else:
+                new_price = state.price * float(np.exp(returns[i]))
+            new_price = round_price(max(new_price, 0.0001))
+
+            state.new_trades = self._generate_trades(state, new_price, int(trade_counts[i]), now)
+            state.price = new_price
+            state.min_price = min(state.min_price, new_price)
+            state.max_price = max(state.max_price, new_price)
+            self._update_candles(state, now)
+
+    def _generate_trades(self, state: SymbolState, price: float, count: int, now: float) -> List[Dict]:
+        """틱 동안 발생한 체결 생성"""
+        trades = []
+        for _ in range(count):
+            side = 'bid' if self.rng.random() < 0.5 else 'ask'
+            units = float(self.rng.lognormal(0, 1)) * state.units_traded_24h / 50000
+            trade_price = round_price(price + (price_step(price) if side == 'bid' else -price_step(price)) / 2)
+            self.trade_seq += 1
+            trade = {
+                'cont_no': str(self.trade_seq),
+                'transaction_date': datetime.fromtimestamp(now, KST).strftime('%Y-%m-%d %H:%M:%S'),
+                'type': side,
+                'units_traded': f"{units:.8f}",
+                'price': f"{trade_price}",
+                'total': f"{units * trade_price:.4f}",
+                'timestamp': now
+            }
+            state.trades.append(trade)
+            state.units_traded_24h += units
+            state.value_24h += units * trade_price
+            trades.append(trade)
+        return trades
+
+    def _update_candles(self, state: SymbolState, now: float):
+        """간격별 현재 캔들 갱신"""
+        volume = sum(float(t['units_traded']) for t in state.new_trades)
+        price = state.price
+
+        for interval, seconds in CANDLE_INTERVALS.items():
+            start_ms = int(now // seconds) * seconds * 1000
+            candles = state.candles[interval]
+            last = candles[-1] if candles else None
+
+            if last and last[0] == start_ms:
+                last[2] = price
+                last[3] = max(last[3], price)
+                last[4] = min(last[4], price)
+                last[5] += volume
+            else:
+                candles.append([start_ms, price, price, price, price, volume])
+
+    # ===========================
+    # 조회
+    # ===========================
+
+    def get_book(self, symbol: str):
+        """
+        호가창 (틱 단위 캐시)
+        Returns:
+            (bids, asks) - 각 [(price, quantity), ...]
+        """
+        state = self.states[symbol]
+        if state.book is not None and state.book_tick == self.tick_count:
+            return state.book
+
+        step = price_step(state.price)
+        levels = self.book_levels
+        depth_scale = state.units_traded_24h / 2000
+
+        def side(direction: int):
+            quantities = self.rng.lognormal(0, 0.8, levels) * depth_scale
+            walls = self.rng.random(levels) < 0.05
+            quantities[walls] *= self.rng.uniform(4, 10, int(walls.sum()))
+            return [(round_price(state.price + direction * step * (k + 0.5)), float(quantities[k]))
+                    for k in range(levels)]
+
+        state.book = (side(-1), side(1))
+        state.book_tick = self.tick_count
+        return state.book
+
+    def ticker(self, symbol: str) -> Dict:
+        """빗썸 /public/ticker 형식"""
+        state = self.states[symbol]
+        change = state.price - state.prev_closing_price
+        rate = change / state.prev_closing_price * 100 if state.prev_closing_price > 0 else 0
+        return {
+            'opening_price': f"{state.opening_price}",
+            'closing_price': f"{state.price}",
+            'min_price': f"{state.min_price}",
+            'max_price': f"{state.max_price}",
+            'units_traded': f"{state.units_traded_24h:.8f}",
+            'acc_trade_value': f"{state.value_24h:.4f}",
+            'prev_closing_price': f"{state.prev_closing_price}",
+            'units_traded_24H': f"{state.units_traded_24h:.8f}",
+            'acc_trade_value_24H': f"{state.value_24h:.4f}",
+            'fluctate_24H': f"{change}",
+            'fluctate_rate_24H': f"{rate:.2f}",
+            'date': str(int(time.time() * 1000))
+        }
+
+    def orderbook(self, symbol: str, count: int = 30) -> Dict:
+        """빗썸 /public/orderbook 형식"""
+        bids, asks = self.get_book(symbol)
+        return {
+            'timestamp': str(int(time.time() * 1000)),
+            'payment_currency': 'KRW',
+            'order_currency': symbol,
+            'bids': [{'price': f"{p}", 'quantity': f"{q:.8f}"} for p, q in bids[:count]],
+            'asks': [{'price': f"{p}", 'quantity': f"{q:.8f}"} for p, q in asks[:count]],
+        }
+
+    def candles(self, symbol: str, interval: str) -> List[List]:
+        """빗썸 /public/candlestick 형식 [[ts, open, close, high, low, volume], ...]"""
+        return [
+            [c[0], f"{c[1]}", f"{c[2]}", f"{c[3]}", f"{c[4]}", f"{c[5]:.8f}"]
+            for c in self.states[symbol].candles[interval]
+        ]
+
+    def transactions(self, symbol: str, count: int = 20) -> List[Dict]:
+        """빗썸 /public/transaction_history 형식 (오래된 순)"""
+        trades = list(self.states[symbol].trades)[-count:]
+        return [{k: v for k, v in t.items() if k != 'timestamp'} for t in trades]
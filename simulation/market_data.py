@@ -0,0 +1,406 @@
+"""
+합성 시장 데이터 생성기
+N개 종목의 상관된 랜덤워크 OHLCV, 호가창(벽 포함), 체결 테이프를 생성하고
+DB(벌크 insert) 또는 메모리 매핑 파일로 저장
+
+사용법:
+    python -m simulation.market_data --symbols 1000 --bars 2000 --out data/synthetic
+    python -m simulation.market_data --symbols 500 --bars 300 --timeframe 15m --db
+"""
+
+import argparse
+import json
+import os
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Dict, List, Optional
+
+import numpy as np
+
+TIMEFRAME_SECONDS = {
+    '1m': 60, '3m': 180, '5m': 300, '10m': 600, '15m': 900, '30m': 1800,
+    '1h': 3600, '4h': 14400, '6h': 21600, '12h': 43200, '1d': 86400, '24h': 86400
+}
+
+
+def make_symbols(count: int, prefix: str = 'SIM') -> List[str]:
+    """합성 심볼 리스트"""
+    return [f"{prefix}{i:04d}" for i in range(1, count + 1)]
+
+
+def correlated_returns(rng: np.random.Generator, n_symbols: int, n_steps: int,
+                       volatility: np.ndarray, market_beta: np.ndarray,
+                       market_volatility: float = 1.0) -> np.ndarray:
+    """
+    1-팩터 모델 기반 상관 수익률
+    r_i = vol_i * (beta_i * m + sqrt(1 - beta_i^2) * e_i)
+    Args:
+        n_symbols: 종목 수
+        n_steps: 스텝 수
+        volatility: 종목별 스텝 변동성 (n_symbols,)
+        market_beta: 종목별 시장 상관 계수 0~1 (n_symbols,)
+    Returns:
+        (n_symbols, n_steps) 로그 수익률
+    """
+    market = rng.standard_normal(n_steps) * market_volatility
+    idio = rng.standard_normal((n_symbols, n_steps))
+    beta = market_beta[:, None]
+    return volatility[:, None] * (beta * market[None, :] + np.sqrt(1 - beta ** 2) * idio)
+
+
+def generate_ohlcv(n_symbols: int, bars: int, timeframe: str = '1m',
+                   end: Optional[datetime] = None, seed: Optional[int] = None,
+                   correlation: float = 0.5) -> Dict[str, np.ndarray]:
+    """
+    상관된 랜덤워크 OHLCV
+    Args:
+        n_symbols: 종목 수
+        bars: 종목당 캔들 수
+        timeframe: 타임프레임
+        end: 마지막 캔들 시각 (기본: 현재 분)
+        seed: 난수 시드
+        correlation: 평균 시장 상관 계수
+    Returns:
+        {'timestamp': (bars,) datetime64[s], 'open'/'high'/'low'/'close'/'volume': (n_symbols, bars)}
+    """
+    rng = np.random.default_rng(seed)
+    seconds = TIMEFRAME_SECONDS[timeframe]
+    end = end or datetime.now().replace(second=0, microsecond=0)
+
+    # 저가 코인일수록 변동성 큼 (빗썸 유니버스 특성)
+    start_prices = np.exp(rng.uniform(np.log(1), np.log(5_000_000), n_symbols))
+    daily_vol = np.clip(0.12 - 0.01 * np.log10(start_prices), 0.02, 0.15)
+    step_vol = daily_vol * np.sqrt(seconds / 86400)
+    beta = np.clip(rng.normal(correlation, 0.15, n_symbols), 0.0, 0.95)
+
+    returns = correlated_returns(rng, n_symbols, bars, step_vol, beta)
+    close = start_prices[:, None] * np.exp(np.cumsum(returns, axis=1))
+    open_ = np.concatenate((start_prices[:, None], close[:, :-1]), axis=1)
+
+    wick = np.abs(rng.standard_normal((n_symbols, bars))) * step_vol[:, None] * 0.5
+    high = np.maximum(open_, close) * (1 + wick)
+    low = np.minimum(open_, close) * (1 - wick)
+
+    # 거래량: 가격 변동이 클수록 증가 + 로그정규 노이즈
+    base_volume = rng.lognormal(14, 1.5, n_symbols) / np.sqrt(start_prices) * seconds / 86400
+    volume = base_volume[:, None] * (1 + 20 * np.abs(returns)) * rng.lognormal(0, 0.4, (n_symbols, bars))
+
+    end64 = np.datetime64(end, 's')
+    timestamps = end64 - np.arange(bars - 1, -1, -1) * np.timedelta64(seconds, 's')
+
+    return {
+        'timestamp': timestamps,
+        'open': open_,
+        'high': high,
+        'low': low,
+        'close': close,
+        'volume': volume
+    }
+
+
+def generate_orderbooks(prices: np.ndarray, levels: int = 30, seed: Optional[int] = None,
+                        wall_probability: float = 0.05, depth_scale: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+    """
+    호가창 생성 (호가 간격 = 가격의 0.05%, 확률적으로 3~10배 벽 포함)
+    Args:
+        prices: 종목별 중간가 (n_symbols,)
+        levels: 호가 단계 수
+        wall_probability: 단계별 벽 발생 확률
+        depth_scale: 종목별 평균 잔량 (n_symbols,)
+    Returns:
+        {'bid_price', 'bid_quantity', 'ask_price', 'ask_quantity'}: (n_symbols, levels)
+    """
+    rng = np.random.default_rng(seed)
+    n = len(prices)
+    depth_scale = depth_scale if depth_scale is not None else 1e6 / np.sqrt(prices)
+
+    tick = np.maximum(prices * 0.0005, 0.0001)[:, None]
+    offsets = np.arange(levels)[None, :] + 0.5
+
+    def side_quantities():
+        qty = rng.lognormal(0, 0.8, (n, levels)) * depth_scale[:, None]
+        # 최우선 호가에서 멀어질수록 잔량 증가
+        qty *= 1 + np.arange(levels)[None, :] / levels
+        walls = rng.random((n, levels)) < wall_probability
+        qty[walls] *= rng.uniform(3, 10, int(walls.sum()))
+        return qty
+
+    return {
+        'bid_price': prices[:, None] - tick * offsets,
+        'bid_quantity': side_quantities(),
+        'ask_price': prices[:, None] + tick * offsets,
+        'ask_quantity': side_quantities(),
+    }
+
+
+def generate_trades(prices: np.ndarray, trades_per_symbol: int, start: datetime,
+                    duration_seconds: float, seed: Optional[int] = None) -> np.ndarray:
+    """
+    체결 테이프 생성 (시간순, 일련번호 포함)
+    Returns:
+        구조화 배열 (symbol_idx, timestamp[ms], seq, price, units, is_buy)
+    """
+    rng = np.random.default_rng(seed)
+    n = len(prices)
+    total = n * trades_per_symbol
+
+    symbol_idx = np.repeat(np.arange(n, dtype=np.int32), trades_per_symbol)
+    offsets_ms = rng.uniform(0, duration_seconds * 1000, total).astype(np.int64)
+    is_buy = rng.random(total) < 0.5
+
+    drift = rng.normal(0, 0.001, total)
+    trade_prices = prices[symbol_idx] * (1 + drift)
+    units = rng.lognormal(0, 1.2, total) * 1e4 / np.sqrt(prices[symbol_idx])
+
+    order = np.argsort(offsets_ms, kind='stable')
+
+    tape = np.empty(total, dtype=[
+        ('symbol_idx', 'i4'), ('timestamp', 'i8'), ('seq', 'i8'),
+        ('price', 'f8'), ('units', 'f8'), ('is_buy', '?')
+    ])
+    start_ms = int(start.timestamp() * 1000)
+    tape['symbol_idx'] = symbol_idx[order]
+    tape['timestamp'] = start_ms + offsets_ms[order]
+    tape['seq'] = np.arange(1, total + 1)
+    tape['price'] = trade_prices[order]
+    tape['units'] = units[order]
+    tape['is_buy'] = is_buy[order]
+    return tape
+
+
+def orderbook_to_api(books: Dict[str, np.ndarray], i: int) -> Dict:
+    """i번째 종목 호가창을 빗썸 응답 형식(문자열 가격/수량)으로 변환"""
+    return {
+        'bids': [{'price': f"{p:.4f}", 'quantity': f"{q:.8f}"}
+                 for p, q in zip(books['bid_price'][i], books['bid_quantity'][i])],
+        'asks': [{'price': f"{p:.4f}", 'quantity': f"{q:.8f}"}
+                 for p, q in zip(books['ask_price'][i], books['ask_quantity'][i])],
+    }
+
+
+# ===========================
+# 저장
+# ===========================
+
+def write_memmap(directory: str, symbols: List[str], arrays: Dict[str, np.ndarray], meta: Dict = None):
+    """
+    배열을 .npy (메모리 매핑 가능) + manifest.json 으로 저장
+    Args:
+        directory: 저장 디렉토리
+        symbols: 종목 리스트 (행 순서)
+        arrays: {이름: 배열}
+        meta: 추가 메타데이터
+    """
+    os.makedirs(directory, exist_ok=True)
+    manifest = {'symbols': symbols, 'arrays': {}, 'meta': meta or {}}
+
+    for name, array in arrays.items():
+        path = os.path.join(directory, f"{name}.npy")
+        out = np.lib.format.open_memmap(path, mode='w+', dtype=array.dtype, shape=array.shape)
+        out[...] = array
+        out.flush()
+        del out
+        manifest['arrays'][name] = {'dtype': str(array.dtype), 'shape': list(array.shape)}
+
+    with open(os.path.join(directory, 'manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, default=str)
+
+
+def load_memmap(directory: str) -> Dict:
+    """
+    write_memmap 결과를 읽기 전용 메모리 매핑으로 로드
+    Returns:
+        {'symbols': [...], 'meta': {...}, 배열 이름: np.memmap, ...}
+    """
+    with open(os.path.join(directory, 'manifest.json'), 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    result = {'symbols': manifest['symbols'], 'meta': manifest.get('meta', {})}
+    for name in manifest['arrays']:
+        result[name] = np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r')
+    return result
+
+
+def write_ohlcv_to_db(symbols: List[str], ohlcv: Dict[str, np.ndarray], timeframe: str,
+                      session=None, batch_size: int = 5000) -> int:
+    """
+    OHLCV를 ohlcv_data 테이블에 벌크 저장 (Postgres는 중복 무시)
+    Returns:
+        저장 시도 행 수
+    """
+    from sqlalchemy import insert
+    from database import SessionLocal, OHLCVData
+
+    own_session = session is None
+    session = session or SessionLocal()
+
+    try:
+        dialect = session.get_bind().dialect.name
+        if dialect == 'postgresql':
+            from sqlalchemy.dialects.postgresql import insert as pg_insert
+            stmt = pg_insert(OHLCVData).on_conflict_do_nothing(
+                index_elements=['symbol', 'timeframe', 'timestamp']
+            )
+        else:
+            stmt = insert(OHLCVData)
+
+        timestamps = ohlcv['timestamp'].astype('datetime64[s]').astype(datetime)
+        total = 0
+        batch = []
+
+        for i, symbol in enumerate(symbols):
+            o, h, l, c, v = (ohlcv[k][i] for k in ('open', 'high', 'low', 'close', 'volume'))
+            for j, ts in enumerate(timestamps):
+                batch.append({
+                    'symbol': symbol,
+                    'timeframe': timeframe,
+                    'timestamp': ts,
+                    'open': Decimal(f"{o[j]:.8f}"),
+                    'high': Decimal(f"{h[j]:.8f}"),
+                    'low': Decimal(f"{l[j]:.8f}"),
+                    'close': Decimal(f"{c[j]:.8f}"),
+                    'volume': Decimal(f"{v[j]:.8f}")
+                })
+                if len(batch) >= batch_size:
+                    session.execute(stmt, batch)
+                    total += len(batch)
+                    batch = []
+
+        if batch:
+            session.execute(stmt, batch)
+            total += len(batch)
+
+        session.commit()
+        return total
+
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        if own_session:
+            session.close()
+
+
+def write_orderbooks_to_db(symbols: List[str], books: Dict[str, np.ndarray], timestamp: datetime,
+                           session=None) -> int:
+    """호가창 스냅샷을 orderbook_snapshots 테이블에 벌크 저장"""
+    from sqlalchemy import insert
+    from database import SessionLocal, OrderbookSnapshot
+
+    own_session = session is None
+    session = session or SessionLocal()
+
+    try:
+        bid_totals = books['bid_quantity'].sum(axis=1)
+        ask_totals = books['ask_quantity'].sum(axis=1)
+        rows = []
+        for i, symbol in enumerate(symbols):
+            book = orderbook_to_api(books, i)
+            rows.append({
+                'symbol': symbol,
+                'timestamp': timestamp,
+                'bids': book['bids'],
+                'asks': book['asks'],
+                'bid_total_volume': Decimal(f"{bid_totals[i]:.8f}"),
+                'ask_total_volume': Decimal(f"{ask_totals[i]:.8f}"),
+                'imbalance_ratio': Decimal(f"{bid_totals[i] / ask_totals[i]:.4f}"),
+                'spread': Decimal(f"{books['ask_price'][i, 0] - books['bid_price'][i, 0]:.8f}")
+            })
+        session.execute(insert(OrderbookSnapshot), rows)
+        session.commit()
+        return len(rows)
+
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        if own_session:
+            session.close()
+
+
+# ===========================
+# 엔진 주입
+# ===========================
+
+def populate_engine_caches(engine, symbols: List[str], ohlcv: Dict[str, np.ndarray],
+                           books: Dict[str, np.ndarray], bar: int = -1):
+    """
+    TradingEngineV2 캐시를 합성 데이터로 채움 (거래소 없이 사이클 실행용)
+    Args:
+        engine: TradingEngineV2 인스턴스
+        symbols: 종목 리스트
+        ohlcv: generate_ohlcv 결과
+        books: generate_orderbooks 결과
+        bar: 사용할 캔들 인덱스
+    """
+    from analysis import orderbook_analytics
+
+    now = datetime.now()
+    end = bar % ohlcv['close'].shape[1] + 1
+    volumes = ohlcv['volume'][:, :end].sum(axis=1)
+
+    for i, symbol in enumerate(symbols):
+        engine.market_data_cache[symbol] = {
+            'price': float(ohlcv['close'][i, bar]),
+            'volume': float(volumes[i]),
+            'timestamp': now
+        }
+
+        book = orderbook_to_api(books, i)
+        parsed = orderbook_analytics.ParsedBook(
+            np.ascontiguousarray(books['bid_price'][i], dtype=np.float64),
+            np.ascontiguousarray(books['bid_quantity'][i], dtype=np.float64),
+            np.ascontiguousarray(books['ask_price'][i], dtype=np.float64),
+            np.ascontiguousarray(books['ask_quantity'][i], dtype=np.float64)
+        )
+        engine.orderbook_cache[symbol] = orderbook_analytics.cache_entry(book['bids'], book['asks'], now, book=parsed)
+
+    engine.symbols = list(symbols)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='합성 시장 데이터 생성')
+    parser.add_argument('--symbols', type=int, default=500, help='종목 수')
+    parser.add_argument('--bars', type=int, default=2000, help='종목당 캔들 수')
+    parser.add_argument('--timeframe', default='1m', choices=list(TIMEFRAME_SECONDS.keys()))
+    parser.add_argument('--levels', type=int, default=30, help='호가 단계 수')
+    parser.add_argument('--trades', type=int, default=1000, help='종목당 체결 수')
+    parser.add_argument('--correlation', type=float, default=0.5)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--out', default=None, help='메모리 매핑 파일 저장 디렉토리')
+    parser.add_argument('--db', action='store_true', help='DB에 벌크 저장 (ohlcv_data, orderbook_snapshots)')
+    args = parser.parse_args()
+
+    symbols = make_symbols(args.symbols)
+
+    print(f"생성 중: {args.symbols}종목 × {args.bars}봉 ({args.timeframe})")
+    ohlcv = generate_ohlcv(args.symbols, args.bars, args.timeframe, seed=args.seed,
+                           correlation=args.correlation)
+    last_close = ohlcv['close'][:, -1]
+    books = generate_orderbooks(last_close, args.levels, seed=args.seed + 1)
+    duration = TIMEFRAME_SECONDS[args.timeframe] * args.bars
+    start = ohlcv['timestamp'][0].astype(datetime)
+    trades = generate_trades(last_close, args.trades, start, duration, seed=args.seed + 2)
+
+    if args.out:
+        write_memmap(args.out, symbols, {
+            'timestamp': ohlcv['timestamp'].astype('datetime64[s]').astype(np.int64),
+            'open': ohlcv['open'], 'high': ohlcv['high'], 'low': ohlcv['low'],
+            'close': ohlcv['close'], 'volume': ohlcv['volume'],
+            **books,
+            'trades': trades
+        }, meta={'timeframe': args.timeframe, 'seed': args.seed, 'generated_at': datetime.now().isoformat()})
+        print(f"✓ 메모리 매핑 파일 저장: {args.out}")
+
+    if args.db:
+        rows = write_ohlcv_to_db(symbols, ohlcv, args.timeframe)
+        print(f"✓ OHLCV {rows:,}행 저장")
+        rows = write_orderbooks_to_db(symbols, books, datetime.now())
+        print(f"✓ 호가창 스냅샷 {rows:,}개 저장")
+
+    if not args.out and not args.db:
+        print("저장 대상 없음 (--out 또는 --db 지정)")
+
+
+if __name__ == "__main__":
+    main()
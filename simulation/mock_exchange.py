@@ -0,0 +1,657 @@
+"""
+모의 빗썸 거래소 서버
+실거래소 없이 부하/지연시간 테스트를 하기 위한 로컬 대체 서버
+
+지원 범위:
+- Public: /public/ticker, /public/orderbook, /public/candlestick, /public/transaction_history
+- Private: /info/balance, /info/wallet_address, /info/orders, /info/order_detail,
+           /info/user_transactions, /trade/place, /trade/cancel
+- WebSocket: /pub/ws (ticker, orderbookdepth, transaction)
+
+사용법:
+    python -m simulation.mock_exchange --port 8765 --symbols 500 --latency-ms 20 --error-rate 0.01
+
+    BITHUMB_API_URL=http://127.0.0.1:8765 \\
+    BITHUMB_WS_URL=ws://127.0.0.1:8765/pub/ws \\
+    python main.py --mode run
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import random
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs
+
+from aiohttp import web, WSMsgType
+
+from simulation.market import MarketSimulator, CANDLE_INTERVALS, KST
+import config
+
+
+def _ok(data=None, **extra) -> Dict:
+    response = {'status': '0000'}
+    if data is not None:
+        response['data'] = data
+    response.update(extra)
+    return response
+
+
+def _error(status: str, message: str) -> Dict:
+    return {'status': status, 'message': message}
+
+
+class TokenBucket:
+    """초당 요청 제한"""
+
+    def __init__(self, rate: float, burst: float = None):
+        self.rate = rate
+        self.capacity = burst or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def allow(self) -> bool:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class MockAccount:
+    """단일 모의 계좌 (잔고/주문/체결 내역)"""
+
+    def __init__(self, initial_krw: float, fee_rate: float):
+        self.fee_rate = fee_rate
+        self.balances = {'KRW': {'total': initial_krw, 'in_use': 0.0}}
+        self.orders = {}          # {order_id: order}
+        self.transactions = []    # 체결 내역 (최신 순 조회)
+        self.order_seq = 0
+
+    def balance(self, currency: str) -> Dict:
+        return self.balances.setdefault(currency, {'total': 0.0, 'in_use': 0.0})
+
+    def next_order_id(self) -> str:
+        self.order_seq += 1
+        return f"C0{int(time.time() * 1000)}{self.order_seq:06d}"
+
+
+class MockBithumbExchange:
+    """모의 빗썸 거래소"""
+
+    def __init__(self, symbols: List[str], seed: Optional[int] = None,
+                 latency_ms: float = 0, jitter_ms: float = 0, error_rate: float = 0.0,
+                 public_rate_limit: float = 135, private_rate_limit: float = 15,
+                 tick_interval: float = 1.0, initial_krw: float = 10_000_000,
+                 fee_rate: float = 0.0025, api_secret: str = None,
+                 recorded: Optional[Dict[str, List[float]]] = None,
+                 correlation: float = 0.0):
+        """
+        Args:
+            symbols: 상장 종목
+            seed: 난수 시드
+            latency_ms: 응답 지연 (ms)
+            jitter_ms: 응답 지연 편차 (ms, 균등분포)
+            error_rate: 에러 응답 비율 (0-1)
+            public_rate_limit: Public API 초당 요청 한도 (클라이언트별)
+            private_rate_limit: Private API 초당 요청 한도 (클라이언트별)
+            tick_interval: 시세 갱신 주기 (초)
+            initial_krw: 모의 계좌 초기 원화
+            fee_rate: 거래 수수료율
+            api_secret: 지정 시 Private API 서명 검증
+            recorded: 녹화 시세 {symbol: [price, ...]}
+            correlation: 종목 간 시장 상관 계수
+        """
+        self.market = MarketSimulator(symbols, seed=seed, recorded=recorded, correlation=correlation)
+        self.account = MockAccount(initial_krw, fee_rate)
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.error_rate = error_rate
+        self.public_rate_limit = public_rate_limit
+        self.private_rate_limit = private_rate_limit
+        self.tick_interval = tick_interval
+        self.api_secret = api_secret
+        self.random = random.Random(seed)
+
+        self._buckets = {}
+        self._ws_clients = {}     # {ws: [subscription, ...]}
+        self.request_count = 0
+
+    # ===========================
+    # 앱 구성
+    # ===========================
+
+    def build_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        app.router.add_get('/public/ticker/{pair}', self.handle_ticker)
+        app.router.add_get('/public/orderbook/{pair}', self.handle_orderbook)
+        app.router.add_get('/public/candlestick/{pair}/{interval}', self.handle_candlestick)
+        app.router.add_get('/public/transaction_history/{pair}', self.handle_transaction_history)
+
+        app.router.add_post('/info/balance', self.handle_balance)
+        app.router.add_post('/info/wallet_address', self.handle_wallet_address)
+        app.router.add_post('/info/orders', self.handle_orders)
+        app.router.add_post('/info/order_detail', self.handle_order_detail)
+        app.router.add_post('/info/user_transactions', self.handle_user_transactions)
+        app.router.add_post('/trade/place', self.handle_place)
+        app.router.add_post('/trade/cancel', self.handle_cancel)
+
+        app.router.add_get('/pub/ws', self.handle_ws)
+
+        app.on_startup.append(self._start_ticker)
+        app.on_cleanup.append(self._stop_ticker)
+        return app
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        if request.path == '/pub/ws':
+            return await handler(request)
+
+        self.request_count += 1
+        is_private = not request.path.startswith('/public/')
+
+        # 요청 한도
+        key = (request.remote, is_private)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rate = self.private_rate_limit if is_private else self.public_rate_limit
+            bucket = self._buckets[key] = TokenBucket(rate)
+        if not bucket.allow():
+            return web.json_response(_error('5300', 'Too Many Requests'), status=429)
+
+        # 지연
+        delay = self.latency + (self.random.uniform(0, self.jitter) if self.jitter else 0)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        # 에러 주입
+        if self.error_rate and self.random.random() < self.error_rate:
+            return web.json_response(_error('5600', 'Mock injected error'))
+
+        if is_private:
+            params, auth_error = await self._read_private(request)
+            if auth_error:
+                return web.json_response(auth_error)
+            request['params'] = params
+
+        result = await handler(request)
+        return web.json_response(result) if isinstance(result, dict) else result
+
+    async def _read_private(self, request: web.Request):
+        """Private 요청 본문 파싱 및 서명 검증"""
+        body = await request.text()
+        params = {k: v[0] for k, v in parse_qs(body).items()}
+
+        api_key = request.headers.get('Api-Key')
+        sign = request.headers.get('Api-Sign')
+        nonce = request.headers.get('Api-Nonce')
+        if not api_key or not sign or not nonce:
+            return params, _error('5100', 'Bad Request.(Auth Data)')
+
+        if self.api_secret:
+            message = request.path + chr(0) + body + chr(0) + nonce
+            digest = hmac.new(self.api_secret.encode('utf-8'), message.encode('utf-8'),
+                              hashlib.sha512).hexdigest()
+            expected = base64.b64encode(digest.encode('utf-8')).decode('utf-8')
+            if not hmac.compare_digest(expected, sign):
+                return params, _error('5300', 'Invalid Apikey')
+
+        return params, None
+
+    def _symbol(self, pair: str) -> Optional[str]:
+        symbol = pair.upper().split('_')[0]
+        return symbol if symbol == 'ALL' or symbol in self.market.states else None
+
+    # ===========================
+    # 시세 갱신
+    # ===========================
+
+    async def _start_ticker(self, app):
+        app['ticker_task'] = asyncio.create_task(self._tick_loop())
+
+    async def _stop_ticker(self, app):
+        app['ticker_task'].cancel()
+
+    async def _tick_loop(self):
+        while True:
+            await asyncio.sleep(self.tick_interval)
+            self.market.step()
+            self._match_resting_orders()
+            if self._ws_clients:
+                await self._broadcast()
+
+    # ===========================
+    # Public API
+    # ===========================
+
+    async def handle_ticker(self, request: web.Request) -> Dict:
+        symbol = self._symbol(request.match_info['pair'])
+        if symbol is None:
+            return _error('5500', 'Invalid Parameter')
+        if symbol == 'ALL':
+            data = {s: self.market.ticker(s) for s in self.market.symbols}
+            data['date'] = str(int(time.time() * 1000))
+            return _ok(data)
+        return _ok(self.market.ticker(symbol))
+
+    async def handle_orderbook(self, request: web.Request) -> Dict:
+        symbol = self._symbol(request.match_info['pair'])
+        if symbol is None:
+            return _error('5500', 'Invalid Parameter')
+        count = min(int(request.query.get('count', 30)), 30)
+        if symbol == 'ALL':
+            data = {s: self.market.orderbook(s, count) for s in self.market.symbols}
+            data['timestamp'] = str(int(time.time() * 1000))
+            data['payment_currency'] = 'KRW'
+            return _ok(data)
+        return _ok(self.market.orderbook(symbol, count))
+
+    async def handle_candlestick(self, request: web.Request) -> Dict:
+        symbol = self._symbol(request.match_info['pair'])
+        interval = request.match_info['interval']
+        if symbol is None or symbol == 'ALL' or interval not in CANDLE_INTERVALS:
+            return _error('5500', 'Invalid Parameter')
+        return _ok(self.market.candles(symbol, interval))
+
+    async def handle_transaction_history(self, request: web.Request) -> Dict:
+        symbol = self._symbol(request.match_info['pair'])
+        if symbol is None or symbol == 'ALL':
+            return _error('5500', 'Invalid Parameter')
+        count = max(1, min(int(request.query.get('count', 20)), 100))
+        return _ok(self.market.transactions(symbol, count))
+
+    # ===========================
+    # Private API
+    # ===========================
+
+    async def handle_balance(self, request: web.Request) -> Dict:
+        currency = request['params'].get('currency', 'ALL').upper()
+        currencies = ['KRW'] + (self.market.symbols if currency == 'ALL' else [currency])
+
+        data = {}
+        for cur in currencies:
+            if cur != 'KRW' and cur not in self.market.states:
+                continue
+            bal = self.account.balance(cur)
+            key = cur.lower()
+            data[f'total_{key}'] = f"{bal['total']:.8f}"
+            data[f'in_use_{key}'] = f"{bal['in_use']:.8f}"
+            data[f'available_{key}'] = f"{bal['total'] - bal['in_use']:.8f}"
+            if cur != 'KRW':
+                data[f'xcoin_last_{key}'] = f"{self.market.states[cur].price}"
+        return _ok(data)
+
+    async def handle_wallet_address(self, request: web.Request) -> Dict:
+        currency = request['params'].get('currency', '').upper()
+        return _ok({'wallet_address': f'mock-{currency.lower()}-address', 'currency': currency})
+
+    async def handle_place(self, request: web.Request) -> Dict:
+        params = request['params']
+        symbol = params.get('order_currency', '').upper()
+        side = params.get('type')
+
+        try:
+            units = float(params.get('units', 0))
+            price = float(params.get('price', 0))
+        except ValueError:
+            return _error('5500', 'Invalid Parameter')
+
+        if symbol not in self.market.states or side not in ('bid', 'ask') or units <= 0 or price <= 0:
+            return _error('5500', 'Invalid Parameter')
+
+        if units * price < 500:
+            return _error('5600', '최소 주문금액은 500 KRW 입니다.')
+
+        account = self.account
+        if side == 'bid':
+            reserve = units * price * (1 + account.fee_rate)
+            krw = account.balance('KRW')
+            if krw['total'] - krw['in_use'] < reserve:
+                return _error('5600', '주문가능한 금액이 부족합니다.')
+            krw['in_use'] += reserve
+        else:
+            reserve = units
+            coin = account.balance(symbol)
+            if coin['total'] - coin['in_use'] < units - 1e-12:
+                return _error('5600', '주문가능한 수량이 부족합니다.')
+            coin['in_use'] += units
+
+        order_id = account.next_order_id()
+        account.orders[order_id] = {
+            'order_id': order_id,
+            'symbol': symbol,
+            'side': side,
+            'price': price,
+            'units': units,
+            'remaining': units,
+            'reserved': reserve,
+            'status': 'Pending',
+            'order_date': int(time.time() * 1_000_000),
+            'cancel_date': '',
+            'contracts': []
+        }
+
+        self._match_order(account.orders[order_id])
+        return _ok(order_id=order_id)
+
+    async def handle_cancel(self, request: web.Request) -> Dict:
+        order = self.account.orders.get(request['params'].get('order_id'))
+        if not order or order['status'] != 'Pending':
+            return _error('5600', '거래 진행중인 내역이 존재하지 않습니다.')
+        self._release(order)
+        order['status'] = 'Cancel'
+        order['cancel_date'] = str(int(time.time() * 1_000_000))
+        return _ok()
+
+    async def handle_orders(self, request: web.Request) -> Dict:
+        params = request['params']
+        symbol = params.get('order_currency', '').upper()
+        side = params.get('type')
+        count = int(params.get('count', 100))
+
+        pending = [o for o in self.account.orders.values()
+                   if o['status'] == 'Pending' and o['symbol'] == symbol and (not side or o['side'] == side)]
+        if not pending:
+            return _error('5600', '거래 진행중인 내역이 존재하지 않습니다.')
+
+        return _ok([{
+            'order_currency': o['symbol'],
+            'payment_currency': 'KRW',
+            'order_id': o['order_id'],
+            'order_date': str(o['order_date']),
+            'type': o['side'],
+            'watch_price': '0',
+            'units': f"{o['units']:.8f}",
+            'units_remaining': f"{o['remaining']:.8f}",
+            'price': f"{o['price']}"
+        } for o in pending[:count]])
+
+    async def handle_order_detail(self, request: web.Request) -> Dict:
+        order = self.account.orders.get(request['params'].get('order_id'))
+        if not order:
+            return _error('5600', '거래 체결내역이 존재하지 않습니다.')
+
+        status = order['status']
+        if status == 'Pending' and order['remaining'] <= 1e-12:
+            status = 'Completed'
+
+        return _ok({
+            'order_date': str(order['order_date']),
+            'type': order['side'],
+            'order_status': status,
+            'order_currency': order['symbol'],
+            'payment_currency': 'KRW',
+            'watch_price': '0',
+            'order_price': f"{order['price']}",
+            'order_qty': f"{order['units']:.8f}",
+            'cancel_date': order['cancel_date'],
+            'cancel_type': '',
+            'contract': order['contracts']
+        })
+
+    async def handle_user_transactions(self, request: web.Request) -> Dict:
+        params = request['params']
+        symbol = params.get('order_currency', '').upper()
+        offset = int(params.get('offset', 0))
+        count = int(params.get('count', 20))
+
+        rows = [t for t in reversed(self.account.transactions) if t['order_currency'] == symbol]
+        return _ok(rows[offset:offset + count])
+
+    # ===========================
+    # 체결 엔진
+    # ===========================
+
+    def _match_order(self, order: Dict):
+        """호가창 대비 즉시 체결 가능한 수량 체결"""
+        bids, asks = self.market.get_book(order['symbol'])
+
+        if order['side'] == 'bid':
+            levels = [(p, q) for p, q in asks if p <= order['price']]
+        else:
+            levels = [(p, q) for p, q in bids if p >= order['price']]
+
+        for level_price, level_qty in levels:
+            if order['remaining'] <= 1e-12:
+                break
+            self._fill(order, level_price, min(level_qty, order['remaining']))
+
+        if order['remaining'] <= 1e-12:
+            order['remaining'] = 0.0
+            order['status'] = 'Completed'
+            self._release(order)
+
+    def _match_resting_orders(self):
+        for order in list(self.account.orders.values()):
+            if order['status'] == 'Pending':
+                self._match_order(order)
+
+    def _fill(self, order: Dict, price: float, units: float):
+        """부분/전체 체결 반영"""
+        account = self.account
+        symbol = order['symbol']
+        total = price * units
+        fee = total * account.fee_rate
+
+        krw = account.balance('KRW')
+        coin = account.balance(symbol)
+
+        if order['side'] == 'bid':
+            released = order['price'] * units * (1 + account.fee_rate)
+            krw['total'] -= total + fee
+            krw['in_use'] -= released
+            order['reserved'] -= released
+            coin['total'] += units
+        else:
+            coin['total'] -= units
+            coin['in_use'] -= units
+            order['reserved'] -= units
+            krw['total'] += total - fee
+
+        order['remaining'] -= units
+        now = datetime.now()
+
+        order['contracts'].append({
+            'transaction_date': str(int(now.timestamp() * 1_000_000)),
+            'price': f"{price}",
+            'units': f"{units:.8f}",
+            'fee_currency': 'KRW',
+            'fee': f"{fee:.4f}",
+            'total': f"{total:.4f}"
+        })
+        account.transactions.append({
+            'search': '1' if order['side'] == 'bid' else '2',
+            'transfer_date': str(int(now.timestamp() * 1_000_000)),
+            'order_currency': symbol,
+            'payment_currency': 'KRW',
+            'units': f"{units:.8f}",
+            'price': f"{price}",
+            'amount': f"{total:.4f}",
+            'fee_currency': 'KRW',
+            'fee': f"{fee:.4f}",
+            'order_balance': f"{coin['total']:.8f}",
+            'payment_balance': f"{krw['total']:.4f}"
+        })
+
+    def _release(self, order: Dict):
+        """남은 예약 금액/수량 해제"""
+        if order['reserved'] <= 0:
+            return
+        if order['side'] == 'bid':
+            self.account.balance('KRW')['in_use'] -= order['reserved']
+        else:
+            self.account.balance(order['symbol'])['in_use'] -= order['reserved']
+        order['reserved'] = 0.0
+
+    # ===========================
+    # WebSocket
+    # ===========================
+
+    async def handle_ws(self, request: web.Request) -> web.WebSocketResponse:
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        await ws.send_json({'status': '0000', 'resmsg': 'Connected Successfully'})
+        self._ws_clients[ws] = []
+
+        try:
+            async for msg in ws:
+                if msg.type != WSMsgType.TEXT:
+                    continue
+                try:
+                    subscription = json.loads(msg.data)
+                except ValueError:
+                    await ws.send_json({'status': '5100', 'resmsg': 'Invalid Filter Syntax'})
+                    continue
+
+                if subscription.get('type') not in ('ticker', 'orderbookdepth', 'transaction'):
+                    await ws.send_json({'status': '5100', 'resmsg': 'Invalid Filter Syntax'})
+                    continue
+
+                subscription['symbols'] = [s.upper().split('_')[0] for s in subscription.get('symbols', [])]
+                self._ws_clients[ws].append(subscription)
+                await ws.send_json({'status': '0000', 'resmsg': 'Filter Registered Successfully'})
+        finally:
+            self._ws_clients.pop(ws, None)
+
+        return ws
+
+    async def _broadcast(self):
+        """구독자에게 이번 틱 데이터 전송"""
+        now = datetime.now()
+        for ws, subscriptions in list(self._ws_clients.items()):
+            for sub in subscriptions:
+                symbols = [s for s in sub['symbols'] if s in self.market.states]
+                try:
+                    if sub['type'] == 'ticker':
+                        for symbol in symbols:
+                            await ws.send_json(self._ws_ticker(symbol, now))
+                    elif sub['type'] == 'orderbookdepth':
+                        await ws.send_json(self._ws_orderbook(symbols, now))
+                    else:
+                        message = self._ws_transactions(symbols)
+                        if message['content']['list']:
+                            await ws.send_json(message)
+                except ConnectionResetError:
+                    self._ws_clients.pop(ws, None)
+                    break
+
+    def _ws_ticker(self, symbol: str, now: datetime) -> Dict:
+        state = self.market.states[symbol]
+        change = state.price - state.prev_closing_price
+        return {'type': 'ticker', 'content': {
+            'symbol': f'{symbol}_KRW',
+            'tickType': '24H',
+            'date': now.strftime('%Y%m%d'),
+            'time': now.strftime('%H%M%S'),
+            'openPrice': f"{state.opening_price}",
+            'closePrice': f"{state.price}",
+            'lowPrice': f"{state.min_price}",
+            'highPrice': f"{state.max_price}",
+            'value': f"{state.value_24h:.4f}",
+            'volume': f"{state.units_traded_24h:.8f}",
+            'sellVolume': f"{state.units_traded_24h / 2:.8f}",
+            'buyVolume': f"{state.units_traded_24h / 2:.8f}",
+            'prevClosePrice': f"{state.prev_closing_price}",
+            'chgRate': f"{change / state.prev_closing_price * 100:.2f}" if state.prev_closing_price else '0',
+            'chgAmt': f"{change}",
+            'volumePower': '100'
+        }}
+
+    def _ws_orderbook(self, symbols: List[str], now: datetime) -> Dict:
+        rows = []
+        for symbol in symbols:
+            bids, asks = self.market.get_book(symbol)
+            for order_type, levels in (('bid', bids[:5]), ('ask', asks[:5])):
+                for price, qty in levels:
+                    rows.append({'symbol': f'{symbol}_KRW', 'orderType': order_type,
+                                 'price': f"{price}", 'quantity': f"{qty:.8f}", 'total': '1'})
+        return {'type': 'orderbookdepth', 'content': {
+            'list': rows, 'datetime': str(int(now.timestamp() * 1_000_000))
+        }}
+
+    def _ws_transactions(self, symbols: List[str]) -> Dict:
+        rows = []
+        for symbol in symbols:
+            for trade in self.market.states[symbol].new_trades:
+                rows.append({
+                    'symbol': f'{symbol}_KRW',
+                    'buySellGb': '2' if trade['type'] == 'bid' else '1',
+                    'contPrice': trade['price'],
+                    'contQty': trade['units_traded'],
+                    'contAmt': trade['total'],
+                    'contDtm': datetime.fromtimestamp(trade['timestamp'], KST).strftime('%Y-%m-%d %H:%M:%S.%f'),
+                    'updn': 'up'
+                })
+        return {'type': 'transaction', 'content': {'list': rows}}
+
+    # ===========================
+    # 실행
+    # ===========================
+
+    def run(self, host: str = '127.0.0.1', port: int = 8765):
+        print(f"모의 빗썸 거래소 시작: http://{host}:{port} (종목 {len(self.market.symbols)}개)")
+        print(f"  BITHUMB_API_URL=http://{host}:{port}")
+        print(f"  BITHUMB_WS_URL=ws://{host}:{port}/pub/ws")
+        web.run_app(self.build_app(), host=host, port=port, print=None)
+
+
+def build_symbols(count: int) -> List[str]:
+    """config.TARGET_PAIRS 우선, 부족분은 합성 심볼로 채움"""
+    symbols = list(dict.fromkeys(config.TARGET_PAIRS))[:count]
+    i = 0
+    while len(symbols) < count:
+        i += 1
+        symbols.append(f"SIM{i:04d}")
+    return symbols
+
+
+def main():
+    parser = argparse.ArgumentParser(description='모의 빗썸 거래소')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--symbols', type=int, default=len(set(config.TARGET_PAIRS)),
+                        help='종목 수 (TARGET_PAIRS 이후 SIM0001... 로 채움)')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--public-rate-limit', type=float, default=135)
+    parser.add_argument('--private-rate-limit', type=float, default=15)
+    parser.add_argument('--tick-interval', type=float, default=1.0)
+    parser.add_argument('--initial-krw', type=float, default=10_000_000)
+    parser.add_argument('--api-secret', default=None, help='지정 시 요청 서명 검증')
+    parser.add_argument('--recorded', default=None, help='녹화 시세 CSV (symbol,timestamp,close)')
+    parser.add_argument('--correlation', type=float, default=0.0, help='종목 간 시장 상관 계수 (0-0.95)')
+    args = parser.parse_args()
+
+    recorded = MarketSimulator.load_recorded(args.recorded) if args.recorded else None
+    symbols = build_symbols(args.symbols)
+    if recorded:
+        symbols = list(dict.fromkeys(symbols + list(recorded.keys())))
+
+    exchange = MockBithumbExchange(
+        symbols,
+        seed=args.seed,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        public_rate_limit=args.public_rate_limit,
+        private_rate_limit=args.private_rate_limit,
+        tick_interval=args.tick_interval,
+        initial_krw=args.initial_krw,
+        api_secret=args.api_secret,
+        recorded=recorded,
+        correlation=args.correlation
+    )
+    exchange.run(args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
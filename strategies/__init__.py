@@ -1,15 +1,24 @@
-from .base_strategy import BaseStrategy
-from .trend_following import TrendFollowingStrategy
-from .mean_reversion import MeanReversionStrategy
-from .momentum_breakout import MomentumBreakoutStrategy
-from .orderbook_imbalance import OrderbookImbalanceStrategy
-from .orderbook_scalping_strategy import OrderbookScalpingStrategy
-
-__all__ = [
-    'BaseStrategy',
-    'TrendFollowingStrategy',
-    'MeanReversionStrategy',
-    'MomentumBreakoutStrategy',
-    'OrderbookImbalanceStrategy',
-    'OrderbookScalpingStrategy'
-]
+import importlib
+
+_EXPORTS = {
+    'BaseStrategy': '.base_strategy',
+    'TrendFollowingStrategy': '.trend_following',
+    'MeanReversionStrategy': '.mean_reversion',
+    'MomentumBreakoutStrategy': '.momentum_breakout',
+    'OrderbookImbalanceStrategy': '.orderbook_imbalance',
+    'OrderbookScalpingStrategy': '.orderbook_scalping_strategy',
+    'register_strategy': '.registry',
+    'create_strategies': '.registry',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    # 전략 클래스는 첫 접근 시 로드
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -4,15 +4,22 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from decimal import Decimal
-import pandas as pd
+import numpy as np
 
 
 class BaseStrategy(ABC):
     """전략 추상 베이스 클래스"""
 
+    # 입력 선언 - 엔진은 활성 전략 선언의 합집합만 수집/계산
+    required_indicators: Tuple[str, ...] = ()   # IndicatorEngine 키 또는 엔진 파생값 (rsi, volume_ratio, orderbook_imbalance)
+    requires_orderbook: bool = False            # 호가창 (bids/asks) 필요 여부
+    orderbook_depth: int = 30                   # 필요 호가 단계 수
+    timeframe: str = '15m'                      # 지표 타임프레임
+    supports_batch: bool = False                # generate_signals_batch 구현 여부
+
     def __init__(self, name: str, strategy_type: str, parameters: Dict = None):
         self.name = name
         self.strategy_type = strategy_type
@@ -61,6 +68,65 @@ class BaseStrategy(ABC):
         """
         pass
 
+    def generate_signals_batch(self, symbols: List[str], columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        전체 종목 일괄 시그널 스크리닝 (선택 구현, supports_batch=True)
+        Args:
+            symbols: 종목 리스트 (배열 행 순서)
+            columns: 종목별 컬럼 배열 - price, volume, volume_ratio, rsi, price_change_5m,
+                     price_change_15m, macd, macd_signal, bb_position, orderbook_imbalance
+                     (누락 지표는 generate_signal의 기본값으로 채워져 있음)
+        Returns:
+            {'mask': bool 배열, 'strength': 배열, 'confidence': 배열, ...전략별 보조 배열}
+        """
+        raise NotImplementedError
+
+    def signals_from_batch(self, symbols: List[str], columns: Dict[str, np.ndarray],
+                           result: Dict[str, np.ndarray]) -> Dict[str, Dict]:
+        """
+        generate_signals_batch 결과 중 mask 종목만 generate_signal 형식 딕셔너리로 변환
+        Returns:
+            {symbol: signal}
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _rsi(indicators: Dict) -> float:
+        """RSI (없음/None/NaN 이면 중립 50 - 일괄 스크리닝 컬럼 기본값과 동일)"""
+        rsi = indicators.get('rsi')
+        return 50.0 if rsi is None or np.isnan(rsi) else float(rsi)
+
+    def _batch_signal(self, price: float, strength: float, confidence: float,
+                      stop_loss: float, take_profit: float, reasoning: str, metadata: Dict) -> Dict:
+        """일괄 스크리닝 결과 → 매수 시그널 딕셔너리"""
+        return {
+            'signal_type': 'BUY',
+            'strength': float(strength),
+            'confidence': float(confidence),
+            'entry_price': float(price),
+            'stop_loss': float(price) * (1 - stop_loss),
+            'take_profit': float(price) * (1 + take_profit),
+            'reasoning': reasoning,
+            'metadata': metadata
+        }
+
+    def get_state(self) -> Dict:
+        """
+        재시작 시 복원할 전략 상태 (JSON 직렬화 가능)
+        Returns:
+            상태 딕셔너리 (상태 없는 전략은 빈 딕셔너리)
+        """
+        return {}
+
+    def load_state(self, state: Dict, age: float):
+        """
+        스냅샷에서 전략 상태 복원
+        Args:
+            state: get_state() 결과
+            age: 스냅샷 경과 시간 (초)
+        """
+        pass
+
     def calculate_position_size(self, capital: float, risk_percent: float, stop_loss_distance: float) -> float:
         """
         포지션 사이즈 계산
@@ -5,14 +5,21 @@
 - 모든 코인 동시 모니터링
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+import numpy as np
 from .base_strategy import BaseStrategy
+from .registry import register_strategy
 import time
+import config
 
 
+@register_strategy('hyper_scalping', strategy_id=1)
 class HyperScalpingStrategy(BaseStrategy):
     """초고속 실시간 수익률 스캘핑"""
 
+    required_indicators = ('rsi', 'volume_ratio')
+    supports_batch = True
+
     def __init__(self, parameters: Dict = None):
         default_params = {
             # 손절만 엄격, 익절은 무제한 (트레일링 스톱으로 추종)
@@ -56,7 +63,7 @@ class HyperScalpingStrategy(BaseStrategy):
                 return None
 
             # RSI 체크 (과매수 구간 제외)
-            rsi = indicators.get('rsi', 50)
+            rsi = self._rsi(indicators)
             if rsi > 70:  # 과매수 구간
                 return None
 
@@ -80,7 +87,7 @@ class HyperScalpingStrategy(BaseStrategy):
             }
 
         # 전략 2: RSI 과매도 반등 (더 신중)
-        rsi = indicators.get('rsi', 50)
+        rsi = self._rsi(indicators)
         if 30 < rsi < 40 and volume_ratio > 1.8:  # RSI 과매도 구간 + 강한 거래량
             if price_change_1m > 0.003:  # 0.3% 이상 상승 중
                 return {
@@ -101,6 +108,74 @@ class HyperScalpingStrategy(BaseStrategy):
 
         return None
 
+    def generate_signals_batch(self, symbols: List[str], columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """generate_signal 과 동일한 규칙을 전체 종목에 한 번에 적용 (last_prices 갱신 포함)"""
+        price = columns['price']
+        volume_ratio = columns['volume_ratio']
+        rsi = columns['rsi']
+
+        prev = np.array([self.last_prices.get(symbol, np.nan) for symbol in symbols], dtype=float)
+        valid = price > 0
+        seen = valid & ~np.isnan(prev)
+
+        # 이전 가격 갱신 (현재가가 유효한 종목만)
+        for i in np.flatnonzero(valid):
+            self.last_prices[symbols[i]] = float(price[i])
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            change = np.where(seen & (prev > 0), (price - prev) / prev, 0.0)
+
+        # 전략 1: 강한 급등 (거래량/RSI 조건 불충족 시 전략 2로 넘어가지 않음)
+        spike = seen & (change >= self.parameters['price_spike_threshold'])
+        spike_signal = spike & (volume_ratio >= self.parameters['min_volume_ratio']) & (rsi <= 70)
+
+        # 전략 2: RSI 과매도 반등
+        bounce_signal = seen & ~spike & (rsi > 30) & (rsi < 40) & (volume_ratio > 1.8) & (change > 0.003)
+
+        strength = np.where(spike_signal, np.minimum(change * 100, 100), np.where(bounce_signal, 65.0, 0.0))
+        confidence = np.where(spike_signal, np.minimum(0.70 + volume_ratio / 20, 0.90),
+                              np.where(bounce_signal, 0.75, 0.0))
+
+        return {
+            'mask': spike_signal | bounce_signal,
+            'strength': strength,
+            'confidence': confidence,
+            'price_change': change,
+            'spike': spike_signal,
+        }
+
+    def signals_from_batch(self, symbols: List[str], columns: Dict[str, np.ndarray],
+                           result: Dict[str, np.ndarray]) -> Dict[str, Dict]:
+        signals = {}
+        for i in np.flatnonzero(result['mask']):
+            change = float(result['price_change'][i])
+            volume_ratio = float(columns['volume_ratio'][i])
+            rsi = float(columns['rsi'][i])
+            if result['spike'][i]:
+                reasoning = f"급등{change*100:+.2f}% 거래량{volume_ratio:.1f}배"
+                trigger = 'strong_spike'
+            else:
+                reasoning = f"RSI반등 {rsi:.0f} 거래량{volume_ratio:.1f}배"
+                trigger = 'rsi_bounce'
+            signals[symbols[i]] = self._batch_signal(
+                columns['price'][i], result['strength'][i], result['confidence'][i],
+                self.parameters['ultra_quick_stop'], self.parameters['instant_profit_target'],
+                reasoning,
+                {'price_change_1m': change, 'volume_ratio': volume_ratio, 'rsi': rsi, 'trigger': trigger}
+            )
+        return signals
+
+    def get_state(self) -> Dict:
+        """이전 가격 캐시 (재시작 직후 첫 관측부터 변동률 계산)"""
+        return {'last_prices': dict(self.last_prices)}
+
+    def load_state(self, state: Dict, age: float):
+        """너무 오래된 가격은 급등 오탐을 만들므로 복원하지 않음"""
+        if age > config.SNAPSHOT_PRICE_MAX_AGE:
+            return
+        for symbol, price in state.get('last_prices', {}).items():
+            self.last_prices.setdefault(symbol, price)
+
     def validate_signal(self, signal: Dict, market_conditions: Dict) -> bool:
         """시그널 유효성 검증 (거의 모든 신호 통과)"""
 
@@ -5,11 +5,15 @@
 
 from typing import Dict, Optional
 from .base_strategy import BaseStrategy
+from .registry import register_strategy
 
 
+@register_strategy('mean_reversion')
 class MeanReversionStrategy(BaseStrategy):
     """평균 회귀 전략"""
 
+    required_indicators = ('bb_upper', 'bb_middle', 'bb_lower', 'rsi_14', 'stoch_k', 'adx_14')
+
     def __init__(self, parameters: Dict = None):
         default_params = {
             'bb_period': 20,
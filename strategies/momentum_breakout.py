@@ -5,11 +5,15 @@
 
 from typing import Dict, Optional
 from .base_strategy import BaseStrategy
+from .registry import register_strategy
 
 
+@register_strategy('momentum_breakout')
 class MomentumBreakoutStrategy(BaseStrategy):
     """모멘텀 돌파 전략"""
 
+    required_indicators = ('ema_21', 'ema_50', 'atr_14', 'volume_sma_20', 'rsi_14')
+
     def __init__(self, parameters: Dict = None):
         default_params = {
             'volume_threshold': 1.5,  # 평균 대비 배수
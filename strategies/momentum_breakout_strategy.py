@@ -6,11 +6,15 @@
 
 from typing import Dict, Optional
 from .base_strategy import BaseStrategy
+from .registry import register_strategy
 
 
+@register_strategy('momentum_scalping')
 class MomentumBreakoutStrategy(BaseStrategy):
     """변동성 돌파 스캘핑"""
 
+    required_indicators = ('rsi_14', 'ema_9', 'ema_21', 'volume_ratio')
+
     def __init__(self, parameters: Dict = None):
         default_params = {
             'price_change_threshold': 0.015,  # 1.5% 이상 급등/급락
@@ -5,13 +5,20 @@
 - 조기 진입 → 20%+ 수익 목표
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+import numpy as np
 from .base_strategy import BaseStrategy
+from .registry import register_strategy
 
 
+@register_strategy('moon_shot')
 class MoonShotStrategy(BaseStrategy):
     """20% 이상 급등 코인 조기 포착"""
 
+    required_indicators = ('volume_ratio', 'price_change_5m', 'price_change_15m', 'rsi',
+                           'macd', 'macd_signal', 'bb_position', 'orderbook_imbalance')
+    supports_batch = True
+
     def __init__(self, parameters: Dict = None):
         default_params = {
             # 급등 전조 신호 파라미터 (현실적으로 완화)
@@ -56,7 +63,7 @@ class MoonShotStrategy(BaseStrategy):
             return None
 
         # 3. RSI 체크 (범위 확대)
-        rsi = indicators.get('rsi', 50)
+        rsi = self._rsi(indicators)
         if rsi < 40 or rsi > 80:  # 40-80 구간 (더 넓게)
             return None
 
@@ -144,6 +151,66 @@ class MoonShotStrategy(BaseStrategy):
 
         return sum(scores)
 
+    def generate_signals_batch(self, symbols: List[str], columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """generate_signal 필터 + _calculate_confidence 를 전체 종목에 벡터화 적용"""
+        price = columns['price']
+        volume_ratio = columns['volume_ratio']
+        change_5m = columns['price_change_5m']
+        change_15m = columns['price_change_15m']
+        rsi = columns['rsi']
+        macd_strength = columns['macd'] - columns['macd_signal']
+        bb_position = columns['bb_position']
+        imbalance = columns['orderbook_imbalance']
+        threshold = self.parameters['price_momentum_threshold']
+
+        passed = (
+            (price > 0) & (price <= self.parameters['max_price_range'])
+            & (volume_ratio >= self.parameters['min_volume_surge'])
+            & ((change_5m >= threshold) | (change_15m >= threshold))
+            & (rsi >= 40) & (rsi <= 80)
+            & (columns['macd'] >= -1)
+            & (bb_position >= 0.4)
+        )
+
+        confidence = (
+            np.minimum(volume_ratio / 5.0, 1.0) * 0.30
+            + np.minimum(change_5m / 0.05, 1.0) * 0.25
+            + np.where((rsi >= 50) & (rsi <= 75), (rsi - 50) / 25, 0) * 0.15
+            + np.where(macd_strength > 0, np.minimum(np.abs(macd_strength) / 2.0, 1.0), 0) * 0.15
+            + np.where(bb_position >= 0.5, (bb_position - 0.5) / 0.5, 0) * 0.10
+            + np.where(imbalance > 1.0, np.minimum(imbalance - 1.0, 1.0), 0) * 0.05
+        )
+
+        mask = passed & (confidence >= self.parameters['min_confidence'])
+        return {
+            'mask': mask,
+            'strength': np.minimum(confidence * 100, 100),
+            'confidence': confidence,
+        }
+
+    def signals_from_batch(self, symbols: List[str], columns: Dict[str, np.ndarray],
+                           result: Dict[str, np.ndarray]) -> Dict[str, Dict]:
+        signals = {}
+        for i in np.flatnonzero(result['mask']):
+            volume_ratio = float(columns['volume_ratio'][i])
+            change_5m = float(columns['price_change_5m'][i])
+            signals[symbols[i]] = self._batch_signal(
+                columns['price'][i], result['strength'][i], result['confidence'][i],
+                self.parameters['stop_loss'], self.parameters['target_profit'],
+                f"급등예측 거래량x{volume_ratio:.1f} 모멘텀{change_5m*100:+.1f}%",
+                {
+                    'volume_ratio': volume_ratio,
+                    'price_change_5m': change_5m,
+                    'price_change_15m': float(columns['price_change_15m'][i]),
+                    'rsi': float(columns['rsi'][i]),
+                    'macd_strength': float(columns['macd'][i] - columns['macd_signal'][i]),
+                    'bb_position': float(columns['bb_position'][i]),
+                    'orderbook_imbalance': float(columns['orderbook_imbalance'][i]),
+                    'trigger': 'moon_shot'
+                }
+            )
+        return signals
+
     def validate_signal(self, signal: Dict, market_conditions: Dict) -> bool:
         """신호 유효성 검증 (완화)"""
 
@@ -5,11 +5,15 @@
 
 from typing import Dict, Optional, List
 from .base_strategy import BaseStrategy
+from .registry import register_strategy
 
 
+@register_strategy('orderbook_imbalance')
 class OrderbookImbalanceStrategy(BaseStrategy):
     """호가창 불균형 전략"""
 
+    requires_orderbook = True
+
     def __init__(self, parameters: Dict = None):
         default_params = {
             'imbalance_threshold': 1.8,  # 불균형 비율
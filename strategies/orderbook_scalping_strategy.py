@@ -4,12 +4,19 @@
 """
 
 from typing import Dict, Optional
+
+from analysis import orderbook_analytics
 from .base_strategy import BaseStrategy
+from .registry import register_strategy
 
 
+@register_strategy('orderbook_scalping')
 class OrderbookScalpingStrategy(BaseStrategy):
     """호가창 실시간 분석 스캘핑"""
 
+    requires_orderbook = True
+    orderbook_depth = 20
+
     def __init__(self, parameters: Dict = None):
         default_params = {
             'wall_size_threshold': 2.5,  # 매수/매도 벽 기준 (평균 대비) - 더 민감하게
@@ -35,53 +42,34 @@ class OrderbookScalpingStrategy(BaseStrategy):
         if current_price <= 0:
             return None
 
-        bids = orderbook.get('bids', [])
-        asks = orderbook.get('asks', [])
-
-        if not bids or not asks:
+        # 엔진 캐시의 파싱된 호가 배열 재사용 (없으면 1회 파싱)
+        book = orderbook_analytics.parse_orderbook(orderbook)
+        if not book.bid_prices.size or not book.ask_prices.size:
             return None
 
-        best_bid = float(bids[0]['price']) if bids else 0
-        best_ask = float(asks[0]['price']) if asks else 0
+        best_bid = book.best_bid
+        best_ask = book.best_ask
 
         # 1. 스프레드 확인 (너무 크면 거래 안함)
         spread = (best_ask - best_bid) / best_bid if best_bid > 0 else 999
         if spread > self.parameters['spread_threshold']:
             return None  # 스프레드 너무 큼
 
-        # 2. 호가 불균형 계산
-        bid_volume = sum(float(b['quantity']) for b in bids[:10])
-        ask_volume = sum(float(a['quantity']) for a in asks[:10])
-
+        # 2. 호가 불균형 계산 (상위 10단계)
+        ask_volume = book.volume('ask', 10)
         if ask_volume <= 0:
             return None
 
-        imbalance_ratio = bid_volume / ask_volume
-
-        # 3. 매수벽/매도벽 감지
-        avg_bid_size = bid_volume / 10
-        avg_ask_size = ask_volume / 10
-
-        buy_walls = []  # 큰 매수 주문들
-        sell_walls = []  # 큰 매도 주문들
-
-        for bid in bids[:20]:
-            qty = float(bid['quantity'])
-            if qty > avg_bid_size * self.parameters['wall_size_threshold']:
-                buy_walls.append({
-                    'price': float(bid['price']),
-                    'quantity': qty,
-                    'distance': (current_price - float(bid['price'])) / current_price
-                })
-
-        for ask in asks[:20]:
-            qty = float(ask['quantity'])
-            if qty > avg_ask_size * self.parameters['wall_size_threshold']:
-                sell_walls.append({
-                    'price': float(ask['price']),
-                    'quantity': qty,
-                    'distance': (float(ask['price']) - current_price) / current_price
-                })
+        imbalance_ratio = orderbook_analytics.top_imbalance(book, 10)
+
+        # 3. 매수벽/매도벽 감지 (상위 20단계, 기준: 상위 10단계 평균)
+        threshold = self.parameters['wall_size_threshold']
+        buy_walls = orderbook_analytics.detect_walls(book, 'bid', threshold, levels=20, average_over=10)
+        sell_walls = orderbook_analytics.detect_walls(book, 'ask', threshold, levels=20, average_over=10)
+        for wall in buy_walls:
+            wall['distance'] = (current_price - wall['price']) / current_price
+        for wall in sell_walls:
+            wall['distance'] = (wall['price'] - current_price) / current_price
 
         # 4. 전략 로직
         signal_type = 'HOLD'
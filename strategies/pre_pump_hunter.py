@@ -8,13 +8,20 @@ Pre-Pump Hunter Strategy
 3. 저가 코인 (변동성 크다) = 한번 터지면 20%+
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+import numpy as np
 from .base_strategy import BaseStrategy
+from .registry import register_strategy
 
 
+@register_strategy('pre_pump_hunter')
 class PrePumpHunter(BaseStrategy):
     """급등 전 선제 매수 - 상승 전에 미리 사두기"""
 
+    required_indicators = ('price_change_5m', 'price_change_15m', 'volume_ratio', 'rsi',
+                           'bb_position', 'macd', 'macd_signal')
+    supports_batch = True
+
     def __init__(self, parameters: Dict = None):
         default_params = {
             # 선제 매수 조건
@@ -68,7 +75,7 @@ class PrePumpHunter(BaseStrategy):
             return None
 
         # 3. RSI 과매도 구간 (반등 준비)
-        rsi = indicators.get('rsi', 50)
+        rsi = self._rsi(indicators)
         if rsi > self.parameters['rsi_max']:  # 이미 오르기 시작 = 늦음
             return None
 
@@ -150,6 +157,72 @@ class PrePumpHunter(BaseStrategy):
 
         return sum(scores)
 
+    def generate_signals_batch(self, symbols: List[str], columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """generate_signal 필터 + _calculate_confidence 를 전체 종목에 벡터화 적용"""
+        price = columns['price']
+        change_5m = columns['price_change_5m']
+        change_15m = columns['price_change_15m']
+        volume_ratio = columns['volume_ratio']
+        rsi = columns['rsi']
+        bb_position = columns['bb_position']
+        macd = columns['macd']
+        macd_signal = columns['macd_signal']
+        dip_min, dip_max = self.parameters['dip_min'], self.parameters['dip_max']
+
+        is_dipping = ((change_5m >= dip_min) & (change_5m <= dip_max)) | \
+                     ((change_15m >= dip_min) & (change_15m <= dip_max))
+        # max(..., key=abs) 와 동일하게 절대값이 큰 쪽 (동률이면 5분)
+        price_change_24h = np.where(np.abs(change_5m) >= np.abs(change_15m), change_5m, change_15m)
+        macd_cross_soon = (macd > macd_signal * 0.8) & (macd < macd_signal)
+
+        passed = (
+            (price > 0) & (price <= self.parameters['max_price'])
+            & is_dipping
+            & (volume_ratio >= self.parameters['volume_surge_min'])
+            & (rsi <= self.parameters['rsi_max'])
+            & (bb_position <= 0.4)
+        )
+
+        confidence = (
+            np.minimum(np.abs(price_change_24h) / 0.10, 1.0) * 0.30
+            + np.minimum(volume_ratio - 1.0, 1.0) * 0.30
+            + np.maximum(np.where(rsi < 50, (50 - rsi) / 20, 0), 0) * 0.20
+            + np.maximum(np.where(bb_position < 0.4, (0.4 - bb_position) / 0.4, 0), 0) * 0.10
+            + np.where(macd_cross_soon, 0.10, 0)
+            + np.where(rsi < self.parameters['rsi_oversold'], 0.15, 0)
+        )
+
+        mask = passed & (confidence >= self.parameters['min_confidence'])
+        return {
+            'mask': mask,
+            'strength': np.minimum(confidence * 100, 100),
+            'confidence': confidence,
+            'price_change_24h': price_change_24h,
+            'macd_cross_soon': macd_cross_soon,
+        }
+
+    def signals_from_batch(self, symbols: List[str], columns: Dict[str, np.ndarray],
+                           result: Dict[str, np.ndarray]) -> Dict[str, Dict]:
+        signals = {}
+        for i in np.flatnonzero(result['mask']):
+            price_change_24h = float(result['price_change_24h'][i])
+            volume_ratio = float(columns['volume_ratio'][i])
+            rsi = float(columns['rsi'][i])
+            signals[symbols[i]] = self._batch_signal(
+                columns['price'][i], result['strength'][i], result['confidence'][i],
+                self.parameters['stop_loss'], self.parameters['target_profit'],
+                f"저점매수 {price_change_24h*100:.1f}% 거래량x{volume_ratio:.1f} RSI{rsi:.0f}",
+                {
+                    'price_change_24h': price_change_24h,
+                    'volume_ratio': volume_ratio,
+                    'rsi': rsi,
+                    'bb_position': float(columns['bb_position'][i]),
+                    'macd_cross_soon': bool(result['macd_cross_soon'][i]),
+                    'trigger': 'pre_pump'
+                }
+            )
+        return signals
+
     def validate_signal(self, signal: Dict, market_conditions: Dict) -> bool:
         """신호 검증 (완화)"""
 
@@ -0,0 +1,104 @@
+"""
+전략 레지스트리
+전략 클래스는 @register_strategy 로 등록하고, 엔진은 config.ACTIVE_STRATEGIES 의 키로 생성
+활성 전략의 입력 선언(지표/호가창/타임프레임)을 합쳐 수집·계산 범위를 결정
+"""
+
+import importlib
+from typing import Dict, List, Optional, Set, Type
+
+# 내장 전략 모듈 (조회 시 import되어 데코레이터 등록)
+BUILTIN_MODULES = [
+    'strategies.hyper_scalping_strategy',
+    'strategies.trend_following',
+    'strategies.mean_reversion',
+    'strategies.momentum_breakout',
+    'strategies.momentum_breakout_strategy',
+    'strategies.orderbook_imbalance',
+    'strategies.orderbook_scalping_strategy',
+    'strategies.moon_shot_strategy',
+    'strategies.pre_pump_hunter',
+]
+
+# 엔진이 파생 계산하는 입력 → 필요한 원본 지표
+DERIVED_INPUTS = {
+    'rsi': ['rsi_14'],
+    'volume_ratio': ['volume_sma_20'],
+    'orderbook_imbalance': [],
+}
+
+_REGISTRY: Dict[str, Type] = {}
+_loaded = False
+
+
+def register_strategy(key: str, strategy_id: Optional[int] = None):
+    """
+    전략 클래스 등록 데코레이터
+    Args:
+        key: 설정에서 사용하는 전략 키 (예: 'hyper_scalping')
+        strategy_id: 고정 strategies.id (없으면 엔진이 전략 이름으로 조회/생성)
+    """
+    def decorator(cls):
+        if key in _REGISTRY and _REGISTRY[key] is not cls:
+            raise ValueError(f"전략 키 중복: {key}")
+        cls.registry_key = key
+        cls.default_strategy_id = strategy_id
+        _REGISTRY[key] = cls
+        return cls
+    return decorator
+
+
+def _load_builtins():
+    global _loaded
+    if not _loaded:
+        for module in BUILTIN_MODULES:
+            importlib.import_module(module)
+        _loaded = True
+
+
+def get_strategy_class(key: str) -> Type:
+    """키로 전략 클래스 조회"""
+    _load_builtins()
+    if key not in _REGISTRY:
+        raise KeyError(f"등록되지 않은 전략: {key} (사용 가능: {', '.join(sorted(_REGISTRY))})")
+    return _REGISTRY[key]
+
+
+def available_strategies() -> List[str]:
+    """등록된 전략 키 목록"""
+    _load_builtins()
+    return sorted(_REGISTRY)
+
+
+def create_strategies(keys: List[str]) -> List:
+    """키 목록으로 전략 인스턴스 생성"""
+    return [get_strategy_class(key)() for key in keys]
+
+
+class DataRequirements:
+    """활성 전략들의 입력 합집합"""
+
+    def __init__(self, strategies: List):
+        self.indicators: Dict[str, Set[str]] = {}   # {timeframe: {지표 키}}
+        self.requires_orderbook = False
+        self.orderbook_depth = 0
+        self.requires_trades = False                 # 체결 테이프 (volume_ratio 단기 거래량)
+
+        for strategy in strategies:
+            keys = self.indicators.setdefault(strategy.timeframe, set())
+            for name in strategy.required_indicators:
+                keys.update(DERIVED_INPUTS.get(name, [name]))
+            if strategy.requires_orderbook or 'orderbook_imbalance' in strategy.required_indicators:
+                self.requires_orderbook = True
+                self.orderbook_depth = max(self.orderbook_depth, strategy.orderbook_depth)
+            if 'volume_ratio' in strategy.required_indicators:
+                self.requires_trades = True
+
+        # 지표가 필요 없는 타임프레임은 계산 생략
+        self.indicators = {tf: keys for tf, keys in self.indicators.items() if keys}
+
+    def describe(self) -> str:
+        parts = [f"{tf}: {', '.join(sorted(keys))}" for tf, keys in self.indicators.items()]
+        orderbook = f"호가창 {self.orderbook_depth}단계" if self.requires_orderbook else "호가창 미수집"
+        trades = "체결 테이프 수집" if self.requires_trades else "체결 테이프 미수집"
+        return f"지표 [{' / '.join(parts) or '없음'}], {orderbook}, {trades}"
@@ -6,8 +6,8 @@ AI 기반 전략 선택기
 import numpy as np
 from typing import Dict, List, Tuple
 from datetime import datetime, timedelta
-from sklearn.linear_model import LogisticRegression
 from database import SessionLocal, Strategy, StrategyPerformance, Trade
+from database import queries
 import pickle
 import os
 
@@ -29,31 +29,29 @@ class StrategySelector:
         # 최근 30일 성과 조회
         cutoff_date = datetime.now() - timedelta(days=30)
 
-        strategies = self.db.query(Strategy).filter(Strategy.is_active == True).all()
+        # 활성 전략 전체 손익을 1회 조회 (전략별 ORM 조회 대신 컬럼 배열)
+        strategy_ids = queries.active_strategy_ids(self.db)
+        pnls_by_strategy = queries.trade_pnls_by_strategy(self.db, since=cutoff_date,
+                                                          strategy_ids=strategy_ids)
 
         weights = {}
         total_score = 0
 
-        for strategy in strategies:
-            # 최근 거래 성과 조회
-            trades = self.db.query(Trade).filter(
-                Trade.strategy_id == strategy.id,
-                Trade.closed_at >= cutoff_date
-            ).all()
-
-            if not trades:
-                weights[strategy.id] = 0.2  # 기본 가중치
+        for strategy_id in strategy_ids:
+            pnls = pnls_by_strategy.get(strategy_id)
+
+            if pnls is None:
+                weights[strategy_id] = 0.2  # 기본 가중치
                 total_score += 0.2
                 continue
 
             # 성과 지표 계산
-            total_trades = len(trades)
-            winning_trades = sum(1 for t in trades if float(t.pnl) > 0)
-            win_rate = winning_trades / total_trades if total_trades > 0 else 0
-            avg_pnl = sum(float(t.pnl) for t in trades) / total_trades if total_trades > 0 else 0
+            total_trades = len(pnls)
+            win_rate = np.count_nonzero(pnls > 0) / total_trades
+            avg_pnl = float(pnls.mean())
 
             # 샤프 비율 근사
-            pnl_std = np.std([float(t.pnl) for t in trades]) if len(trades) > 1 else 1
+            pnl_std = float(pnls.std()) if total_trades > 1 else 1
             sharpe = (avg_pnl / pnl_std) if pnl_std > 0 else 0
 
             # 종합 점수 계산
@@ -63,8 +61,8 @@ class StrategySelector:
                 min(avg_pnl / 100000, 0.5) * 0.3  # 평균 수익 30%
             )
 
-            weights[strategy.id] = max(score, 0.1)  # 최소 0.1
-            total_score += weights[strategy.id]
+            weights[strategy_id] = max(score, 0.1)  # 최소 0.1
+            total_score += weights[strategy_id]
 
         # 정규화 (합계 1.0)
         if total_score > 0:
@@ -163,7 +161,9 @@ class StrategySelector:
         if len(X) < 50:
             return
 
-        # 로지스틱 회귀 모델 학습
+        # 로지스틱 회귀 모델 학습 (sklearn은 학습 시점에만 로드)
+        from sklearn.linear_model import LogisticRegression
+
         self.model = LogisticRegression()
         self.model.fit(X, y)
 
@@ -5,11 +5,15 @@ EMA 크로스오버, MACD, ADX를 활용한 추세 매매
 
 from typing import Dict, Optional
 from .base_strategy import BaseStrategy
+from .registry import register_strategy
 
 
+@register_strategy('trend_following')
 class TrendFollowingStrategy(BaseStrategy):
     """추세 추종 전략"""
 
+    required_indicators = ('ema_9', 'ema_21', 'ema_50', 'macd', 'macd_signal', 'adx_14', 'rsi_14')
+
     def __init__(self, parameters: Dict = None):
         default_params = {
             'ema_short': 9,
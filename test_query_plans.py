@@ -0,0 +1,302 @@
+"""
+핫 쿼리 조회 계획 회귀 검사
+- 로컬 PostgreSQL 에 임시 스키마를 만들고 테이블 + 핫 쿼리 인덱스(database.init_db.HOT_INDEXES) 생성
+- 운영 분포를 흉내 낸 데이터 시드 후 VACUUM ANALYZE (작은 테이블은 인덱스가 있어도 Seq Scan 이 선택되므로)
+- 핫 쿼리 카탈로그를 EXPLAIN 해 대상 테이블을 Seq Scan 으로 읽는 쿼리가 있으면 실패 (exit 1)
+
+사용법:
+    python test_query_plans.py --db-url postgresql://postgres@localhost:5432/postgres
+    QUERY_PLAN_DB_URL=postgresql://... python test_query_plans.py --keep   # 검사 후 스키마 유지
+
+운영 DB 가 아닌 로컬/CI PostgreSQL 에서 실행할 것 (임시 스키마만 생성/삭제하지만 시드 부하가 큼)
+"""
+
+import argparse
+import json
+import os
+import sys
+
+# 모델이 임시 스키마를 가리키도록 database import 전에 스키마 지정
+SCHEMA = os.getenv('QUERY_PLAN_SCHEMA', 'query_plan_check')
+os.environ['DB_SCHEMA'] = SCHEMA
+
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from sqlalchemy import Float, case, cast, create_engine, func, select, text
+
+from database import Base, OHLCVData, Position, Trade, AccountBalance
+from database import queries
+from database.init_db import create_indexes
+import config
+
+# 시드 규모 (테이블별 행 수)
+SEED_SYMBOLS = 40
+SEED_CANDLES = 2000       # 종목/타임프레임별 캔들 수 (3개 타임프레임)
+SEED_POSITIONS = 20000    # 대부분 CLOSED, ACTIVE 는 SEED_ACTIVE_POSITIONS 개
+SEED_ACTIVE_POSITIONS = 10
+SEED_TRADES = 100000      # 7분 간격 (약 16개월)
+SEED_BALANCES = 50000     # 10분 간격
+SEED_ANOMALIES = 50000    # 10분 간격, 최근 SEED_UNLABELED 개만 라벨링 대기
+SEED_UNLABELED = 200
+
+SEED_SQL = [
+    """
+    INSERT INTO {schema}.strategies (name, strategy_type, parameters, is_active, created_at, updated_at)
+    SELECT 'plan_' || i, 'test', '{{}}'::jsonb, i % 3 <> 0, now(), now()
+    FROM generate_series(1, 10) i
+    """,
+    """
+    INSERT INTO {schema}.ohlcv_data (symbol, timeframe, timestamp, open, high, low, close, volume)
+    SELECT 'SYM' || s, tf.name, date_trunc('hour', now()::timestamp) - i * tf.step,
+           100, 101, 99, 100 + i % 7, 10
+    FROM generate_series(1, :symbols) s
+    CROSS JOIN (VALUES ('1m', interval '1 minute'), ('5m', interval '5 minutes'), ('1h', interval '1 hour'))
+        AS tf(name, step)
+    CROSS JOIN generate_series(0, :candles - 1) i
+    """,
+    """
+    INSERT INTO {schema}.positions (symbol, position_type, entry_price, quantity, status, opened_at, closed_at)
+    SELECT 'SYM' || (i % :symbols + 1), 'LONG', 100, 1,
+           CASE WHEN i <= :active_positions THEN (ARRAY['PENDING', 'OPEN', 'CLOSING'])[i % 3 + 1] ELSE 'CLOSED' END,
+           now()::timestamp - i * interval '10 minutes', now()::timestamp - i * interval '5 minutes'
+    FROM generate_series(1, :positions) i
+    """,
+    """
+    INSERT INTO {schema}.trades (strategy_id, symbol, entry_price, exit_price, quantity, pnl, pnl_percent,
+                                 holding_time_minutes, exit_reason, opened_at, closed_at)
+    SELECT 1 + i % 10, 'SYM' || (i % :symbols + 1), 100, 101, 1, (i % 7) * 1000 - 3000, i % 7 - 3,
+           30, 'take_profit',
+           now()::timestamp - i * interval '7 minutes' - interval '30 minutes',
+           now()::timestamp - i * interval '7 minutes'
+    FROM generate_series(1, :trades) i
+    """,
+    """
+    INSERT INTO {schema}.account_balance (timestamp, total_krw, total_crypto_value, total_value,
+                                          available_krw, positions_value)
+    SELECT now()::timestamp - i * interval '10 minutes', 1000000, 0, 1000000 + i % 1000, 1000000, 0
+    FROM generate_series(1, :balances) i
+    """,
+    """
+    INSERT INTO {schema}.orderbook_anomalies (symbol, timestamp, anomaly_type, severity, details, price_before)
+    SELECT 'SYM' || (i % :symbols + 1), now()::timestamp - i * interval '10 minutes', 'whale_wall', 50,
+           CASE WHEN i <= :unlabeled THEN '{{"side": "bid"}}'::jsonb
+                ELSE '{{"side": "bid", "outcome": {{"5m": {{"return": 0.01}}}}}}'::jsonb END,
+           100
+    FROM generate_series(1, :anomalies) i
+    """,
+]
+
+
+def hot_queries() -> List[Dict]:
+    """
+    핫 쿼리 카탈로그 (앱 조회와 같은 형태)
+    Returns:
+        [{'name', 'tables': Seq Scan 을 허용하지 않는 테이블, 'statement'}]
+    """
+    now = datetime.now()
+    today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    pnl = cast(Trade.pnl, Float)
+
+    return [
+        {
+            # IndicatorEngine.get_ohlcv_data
+            'name': 'ohlcv_latest',
+            'tables': ['ohlcv_data'],
+            'statement': queries.ohlcv_statement('SYM1', '1m', 200),
+        },
+        {
+            # AnomalyLabeler._build_label_sql 기간별 1분봉 종가 (LATERAL)
+            'name': 'ohlcv_label_lookup',
+            'tables': ['ohlcv_data'],
+            'statement': select(cast(OHLCVData.close, Float))
+            .where(OHLCVData.symbol == 'SYM1', OHLCVData.timeframe == '1m',
+                   OHLCVData.timestamp > now - timedelta(hours=3),
+                   OHLCVData.timestamp <= now - timedelta(hours=3) + timedelta(minutes=1))
+            .order_by(OHLCVData.timestamp).limit(1),
+        },
+        {
+            # RiskManager.can_open_position, OrderReconciler
+            'name': 'positions_active',
+            'tables': ['positions'],
+            'statement': select(Position.id, Position.symbol, Position.status)
+            .where(Position.status.in_(Position.ACTIVE_STATUSES)),
+        },
+        {
+            # TradingEngineV2 종목별 오픈 포지션 관리
+            'name': 'positions_symbol_open',
+            'tables': ['positions'],
+            'statement': select(Position.id, Position.quantity)
+            .where(Position.symbol == 'SYM1', Position.status == 'OPEN'),
+        },
+        {
+            # StrategySelector.calculate_strategy_weights
+            'name': 'trades_strategy_recent',
+            'tables': ['trades'],
+            'statement': select(Trade.strategy_id, pnl)
+            .where(Trade.strategy_id.in_([1, 2, 4, 5, 7, 8, 10]), Trade.closed_at >= now - timedelta(days=30))
+            .order_by(Trade.strategy_id, Trade.closed_at),
+        },
+        {
+            # RiskManager.update_daily_performance, dashboard /api/performance
+            'name': 'trades_day_summary',
+            'tables': ['trades'],
+            'statement': select(func.count(Trade.id), func.sum(case((Trade.pnl > 0, 1), else_=0)), func.sum(pnl))
+            .where(Trade.closed_at >= today, Trade.closed_at < today + timedelta(days=1)),
+        },
+        {
+            # dashboard /api/trades
+            'name': 'trades_recent',
+            'tables': ['trades'],
+            'statement': select(Trade.id, Trade.symbol, pnl).order_by(Trade.closed_at.desc()).limit(50),
+        },
+        {
+            # RiskManager / OrderExecutor / dashboard 최근 잔고
+            'name': 'balance_latest',
+            'tables': ['account_balance'],
+            'statement': select(cast(AccountBalance.total_value, Float))
+            .order_by(AccountBalance.timestamp.desc()).limit(1),
+        },
+        {
+            # AnomalyLabeler._build_label_sql pending CTE (label_pending)
+            'name': 'anomalies_unlabeled',
+            'tables': ['orderbook_anomalies'],
+            'statement': text(f"""
+                SELECT id, symbol, timestamp, price_before
+                FROM {SCHEMA}.orderbook_anomalies
+                WHERE details -> 'outcome' IS NULL
+                  AND timestamp <= :cutoff
+                  AND price_before > 0
+                ORDER BY timestamp
+                LIMIT :limit
+            """).bindparams(cutoff=now - timedelta(minutes=30), limit=500),
+        },
+    ]
+
+
+def seq_scans(plan: Dict, tables: List[str]) -> List[str]:
+    """EXPLAIN JSON 계획에서 대상 테이블 Seq Scan 노드 찾기"""
+    found = []
+    if plan.get('Node Type') == 'Seq Scan' and plan.get('Relation Name') in tables:
+        found.append(plan['Relation Name'])
+    for child in plan.get('Plans', []):
+        found.extend(seq_scans(child, tables))
+    return found
+
+
+def scan_nodes(plan: Dict) -> List[str]:
+    """로그용 스캔 노드 요약 ('Index Only Scan using idx_x' 등)"""
+    nodes = []
+    if 'Relation Name' in plan:
+        index = plan.get('Index Name')
+        nodes.append(f"{plan['Node Type']}" + (f" using {index}" if index else f" on {plan['Relation Name']}"))
+    for child in plan.get('Plans', []):
+        nodes.extend(scan_nodes(child))
+    return nodes
+
+
+def explain(conn, statement) -> Dict:
+    """쿼리 EXPLAIN (FORMAT JSON) → 최상위 계획 노드"""
+    compiled = statement.compile(dialect=conn.dialect, compile_kwargs={'render_postcompile': True})
+    result = conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params).scalar()
+    if isinstance(result, str):
+        result = json.loads(result)
+    return result[0]['Plan']
+
+
+def create_schema(engine) -> bool:
+    """임시 스키마 생성 (이미 있으면 건드리지 않고 False)"""
+    with engine.connect() as conn:
+        exists = conn.execute(text(
+            "SELECT 1 FROM information_schema.schemata WHERE schema_name = :schema"
+        ), {'schema': SCHEMA}).scalar()
+        if exists:
+            return False
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        conn.commit()
+    return True
+
+
+def setup_schema(engine):
+    """테이블/인덱스 생성 → 시드 → VACUUM ANALYZE (인덱스 전용 스캔 판단용 가시성 맵 포함)"""
+    Base.metadata.create_all(bind=engine)
+    created = create_indexes(engine, SCHEMA)
+    print(f"  ✓ 테이블 및 인덱스 생성 ({', '.join(created)})")
+
+    params = {
+        'symbols': SEED_SYMBOLS, 'candles': SEED_CANDLES,
+        'positions': SEED_POSITIONS, 'active_positions': SEED_ACTIVE_POSITIONS,
+        'trades': SEED_TRADES, 'balances': SEED_BALANCES,
+        'anomalies': SEED_ANOMALIES, 'unlabeled': SEED_UNLABELED,
+    }
+    with engine.connect() as conn:
+        for sql in SEED_SQL:
+            statement = text(sql.format(schema=SCHEMA))
+            conn.execute(statement, {k: v for k, v in params.items() if f":{k}" in sql})
+        conn.commit()
+
+    with engine.execution_options(isolation_level='AUTOCOMMIT').connect() as conn:
+        for table in Base.metadata.sorted_tables:
+            conn.execute(text(f"VACUUM ANALYZE {SCHEMA}.{table.name}"))
+    print("  ✓ 시드 데이터 생성 및 VACUUM ANALYZE 완료")
+
+
+def check_plans(engine) -> bool:
+    """핫 쿼리 카탈로그 EXPLAIN - Seq Scan 이 하나라도 있으면 False"""
+    passed = True
+    with engine.connect() as conn:
+        for query in hot_queries():
+            plan = explain(conn, query['statement'])
+            scans = seq_scans(plan, query['tables'])
+            nodes = ', '.join(scan_nodes(plan))
+            if scans:
+                passed = False
+                print(f"  ✗ {query['name']}: Seq Scan on {', '.join(scans)} ({nodes})")
+            else:
+                print(f"  ✓ {query['name']}: {nodes}")
+    return passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='핫 쿼리 조회 계획 회귀 검사 (Seq Scan 검출)')
+    parser.add_argument('--db-url', default=os.getenv('QUERY_PLAN_DB_URL'),
+                        help='검사용 PostgreSQL URL (기본: QUERY_PLAN_DB_URL)')
+    parser.add_argument('--keep', action='store_true', help='검사 후 임시 스키마 유지 (계획 직접 확인용)')
+    args = parser.parse_args()
+
+    if not args.db_url:
+        print("검사용 DB URL 필요: --db-url 또는 QUERY_PLAN_DB_URL (운영 DB 사용 금지)")
+        sys.exit(2)
+
+    engine = create_engine(args.db_url, connect_args={'options': f'-c search_path={SCHEMA}'})
+
+    print("=" * 60)
+    print(f"핫 쿼리 조회 계획 검사 (스키마: {config.DB_SCHEMA})")
+    print("=" * 60)
+
+    if not create_schema(engine):
+        print(f"스키마 '{SCHEMA}' 가 이미 존재 (이전 --keep 실행) - DROP SCHEMA {SCHEMA} CASCADE 후 재실행")
+        engine.dispose()
+        sys.exit(2)
+
+    try:
+        print("\n[1/2] 스키마 준비 중...")
+        setup_schema(engine)
+
+        print("\n[2/2] EXPLAIN 검사 중...")
+        passed = check_plans(engine)
+    finally:
+        if not args.keep:
+            with engine.connect() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+                conn.commit()
+        engine.dispose()
+
+    print("\n" + "=" * 60)
+    print("모든 핫 쿼리가 인덱스를 사용합니다" if passed else "Seq Scan 으로 퇴화한 핫 쿼리가 있습니다")
+    print("=" * 60)
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
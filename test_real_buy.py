@@ -42,6 +42,10 @@ print(f"\n주문 실행 (5,500원)...")
 position = executor.execute_signal(test_signal, position_size)
 
 if position:
+    # 실전 주문은 비동기 체결 - 체결 반영까지 대기 후 확인
+    executor.wait_for_orders()
+    executor.db.refresh(position)
+
     print(f"\n[SUCCESS] 실제 매수 성공!")
     print(f"  포지션 ID: {position.id}")
     print(f"  심볼: {position.symbol}")
@@ -0,0 +1,124 @@
+"""
+체결 테이프 회귀 검사 (네트워크/DB 불필요)
+- 호스트 시간대가 UTC 여도 KST 체결 시각이 현재 초 바에 들어가는지 (Docker 이미지 기본 TZ)
+- 다음 폴링에서 같은 초 체결이 추가돼도 파일 기록 바가 메모리 바와 같은지
+- 실시간 체결의 같은 시각/가격/수량/방향 별개 체결이 모두 반영되는지
+
+사용법:
+    python test_trade_tape.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+# Docker 이미지(python:3.11-slim)와 같은 UTC 호스트로 검사 - 모듈 import 전에 지정
+os.environ['TZ'] = 'UTC'
+time.tzset()
+
+from datetime import datetime
+
+from collectors.trade_tape import TradeTape
+from database.models import KST
+import config
+
+
+def kst_string(ts: float, micro: bool = False) -> str:
+    """epoch 초 → 빗썸 형식 KST 시각 문자열 (시간대 표기 없음)"""
+    fmt = '%Y-%m-%d %H:%M:%S.%f' if micro else '%Y-%m-%d %H:%M:%S'
+    return datetime.fromtimestamp(ts, KST).strftime(fmt)
+
+
+def check_kst_under_utc() -> bool:
+    """UTC 호스트에서 KST 체결 시각 → 현재 초 바"""
+    now = time.time()
+    tape = TradeTape(window=120, path='')
+    tape.ingest('BTC', [{'cont_no': '1', 'transaction_date': kst_string(now),
+                         'type': 'bid', 'units_traded': '0.5', 'price': '100'}])
+    tape.ingest_ws([{'symbol': 'ETH_KRW', 'buySellGb': '2', 'contPrice': '10', 'contQty': '2',
+                     'contDtm': kst_string(now, micro=True)}])
+
+    passed = True
+    for symbol, volume in (('BTC', 0.5), ('ETH', 2.0)):
+        bars = tape.bars(symbol, now=now + 1)
+        offset = int(bars['second'][-1]) - int(now) if bars.size else None
+        summary = tape.summary(symbol, 60, now=now + 1)
+        if offset is None or abs(offset) > 1 or summary['volume'] != volume:
+            passed = False
+            print(f"  ✗ {symbol}: 바 시각 오차 {offset}초, 60초 거래량 {summary['volume']}")
+        else:
+            print(f"  ✓ {symbol}: 바 시각 오차 {offset}초, 60초 거래량 {summary['volume']}")
+    return passed
+
+
+def check_flush_late_trades() -> bool:
+    """같은 초 체결이 다음 폴링에 도착해도 기록 바 = 메모리 바"""
+    start = int(time.time()) - 120
+    with tempfile.TemporaryDirectory() as path:
+        tape = TradeTape(window=300, path=path)
+
+        def poll(cont_no: int, second: int):
+            tape.ingest('BTC', [{'cont_no': str(cont_no), 'transaction_date': kst_string(second),
+                                 'type': 'ask', 'units_traded': '1', 'price': '100'}])
+
+        poll(1, start)
+        tape.flush(now=start + 2)               # 폴링 직후 기록 시도 (같은 초 체결 대기)
+        poll(2, start)                          # 같은 초 체결이 다음 폴링에 도착
+        poll(3, start + 5)
+        tape.flush(now=start + 6)               # watermark 이전 초 확정 → 기록
+        poll(4, start + 5)
+        tape.flush(now=start + 5 + config.TRADE_TAPE_FLUSH_LAG + 1)
+        tape.flush(now=start + 5 + config.TRADE_TAPE_FLUSH_LAG + 20)
+
+        saved = TradeTape.load_bars(path, 'BTC', kst_string(start)[:10])
+        if kst_string(start + 5)[:10] != kst_string(start)[:10]:
+            saved = list(saved) + list(TradeTape.load_bars(path, 'BTC', kst_string(start + 5)[:10]))
+        recorded = [(int(bar['second']), int(bar['trades'])) for bar in saved]
+
+    expected = [(start, 2), (start + 5, 2)]
+    if recorded != expected:
+        print(f"  ✗ 기록 바 {recorded} (기대 {expected})")
+        return False
+    print(f"  ✓ 기록 바 {recorded}")
+    return True
+
+
+def check_ws_identical_trades() -> bool:
+    """같은 시각/가격/수량/방향 별개 체결 2건 반영, 같은 메시지 재전송은 중복 제거"""
+    contdtm = kst_string(time.time(), micro=True)
+    message = [{'symbol': 'XRP_KRW', 'buySellGb': '1', 'contPrice': '700', 'contQty': '10',
+                'contDtm': contdtm}] * 2
+    tape = TradeTape(window=120, path='')
+    accepted = tape.ingest_ws(message)
+    replayed = tape.ingest_ws(message)
+    if accepted != 2 or replayed != 0:
+        print(f"  ✗ 반영 {accepted}건, 재전송 반영 {replayed}건 (기대 2, 0)")
+        return False
+    print(f"  ✓ 반영 {accepted}건, 재전송 반영 {replayed}건")
+    return True
+
+
+def main():
+    print("=" * 60)
+    print(f"체결 테이프 검사 (TZ={os.environ['TZ']})")
+    print("=" * 60)
+
+    checks = [
+        ('KST 체결 시각 (UTC 호스트)', check_kst_under_utc),
+        ('지연 수신 체결 파일 기록', check_flush_late_trades),
+        ('실시간 동일 조건 체결', check_ws_identical_trades),
+    ]
+    passed = True
+    for index, (name, check) in enumerate(checks, 1):
+        print(f"\n[{index}/{len(checks)}] {name}")
+        passed = check() and passed
+
+    print("\n" + "=" * 60)
+    print("모든 검사 통과" if passed else "실패한 검사가 있습니다")
+    print("=" * 60)
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == '__main__':
+    main()
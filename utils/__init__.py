@@ -1,3 +1,17 @@
-from .telegram_notifier import TelegramNotifier
+import importlib
 
-__all__ = ['TelegramNotifier']
+_EXPORTS = {
+    'TelegramNotifier': '.telegram_notifier',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    # 첫 접근 시 로드 (utils.metrics 만 쓰는 모듈이 requests까지 로드하지 않도록)
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,264 @@
+"""
+성능 메트릭 수집 모듈
+저비용 카운터/게이지/고정 버킷 히스토그램 + Prometheus 텍스트 포맷 출력
+"""
+
+import math
+import time
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+# 기본 지연시간 버킷 (초) - 1ms ~ 30s
+DEFAULT_LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+
+def _format_labels(labelnames: Tuple[str, ...], labelvalues: Tuple[str, ...], extra: str = '') -> str:
+    """라벨 문자열 생성 ({a="x",b="y"})"""
+    pairs = [f'{name}="{value}"' for name, value in zip(labelnames, labelvalues)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    """값 포맷 (정수는 정수로, 비유한 값은 Prometheus 표기 +Inf/-Inf/NaN)"""
+    if not math.isfinite(value):
+        if math.isnan(value):
+            return 'NaN'
+        return '+Inf' if value > 0 else '-Inf'
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """메트릭 베이스"""
+
+    metric_type = ''
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} {self.metric_type}'
+        ]
+        lines.extend(self._render_samples())
+        return lines
+
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """누적 카운터"""
+
+    metric_type = 'counter'
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values = {}
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}'
+                for key, value in items]
+
+
+class Gauge(_Metric):
+    """현재값 게이지"""
+
+    metric_type = 'gauge'
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values = {}
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f'{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}'
+                for key, value in items]
+
+
+class Histogram(_Metric):
+    """고정 버킷 히스토그램"""
+
+    metric_type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}  # {labels: [bucket_counts, sum, count]}
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        idx = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                self._series[key] = series
+            series[0][idx] += 1
+            series[1] += value
+            series[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """블록 실행 시간 측정"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def get_count(self, **labels) -> int:
+        series = self._series.get(self._key(labels))
+        return series[2] if series else 0
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            items = [(key, list(series[0]), series[1], series[2]) for key, series in self._series.items()]
+
+        lines = []
+        for key, bucket_counts, total, count in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, bucket_counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, f'le="{bound}"')
+                lines.append(f'{self.name}_bucket{labels} {cumulative}')
+            labels = _format_labels(self.labelnames, key, 'le="+Inf"')
+            lines.append(f'{self.name}_bucket{labels} {count}')
+            lines.append(f'{self.name}_sum{_format_labels(self.labelnames, key)} {repr(float(total))}')
+            lines.append(f'{self.name}_count{_format_labels(self.labelnames, key)} {count}')
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 저장소"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Tuple[str, ...] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """Prometheus 텍스트 포맷 출력"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+# 텍스트 포맷 Content-Type
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# ===========================
+# 핫패스 메트릭
+# ===========================
+
+API_REQUEST_SECONDS = REGISTRY.histogram(
+    'bithumb_api_request_seconds', '빗썸 API 요청 왕복 시간', ('endpoint',))
+API_ERRORS = REGISTRY.counter(
+    'bithumb_api_errors_total', '빗썸 API 요청 실패 횟수', ('endpoint',))
+
+DB_COMMIT_SECONDS = REGISTRY.histogram(
+    'db_commit_seconds', 'DB 커밋 소요 시간', ('component',))
+
+INDICATOR_SECONDS = REGISTRY.histogram(
+    'indicator_calculation_seconds', '종목당 지표 계산 시간', ('timeframe',))
+
+SIGNAL_SECONDS = REGISTRY.histogram(
+    'signal_generation_seconds', '종목당 시그널 생성 시간', ('strategy',))
+
+ORDER_PLACEMENT_SECONDS = REGISTRY.histogram(
+    'order_placement_seconds', '거래소 주문 요청 시간', ('side',))
+
+TRADING_CYCLE_SECONDS = REGISTRY.histogram(
+    'trading_cycle_seconds', '트레이딩 사이클 전체 시간',
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0))
+TRADING_CYCLE_SYMBOL_SECONDS = REGISTRY.histogram(
+    'trading_cycle_symbol_seconds', '트레이딩 사이클 종목당 처리 시간')
+
+MARKET_DATA_AGE_SECONDS = REGISTRY.histogram(
+    'market_data_cache_age_seconds', '시그널 생성 시점의 시세 캐시 경과 시간',
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 15.0, 30.0, 60.0, 120.0, 300.0))
+
+TICK_TO_ORDER_SECONDS = REGISTRY.histogram(
+    'tick_to_order_seconds', '시세 수신부터 주문 완료까지 지연',
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0))
+
+ORDERS_TOTAL = REGISTRY.counter(
+    'orders_total', '주문 요청 수', ('side', 'result'))
+
+EXECUTION_SLIPPAGE_BPS = REGISTRY.histogram(
+    'execution_slippage_bps', '중간가 대비 체결가 슬리피지 (bp, stage=expected|realized)', ('side', 'stage'),
+    buckets=(0.0, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0))
+
+NOTIFICATIONS_TOTAL = REGISTRY.counter(
+    'notifications_total', '텔레그램 알림 처리 수 (result=sent|retry|failed|dropped)', ('result',))
+NOTIFICATION_QUEUE_DEPTH = REGISTRY.gauge(
+    'notification_queue_depth', '텔레그램 알림 대기열 길이')
+
+TRADES_INGESTED_TOTAL = REGISTRY.counter(
+    'trades_ingested_total', '체결 내역 수신 수 (result=accepted|duplicate|invalid)', ('result',))
+
+SCHEDULER_LAG_SECONDS = REGISTRY.histogram(
+    'scheduler_lag_seconds', '예약 수집 작업의 예정 시각 대비 실행 지연', ('kind',),
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0))
+SCHEDULER_BUDGET_STRETCH = REGISTRY.gauge(
+    'scheduler_budget_stretch', '요청 한도 초과 시 수집 주기 배수 (1이면 한도 이내)')
+SCHEDULER_REQUEST_RATE = REGISTRY.gauge(
+    'scheduler_request_rate', '예약 수집 작업의 예상 초당 요청 수 (한도 적용 전)')
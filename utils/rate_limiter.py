@@ -0,0 +1,58 @@
+"""
+API 요청 속도 제한 모듈
+프로세스 전체가 공유하는 토큰 버킷 (빗썸 Public/Private 한도 분리)
+"""
+
+import time
+import threading
+
+import config
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: float = None):
+        """
+        Args:
+            rate: 초당 토큰 보충량 (0 이하면 제한 없음)
+            capacity: 최대 버스트 (기본: rate)
+        """
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """토큰 즉시 획득 시도"""
+        if self.rate <= 0:
+            return True
+        with self._lock:
+            self._refill(time.monotonic())
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1):
+        """토큰 획득 (부족하면 보충될 때까지 대기)"""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                wait = (tokens - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# 공유 리미터 (모든 BithumbAPI 인스턴스가 사용)
+PUBLIC_LIMITER = TokenBucket(config.PUBLIC_API_RATE_LIMIT)
+PRIVATE_LIMITER = TokenBucket(config.PRIVATE_API_RATE_LIMIT)
@@ -1,12 +1,30 @@
 """
 텔레그램 알림 시스템
 중요 이벤트를 텔레그램으로 전송
+- notify_* 는 대기열에 넣고 즉시 반환 (트레이딩 스레드에서 네트워크/DB 대기 없음)
+- 백그라운드 전송 스레드가 재시도/백오프 (429 는 retry_after 준수)
+- 짧은 시간에 몰린 같은 종류 알림(청산 여러 건 등)은 요약 메시지 1건으로 병합
 """
 
+import queue
+import threading
+import time
 import requests
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import config
+from utils import metrics
+
+# 병합 가능한 알림 종류 → 요약 제목
+DIGEST_TITLES = {
+    'trade_open': '🟢 <b>포지션 오픈 {count}건</b>',
+    'trade_close': '🧾 <b>포지션 청산 {count}건</b>',
+    'signal': '🔔 <b>시그널 감지 {count}건</b>',
+    'risk': '⚠️ <b>리스크 경고 {count}건</b>',
+    'error': '❌ <b>에러 {count}건</b>',
+}
+
+MAX_MESSAGE_LENGTH = 4000   # 텔레그램 한도 4096자
 
 
 class TelegramNotifier:
@@ -17,33 +35,192 @@ class TelegramNotifier:
         self.chat_id = chat_id or config.TELEGRAM_CHAT_ID
         self.base_url = f"https://api.telegram.org/bot{self.bot_token}"
 
+        # 알림 대기열 (kind, 메시지 또는 데이터) - 첫 알림 시 전송 스레드 시작
+        self._outbox: "queue.Queue[Tuple[str, object]]" = queue.Queue(maxsize=config.TELEGRAM_OUTBOX_SIZE)
+        self._sender: Optional[threading.Thread] = None
+        self._sender_lock = threading.Lock()
+        self._session = requests.Session()
+        self._retry_after = 0.0
+
+    @property
+    def is_configured(self) -> bool:
+        return bool(self.bot_token and self.chat_id)
+
     def send_message(self, message: str, parse_mode: str = 'HTML') -> bool:
         """
-        텔레그램 메시지 전송
+        텔레그램 메시지 즉시 전송 (동기 - 연결 테스트용, 알림은 notify_* 사용)
         Args:
             message: 전송할 메시지
             parse_mode: 'HTML' 또는 'Markdown'
         Returns:
             성공 여부
         """
-        if not self.bot_token or not self.chat_id:
+        if not self.is_configured:
             print("텔레그램 설정 없음")
             return False
 
+        return self._post(message, parse_mode) == 'sent'
+
+    def _post(self, message: str, parse_mode: str = 'HTML') -> str:
+        """
+        sendMessage 1회 호출
+        Returns:
+            'sent', 'retry' (네트워크/5xx/429) 또는 'failed' (재시도 무의미)
+        """
         try:
-            url = f"{self.base_url}/sendMessage"
-            payload = {
+            response = self._session.post(f"{self.base_url}/sendMessage", json={
                 'chat_id': self.chat_id,
                 'text': message,
                 'parse_mode': parse_mode
-            }
-
-            response = requests.post(url, json=payload, timeout=10)
-            return response.status_code == 200
-
+            }, timeout=10)
         except Exception as e:
             print(f"텔레그램 전송 실패: {str(e)}")
+            return 'retry'
+
+        if response.status_code == 200:
+            return 'sent'
+        if response.status_code == 429 or response.status_code >= 500:
+            if response.status_code == 429:
+                try:
+                    self._retry_after = float(response.json().get('parameters', {}).get('retry_after', 0))
+                except ValueError:
+                    pass
+            return 'retry'
+        print(f"텔레그램 전송 실패: HTTP {response.status_code} {response.text[:200]}")
+        return 'failed'
+
+    # ===========================
+    # 대기열 / 전송 스레드
+    # ===========================
+
+    def enqueue(self, kind: str, payload) -> bool:
+        """
+        알림 대기열 추가 (즉시 반환)
+        Args:
+            kind: 알림 종류 (DIGEST_TITLES 에 있으면 병합 대상)
+            payload: 메시지 문자열 (trade_close 는 청산 데이터 dict)
+        Returns:
+            대기열 추가 여부
+        """
+        if not self.is_configured:
+            return False
+
+        try:
+            self._outbox.put_nowait((kind, payload))
+        except queue.Full:
+            metrics.NOTIFICATIONS_TOTAL.inc(result='dropped')
             return False
+        metrics.NOTIFICATION_QUEUE_DEPTH.set(self._outbox.qsize())
+
+        if self._sender is None:
+            with self._sender_lock:
+                if self._sender is None:
+                    self._sender = threading.Thread(target=self._run_sender, name='telegram-sender', daemon=True)
+                    self._sender.start()
+        return True
+
+    def flush(self, timeout: float = 10) -> bool:
+        """대기 중인 알림 전송 완료까지 대기 (종료 직전 사용)"""
+        deadline = time.time() + timeout
+        while self._outbox.unfinished_tasks:
+            if time.time() >= deadline:
+                return False
+            time.sleep(0.1)
+        return True
+
+    def _run_sender(self):
+        while True:
+            batch = [self._outbox.get()]
+            # 병합 대기 - 같은 사이클의 후속 알림 수집
+            deadline = time.time() + config.TELEGRAM_COALESCE_WINDOW
+            while True:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._outbox.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                for message in self._build_messages(batch):
+                    self._deliver(message)
+            except Exception as e:
+                print(f"텔레그램 알림 처리 실패: {str(e)}")
+            finally:
+                for _ in batch:
+                    self._outbox.task_done()
+                metrics.NOTIFICATION_QUEUE_DEPTH.set(self._outbox.qsize())
+
+    def _deliver(self, message: str):
+        """재시도 + 지수 백오프 전송"""
+        delay = config.TELEGRAM_RETRY_BACKOFF
+        for attempt in range(config.TELEGRAM_MAX_RETRIES + 1):
+            self._retry_after = 0.0
+            result = self._post(message)
+            if result == 'sent':
+                metrics.NOTIFICATIONS_TOTAL.inc(result='sent')
+                return
+            if result == 'failed' or attempt == config.TELEGRAM_MAX_RETRIES:
+                break
+            metrics.NOTIFICATIONS_TOTAL.inc(result='retry')
+            time.sleep(max(delay, self._retry_after))
+            delay *= 2
+        metrics.NOTIFICATIONS_TOTAL.inc(result='failed')
+
+    def _build_messages(self, batch: List[Tuple[str, object]]) -> List[str]:
+        """
+        배치 → 전송 메시지 (도착 순서 유지, 병합 대상 종류가 2건 이상이면 요약 1건)
+        """
+        groups: Dict[str, List] = {}
+        order: List[Tuple[str, object]] = []
+        for kind, payload in batch:
+            if kind in DIGEST_TITLES:
+                if kind not in groups:
+                    groups[kind] = []
+                    order.append((kind, None))
+                groups[kind].append(payload)
+            else:
+                order.append((kind, payload))
+
+        # 청산 알림은 당일 수익을 한 번만 계산 (전송 스레드에서 DB 조회)
+        daily_profit = self._get_daily_profit() if 'trade_close' in groups else None
+
+        messages = []
+        for kind, payload in order:
+            if kind not in groups:
+                messages.append(payload)
+            elif len(groups[kind]) == 1:
+                item = groups[kind][0]
+                messages.append(self._format_trade_close(item, daily_profit) if kind == 'trade_close' else item)
+            else:
+                messages.extend(self._format_digest(kind, groups[kind], daily_profit))
+        return messages
+
+    def _format_digest(self, kind: str, items: List, daily_profit: Optional[dict]) -> List[str]:
+        """요약 메시지 (길이 한도 초과 시 분할)"""
+        header = DIGEST_TITLES[kind].format(count=len(items))
+        if kind == 'trade_close':
+            lines = [f"{'🟢' if t['pnl'] > 0 else '🔴'} {t['symbol']} {t['pnl']:+,.0f}원 "
+                     f"({t['pnl_percent']:+.2f}%) | {t['exit_reason']}" for t in items]
+            total = sum(t['pnl'] for t in items)
+            footer = (f"\n{'💰' if total > 0 else '💸'} <b>합계: {total:+,.0f}원</b>\n"
+                      f"📊 <b>오늘 수익: {daily_profit['pnl']:+,.0f}원 ({daily_profit['pnl_percent']:+.2f}%)</b>")
+        else:
+            # 개별 메시지에서 제목/시각 줄을 뺀 본문을 한 줄로 요약
+            lines = [' | '.join(line.strip() for line in item.strip().splitlines()[1:-1] if line.strip())
+                     for item in items]
+            footer = ''
+        footer += f"\n\n⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+
+        messages, current = [], header + '\n'
+        for line in lines:
+            if len(current) + len(line) + len(footer) + 1 > MAX_MESSAGE_LENGTH:
+                messages.append(current)
+                current = header + ' (계속)\n'
+            current += '\n' + line
+        messages.append(current + footer)
+        return messages
 
     def notify_trade_open(self, position_data: dict):
         """포지션 오픈 알림"""
@@ -64,16 +241,18 @@ class TelegramNotifier:
 
 ⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
-        self.send_message(message)
+        self.enqueue('trade_open', message)
 
     def notify_trade_close(self, trade_data: dict):
-        """포지션 청산 알림"""
+        """포지션 청산 알림 (당일 수익은 전송 시 계산)"""
+        self.enqueue('trade_close', dict(trade_data))
+
+    def _format_trade_close(self, trade_data: dict, daily_profit: dict) -> str:
+        """포지션 청산 메시지"""
         pnl = trade_data['pnl']
         pnl_percent = trade_data['pnl_percent']
         emoji = "🟢" if pnl > 0 else "🔴"
 
-        # 당일 수익률 계산
-        daily_profit = self._get_daily_profit()
         daily_pnl = daily_profit['pnl']
         daily_pnl_percent = daily_profit['pnl_percent']
 
@@ -94,7 +273,7 @@ class TelegramNotifier:
 
 ⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
-        self.send_message(message)
+        return message
 
     def notify_signal(self, signal_data: dict):
         """시그널 감지 알림"""
@@ -118,7 +297,7 @@ class TelegramNotifier:
 
 ⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
-        self.send_message(message)
+        self.enqueue('signal', message)
 
     def notify_risk_alert(self, alert_data: dict):
         """리스크 경고 알림"""
@@ -130,7 +309,7 @@ class TelegramNotifier:
 
 ⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
-        self.send_message(message)
+        self.enqueue('risk', message)
 
     def notify_daily_summary(self, summary_data: dict):
         """일일 요약 알림"""
@@ -153,7 +332,7 @@ class TelegramNotifier:
 
 ⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
-        self.send_message(message)
+        self.enqueue('daily_summary', message)
 
     def notify_error(self, error_message: str):
         """에러 알림"""
@@ -164,7 +343,7 @@ class TelegramNotifier:
 
 ⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
-        self.send_message(message)
+        self.enqueue('error', message)
 
     def notify_system_start(self):
         """시스템 시작 알림"""
@@ -177,7 +356,7 @@ class TelegramNotifier:
 
 ⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
-        self.send_message(message)
+        self.enqueue('system_start', message)
 
     def notify_system_stop(self):
         """시스템 중단 알림"""
@@ -186,7 +365,7 @@ class TelegramNotifier:
 
 ⏰ {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 """
-        self.send_message(message)
+        self.enqueue('system_stop', message)
 
     def _get_daily_profit(self) -> dict:
         """당일 수익률 계산"""
@@ -246,3 +425,4 @@ if __name__ == "__main__":
     }
 
     notifier.notify_trade_open(test_data)
+    notifier.flush()